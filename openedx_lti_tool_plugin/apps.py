@@ -40,9 +40,15 @@ class OpenEdxLtiToolPluginConfig(AppConfig):
     def ready(self):
         """App ready method.
 
-        This will import the app signals to allow them to work.
+        This will load the edx-platform backend registry and import
+        the app signals to allow them to work.
         """
+        from openedx_lti_tool_plugin.edxapp_wrapper.registry import load_backends, reload_backends
+
+        load_backends()
+
         from openedx_lti_tool_plugin import signals
+        from openedx_lti_tool_plugin.deep_linking.signals import invalidate_content_item_catalog
         from openedx_lti_tool_plugin.resource_link_launch.ags.signals import (
             publish_course_score,
             update_unit_or_problem_score,
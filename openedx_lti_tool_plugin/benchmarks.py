@@ -0,0 +1,241 @@
+"""Microbenchmarks of the plugin hot functions.
+
+The benchmarks call the pure-Python functions of the launch, LtiProfile,
+LtiToolConfiguration and deep linking paths with synthetic data. No query
+or edx-platform service is used, the benchmarks can run locally with the
+test settings and the results of two releases can be compared.
+
+The results are the time per call in microseconds of the best, median,
+mean and worst repeat.
+
+Attributes:
+    urlpatterns (list): Plugin URL patterns included with the plugin namespace.
+    BENCHMARKS (tuple): Benchmark names.
+    DEFAULT_SIZE (int): Default number of allowed course IDs, form content items and serialized items.
+    DEFAULT_NUMBER (int): Default number of calls per repeat.
+    DEFAULT_REPEAT (int): Default number of repeats.
+
+"""
+import json
+import platform
+import statistics
+import timeit
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import django
+from crum import set_current_request
+from django.conf import settings
+from django.http.request import HttpRequest
+from django.test import RequestFactory
+from django.urls import include, re_path, set_urlconf
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_lti_tool_plugin import __version__
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import CourseContentItemSerializer
+from openedx_lti_tool_plugin.deep_linking.forms import DeepLinkingForm
+from openedx_lti_tool_plugin.models import CourseContext, LtiProfile, LtiToolConfiguration
+from openedx_lti_tool_plugin.resource_link_launch.views import ResourceLinkLaunchView
+from openedx_lti_tool_plugin.snapshot import SNAPSHOT_ATTR, SettingsSnapshot
+from openedx_lti_tool_plugin.utils import get_identity_claims, get_pii_from_claims
+
+urlpatterns = [
+    re_path(
+        app_config.plugin_app['url_config']['lms.djangoapp']['regex'],
+        include(('openedx_lti_tool_plugin.urls', app_config.name), namespace=app_config.name),
+    ),
+]
+
+BENCHMARKS = (
+    'get_identity_claims',
+    'get_pii_from_claims',
+    'get_opaque_keys',
+    'lti_profile_name',
+    'lti_profile_username',
+    'is_course_id_allowed',
+    'deep_linking_form_clean',
+    'course_content_item_serializer',
+)
+DEFAULT_SIZE = 500
+DEFAULT_NUMBER = 1000
+DEFAULT_REPEAT = 5
+BenchmarkResult = namedtuple(
+    'BenchmarkResult',
+    ['name', 'number', 'repeat', 'min_us', 'median_us', 'mean_us', 'max_us'],
+)
+
+
+def get_course_ids(size: int) -> list:
+    """Get synthetic course IDs.
+
+    Args:
+        size: Number of course IDs.
+
+    Returns:
+        List of course ID strings.
+
+    """
+    return [f'course-v1:org{number % 10}+course-{number}+run' for number in range(size)]
+
+
+def get_request_host() -> str:
+    """Get a host allowed by the ALLOWED_HOSTS setting.
+
+    Returns:
+        First ALLOWED_HOSTS host or localhost.
+
+    """
+    host = next(iter(settings.ALLOWED_HOSTS), '*').lstrip('.')
+
+    return 'localhost' if host == '*' else host
+
+
+def get_benchmarks(size: int = DEFAULT_SIZE) -> Dict[str, Callable[[], Any]]:
+    """Get benchmark functions.
+
+    The data of every benchmark is built once, before it's timed.
+
+    Args:
+        size: Number of allowed course IDs, form content items and serialized items.
+
+    Returns:
+        Dictionary of benchmark name and function.
+
+    """
+    course_ids = get_course_ids(size)
+    launch_data = {
+        'iss': 'https://platform.example.com',
+        'aud': ['client-id', 'other-client-id'],
+        'azp': 'client-id',
+        'sub': 'subject-id',
+        'name': 'Jane Doe',
+        'given_name': 'Jane',
+        'family_name': 'Doe',
+        'email': 'jane.doe@example.com',
+        'https://purl.imsglobal.org/spec/lti/claim/message_type': 'LtiResourceLinkRequest',
+        'https://purl.imsglobal.org/spec/lti/claim/version': '1.3.0',
+        'https://purl.imsglobal.org/spec/lti/claim/custom': {'resourceId': course_ids[-1]},
+    }
+    lti_profile = LtiProfile(
+        platform_id=launch_data['iss'],
+        client_id='client-id',
+        subject_id=launch_data['sub'],
+        pii={'given_name': 'Jane', 'middle_name': 'M.', 'family_name': 'Doe'},
+    )
+    lti_tool_configuration = LtiToolConfiguration(allowed_course_ids=json.dumps(course_ids))
+    content_items = json.dumps([
+        {
+            'type': 'ltiResourceLink',
+            'url': 'https://lms.example.com/openedx_lti_tool_plugin/1.3/launch/',
+            'title': f'Course {number}',
+            'custom': {'resourceId': course_id},
+        }
+        for number, course_id in enumerate(course_ids)
+    ])
+    learning_context_model = CourseContext._meta.get_field('learning_context').related_model
+    course_contexts = [
+        CourseContext(
+            learning_context=learning_context_model(
+                context_key=CourseKey.from_string(course_id),
+                title=f'Course {number}',
+            ),
+        )
+        for number, course_id in enumerate(course_ids)
+    ]
+    request = RequestFactory(SERVER_NAME=get_request_host()).get('/')
+
+    return {
+        'get_identity_claims': lambda: get_identity_claims(launch_data),
+        'get_pii_from_claims': lambda: get_pii_from_claims(launch_data),
+        'get_opaque_keys': lambda: ResourceLinkLaunchView.get_opaque_keys(
+            'block-v1:org+course+run+type@problem+block@test',
+        ),
+        'lti_profile_name': lambda: lti_profile.name,
+        'lti_profile_username': lambda: lti_profile.username,
+        'is_course_id_allowed': lambda: lti_tool_configuration.is_course_id_allowed(course_ids[-1]),
+        'deep_linking_form_clean': lambda: DeepLinkingForm({'content_items': content_items}).is_valid(),
+        'course_content_item_serializer': lambda: CourseContentItemSerializer(
+            course_contexts,
+            many=True,
+            context={'request': request},
+        ).data,
+    }
+
+
+def run_benchmark(name: str, function: Callable[[], Any], number: int, repeat: int) -> BenchmarkResult:
+    """Run a benchmark.
+
+    Args:
+        name: Benchmark name.
+        function: Benchmark function.
+        number: Number of calls per repeat.
+        repeat: Number of repeats.
+
+    Returns:
+        BenchmarkResult of the benchmark.
+
+    """
+    timings = [
+        total / number * 1_000_000
+        for total in timeit.Timer(function).repeat(repeat=repeat, number=number)
+    ]
+
+    return BenchmarkResult(
+        name,
+        number,
+        repeat,
+        round(min(timings), 3),
+        round(statistics.median(timings), 3),
+        round(statistics.mean(timings), 3),
+        round(max(timings), 3),
+    )
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    size: int = DEFAULT_SIZE,
+    number: int = DEFAULT_NUMBER,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """Run benchmarks.
+
+    The benchmarks run with a current request holding a settings snapshot
+    with the SAVE_PII_DATA switch enabled, so the switch is not queried,
+    and the plugin URL patterns included with the plugin namespace.
+
+    Args:
+        names: Benchmark names, all the benchmarks are run if not set.
+        size: Number of allowed course IDs, form content items and serialized items.
+        number: Number of calls per repeat.
+        repeat: Number of repeats.
+
+    Returns:
+        Dictionary with the environment versions, the
+        benchmark arguments and the benchmark results.
+
+    """
+    benchmarks = get_benchmarks(size)
+    request = HttpRequest()
+    snapshot = SettingsSnapshot()
+    # Preset the cached SAVE_PII_DATA switch state.
+    snapshot.__dict__['save_pii_data'] = True
+    setattr(request, SNAPSHOT_ATTR, snapshot)
+    set_current_request(request)
+    set_urlconf(__name__)
+
+    try:
+        results = [run_benchmark(name, benchmarks[name], number, repeat) for name in names or BENCHMARKS]
+    finally:
+        set_current_request(None)
+        set_urlconf(None)
+
+    return {
+        'plugin_version': __version__,
+        'python_version': platform.python_version(),
+        'django_version': django.get_version(),
+        'size': size,
+        'number': number,
+        'repeat': repeat,
+        'results': [result._asdict() for result in results],
+    }
@@ -0,0 +1,154 @@
+"""LTI platform circuit breaker.
+
+Attributes:
+    CLOSED (str): Closed state, requests are sent to the LTI platform.
+    OPEN (str): Open state, requests to the LTI platform fail fast.
+    HALF_OPEN (str): Half-open state, a single probe request is sent to the LTI platform.
+    STATE_TIMEOUT (int): Circuit breaker state cache timeout in seconds.
+    JWKS (str): LTI platform public key set endpoint kind.
+    AGS (str): LTI platform assignment and grade services endpoint kind.
+
+"""
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+
+log = logging.getLogger(__name__)
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+STATE_TIMEOUT = 60 * 60 * 24
+JWKS = 'jwks'
+AGS = 'ags'
+
+
+class CircuitBreaker:
+    """LTI platform circuit breaker.
+
+    A circuit breaker shared between processes, the circuit state
+    is stored on the Django cache. Each endpoint kind of an LTI platform
+    has its own circuit, so an AGS endpoint outage doesn't fail the
+    launches of the LTI platform.
+
+    The circuit opens after `failure_threshold` consecutive failures
+    of the LTI platform, while the circuit is open every request fails
+    fast. After `recovery_timeout` seconds the circuit is half-open and
+    a single probe request is allowed, the circuit closes if the probe
+    succeeds or opens again if it fails.
+
+    """
+
+    def __init__(
+        self,
+        platform_id: str,
+        endpoint: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[int] = None,
+    ):
+        """Initialize class instance.
+
+        Args:
+            platform_id: LTI platform ID.
+            endpoint: LTI platform endpoint kind (JWKS or AGS).
+            failure_threshold: Failures that open the circuit,
+                defaults to the OLTITP_CIRCUIT_BREAKER_FAILURE_THRESHOLD setting.
+            recovery_timeout: Seconds the circuit stays open,
+                defaults to the OLTITP_CIRCUIT_BREAKER_RECOVERY_TIMEOUT setting.
+
+        """
+        self.platform_id = platform_id
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold or settings.OLTITP_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or settings.OLTITP_CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+        self.cache_key = (
+            f'{app_config.name}.circuit_breaker.{endpoint}.'
+            f'{hashlib.md5(platform_id.encode("utf-8")).hexdigest()}'
+        )
+
+    @property
+    def failures_key(self) -> str:
+        """str: Consecutive failures cache key."""
+        return f'{self.cache_key}.failures'
+
+    @property
+    def opened_key(self) -> str:
+        """str: Circuit opened timestamp cache key."""
+        return f'{self.cache_key}.opened'
+
+    @property
+    def probe_key(self) -> str:
+        """str: Half-open probe request lock cache key."""
+        return f'{self.cache_key}.probe'
+
+    @property
+    def state(self) -> str:
+        """str: Circuit breaker state."""
+        opened = cache.get(self.opened_key)
+
+        if opened is None:
+            return CLOSED
+
+        return OPEN if time.time() - opened < self.recovery_timeout else HALF_OPEN
+
+    def acquire(self) -> float:
+        """Acquire permission to send a request to the LTI platform.
+
+        Returns:
+            0 if the request is allowed or the seconds to wait
+            until the next request is allowed.
+
+        """
+        opened = cache.get(self.opened_key)
+
+        if opened is None:
+            return 0
+
+        if (remaining := opened + self.recovery_timeout - time.time()) > 0:
+            return remaining
+
+        # Half-open state, only one process sends the probe request.
+        if cache.add(self.probe_key, True, self.recovery_timeout):
+            return 0
+
+        return self.recovery_timeout
+
+    def record_success(self):
+        """Record a successful LTI platform request and close the circuit."""
+        if self.state != CLOSED:
+            log.info(f'LTI platform circuit breaker closed: {self.log_extra}')
+
+        cache.delete_many([self.failures_key, self.opened_key, self.probe_key])
+
+    def record_failure(self):
+        """Record a failed LTI platform request.
+
+        The circuit opens if the failure threshold is reached
+        or the half-open probe request failed.
+
+        """
+        cache.add(self.failures_key, 0, STATE_TIMEOUT)
+        failures = cache.incr(self.failures_key)
+
+        if failures < self.failure_threshold and self.state == CLOSED:
+            return
+
+        cache.set(self.opened_key, time.time(), STATE_TIMEOUT)
+        cache.delete_many([self.failures_key, self.probe_key])
+        log_extra = {**self.log_extra, 'failures': failures}
+        log.warning(f'LTI platform circuit breaker opened: {log_extra}')
+
+    @property
+    def log_extra(self) -> dict:
+        """dict: Circuit breaker log extra data."""
+        return {
+            'platform_id': self.platform_id,
+            'endpoint': self.endpoint,
+            'failure_threshold': self.failure_threshold,
+            'recovery_timeout': self.recovery_timeout,
+        }
@@ -2,6 +2,7 @@
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from ddt import data, ddt
 from django.test import TestCase
 from pylti1p3.exception import LtiException
 from rest_framework.exceptions import APIException
@@ -10,11 +11,12 @@ from rest_framework.status import HTTP_400_BAD_REQUEST
 from openedx_lti_tool_plugin.deep_linking.api.tests import MODULE_PATH
 from openedx_lti_tool_plugin.deep_linking.api.v1.views import DeepLinkingViewSet
 from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
+from openedx_lti_tool_plugin.deep_linking.session import SESSION_PARAM
 
 MODULE_PATH = f'{MODULE_PATH}.views'
 
 
-@patch(f'{MODULE_PATH}.validate_deep_linking_message')
+@ddt
 @patch(f'{MODULE_PATH}.super')
 class TestDeepLinkingViewSet(TestCase):
     """Test DeepLinkingViewSet class."""
@@ -28,12 +30,8 @@ class TestDeepLinkingViewSet(TestCase):
         self.launch_id = uuid4()
         self.error_message = 'test-error-message'
 
-    def test_initial_with_valid_message(
-        self,
-        super_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-    ):
-        """Test initial method with valid DjangoMessageLaunch (happy path)."""
+    def test_initial_with_valid_session(self, super_mock: MagicMock):
+        """Test initial method with valid deep linking session (happy path)."""
         self.view_class.initial(
             self.view_self,
             self.request,
@@ -41,53 +39,25 @@ class TestDeepLinkingViewSet(TestCase):
         )
 
         super_mock.assert_called_once_with()
-        self.view_self.get_message_from_cache.assert_called_once_with(
+        self.request.query_params.get.assert_called_once_with(SESSION_PARAM)
+        self.view_self.get_deep_linking_session.assert_called_once_with(
             self.request,
             self.launch_id,
+            self.request.query_params.get(),
         )
-        validate_deep_linking_message_mock.assert_called_once_with(
-            self.view_self.get_message_from_cache(),
-        )
-        self.view_self.get_message_from_cache().get_launch_data.assert_called_once_with()
         self.assertEqual(
             self.view_self.launch_data,
-            self.view_self.get_message_from_cache().get_launch_data(),
-        )
-
-    def test_initial_with_lti_exception(
-        self,
-        super_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-    ):
-        """Test initial method with LtiException."""
-        self.view_self.get_message_from_cache.side_effect = LtiException(
-            self.error_message,
-        )
-
-        with self.assertRaises(APIException) as ctxm:
-            self.view_class.initial(
-                self.view_self,
-                self.request,
-                launch_id=self.launch_id,
-            )
-
-        self.assertEqual(self.error_message, str(ctxm.exception))
-        self.assertEqual(HTTP_400_BAD_REQUEST, ctxm.exception.detail.code)
-        super_mock.assert_called_once_with()
-        self.view_self.get_message_from_cache.assert_called_once_with(
-            self.request,
-            self.launch_id,
+            self.view_self.get_deep_linking_session().launch_data,
         )
-        validate_deep_linking_message_mock.assert_not_called()
-        self.view_self.get_message_from_cache.return_value.get_launch_data.assert_not_called()
 
-    def test_initial_with_deep_linking_exception(
+    @data(LtiException, DeepLinkingException)
+    def test_initial_with_exception(
         self,
+        exception_class: Exception,
         super_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
     ):
-        """Test initial method with DeepLinkingException."""
-        self.view_self.get_message_from_cache.side_effect = DeepLinkingException(
+        """Test initial method with LtiException or DeepLinkingException."""
+        self.view_self.get_deep_linking_session.side_effect = exception_class(
             self.error_message,
         )
 
@@ -101,9 +71,8 @@ class TestDeepLinkingViewSet(TestCase):
         self.assertEqual(self.error_message, str(ctxm.exception))
         self.assertEqual(HTTP_400_BAD_REQUEST, ctxm.exception.detail.code)
         super_mock.assert_called_once_with()
-        self.view_self.get_message_from_cache.assert_called_once_with(
+        self.view_self.get_deep_linking_session.assert_called_once_with(
             self.request,
             self.launch_id,
+            self.request.query_params.get(SESSION_PARAM),
         )
-        validate_deep_linking_message_mock.assert_not_called()
-        self.view_self.get_message_from_cache.return_value.get_launch_data.assert_not_called()
@@ -0,0 +1,110 @@
+"""Django REST Framework Filters."""
+from django.db.models import Q, QuerySet
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry
+
+
+class ContentItemFilter(BaseFilterBackend):
+    """Content Item Filter.
+
+    Filter a CourseContext QuerySet by title, course organization and
+    course run, the filters are applied by the database.
+
+    The title filter matches a title substring or a course with a
+    similar title on the deep linking search index, so the filter
+    is typo-tolerant.
+
+    Attributes:
+        title_query_param (str): Case-insensitive title query param.
+        org_query_param (str): Case-insensitive course organization query param.
+        run_query_param (str): Case-insensitive course run query param.
+
+    """
+
+    title_query_param = 'title'
+    org_query_param = 'org'
+    run_query_param = 'run'
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: APIView) -> QuerySet:
+        """Filter CourseContext QuerySet.
+
+        Args:
+            request: HTTP request object.
+            queryset: CourseContext QuerySet.
+            view: API view object.
+
+        Returns:
+            Filtered CourseContext QuerySet.
+
+        """
+        title = request.query_params.get(self.title_query_param, '').strip()
+        org = request.query_params.get(self.org_query_param, '').strip()
+        run = request.query_params.get(self.run_query_param, '').strip()
+
+        if org:
+            queryset = queryset.filter_by_orgs([org], lookup='istartswith')
+
+        if run:
+            queryset = queryset.filter(
+                Q(learning_context__context_key__iendswith=f'+{run}')
+                | Q(learning_context__context_key__iendswith=f'/{run}')
+                | Q(learning_context__context_key__icontains=f'+{run}+ccx@'),
+            )
+
+        if title:
+            queryset = queryset.filter(
+                Q(learning_context__title__icontains=title)
+                | Q(learning_context__context_key__in=ContentSearchEntry.objects.matching_course_keys(title)),
+            )
+
+        return queryset
+
+
+class ContentItemOrderingFilter(BaseFilterBackend):
+    """Content Item Ordering Filter.
+
+    Order a CourseContext QuerySet by one of the `ordering_fields`, a `-`
+    prefix orders in descending order. The course ID is always the last
+    ordering field, so the order is unique. The primary key order is kept
+    for an invalid or missing ordering.
+
+    The `org` ordering is the course ID ordering, the course ID
+    starts with the course organization.
+
+    Attributes:
+        ordering_query_param (str): Ordering query param.
+        ordering_fields (dict): Database fields of the fields allowed for ordering.
+
+    """
+
+    ordering_query_param = 'ordering'
+    ordering_fields = {
+        'title': 'learning_context__title',
+        'course_id': 'learning_context__context_key',
+        'org': 'learning_context__context_key',
+    }
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: APIView) -> QuerySet:
+        """Order CourseContext QuerySet.
+
+        Args:
+            request: HTTP request object.
+            queryset: CourseContext QuerySet.
+            view: API view object.
+
+        Returns:
+            Ordered CourseContext QuerySet.
+
+        """
+        ordering = request.query_params.get(self.ordering_query_param, '').strip()
+
+        if not (field := self.ordering_fields.get(ordering.lstrip('-'))):
+            return queryset.order_by('pk')
+
+        prefix = '-' if ordering.startswith('-') else ''
+        fields = dict.fromkeys([f'{prefix}{field}', f'{prefix}learning_context__context_key'])
+
+        return queryset.order_by(*fields)
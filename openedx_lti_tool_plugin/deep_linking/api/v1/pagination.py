@@ -1,5 +1,14 @@
 """Pagination."""
-from rest_framework.pagination import PageNumberPagination
+import json
+from collections import OrderedDict
+from typing import List, Optional
+
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
 class ContentItemPagination(PageNumberPagination):
@@ -7,3 +16,230 @@ class ContentItemPagination(PageNumberPagination):
 
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class ContentItemCursorPagination(CursorPagination):
+    """Content Item Cursor Pagination.
+
+    Keyset pagination with the QuerySet ordering, the cursor position is
+    the ordering field values of the last item of a page (or of the first
+    item for the previous page). A page is fetched with a query that seeks
+    past the position, e.g. `WHERE (title, course_id) > (position)` for an
+    ordering by title and course ID, so deep pages cost the same as the
+    first page and no `COUNT(*)` query is executed.
+
+    The QuerySet ordering must be unique, the `ordering` attribute is
+    used if the QuerySet is not ordered.
+
+    An approximate total can be requested with the `count` query param,
+    the total is only computed for the first page.
+
+    Attributes:
+        count_query_param (str): Query param that includes the total in the response.
+        count (int, optional): Total number of items or None.
+        next_position (list, optional): Cursor position of the next page.
+        previous_position (list, optional): Cursor position of the previous page.
+
+    """
+
+    ordering = 'pk'
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_query_param = 'count'
+    count = None
+    next_position = None
+    previous_position = None
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Optional[APIView] = None,
+    ) -> Optional[List]:
+        """Paginate QuerySet.
+
+        Args:
+            queryset: QuerySet to paginate.
+            request: HTTP request object.
+            view: API view object.
+
+        Returns:
+            List of page objects or None if pagination is disabled.
+
+        Raises:
+            NotFound: If the cursor is invalid.
+
+        """
+        self.count = None
+        self.next_position = None
+        self.previous_position = None
+        self.page_size = self.get_page_size(request)
+
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()  # pylint: disable=attribute-defined-outside-init
+        self.cursor = self.decode_cursor(request)  # pylint: disable=attribute-defined-outside-init
+
+        if not queryset.query.order_by:
+            queryset = queryset.order_by(self.ordering)
+
+        ordering = [str(field) for field in queryset.query.order_by]
+
+        if request.query_params.get(self.count_query_param) and not self.cursor:
+            self.count = queryset.count()
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.get_cursor_position(ordering)
+
+        if reverse:
+            queryset = queryset.reverse()
+
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(ordering, position, reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]  # pylint: disable=attribute-defined-outside-init
+
+        if reverse:
+            self.page.reverse()
+
+        has_next, has_previous = (position is not None, has_more) if reverse else (has_more, position is not None)
+
+        if self.page and has_next:
+            self.next_position = self.get_position(self.page[-1], ordering)
+
+        if self.page and has_previous:
+            self.previous_position = self.get_position(self.page[0], ordering)
+
+        return self.page
+
+    def get_cursor_position(self, ordering: List[str]) -> Optional[list]:
+        """Get the position of the request cursor.
+
+        Args:
+            ordering: QuerySet ordering fields.
+
+        Returns:
+            List of ordering field values or None if there is no cursor.
+
+        Raises:
+            NotFound: If the cursor position is invalid.
+
+        """
+        if not (self.cursor and self.cursor.position):
+            return None
+
+        try:
+            position = json.loads(self.cursor.position)
+        except ValueError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        if not isinstance(position, list) or len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    @staticmethod
+    def get_seek_filter(ordering: List[str], position: list, reverse: bool) -> Q:
+        """Get the filter of the items after a position.
+
+        The filter is a lexicographic comparison of the ordering
+        fields, e.g. `a > x OR (a = x AND b > y)`.
+
+        Args:
+            ordering: QuerySet ordering fields.
+            position: Ordering field values of the position.
+            reverse: True if the items before the position are filtered.
+
+        Returns:
+            Seek filter.
+
+        """
+        seek_filter = Q()
+        equal_filter = Q()
+
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            seek_filter |= equal_filter & Q(**{f'{name}__{lookup}': value})
+            equal_filter &= Q(**{name: value})
+
+        return seek_filter
+
+    @staticmethod
+    def get_position(instance: Model, ordering: List[str]) -> list:
+        """Get the position of an item.
+
+        Args:
+            instance: Model instance.
+            ordering: QuerySet ordering fields.
+
+        Returns:
+            List of ordering field values.
+
+        """
+        position = []
+
+        for field in ordering:
+            value = instance
+
+            for name in field.lstrip('-').split('__'):
+                value = getattr(value, name)
+
+            position.append(value if isinstance(value, (int, float)) or value is None else str(value))
+
+        return position
+
+    def get_position_link(self, position: Optional[list], reverse: bool) -> Optional[str]:
+        """Get a page link.
+
+        Args:
+            position: Cursor position or None.
+            reverse: True if the link is a previous page link.
+
+        Returns:
+            Page URL or None.
+
+        """
+        if position is None:
+            return None
+
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=json.dumps(position)))
+
+    def get_next_link(self) -> Optional[str]:
+        """Get next page link.
+
+        Returns:
+            Next page URL or None.
+
+        """
+        return self.get_position_link(self.next_position, False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Get previous page link.
+
+        Returns:
+            Previous page URL or None.
+
+        """
+        return self.get_position_link(self.previous_position, True)
+
+    def get_paginated_response(self, data: List) -> Response:
+        """Get paginated response.
+
+        Args:
+            data: Serialized page data.
+
+        Returns:
+            Response with next and previous page links, approximate count and results.
+
+        """
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('count', self.count),
+            ('results', data),
+        ]))
@@ -1,9 +1,12 @@
 """Django REST Framework Serializers."""
 from django.http.request import HttpRequest
 from django.urls import reverse
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry
+from openedx_lti_tool_plugin.deep_linking.outline import OutlineItem
 from openedx_lti_tool_plugin.models import CourseContext
 
 
@@ -20,6 +23,20 @@ class CourseContentItemSerializer(serializers.Serializer):  # pylint: disable=ab
     title = serializers.CharField(allow_blank=True)
     custom = serializers.SerializerMethodField()
 
+    @cached_property
+    def launch_url(self) -> str:
+        """str: LTI Resource Link Launch URL.
+
+        The URL is the same for every content item, it's
+        computed once for all the items of a list.
+
+        """
+        request: HttpRequest = self.context.get('request')
+
+        return request.build_absolute_uri(
+            reverse(f'{app_config.name}:1.3:resource-link:launch'),
+        )
+
     def get_url(self, *args) -> str:
         """Get Content Item URL.
 
@@ -30,11 +47,7 @@ class CourseContentItemSerializer(serializers.Serializer):  # pylint: disable=ab
             LTI Resource Link Launch URL.
 
         """
-        request: HttpRequest = self.context.get('request')
-
-        return request.build_absolute_uri(
-            reverse(f'{app_config.name}:1.3:resource-link:launch'),
-        )
+        return self.launch_url
 
     def get_custom(self, course_context: CourseContext):
         """Get Content Item Custom Parameters.
@@ -49,3 +62,56 @@ class CourseContentItemSerializer(serializers.Serializer):  # pylint: disable=ab
         return {
             'resourceId': str(course_context.course_id),
         }
+
+
+class ContentSearchItemSerializer(CourseContentItemSerializer):  # pylint: disable=abstract-method
+    """Content Search Item Serializer.
+
+    .. _LTI Deep Linking Specification - Content Item Types:
+        https://www.imsglobal.org/spec/lti-dl/v2p0#content-item-types
+
+    """
+
+    def get_custom(self, entry: ContentSearchEntry):  # pylint: disable=arguments-renamed
+        """Get Content Item Custom Parameters.
+
+        Args:
+            entry: ContentSearchEntry object.
+
+        Returns:
+            Content Item Custom Parameters.
+
+        """
+        return {
+            'resourceId': entry.resource_id,
+        }
+
+
+class OutlineSectionSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Course Outline Section Serializer."""
+
+    id = serializers.CharField(source='usage_key')
+    title = serializers.CharField(allow_blank=True)
+
+
+class OutlineContentItemSerializer(CourseContentItemSerializer):  # pylint: disable=abstract-method
+    """Course Outline Content Item Serializer.
+
+    .. _LTI Deep Linking Specification - Content Item Types:
+        https://www.imsglobal.org/spec/lti-dl/v2p0#content-item-types
+
+    """
+
+    def get_custom(self, item: OutlineItem):  # pylint: disable=arguments-renamed
+        """Get Content Item Custom Parameters.
+
+        Args:
+            item: OutlineItem tuple.
+
+        Returns:
+            Content Item Custom Parameters.
+
+        """
+        return {
+            'resourceId': item.usage_key,
+        }
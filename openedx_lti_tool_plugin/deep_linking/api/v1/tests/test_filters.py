@@ -0,0 +1,155 @@
+"""Test filters module."""
+from unittest.mock import MagicMock
+
+import ddt
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+
+from openedx_lti_tool_plugin.deep_linking.api.v1.filters import ContentItemFilter, ContentItemOrderingFilter
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry
+from openedx_lti_tool_plugin.models import CourseContext
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+
+FIRST_COURSE = ('course-v1:OrgA+Course+2024', 'Introduction to Physics')
+SECOND_COURSE = ('course-v1:OrgB+Course+2025', 'Advanced physics')
+THIRD_COURSE = ('course-v1:OrgA+Other+2025', 'Calculus')
+FOURTH_COURSE = ('OrgC/Course/2023', 'Calculus')
+COURSES = [FIRST_COURSE, SECOND_COURSE, THIRD_COURSE, FOURTH_COURSE]
+
+
+class ContentItemFilterTestMixin:
+    """Content item filter test mixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+
+        for course_id, title in COURSES:
+            CourseContextTest.objects.create(
+                learning_context=LearningContextTest.objects.create(context_key=course_id, title=title),
+            )
+
+    def get_courses(self, queryset) -> list:
+        """Get the course ID and title tuples of a CourseContext QuerySet.
+
+        Args:
+            queryset: CourseContext QuerySet.
+
+        Returns:
+            List of course ID and title tuples.
+
+        """
+        return [(str(course.course_id), course.title) for course in queryset]
+
+
+@ddt.ddt
+class TestContentItemFilter(ContentItemFilterTestMixin, TestCase):
+    """Test ContentItemFilter class."""
+
+    def test_class_attributes(self):
+        """Test class attributes."""
+        self.assertEqual(ContentItemFilter.title_query_param, 'title')
+        self.assertEqual(ContentItemFilter.org_query_param, 'org')
+        self.assertEqual(ContentItemFilter.run_query_param, 'run')
+
+    @ddt.data(
+        ({}, COURSES),
+        ({'title': 'PHYSICS'}, [FIRST_COURSE, SECOND_COURSE]),
+        ({'title': ' calc '}, [THIRD_COURSE, FOURTH_COURSE]),
+        ({'org': 'orga'}, [FIRST_COURSE, THIRD_COURSE]),
+        ({'org': 'orgc'}, [FOURTH_COURSE]),
+        ({'org': 'org'}, []),
+        ({'run': '2025'}, [SECOND_COURSE, THIRD_COURSE]),
+        ({'run': '2023'}, [FOURTH_COURSE]),
+        ({'org': 'OrgA', 'run': '2025'}, [THIRD_COURSE]),
+        ({'title': 'physics', 'run': '2025'}, [SECOND_COURSE]),
+        ({'title': 'chemistry'}, []),
+    )
+    @ddt.unpack
+    def test_filter_queryset(self, query_params: dict, expected: list):
+        """Test filter_queryset method."""
+        request = Request(RequestFactory().get('/', query_params))
+
+        self.assertEqual(
+            self.get_courses(
+                ContentItemFilter().filter_queryset(request, CourseContext.objects.order_by('pk'), MagicMock()),
+            ),
+            expected,
+        )
+
+    def test_filter_queryset_with_search_index(self):
+        """Test filter_queryset method matches a similar title on the search index."""
+        ContentSearchEntry.objects.index_course(FIRST_COURSE[0], [('', 'course', FIRST_COURSE[1])])
+        request = Request(RequestFactory().get('/', {'title': 'introductoin physcs'}))
+
+        self.assertEqual(
+            self.get_courses(ContentItemFilter().filter_queryset(request, CourseContext.objects.all(), MagicMock())),
+            [FIRST_COURSE],
+        )
+
+    def test_filter_queryset_with_query_count(self):
+        """Test filter_queryset method filters with a single query."""
+        request = Request(RequestFactory().get('/', {'title': 'physics', 'org': 'OrgA', 'run': '2024'}))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.get_courses(
+                    ContentItemFilter().filter_queryset(
+                        request,
+                        CourseContext.objects.select_related('learning_context'),
+                        MagicMock(),
+                    ),
+                ),
+                [FIRST_COURSE],
+            )
+
+
+@ddt.ddt
+class TestContentItemOrderingFilter(ContentItemFilterTestMixin, TestCase):
+    """Test ContentItemOrderingFilter class."""
+
+    def test_class_attributes(self):
+        """Test class attributes."""
+        self.assertEqual(ContentItemOrderingFilter.ordering_query_param, 'ordering')
+        self.assertEqual(
+            ContentItemOrderingFilter.ordering_fields,
+            {
+                'title': 'learning_context__title',
+                'course_id': 'learning_context__context_key',
+                'org': 'learning_context__context_key',
+            },
+        )
+
+    @ddt.data(
+        ({}, COURSES, ('pk',)),
+        ({'ordering': 'invalid'}, COURSES, ('pk',)),
+        (
+            {'ordering': 'title'},
+            [SECOND_COURSE, FOURTH_COURSE, THIRD_COURSE, FIRST_COURSE],
+            ('learning_context__title', 'learning_context__context_key'),
+        ),
+        (
+            {'ordering': '-title'},
+            [FIRST_COURSE, THIRD_COURSE, FOURTH_COURSE, SECOND_COURSE],
+            ('-learning_context__title', '-learning_context__context_key'),
+        ),
+        (
+            {'ordering': 'course_id'},
+            [FOURTH_COURSE, FIRST_COURSE, THIRD_COURSE, SECOND_COURSE],
+            ('learning_context__context_key',),
+        ),
+        (
+            {'ordering': '-org'},
+            [SECOND_COURSE, THIRD_COURSE, FIRST_COURSE, FOURTH_COURSE],
+            ('-learning_context__context_key',),
+        ),
+    )
+    @ddt.unpack
+    def test_filter_queryset(self, query_params: dict, expected: list, order_by: tuple):
+        """Test filter_queryset method."""
+        request = Request(RequestFactory().get('/', query_params))
+
+        queryset = ContentItemOrderingFilter().filter_queryset(request, CourseContext.objects.all(), MagicMock())
+
+        self.assertEqual(queryset.query.order_by, order_by)
+        self.assertEqual(self.get_courses(queryset), expected)
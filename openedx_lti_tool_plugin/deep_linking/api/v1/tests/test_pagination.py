@@ -1,10 +1,21 @@
 """Test pagination module."""
-from django.test import TestCase
+import json
+from typing import Optional
+from unittest.mock import MagicMock, patch
 
-from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemPagination
-from openedx_lti_tool_plugin.deep_linking.api.v1.tests import MODULE_PATH
+import ddt
+from django.db.models import Q
+from django.test import RequestFactory, TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
 
-MODULE_PATH = f'{MODULE_PATH}.pagination'
+from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemCursorPagination, ContentItemPagination
+from openedx_lti_tool_plugin.models import CourseContext
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+
+TITLES = ['Physics', 'Calculus', 'Calculus', 'Biology', 'Algebra']
+COURSE_IDS = [f'course-v1:org+course-{number}+run' for number in range(len(TITLES))]
 
 
 class TestContentItemPagination(TestCase):
@@ -19,3 +30,141 @@ class TestContentItemPagination(TestCase):
         """Test class attributes."""
         self.assertEqual(self.pagination_class.page_size_query_param, 'page_size')
         self.assertEqual(self.pagination_class.max_page_size, 100)
+
+
+@ddt.ddt
+class TestContentItemCursorPagination(TestCase):
+    """Test ContentItemCursorPagination class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.pagination = ContentItemCursorPagination()
+
+        for course_id, title in zip(COURSE_IDS, TITLES):
+            CourseContextTest.objects.create(
+                learning_context=LearningContextTest.objects.create(context_key=course_id, title=title),
+            )
+
+        self.queryset = CourseContext.objects.select_related('learning_context')
+
+    def paginate(self, url: str, queryset) -> list:
+        """Paginate a QuerySet with a new pagination instance.
+
+        Args:
+            url: Request URL.
+            queryset: CourseContext QuerySet.
+
+        Returns:
+            List of page course IDs.
+
+        """
+        self.pagination = ContentItemCursorPagination()
+        page = self.pagination.paginate_queryset(queryset, Request(RequestFactory().get(url)))
+
+        return [str(course_context.course_id) for course_context in page]
+
+    def get_cursor_url(self, position: Optional[str], reverse: bool = False) -> str:
+        """Get a page URL with a cursor.
+
+        Args:
+            position: Cursor position.
+            reverse: Cursor reverse flag.
+
+        Returns:
+            Page URL.
+
+        """
+        self.pagination.base_url = 'http://testserver/?page_size=2'
+
+        return self.pagination.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))
+
+    def test_class_attributes(self):
+        """Test class attributes."""
+        self.assertEqual(ContentItemCursorPagination.ordering, 'pk')
+        self.assertEqual(ContentItemCursorPagination.page_size, 25)
+        self.assertEqual(ContentItemCursorPagination.page_size_query_param, 'page_size')
+        self.assertEqual(ContentItemCursorPagination.max_page_size, 100)
+        self.assertEqual(ContentItemCursorPagination.count_query_param, 'count')
+
+    @ddt.data(
+        (
+            ('learning_context__title', 'learning_context__context_key'),
+            [COURSE_IDS[4], COURSE_IDS[3], COURSE_IDS[1], COURSE_IDS[2], COURSE_IDS[0]],
+        ),
+        (
+            ('-learning_context__title', '-learning_context__context_key'),
+            [COURSE_IDS[0], COURSE_IDS[2], COURSE_IDS[1], COURSE_IDS[3], COURSE_IDS[4]],
+        ),
+        (('pk',), COURSE_IDS),
+        ((), COURSE_IDS),
+    )
+    @ddt.unpack
+    def test_paginate_queryset(self, ordering: tuple, expected: list):
+        """Test paginate_queryset method pages forward and backward."""
+        queryset = self.queryset.order_by(*ordering)
+
+        self.assertEqual(self.paginate('/?page_size=2', queryset), expected[:2])
+        self.assertIsNone(self.pagination.get_previous_link())
+        self.assertEqual(self.paginate(self.pagination.get_next_link(), queryset), expected[2:4])
+        self.assertEqual(self.paginate(self.pagination.get_next_link(), queryset), expected[4:])
+        self.assertIsNone(self.pagination.get_next_link())
+        self.assertEqual(self.paginate(self.pagination.get_previous_link(), queryset), expected[2:4])
+        self.assertEqual(self.paginate(self.pagination.get_previous_link(), queryset), expected[:2])
+        self.assertIsNone(self.pagination.get_previous_link())
+        self.assertEqual(self.paginate(self.pagination.get_next_link(), queryset), expected[2:4])
+
+    def test_paginate_queryset_with_seek_query(self):
+        """Test paginate_queryset method fetches a page with a single seek query."""
+        queryset = self.queryset.order_by('learning_context__title', 'learning_context__context_key')
+        url = self.get_cursor_url(json.dumps(['Calculus', COURSE_IDS[1]]))
+
+        with self.assertNumQueries(1) as queries:
+            self.assertEqual(self.paginate(url, queryset), [COURSE_IDS[2], COURSE_IDS[0]])
+
+        self.assertNotIn('OFFSET', queries.captured_queries[0]['sql'])
+
+    def test_paginate_queryset_with_count(self):
+        """Test paginate_queryset method with count query param."""
+        self.paginate('/?count=true&page_size=2', self.queryset)
+
+        self.assertEqual(self.pagination.count, len(COURSE_IDS))
+
+        self.paginate(f'{self.pagination.get_next_link()}&count=true', self.queryset)
+
+        self.assertIsNone(self.pagination.count)
+
+    @ddt.data('invalid', json.dumps({}), json.dumps(['Calculus', COURSE_IDS[1], 'extra']))
+    def test_paginate_queryset_with_invalid_cursor(self, position: str):
+        """Test paginate_queryset method with an invalid cursor position."""
+        url = self.get_cursor_url(position)
+
+        with self.assertRaises(NotFound):
+            self.paginate(url, self.queryset.order_by('learning_context__title', 'learning_context__context_key'))
+
+    def test_get_seek_filter(self):
+        """Test get_seek_filter method."""
+        self.assertEqual(
+            ContentItemCursorPagination.get_seek_filter(['-title', 'course_id'], ['Title', 'course'], False),
+            Q(title__lt='Title') | (Q(title='Title') & Q(course_id__gt='course')),
+        )
+        self.assertEqual(
+            ContentItemCursorPagination.get_seek_filter(['-title', 'course_id'], ['Title', 'course'], True),
+            Q(title__gt='Title') | (Q(title='Title') & Q(course_id__lt='course')),
+        )
+
+    @patch.object(ContentItemCursorPagination, 'get_previous_link')
+    @patch.object(ContentItemCursorPagination, 'get_next_link')
+    def test_get_paginated_response(self, get_next_link_mock: MagicMock, get_previous_link_mock: MagicMock):
+        """Test get_paginated_response method."""
+        self.pagination.count = 10
+
+        self.assertEqual(
+            self.pagination.get_paginated_response(['item']).data,
+            {
+                'next': get_next_link_mock.return_value,
+                'previous': get_previous_link_mock.return_value,
+                'count': 10,
+                'results': ['item'],
+            },
+        )
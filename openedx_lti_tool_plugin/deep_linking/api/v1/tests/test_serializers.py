@@ -4,8 +4,14 @@ from unittest.mock import MagicMock, patch
 from django.test import TestCase
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
-from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import CourseContentItemSerializer
+from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import (
+    ContentSearchItemSerializer,
+    CourseContentItemSerializer,
+    OutlineContentItemSerializer,
+    OutlineSectionSerializer,
+)
 from openedx_lti_tool_plugin.deep_linking.api.v1.tests import MODULE_PATH
+from openedx_lti_tool_plugin.deep_linking.outline import OutlineItem
 
 MODULE_PATH = f'{MODULE_PATH}.serializers'
 
@@ -22,22 +28,41 @@ class TestCourseContentItemSerializer(TestCase):
         self.serializer_self = MagicMock(context={'request': self.request})
 
     @patch(f'{MODULE_PATH}.reverse')
-    def test_get_url(
+    def test_launch_url(
         self,
         reverse_mock: MagicMock,
     ):
+        """Test launch_url property."""
+        serializer = self.serializer_class(context={'request': self.request})
+
+        self.assertEqual(serializer.launch_url, self.request.build_absolute_uri.return_value)
+        self.assertEqual(serializer.launch_url, self.request.build_absolute_uri.return_value)
+        reverse_mock.assert_called_once_with(
+            f'{app_config.name}:1.3:resource-link:launch'
+        )
+        self.request.build_absolute_uri.assert_called_once_with(reverse_mock())
+
+    def test_get_url(self):
         """Test get_url method."""
         self.assertEqual(
             self.serializer_class.get_url(
                 self.serializer_self,
                 None,
             ),
-            self.request.build_absolute_uri.return_value,
-        )
-        reverse_mock.assert_called_once_with(
-            f'{app_config.name}:1.3:resource-link:launch'
+            self.serializer_self.launch_url,
         )
-        self.request.build_absolute_uri.assert_called_once_with(reverse_mock())
+
+    @patch(f'{MODULE_PATH}.reverse')
+    def test_many(self, reverse_mock: MagicMock):
+        """Test serializer with many instances computes the launch URL once."""
+        course_contexts = [MagicMock(course_id='course-v1:org+course+run', title=f'title-{i}') for i in range(3)]
+
+        data = self.serializer_class(course_contexts, many=True, context={'request': self.request}).data
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual({item['url'] for item in data}, {self.request.build_absolute_uri.return_value})
+        reverse_mock.assert_called_once()
+        self.request.build_absolute_uri.assert_called_once()
 
     def test_get_custom(self):
         """Test get_custom method."""
@@ -48,3 +73,44 @@ class TestCourseContentItemSerializer(TestCase):
             ),
             {'resourceId': str(self.course_context.course_id)},
         )
+
+
+class TestContentSearchItemSerializer(TestCase):
+    """Test ContentSearchItemSerializer class."""
+
+    def test_class_inheritance(self):
+        """Test class inheritance."""
+        self.assertTrue(issubclass(ContentSearchItemSerializer, CourseContentItemSerializer))
+
+    def test_get_custom(self):
+        """Test get_custom method."""
+        entry = MagicMock()
+
+        self.assertEqual(
+            ContentSearchItemSerializer.get_custom(MagicMock(), entry),
+            {'resourceId': entry.resource_id},
+        )
+
+
+class TestOutlineSectionSerializer(TestCase):
+    """Test OutlineSectionSerializer class."""
+
+    def test_data(self):
+        """Test serializer data."""
+        item = OutlineItem('section-id', 'chapter', 'Section', False)
+
+        self.assertEqual(OutlineSectionSerializer(item).data, {'id': 'section-id', 'title': 'Section'})
+
+
+class TestOutlineContentItemSerializer(TestCase):
+    """Test OutlineContentItemSerializer class."""
+
+    def test_class_inheritance(self):
+        """Test class inheritance."""
+        self.assertTrue(issubclass(OutlineContentItemSerializer, CourseContentItemSerializer))
+
+    def test_get_custom(self):
+        """Test get_custom method."""
+        item = OutlineItem('unit-id', 'vertical', 'Unit', True)
+
+        self.assertEqual(OutlineContentItemSerializer.get_custom(MagicMock(), item), {'resourceId': 'unit-id'})
@@ -1,10 +1,19 @@
 """Test urls module."""
 from uuid import uuid4
 
+import ddt
 from django.test import TestCase
 from django.urls import resolve, reverse
 
-from openedx_lti_tool_plugin.deep_linking.api.v1.views import CourseContentItemViewSet
+from openedx_lti_tool_plugin.deep_linking.api.v1.views import (
+    ContentSearchViewSet,
+    CourseContentItemViewSet,
+    CourseOutlineViewSet,
+)
+
+COURSE_ID = 'course-v1:org+course+run'
+SECTION_ID = 'block-v1:org+course+run+type@chapter+block@section'
+UNIT_ID = 'block-v1:org+course+run+type@vertical+block@unit'
 
 
 class TestCourseContentItemViewSetUrlPatterns(TestCase):
@@ -21,3 +30,37 @@ class TestCourseContentItemViewSetUrlPatterns(TestCase):
             ).func.cls,
             CourseContentItemViewSet,
         )
+
+
+class TestContentSearchViewSetUrlPatterns(TestCase):
+    """Test ContentSearchViewSet Django URL Configuration."""
+
+    def test_view_url(self):
+        """Test View URL."""
+        self.assertEqual(
+            resolve(
+                reverse(
+                    '1.3:deep-linking:api:v1:content-item-search',
+                    args=[uuid4()],
+                ),
+            ).func.cls,
+            ContentSearchViewSet,
+        )
+
+
+@ddt.ddt
+class TestCourseOutlineViewSetUrlPatterns(TestCase):
+    """Test CourseOutlineViewSet Django URL Configuration."""
+
+    @ddt.data(
+        ('1.3:deep-linking:api:v1:course-outline-sections', [COURSE_ID], 'sections'),
+        ('1.3:deep-linking:api:v1:course-outline-units', [COURSE_ID, SECTION_ID], 'units'),
+        ('1.3:deep-linking:api:v1:course-outline-problems', [COURSE_ID, UNIT_ID], 'problems'),
+    )
+    @ddt.unpack
+    def test_view_url(self, name: str, args: list, action: str):
+        """Test View URL."""
+        match = resolve(reverse(name, args=[uuid4(), *args]))
+
+        self.assertEqual(match.func.cls, CourseOutlineViewSet)
+        self.assertEqual(match.func.actions, {'get': action})
@@ -2,18 +2,37 @@
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import ddt
 from django.http.response import Http404
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
+from opaque_keys.edx.keys import CourseKey
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemPagination
-from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import CourseContentItemSerializer
+from openedx_lti_tool_plugin.deep_linking.api.v1.filters import ContentItemFilter, ContentItemOrderingFilter
+from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemCursorPagination, ContentItemPagination
+from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import (
+    ContentSearchItemSerializer,
+    CourseContentItemSerializer,
+    OutlineContentItemSerializer,
+    OutlineSectionSerializer,
+)
 from openedx_lti_tool_plugin.deep_linking.api.v1.tests import MODULE_PATH
-from openedx_lti_tool_plugin.deep_linking.api.v1.views import CourseContentItemViewSet
+from openedx_lti_tool_plugin.deep_linking.api.v1.views import (
+    ContentSearchViewSet,
+    CourseCatalogMixin,
+    CourseContentItemViewSet,
+    CourseOutlineViewSet,
+)
+from openedx_lti_tool_plugin.deep_linking.models import DEFAULT_SEARCH_LIMIT, ContentSearchEntry
+from openedx_lti_tool_plugin.deep_linking.outline import PROBLEMS, SECTIONS, UNITS
 from openedx_lti_tool_plugin.models import CourseContext
 from openedx_lti_tool_plugin.tests import AUD, ISS
 
 MODULE_PATH = f'{MODULE_PATH}.views'
+COURSE_KEY = 'course-v1:org+course+run'
 
 
 class TestCourseContentItemViewSet(TestCase):
@@ -35,7 +54,24 @@ class TestCourseContentItemViewSet(TestCase):
     def test_class_attributes(self):
         """Test class attributes."""
         self.assertEqual(self.view_class.serializer_class, CourseContentItemSerializer)
+        self.assertEqual(self.view_class.filter_backends, (ContentItemFilter, ContentItemOrderingFilter))
         self.assertEqual(self.view_class.pagination_class, ContentItemPagination)
+        self.assertEqual(self.view_class.cursor_pagination_class, ContentItemCursorPagination)
+
+    def test_paginator(self):
+        """Test paginator property."""
+        view = self.view_class()
+        view.request = MagicMock(query_params={})
+
+        self.assertIsInstance(view.paginator, ContentItemPagination)
+
+    def test_paginator_with_cursor_pagination(self):
+        """Test paginator property with cursor pagination mode."""
+        view = self.view_class()
+        view.request = MagicMock(query_params={'pagination': 'cursor'})
+
+        self.assertIsInstance(view.paginator, ContentItemCursorPagination)
+        self.assertIs(view.paginator, view.paginator)
 
     @patch.object(CourseContext.objects, 'all_for_lti_tool')
     @patch(f'{MODULE_PATH}.get_identity_claims')
@@ -47,16 +83,337 @@ class TestCourseContentItemViewSet(TestCase):
         """Test get_queryset method."""
         get_identity_claims_mock.return_value = ISS, AUD, None, None
 
+        queryset = all_for_lti_tool_mock.return_value.filter_by_site_orgs.return_value
+
         self.assertEqual(
             self.view_class.get_queryset(self.view_self),
-            all_for_lti_tool_mock.return_value.filter_by_site_orgs.return_value,
+            queryset.select_related.return_value.only.return_value,
         )
         get_identity_claims_mock.assert_called_once_with(self.launch_data)
         all_for_lti_tool_mock.assert_called_once_with(ISS, AUD)
         all_for_lti_tool_mock().filter_by_site_orgs.assert_called_once_with()
+        queryset.select_related.assert_called_once_with('learning_context')
+        queryset.select_related().only.assert_called_once_with(
+            'learning_context__context_key',
+            'learning_context__title',
+        )
+
+    @patch(f'{MODULE_PATH}.get_catalog_key', return_value='catalog-key')
+    @patch(f'{MODULE_PATH}.get_identity_claims')
+    def test_get_etag(self, get_identity_claims_mock: MagicMock, get_catalog_key_mock: MagicMock):
+        """Test get_etag method."""
+        get_identity_claims_mock.return_value = ISS, AUD, None, None
+        self.view_self.request = Request(RequestFactory().get('/', {'page': '2', 'ordering': 'title'}))
+        etag = self.view_class.get_etag(self.view_self)
+
+        self.assertTrue(etag.startswith('"'))
+        get_identity_claims_mock.assert_called_once_with(self.launch_data)
+        get_catalog_key_mock.assert_called_once_with(ISS, AUD, self.view_self.request.get_host())
+
+        self.view_self.request = Request(RequestFactory().get('/', {'ordering': 'title', 'page': '2'}))
+
+        self.assertEqual(self.view_class.get_etag(self.view_self), etag)
+
+        self.view_self.request = Request(RequestFactory().get('/', {'ordering': 'title', 'page': '3'}))
+
+        self.assertNotEqual(self.view_class.get_etag(self.view_self), etag)
+
+        get_catalog_key_mock.return_value = 'other-catalog-key'
+        self.view_self.request = Request(RequestFactory().get('/', {'ordering': 'title', 'page': '2'}))
+
+        self.assertNotEqual(self.view_class.get_etag(self.view_self), etag)
+
+    def test_list(self):
+        """Test list method (happy path)."""
+        serializer = self.view_self.get_serializer.return_value
+
+        self.assertEqual(
+            self.view_class.list(self.view_self, self.request),
+            self.view_self.get_paginated_response.return_value,
+        )
+        self.view_self.get_queryset.assert_called_once_with()
+        self.view_self.filter_queryset.assert_called_once_with(self.view_self.get_queryset.return_value)
+        self.view_self.paginate_queryset.assert_called_once_with(self.view_self.filter_queryset.return_value)
+        self.view_self.get_serializer.assert_called_once_with(
+            self.view_self.paginate_queryset.return_value,
+            many=True,
+        )
+        self.view_self.get_paginated_response.assert_called_once_with(serializer.data)
+        self.view_self.get_paginated_response().__setitem__.assert_called_once_with(
+            'ETag',
+            self.view_self.get_etag.return_value,
+        )
+
+    @patch(f'{MODULE_PATH}.Response')
+    def test_list_without_pagination(self, response_mock: MagicMock):
+        """Test list method without pagination."""
+        self.view_self.paginate_queryset.return_value = None
+        serializer = self.view_self.get_serializer.return_value
+
+        self.assertEqual(self.view_class.list(self.view_self, self.request), response_mock.return_value)
+        self.view_self.get_serializer.assert_called_once_with(self.view_self.filter_queryset.return_value, many=True)
+        response_mock.assert_called_once_with(serializer.data)
+        response_mock().__setitem__.assert_called_once_with('ETag', self.view_self.get_etag.return_value)
+
+    def test_list_with_matching_etag(self):
+        """Test list method with a matching If-None-Match header."""
+        self.view_self.get_etag.return_value = '"etag"'
+        request = Request(RequestFactory().get('/', HTTP_IF_NONE_MATCH='"etag"'))
+
+        response = self.view_class.list(self.view_self, request)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], '"etag"')
+        self.view_self.get_queryset.assert_not_called()
+        self.view_self.paginate_queryset.assert_not_called()
 
     @override_settings(OLTITP_ENABLE_LTI_TOOL=False)
     def test_with_lti_disabled(self):
         """Test raise 404 response when plugin is disabled."""
         with self.assertRaises(Http404):
             self.view_class.as_view({'get': 'list'})(self.request)
+
+
+@ddt.ddt
+class TestContentSearchViewSet(TestCase):
+    """Test ContentSearchViewSet class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.view_class = ContentSearchViewSet
+        self.view_self = MagicMock(search_query_param='q')
+        self.request = RequestFactory().get(
+            reverse(
+                '1.3:deep-linking:api:v1:content-item-search',
+                args=[uuid4()],
+            ),
+        )
+
+    def test_class_attributes(self):
+        """Test class attributes."""
+        self.assertTrue(issubclass(self.view_class, CourseCatalogMixin))
+        self.assertEqual(self.view_class.serializer_class, ContentSearchItemSerializer)
+        self.assertEqual(self.view_class.search_query_param, 'q')
+        self.assertEqual(self.view_class.limit_query_param, 'limit')
+        self.assertEqual(self.view_class.max_limit, 100)
+
+    @ddt.data(
+        ({}, DEFAULT_SEARCH_LIMIT),
+        ({'limit': 'invalid'}, DEFAULT_SEARCH_LIMIT),
+        ({'limit': '5'}, 5),
+        ({'limit': '0'}, 1),
+        ({'limit': '1000'}, 100),
+    )
+    @ddt.unpack
+    def test_get_limit(self, query_params: dict, expected: int):
+        """Test get_limit method."""
+        view = self.view_class()
+        view.request = MagicMock(query_params=query_params)
+
+        self.assertEqual(view.get_limit(), expected)
+
+    @patch(f'{MODULE_PATH}.Response')
+    @patch.object(ContentSearchEntry.objects, 'search')
+    def test_list(self, search_mock: MagicMock, response_mock: MagicMock):
+        """Test list method (happy path)."""
+        request = MagicMock(query_params={'q': ' physics '})
+
+        self.assertEqual(self.view_class.list(self.view_self, request), response_mock.return_value)
+        search_mock.assert_called_once_with(
+            'physics',
+            courses=self.view_self.get_queryset.return_value,
+            limit=self.view_self.get_limit.return_value,
+        )
+        self.view_self.get_serializer.assert_called_once_with(search_mock.return_value, many=True)
+        response_mock.assert_called_once_with(self.view_self.get_serializer().data)
+
+    @patch(f'{MODULE_PATH}.Response')
+    @patch.object(ContentSearchEntry.objects, 'search')
+    def test_list_without_query(self, search_mock: MagicMock, response_mock: MagicMock):
+        """Test list method without search query."""
+        request = MagicMock(query_params={})
+
+        self.assertEqual(self.view_class.list(self.view_self, request), response_mock.return_value)
+        search_mock.assert_not_called()
+        self.view_self.get_queryset.assert_not_called()
+        response_mock.assert_called_once_with([])
+
+    @override_settings(OLTITP_ENABLE_LTI_TOOL=False)
+    def test_with_lti_disabled(self):
+        """Test raise 404 response when plugin is disabled."""
+        with self.assertRaises(Http404):
+            self.view_class.as_view({'get': 'list'})(self.request)
+
+
+class TestCourseOutlineViewSet(TestCase):
+    """Test CourseOutlineViewSet class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.view_class = CourseOutlineViewSet
+        self.view_self = MagicMock()
+        self.request = MagicMock()
+        self.course_key = CourseKey.from_string(COURSE_KEY)
+        self.usage_key = self.course_key.make_usage_key('chapter', 'section')
+
+    def test_class_attributes(self):
+        """Test class attributes."""
+        self.assertTrue(issubclass(self.view_class, CourseCatalogMixin))
+        self.assertEqual(self.view_class.serializer_class, OutlineContentItemSerializer)
+
+    def test_sections(self):
+        """Test sections method."""
+        self.assertEqual(
+            self.view_class.sections(self.view_self, self.request, COURSE_KEY),
+            self.view_self.get_outline_response.return_value,
+        )
+        self.view_self.get_outline_response.assert_called_once_with(
+            self.request,
+            COURSE_KEY,
+            None,
+            SECTIONS,
+            OutlineSectionSerializer,
+        )
+
+    def test_units(self):
+        """Test units method."""
+        self.assertEqual(
+            self.view_class.units(self.view_self, self.request, COURSE_KEY, str(self.usage_key)),
+            self.view_self.get_outline_response.return_value,
+        )
+        self.view_self.get_outline_response.assert_called_once_with(
+            self.request,
+            COURSE_KEY,
+            str(self.usage_key),
+            UNITS,
+            self.view_self.get_serializer_class.return_value,
+        )
+
+    def test_problems(self):
+        """Test problems method."""
+        self.assertEqual(
+            self.view_class.problems(self.view_self, self.request, COURSE_KEY, str(self.usage_key)),
+            self.view_self.get_outline_response.return_value,
+        )
+        self.view_self.get_outline_response.assert_called_once_with(
+            self.request,
+            COURSE_KEY,
+            str(self.usage_key),
+            PROBLEMS,
+            self.view_self.get_serializer_class.return_value,
+        )
+
+    def test_get_opaque_keys(self):
+        """Test get_opaque_keys method (happy path)."""
+        self.assertEqual(
+            self.view_class.get_opaque_keys(COURSE_KEY, str(self.usage_key)),
+            (self.course_key, self.usage_key),
+        )
+        self.assertEqual(self.view_class.get_opaque_keys(COURSE_KEY, None), (self.course_key, None))
+
+    def test_get_opaque_keys_with_invalid_keys(self):
+        """Test get_opaque_keys method with invalid keys."""
+        other_usage_key = CourseKey.from_string('course-v1:org+other+run').make_usage_key('chapter', 'section')
+
+        for course_id, usage_key in [('invalid', None), (COURSE_KEY, 'invalid'), (COURSE_KEY, str(other_usage_key))]:
+            with self.subTest(course_id=course_id, usage_key=usage_key), self.assertRaises(NotFound):
+                self.view_class.get_opaque_keys(course_id, usage_key)
+
+
+@patch(f'{MODULE_PATH}.get_outline_items')
+@patch(f'{MODULE_PATH}.get_course_version', return_value='random-version')
+class TestCourseOutlineViewSetGetOutlineResponse(TestCase):
+    """Test CourseOutlineViewSet get_outline_response method."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.view_self = MagicMock()
+        self.course_key = CourseKey.from_string(COURSE_KEY)
+        self.usage_key = self.course_key.make_usage_key('chapter', 'section')
+        self.view_self.get_opaque_keys.return_value = self.course_key, self.usage_key
+        self.view_self.get_queryset().filter().exists.return_value = True
+        self.request = Request(RequestFactory().get('/'))
+        self.serializer_class = MagicMock()
+
+    def get_outline_response(self, request: Request = None) -> Response:
+        """Call get_outline_response method."""
+        return CourseOutlineViewSet.get_outline_response(
+            self.view_self,
+            request or self.request,
+            COURSE_KEY,
+            str(self.usage_key),
+            UNITS,
+            self.serializer_class,
+        )
+
+    def test_get_outline_response(self, get_course_version_mock: MagicMock, get_outline_items_mock: MagicMock):
+        """Test get_outline_response method (happy path)."""
+        response = self.get_outline_response()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, self.serializer_class.return_value.data)
+        self.assertTrue(response['ETag'])
+        self.view_self.get_opaque_keys.assert_called_once_with(COURSE_KEY, str(self.usage_key))
+        self.view_self.get_queryset().filter.assert_called_with(learning_context__context_key=self.course_key)
+        get_course_version_mock.assert_called_once_with(COURSE_KEY)
+        get_outline_items_mock.assert_called_once_with(self.course_key, self.usage_key, UNITS, 'random-version')
+        self.serializer_class.assert_called_once_with(
+            get_outline_items_mock.return_value,
+            many=True,
+            context=self.view_self.get_serializer_context.return_value,
+        )
+
+    def test_with_matching_etag(self, get_course_version_mock: MagicMock, get_outline_items_mock: MagicMock):
+        """Test get_outline_response method with a matching If-None-Match header."""
+        etag = self.get_outline_response()['ETag']
+        get_outline_items_mock.reset_mock()
+
+        response = self.get_outline_response(Request(RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag)))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        get_outline_items_mock.assert_not_called()
+
+        get_course_version_mock.return_value = 'new-version'
+
+        self.assertEqual(
+            self.get_outline_response(Request(RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag))).status_code,
+            200,
+        )
+
+    def test_without_course_in_catalog(
+        self,
+        get_course_version_mock: MagicMock,
+        get_outline_items_mock: MagicMock,
+    ):
+        """Test get_outline_response method without the course in the catalog."""
+        self.view_self.get_queryset().filter().exists.return_value = False
+
+        with self.assertRaises(NotFound):
+            self.get_outline_response()
+
+        get_course_version_mock.assert_not_called()
+        get_outline_items_mock.assert_not_called()
+
+    def test_without_course_version(self, get_course_version_mock: MagicMock, get_outline_items_mock: MagicMock):
+        """Test get_outline_response method without course version."""
+        get_course_version_mock.return_value = None
+
+        with self.assertRaises(NotFound):
+            self.get_outline_response()
+
+        get_outline_items_mock.assert_not_called()
+
+    def test_without_parent_block(
+        self,
+        get_course_version_mock: MagicMock,  # pylint: disable=unused-argument
+        get_outline_items_mock: MagicMock,
+    ):
+        """Test get_outline_response method without parent block."""
+        get_outline_items_mock.return_value = None
+
+        with self.assertRaises(NotFound):
+            self.get_outline_response()
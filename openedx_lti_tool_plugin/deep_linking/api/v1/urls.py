@@ -16,4 +16,24 @@ urlpatterns = [
         views.CourseContentItemViewSet.as_view({'get': 'list'}),
         name='course-content-item-list',
     ),
+    path(
+        '<uuid:launch_id>/content_items/search',
+        views.ContentSearchViewSet.as_view({'get': 'list'}),
+        name='content-item-search',
+    ),
+    path(
+        '<uuid:launch_id>/content_items/courses/<str:course_id>/sections',
+        views.CourseOutlineViewSet.as_view({'get': 'sections'}),
+        name='course-outline-sections',
+    ),
+    path(
+        '<uuid:launch_id>/content_items/courses/<str:course_id>/sections/<str:usage_key>/units',
+        views.CourseOutlineViewSet.as_view({'get': 'units'}),
+        name='course-outline-units',
+    ),
+    path(
+        '<uuid:launch_id>/content_items/courses/<str:course_id>/units/<str:usage_key>/problems',
+        views.CourseOutlineViewSet.as_view({'get': 'problems'}),
+        name='course-outline-problems',
+    ),
 ]
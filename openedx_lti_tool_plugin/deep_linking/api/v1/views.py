@@ -1,16 +1,73 @@
 """Django Views."""
+import hashlib
+from typing import Optional, Tuple, Type
+
 from django.db.models import QuerySet
+from django.utils.http import parse_etags, quote_etag
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from rest_framework.exceptions import NotFound
 from rest_framework.mixins import ListModelMixin
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+from rest_framework.status import HTTP_304_NOT_MODIFIED
 
-from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemPagination
-from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import CourseContentItemSerializer
+from openedx_lti_tool_plugin.deep_linking.api.v1.filters import ContentItemFilter, ContentItemOrderingFilter
+from openedx_lti_tool_plugin.deep_linking.api.v1.pagination import ContentItemCursorPagination, ContentItemPagination
+from openedx_lti_tool_plugin.deep_linking.api.v1.serializers import (
+    ContentSearchItemSerializer,
+    CourseContentItemSerializer,
+    OutlineContentItemSerializer,
+    OutlineSectionSerializer,
+)
 from openedx_lti_tool_plugin.deep_linking.api.views import DeepLinkingViewSet
+from openedx_lti_tool_plugin.deep_linking.catalog import get_catalog_key
+from openedx_lti_tool_plugin.deep_linking.models import DEFAULT_SEARCH_LIMIT, ContentSearchEntry
+from openedx_lti_tool_plugin.deep_linking.outline import (
+    PROBLEMS,
+    SECTIONS,
+    UNITS,
+    get_course_version,
+    get_outline_items,
+)
 from openedx_lti_tool_plugin.models import CourseContext
 from openedx_lti_tool_plugin.utils import get_identity_claims
 
 
+class CourseCatalogMixin:
+    """Course Catalog Mixin.
+
+    Get the courses available for the LtiTool related to the request
+    launch data and the site configuration `course_org_filter` setting.
+
+    """
+
+    def get_queryset(self) -> QuerySet:
+        """Get QuerySet.
+
+        The LearningContext is joined and only the fields used by the
+        serializer are loaded, a page is fetched with a single query.
+
+        Returns:
+            CourseContext QuerySet.
+
+        """
+        # Obtain the Issuer and Audience claim from the launch data
+        # these claims will be used by the CourseContext.all_for_lti_tool method
+        # to query the pylti1.3 LtiTool model related to this launch data.
+        iss, aud, _sub, _pii = get_identity_claims(self.launch_data)
+
+        return CourseContext.objects.all_for_lti_tool(iss, aud)\
+            .filter_by_site_orgs()\
+            .select_related('learning_context')\
+            .only('learning_context__context_key', 'learning_context__title')
+
+
 class CourseContentItemViewSet(
+    CourseCatalogMixin,
     ListModelMixin,
     DeepLinkingViewSet,
 ):
@@ -24,22 +81,273 @@ class CourseContentItemViewSet(
     available for the LtiTool related to the request launch data and the
     site configuration `course_org_filter` setting.
 
+    The list can be filtered with the `title`, `org` and `run` query params
+    and ordered with the `ordering` query param, the courses are filtered,
+    ordered and paginated by the database.
+
+    The response has an ETag of the catalog cache key and the query params, the
+    key changes when an LtiTool or LtiToolConfiguration is saved or deleted and
+    within a minute of a course being created, deleted or published, so an
+    unchanged page is answered with a 304 response.
+
+    The list is paginated by page number, a cursor pagination mode
+    can be requested with the `pagination=cursor` query param.
+
+    Attributes:
+        cursor_pagination_class (ContentItemCursorPagination): Cursor pagination class.
+
     """
 
     authentication_classes = (JwtAuthentication,)
     serializer_class = CourseContentItemSerializer
+    filter_backends = (ContentItemFilter, ContentItemOrderingFilter)
     pagination_class = ContentItemPagination
+    cursor_pagination_class = ContentItemCursorPagination
 
-    def get_queryset(self) -> QuerySet:
-        """Get QuerySet.
+    @property
+    def paginator(self) -> BasePagination:
+        """BasePagination: Paginator instance for the requested pagination mode."""
+        if not hasattr(self, '_paginator') and self.request.query_params.get('pagination') == 'cursor':
+            self._paginator = self.cursor_pagination_class()  # pylint: disable=attribute-defined-outside-init
+
+        return super().paginator
+
+    def list(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """List content items.
+
+        Args:
+            request: HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
 
         Returns:
-            CourseContext QuerySet.
+            Content item list response.
+
+        """
+        etag = self.get_etag()
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if (page := self.paginate_queryset(queryset)) is not None:
+            response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        else:
+            response = Response(self.get_serializer(queryset, many=True).data)
+
+        response['ETag'] = etag
+
+        return response
+
+    def get_etag(self) -> str:
+        """Get the content item list ETag.
+
+        Returns:
+            ETag of the catalog cache key and the request query params.
 
         """
-        # Obtain the Issuer and Audience claim from the launch data
-        # these claims will be used by the CourseContext.all_for_lti_tool method
-        # to query the pylti1.3 LtiTool model related to this launch data.
         iss, aud, _sub, _pii = get_identity_claims(self.launch_data)
+        key = get_catalog_key(iss, aud, self.request.get_host())
+        query = sorted(self.request.query_params.lists())
+
+        return quote_etag(hashlib.md5(f'{key}:{query}'.encode('utf-8')).hexdigest())
+
+
+class ContentSearchViewSet(
+    CourseCatalogMixin,
+    ListModelMixin,
+    DeepLinkingViewSet,
+):
+    """Content Search ViewSet.
+
+    This ViewSet returns a list of LTI Resource Link content items for the
+    courses, units and problems with a title matching the `q` query param,
+    the search is limited to the courses of the LtiTool and site catalog.
+
+    The results are ordered by relevance and limited by the `limit` query param.
+
+    Attributes:
+        search_query_param (str): Search query param.
+        limit_query_param (str): Search results limit query param.
+        max_limit (int): Maximum search results limit.
+
+    """
+
+    authentication_classes = (JwtAuthentication,)
+    serializer_class = ContentSearchItemSerializer
+    search_query_param = 'q'
+    limit_query_param = 'limit'
+    max_limit = 100
+
+    def get_limit(self) -> int:
+        """Get search results limit.
+
+        Returns:
+            Search results limit query param value or DEFAULT_SEARCH_LIMIT.
+
+        """
+        try:
+            return min(max(int(self.request.query_params[self.limit_query_param]), 1), self.max_limit)
+        except (KeyError, ValueError):
+            return DEFAULT_SEARCH_LIMIT
+
+    def list(self, request: Request, *args: tuple, **kwargs: dict) -> Response:
+        """Search content items.
+
+        Args:
+            request: HTTP request object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Content item search results response.
+
+        """
+        if not (query := request.query_params.get(self.search_query_param, '').strip()):
+            return Response([])
+
+        entries = ContentSearchEntry.objects.search(
+            query,
+            courses=self.get_queryset(),
+            limit=self.get_limit(),
+        )
+
+        return Response(self.get_serializer(entries, many=True).data)
+
+
+class CourseOutlineViewSet(
+    CourseCatalogMixin,
+    DeepLinkingViewSet,
+):
+    """Course Outline ViewSet.
+
+    This ViewSet returns a level of a course outline: the sections of a
+    course, the units of a section or the gradable problems of a unit,
+    units and problems are returned as LTI Resource Link content items.
+
+    Each level is loaded lazily from the cached course outline, the
+    response has an ETag of the course published version so an
+    unchanged level is answered with a 304 response.
+
+    """
+
+    authentication_classes = (JwtAuthentication,)
+    serializer_class = OutlineContentItemSerializer
+
+    def sections(self, request: Request, course_id: str, **kwargs: dict) -> Response:
+        """List course sections.
+
+        Args:
+            request: HTTP request object.
+            course_id: Course ID string.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Course sections response.
+
+        """
+        return self.get_outline_response(request, course_id, None, SECTIONS, OutlineSectionSerializer)
+
+    def units(self, request: Request, course_id: str, usage_key: str, **kwargs: dict) -> Response:
+        """List section units.
+
+        Args:
+            request: HTTP request object.
+            course_id: Course ID string.
+            usage_key: Section usage key string.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Section units content items response.
+
+        """
+        return self.get_outline_response(request, course_id, usage_key, UNITS, self.get_serializer_class())
+
+    def problems(self, request: Request, course_id: str, usage_key: str, **kwargs: dict) -> Response:
+        """List unit gradable problems.
+
+        Args:
+            request: HTTP request object.
+            course_id: Course ID string.
+            usage_key: Unit usage key string.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Unit problems content items response.
+
+        """
+        return self.get_outline_response(request, course_id, usage_key, PROBLEMS, self.get_serializer_class())
+
+    def get_outline_response(
+        self,
+        request: Request,
+        course_id: str,
+        usage_key: Optional[str],
+        level: str,
+        serializer_class: Type[Serializer],
+    ) -> Response:
+        """Get course outline level response.
+
+        Args:
+            request: HTTP request object.
+            course_id: Course ID string.
+            usage_key: Parent block usage key string or None.
+            level: Outline level.
+            serializer_class: Outline item serializer class.
+
+        Returns:
+            Outline level response or 304 response if the ETag matches.
+
+        Raises:
+            NotFound: If the course is not available for the LtiTool and site,
+                the course has no outline or the parent block doesn't exist.
+
+        """
+        course_key, parent_key = self.get_opaque_keys(course_id, usage_key)
+
+        if not self.get_queryset().filter(learning_context__context_key=course_key).exists():
+            raise NotFound()
+
+        if not (version := get_course_version(str(course_key))):
+            raise NotFound()
+
+        etag = quote_etag(
+            hashlib.md5(f'{version}:{request.get_host()}:{parent_key}:{level}'.encode('utf-8')).hexdigest(),
+        )
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        if (items := get_outline_items(course_key, parent_key, level, version)) is None:
+            raise NotFound()
+
+        serializer = serializer_class(items, many=True, context=self.get_serializer_context())
+
+        return Response(serializer.data, headers={'ETag': etag})
+
+    @staticmethod
+    def get_opaque_keys(course_id: str, usage_key: Optional[str]) -> Tuple[CourseKey, Optional[UsageKey]]:
+        """Get course and parent block opaque keys.
+
+        Args:
+            course_id: Course ID string.
+            usage_key: Parent block usage key string or None.
+
+        Returns:
+            Course key and parent block usage key or None.
+
+        Raises:
+            NotFound: If a key is invalid or the block is not from the course.
+
+        """
+        try:
+            course_key = CourseKey.from_string(course_id)
+            parent_key = UsageKey.from_string(usage_key) if usage_key else None
+        except InvalidKeyError as exc:
+            raise NotFound() from exc
+
+        if parent_key and parent_key.course_key != course_key:
+            raise NotFound()
 
-        return CourseContext.objects.all_for_lti_tool(iss, aud).filter_by_site_orgs()
+        return course_key, parent_key
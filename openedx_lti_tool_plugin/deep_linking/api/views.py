@@ -7,13 +7,14 @@ from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework.viewsets import GenericViewSet
 
 from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
-from openedx_lti_tool_plugin.deep_linking.utils import validate_deep_linking_message
+from openedx_lti_tool_plugin.deep_linking.session import SESSION_PARAM, DeepLinkingSessionMixin
 from openedx_lti_tool_plugin.mixins import LTIToolMixin
 from openedx_lti_tool_plugin.views import requires_openedx_lti_tool_plugin_enabled
 
 
 @method_decorator(requires_openedx_lti_tool_plugin_enabled, name='dispatch')
 class DeepLinkingViewSet(
+    DeepLinkingSessionMixin,
     LTIToolMixin,
     GenericViewSet,
 ):
@@ -30,8 +31,9 @@ class DeepLinkingViewSet(
         """
         Override APIView initial method.
 
-        This method will try to obtain the launch data using the launch ID
-        found in the kwargs and add it to the launch_data attribute.
+        This method will try to obtain the launch data from the deep linking
+        session token query param, or the cached launch message of the launch
+        ID found in the kwargs, and add it to the launch_data attribute.
 
         Args:
             request: HTTP request object.
@@ -39,16 +41,18 @@ class DeepLinkingViewSet(
             **kwargs: Arbitrary keyword arguments.
 
         Raises:
-            APIException: If there is no DjangoMessageLaunch found in the cache
-                for the launch ID found in the request kwargs, or the launch data
-                if invalid.
+            APIException: If the session token is invalid, or there is no
+                DjangoMessageLaunch found in the cache for the launch ID found
+                in the request kwargs, or the launch data is invalid.
 
         """
         super().initial(request, *args, **kwargs)
 
         try:
-            message = self.get_message_from_cache(request, kwargs.get('launch_id', ''))
-            validate_deep_linking_message(message)
-            self.launch_data = message.get_launch_data()
+            self.launch_data = self.get_deep_linking_session(
+                request,
+                kwargs.get('launch_id', ''),
+                request.query_params.get(SESSION_PARAM),
+            ).launch_data
         except (LtiException, DeepLinkingException) as exc:
             raise APIException(exc, code=HTTP_400_BAD_REQUEST) from exc
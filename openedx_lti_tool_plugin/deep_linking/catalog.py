@@ -0,0 +1,103 @@
+"""Deep linking content item catalog.
+
+The content items are served from the CourseContext table, only
+the catalog version is cached to validate the content item ETags.
+
+Attributes:
+    CATALOG_VERSION_KEY (str): Catalog version cache key.
+    COURSES_VERSION_KEY (str): Courses version cache key.
+    COURSES_VERSION_TIMEOUT (int): Courses version cache timeout in seconds.
+
+"""
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.models import CourseContext
+from openedx_lti_tool_plugin.snapshot import get_settings_snapshot
+
+CATALOG_VERSION_KEY = f'{app_config.name}.deep_linking.catalog.version'
+COURSES_VERSION_KEY = f'{app_config.name}.deep_linking.catalog.courses_version'
+COURSES_VERSION_TIMEOUT = 60
+
+
+def get_catalog_version() -> str:
+    """Get the content item catalog version.
+
+    Returns:
+        Current catalog version.
+
+    """
+    return cache.get_or_set(CATALOG_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def invalidate_catalog():
+    """Invalidate every content item catalog.
+
+    A new catalog version is set, the content item ETags
+    of the previous version no longer match.
+
+    """
+    cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_courses_version() -> str:
+    """Get the courses version.
+
+    The learning_sequences tables are written by the CMS when a course
+    is published, the version is obtained from the number of courses,
+    the last course primary key and the last course publish datetime,
+    so a created, deleted or published course changes the version.
+    The version is cached for COURSES_VERSION_TIMEOUT seconds.
+
+    Returns:
+        Current courses version.
+
+    """
+    def get_version() -> str:
+        aggregate = CourseContext.objects.aggregate(
+            count=Count('pk'),
+            last_pk=Max('pk'),
+            published_at=Max('learning_context__published_at'),
+        )
+
+        return ':'.join(str(aggregate[name]) for name in ('count', 'last_pk', 'published_at'))
+
+    return cache.get_or_set(COURSES_VERSION_KEY, get_version, COURSES_VERSION_TIMEOUT)
+
+
+def get_catalog_key(iss: str, aud: str, site: str) -> str:
+    """Get the content item catalog cache key.
+
+    The key changes with the catalog version, the courses version, the
+    LtiTool, the site, the site configuration orgs and the
+    COURSE_ACCESS_CONFIGURATION switch state, so a change
+    of any of them changes the key.
+
+    Args:
+        iss: Issuer claim.
+        aud: Audience claim.
+        site: Site domain.
+
+    Returns:
+        Catalog cache key.
+
+    """
+    snapshot = get_settings_snapshot()
+    values = [
+        get_catalog_version(),
+        get_courses_version(),
+        iss,
+        aud,
+        site,
+        str(snapshot.course_access_configuration),
+        *sorted(snapshot.site_orgs),
+    ]
+
+    return (
+        f'{app_config.name}.deep_linking.catalog.'
+        f'{hashlib.md5(":".join(values).encode("utf-8")).hexdigest()}'
+    )
@@ -33,7 +33,7 @@ class DeepLinkingForm(forms.Form):
 
     content_items = forms.JSONField(
         required=False,
-        validators=[JSONSchemaValidator(CONTENT_ITEMS_SCHEMA)],
+        validators=[JSONSchemaValidator(CONTENT_ITEMS_SCHEMA, all_errors=True)],
     )
 
     def clean(self) -> dict:
@@ -0,0 +1,211 @@
+"""Django Models.
+
+Attributes:
+    DEFAULT_SEARCH_LIMIT (int): Default number of search results.
+    SEARCH_SIMILARITY (float): Minimum fraction of query trigrams a search result matches.
+
+"""
+import math
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import models, transaction
+from django.db.models import Count, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+from openedx_lti_tool_plugin.deep_linking.utils import get_trigrams
+
+DEFAULT_SEARCH_LIMIT = 20
+SEARCH_SIMILARITY = 0.5
+
+
+class ContentSearchEntryQuerySet(models.QuerySet):
+    """ContentSearchEntry QuerySet."""
+
+    def search(
+        self,
+        query: str,
+        courses: Optional[QuerySet] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List['ContentSearchEntry']:
+        """Search entries by title.
+
+        The search is typo-tolerant, an entry matches if its title has at
+        least SEARCH_SIMILARITY of the query trigrams. The entries are ranked
+        by the number of matching trigrams, the ranking is done by the
+        database with the ContentSearchTrigram (trigram, entry) index.
+
+        The courses are filtered with a subquery of the CourseContext
+        table, so the course IDs are not sent on the search query.
+
+        Args:
+            query: Search query.
+            courses: CourseContext QuerySet the search is limited to.
+            limit: Maximum number of results.
+
+        Returns:
+            List of ContentSearchEntry objects ordered by relevance.
+
+        """
+        trigrams = get_trigrams(query)
+
+        if not trigrams or limit <= 0:
+            return []
+
+        matches = ContentSearchTrigram.objects.filter(trigram__in=trigrams)
+
+        if courses is not None:
+            matches = matches.filter(
+                entry__context_key__in=courses.values('learning_context__context_key'),
+            )
+
+        ranking = list(
+            matches.values('entry_id')
+            .annotate(matches=Count('entry_id'))
+            .filter(matches__gte=math.ceil(len(trigrams) * SEARCH_SIMILARITY))
+            .order_by('-matches', 'entry_id')
+            .values_list('entry_id', flat=True)[:limit]
+        )
+        entries = self.in_bulk(ranking)
+
+        return [entries[entry_id] for entry_id in ranking if entry_id in entries]
+
+    def matching_course_keys(self, query: str) -> QuerySet:
+        """Get the course keys of the course entries matching a query.
+
+        A course entry matches if its title has at least SEARCH_SIMILARITY
+        of the query trigrams, the result is a QuerySet that can be used
+        as a subquery of a course filter.
+
+        Args:
+            query: Search query.
+
+        Returns:
+            QuerySet of matching course keys.
+
+        """
+        if not (trigrams := get_trigrams(query)):
+            return self.none().values('context_key')
+
+        return ContentSearchTrigram.objects.filter(trigram__in=trigrams, entry__usage_key='')\
+            .values('entry__context_key')\
+            .annotate(matches=Count('entry_id'))\
+            .filter(matches__gte=math.ceil(len(trigrams) * SEARCH_SIMILARITY))\
+            .values('entry__context_key')
+
+
+class ContentSearchEntryManager(models.Manager.from_queryset(ContentSearchEntryQuerySet)):
+    """ContentSearchEntry Manager."""
+
+    @transaction.atomic
+    def index_course(
+        self,
+        context_key: str,
+        entries: Iterable[Tuple[str, str, str]],
+        published_version: str = '',
+    ):
+        """Replace the search entries of a course.
+
+        Args:
+            context_key: Course ID string.
+            entries: Usage key string, block type and title tuples,
+                the usage key is an empty string for the course entry.
+            published_version: Indexed course published version.
+
+        """
+        self.filter(context_key=context_key).delete()
+        self.bulk_create([
+            self.model(
+                context_key=context_key,
+                usage_key=usage_key,
+                block_type=block_type,
+                title=title[:255],
+                published_version=published_version,
+            )
+            for usage_key, block_type, title in entries
+        ])
+        ContentSearchTrigram.objects.bulk_create([
+            ContentSearchTrigram(entry_id=entry_id, trigram=trigram)
+            for entry_id, title in self.filter(context_key=context_key).values_list('id', 'title')
+            for trigram in get_trigrams(title)
+        ])
+
+
+class ContentSearchEntry(models.Model):
+    """Deep Linking Content Search Entry.
+
+    This model represents a course or block of the deep linking search index.
+
+    """
+
+    context_key = models.CharField(
+        max_length=255,
+        db_index=True,
+        verbose_name=_('Context Key'),
+        help_text=_('Course ID of the entry.'),
+    )
+    usage_key = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_('Usage Key'),
+        help_text=_('Usage key of the block, empty for a course entry.'),
+    )
+    block_type = models.CharField(
+        max_length=64,
+        verbose_name=_('Block Type'),
+    )
+    title = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_('Title'),
+    )
+    published_version = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_('Published Version'),
+        help_text=_('Course published version of the indexed entry.'),
+    )
+
+    objects = ContentSearchEntryManager()
+
+    class Meta:
+        """Model metadata options."""
+
+        verbose_name = 'content search entry'
+        verbose_name_plural = 'content search entries'
+
+    def __str__(self) -> str:
+        """Get a string representation of this model instance."""
+        return f'<ContentSearchEntry, ID: {self.id}>'
+
+    @property
+    def resource_id(self) -> str:
+        """str: Resource link launch resource ID."""
+        return self.usage_key or self.context_key
+
+
+class ContentSearchTrigram(models.Model):
+    """Deep Linking Content Search Trigram.
+
+    This model represents a trigram of a ContentSearchEntry title.
+
+    """
+
+    entry = models.ForeignKey(
+        ContentSearchEntry,
+        on_delete=models.CASCADE,
+        related_name='trigrams',
+    )
+    trigram = models.CharField(max_length=3)
+
+    class Meta:
+        """Model metadata options."""
+
+        verbose_name = 'content search trigram'
+        verbose_name_plural = 'content search trigrams'
+        indexes = [
+            models.Index(fields=['trigram', 'entry'], name='content_search_trigram'),
+        ]
+
+    def __str__(self) -> str:
+        """Get a string representation of this model instance."""
+        return f'<ContentSearchTrigram, ID: {self.id}>'
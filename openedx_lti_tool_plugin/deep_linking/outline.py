@@ -0,0 +1,153 @@
+"""Deep linking course outline.
+
+Attributes:
+    OUTLINE_TIMEOUT (int): Course outline level cache timeout in seconds.
+    SECTIONS (str): Course sections outline level.
+    UNITS (str): Section units outline level.
+    PROBLEMS (str): Unit gradable problems outline level.
+    OUTLINE_LEVELS (dict): Block predicate of each outline level.
+
+"""
+import hashlib
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional
+
+from django.core.cache import cache
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.edxapp_wrapper.block_structure_module import get_course_in_cache
+from openedx_lti_tool_plugin.models import CourseContext
+
+OUTLINE_TIMEOUT = 60 * 60 * 24
+SECTIONS = 'sections'
+UNITS = 'units'
+PROBLEMS = 'problems'
+OutlineItem = namedtuple('OutlineItem', ['usage_key', 'block_type', 'title', 'graded'])
+
+
+def is_section(blocks: Any, usage_key: UsageKey) -> bool:  # pylint: disable=unused-argument
+    """Check if a block is a course section.
+
+    Args:
+        blocks: Course BlockStructure.
+        usage_key: Block usage key.
+
+    Returns:
+        True if the block is a chapter.
+
+    """
+    return usage_key.block_type == 'chapter'
+
+
+def is_unit(blocks: Any, usage_key: UsageKey) -> bool:  # pylint: disable=unused-argument
+    """Check if a block is a unit.
+
+    Args:
+        blocks: Course BlockStructure.
+        usage_key: Block usage key.
+
+    Returns:
+        True if the block is a vertical.
+
+    """
+    return usage_key.block_type == 'vertical'
+
+
+def is_gradable(blocks: Any, usage_key: UsageKey) -> bool:
+    """Check if a block is a gradable problem.
+
+    Args:
+        blocks: Course BlockStructure.
+        usage_key: Block usage key.
+
+    Returns:
+        True if the block is a problem or has a score.
+
+    """
+    return usage_key.block_type == 'problem' or bool(blocks.get_xblock_field(usage_key, 'has_score', False))
+
+
+OUTLINE_LEVELS: Dict[str, Callable[[Any, UsageKey], bool]] = {
+    SECTIONS: is_section,
+    UNITS: is_unit,
+    PROBLEMS: is_gradable,
+}
+
+
+def get_course_version(course_id: str) -> Optional[str]:
+    """Get the published version of a course.
+
+    Args:
+        course_id: Course ID string.
+
+    Returns:
+        Course published version or None if the course has no outline.
+
+    """
+    return CourseContext.objects.filter(learning_context__context_key=course_id)\
+        .values_list('learning_context__published_version', flat=True)\
+        .first()
+
+
+def get_outline_items(
+    course_key: CourseKey,
+    parent_key: Optional[UsageKey],
+    level: str,
+    version: str,
+) -> Optional[List[OutlineItem]]:
+    """Get the outline items of a course block.
+
+    The blocks are obtained from the cached course BlockStructure, the
+    descendants of the parent block are walked in course order and the
+    blocks matching the outline level are returned without their descendants.
+
+    The items of each block and level are cached for the course published
+    version, browsing the outline doesn't load the BlockStructure again
+    until the course is published.
+
+    Args:
+        course_key: Course key.
+        parent_key: Parent block usage key, None for the course root block.
+        level: Outline level (SECTIONS, UNITS or PROBLEMS).
+        version: Course published version.
+
+    Returns:
+        List of OutlineItem tuples or None if the parent block doesn't exist.
+
+    """
+    cache_key = (
+        f'{app_config.name}.deep_linking.outline.'
+        f'{hashlib.md5(f"{course_key}:{version}:{parent_key}:{level}".encode("utf-8")).hexdigest()}'
+    )
+
+    if (items := cache.get(cache_key)) is not None:
+        return [OutlineItem(*item) for item in items]
+
+    blocks = get_course_in_cache(course_key)
+    parent_key = parent_key or blocks.root_block_usage_key
+
+    if parent_key not in blocks:
+        return None
+
+    is_match = OUTLINE_LEVELS[level]
+    items = []
+    pending = list(reversed(blocks.get_children(parent_key)))
+
+    while pending:
+        usage_key = pending.pop()
+
+        if not is_match(blocks, usage_key):
+            pending.extend(reversed(blocks.get_children(usage_key)))
+            continue
+
+        items.append(OutlineItem(
+            str(usage_key),
+            usage_key.block_type,
+            blocks.get_xblock_field(usage_key, 'display_name') or usage_key.block_type,
+            bool(blocks.get_xblock_field(usage_key, 'graded', False)),
+        ))
+
+    cache.set(cache_key, [tuple(item) for item in items], OUTLINE_TIMEOUT)
+
+    return items
@@ -0,0 +1,145 @@
+"""Deep linking content search index.
+
+The LMS doesn't receive the course publish signals, the CMS writes the
+learning_sequences LearningContext of a published course with a new
+published version. A course is stale if its published version differs
+from the version stored on its search entries, the stale courses are
+reindexed by the update_stale_search_indexes task or the
+build_deep_linking_search_index command `--stale` option.
+
+A course deleted from the LMS has no LearningContext, the search
+entries of the deleted courses are also removed by them.
+
+Attributes:
+    SEARCH_BLOCK_TYPES (tuple): Block types added to the search index.
+
+"""
+import logging
+from typing import List, Tuple
+
+from django.db.models import F, OuterRef, Q, Subquery
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry
+from openedx_lti_tool_plugin.edxapp_wrapper.modulestore_module import modulestore
+from openedx_lti_tool_plugin.models import CourseContext
+
+log = logging.getLogger(__name__)
+SEARCH_BLOCK_TYPES = ('vertical', 'problem')
+
+
+def get_course_entries(course_key: CourseKey) -> List[Tuple[str, str, str]]:
+    """Get the search entries of a course.
+
+    Args:
+        course_key: Course key.
+
+    Returns:
+        Usage key string, block type and title tuples of the course
+        and its SEARCH_BLOCK_TYPES blocks, an empty list if the
+        course doesn't exist.
+
+    """
+    store = modulestore()
+
+    if not (course := store.get_course(course_key, depth=0)):
+        return []
+
+    entries = [('', 'course', course.display_name_with_default)]
+
+    for block_type in SEARCH_BLOCK_TYPES:
+        entries.extend(
+            (str(block.location), block_type, block.display_name_with_default)
+            for block in store.get_items(course_key, qualifiers={'category': block_type})
+        )
+
+    return entries
+
+
+def get_published_version(course_key: CourseKey) -> str:
+    """Get the published version of a course.
+
+    Args:
+        course_key: Course key.
+
+    Returns:
+        LearningContext published version, an empty
+        string if the course doesn't exist.
+
+    """
+    return CourseContext.objects\
+        .filter(learning_context__context_key=course_key)\
+        .values_list('learning_context__published_version', flat=True)\
+        .first() or ''
+
+
+def get_stale_course_ids() -> List[str]:
+    """Get the course IDs with a stale search index.
+
+    The indexed version of each course is obtained from its course
+    search entry with a subquery, a course without a course search
+    entry or with a different published version is stale.
+
+    Returns:
+        List of course ID strings.
+
+    """
+    indexed_version = ContentSearchEntry.objects.filter(
+        context_key=OuterRef('learning_context__context_key'),
+        usage_key='',
+    ).values('published_version')[:1]
+
+    return [
+        str(course_id)
+        for course_id in CourseContext.objects
+        .annotate(indexed_version=Subquery(indexed_version))
+        .filter(
+            Q(indexed_version__isnull=True)
+            | ~Q(indexed_version=F('learning_context__published_version')),
+        )
+        .order_by('pk')
+        .values_list('learning_context__context_key', flat=True)
+    ]
+
+
+def delete_orphan_search_entries() -> int:
+    """Delete the search entries of the courses that no longer exist.
+
+    The course IDs are filtered with a subquery of the CourseContext
+    table, the trigrams of the entries are deleted on cascade.
+
+    Returns:
+        Number of deleted search entries.
+
+    """
+    _deleted, deleted_by_model = ContentSearchEntry.objects.exclude(
+        context_key__in=CourseContext.objects.values('learning_context__context_key'),
+    ).delete()
+    deleted = deleted_by_model.get(ContentSearchEntry._meta.label, 0)
+    log_extra = {'entries': deleted}
+    log.info(f'Deep linking search orphan entries deleted: {log_extra}')
+
+    return deleted
+
+
+def update_search_index(course_id: str) -> int:
+    """Update the search index of a course.
+
+    The published version is obtained before the course entries, a
+    course published while it's indexed is stale on the next check.
+
+    Args:
+        course_id: Course ID string.
+
+    Returns:
+        Number of indexed entries.
+
+    """
+    course_key = CourseKey.from_string(course_id)
+    published_version = get_published_version(course_key)
+    entries = get_course_entries(course_key)
+    ContentSearchEntry.objects.index_course(course_id, entries, published_version)
+    log_extra = {'course_id': course_id, 'entries': len(entries), 'published_version': published_version}
+    log.info(f'Deep linking search index updated: {log_extra}')
+
+    return len(entries)
@@ -0,0 +1,179 @@
+"""Deep linking session token.
+
+Attributes:
+    SESSION_PARAM (str): Session token query param and form field name.
+    SESSION_SALT (str): Session token signature salt.
+    SESSION_MAX_AGE (int): Session token maximum age in seconds.
+    DEPLOYMENT_ID_CLAIM (str): LTI deployment ID claim.
+    DEEP_LINKING_SETTINGS_CLAIM (str): LTI deep linking settings claim.
+    SESSION_CLAIMS (tuple): Launch data claims stored in the session token.
+
+"""
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from django.core import signing
+from django.http.request import HttpRequest
+from django.utils.translation import gettext as _
+from pylti1p3.contrib.django import DjangoDbToolConf
+from pylti1p3.deep_link import DeepLink
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
+from openedx_lti_tool_plugin.deep_linking.utils import validate_deep_linking_message
+from openedx_lti_tool_plugin.message_launch import LtiMessageLaunch
+from openedx_lti_tool_plugin.utils import get_client_id
+
+SESSION_PARAM = 'session'
+SESSION_SALT = f'{app_config.name}.deep_linking.session'
+SESSION_MAX_AGE = 60 * 60
+DEPLOYMENT_ID_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/deployment_id'
+DEEP_LINKING_SETTINGS_CLAIM = 'https://purl.imsglobal.org/spec/lti-dl/claim/deep_linking_settings'
+SESSION_CLAIMS = ('iss', 'aud', 'azp', 'sub', DEPLOYMENT_ID_CLAIM, DEEP_LINKING_SETTINGS_CLAIM)
+
+
+class DeepLinkingSession:
+    """Deep Linking Session.
+
+    The claims of a validated LtiDeepLinkingRequest message needed by the
+    deep linking form and API, stored on a signed and expiring token.
+
+    The token is verified with the Django SECRET_KEY, the deep linking
+    requests after the launch don't restore the launch message from the
+    cache and can be handled by any LMS node.
+
+    """
+
+    def __init__(self, launch_id: str, launch_data: dict):
+        """Initialize class instance.
+
+        Args:
+            launch_id: Launch ID UUID4 string.
+            launch_data: Launch data dictionary.
+
+        """
+        self.launch_id = str(launch_id)
+        self.launch_data = {claim: launch_data[claim] for claim in SESSION_CLAIMS if claim in launch_data}
+
+    @classmethod
+    def from_message(cls, launch_id: str, message: LtiMessageLaunch) -> DeepLinkingSession:
+        """Create a session from a validated launch message.
+
+        Args:
+            launch_id: Launch ID UUID4 string.
+            message: LtiMessageLaunch object.
+
+        Returns:
+            DeepLinkingSession instance.
+
+        """
+        return cls(launch_id, message.get_launch_data())
+
+    @classmethod
+    def loads(cls, token: str, launch_id: str) -> DeepLinkingSession:
+        """Create a session from a session token.
+
+        Args:
+            token: Session token.
+            launch_id: Launch ID UUID4 string.
+
+        Returns:
+            DeepLinkingSession instance.
+
+        Raises:
+            DeepLinkingException: If the token is invalid, expired
+                or from another launch.
+
+        """
+        try:
+            data = signing.loads(token, salt=SESSION_SALT, max_age=SESSION_MAX_AGE)
+        except signing.SignatureExpired as exc:
+            raise DeepLinkingException(_('Deep linking session expired.')) from exc
+        except signing.BadSignature as exc:
+            raise DeepLinkingException(_('Invalid deep linking session.')) from exc
+
+        if data.get('launch_id') != str(launch_id):
+            raise DeepLinkingException(_('Invalid deep linking session.'))
+
+        return cls(data['launch_id'], data.get('launch_data', {}))
+
+    def dumps(self) -> str:
+        """Get the session token.
+
+        Returns:
+            Signed session token.
+
+        """
+        return signing.dumps(
+            {'launch_id': self.launch_id, 'launch_data': self.launch_data},
+            salt=SESSION_SALT,
+            compress=True,
+        )
+
+    def get_deep_link(self, tool_config: DjangoDbToolConf) -> DeepLink:
+        """Get the pylti1.3 DeepLink of the session.
+
+        Args:
+            tool_config: pylti1.3 Tool Configuration.
+
+        Returns:
+            pylti1.3 DeepLink object.
+
+        Raises:
+            DeepLinkingException: If the deep linking settings claim is missing.
+            LtiException: If the LtiTool is not found.
+
+        """
+        if not (deep_linking_settings := self.launch_data.get(DEEP_LINKING_SETTINGS_CLAIM)):
+            raise DeepLinkingException(_('Deep linking settings claim is missing.'))
+
+        return DeepLink(
+            tool_config.find_registration_by_params(
+                self.launch_data.get('iss'),
+                get_client_id(self.launch_data.get('aud'), self.launch_data.get('azp')),
+            ),
+            self.launch_data.get(DEPLOYMENT_ID_CLAIM),
+            deep_linking_settings,
+        )
+
+
+class DeepLinkingSessionMixin:
+    """Deep Linking Session Mixin.
+
+    This mixin requires the LTIToolMixin.get_message_from_cache method.
+
+    """
+
+    def get_deep_linking_session(
+        self,
+        request: HttpRequest,
+        launch_id: UUID,
+        token: Optional[str] = None,
+    ) -> DeepLinkingSession:
+        """Get the deep linking session.
+
+        The session is loaded from the session token, without a token
+        the launch message is restored from the cache and validated.
+
+        Args:
+            request: HTTP request object.
+            launch_id: Launch ID UUID4.
+            token: Session token.
+
+        Returns:
+            DeepLinkingSession instance.
+
+        Raises:
+            DeepLinkingException: If the token or the launch message is invalid.
+            LtiException: If the launch message is not found.
+
+        """
+        if token:
+            return DeepLinkingSession.loads(token, launch_id)
+
+        message = self.get_message_from_cache(request, launch_id)
+        validate_deep_linking_message(message)
+
+        return DeepLinkingSession.from_message(launch_id, message)
@@ -0,0 +1,49 @@
+"""Django Signals."""
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.catalog import invalidate_catalog
+from openedx_lti_tool_plugin.models import LtiToolConfiguration
+
+
+@receiver(
+    post_save,
+    sender=LtiToolConfiguration,
+    dispatch_uid=f'{app_config.name}.lti_tool_configuration_invalidate_catalog',
+)
+@receiver(
+    post_delete,
+    sender=LtiToolConfiguration,
+    dispatch_uid=f'{app_config.name}.lti_tool_configuration_delete_invalidate_catalog',
+)
+@receiver(
+    post_save,
+    sender=LtiTool,
+    dispatch_uid=f'{app_config.name}.lti_tool_invalidate_catalog',
+)
+@receiver(
+    post_delete,
+    sender=LtiTool,
+    dispatch_uid=f'{app_config.name}.lti_tool_delete_invalidate_catalog',
+)
+def invalidate_content_item_catalog(
+    sender: Any,  # pylint: disable=unused-argument
+    **kwargs: dict,
+):
+    """Invalidate the deep linking content item catalog.
+
+    The LtiToolConfiguration stores the courses allowed for an LtiTool
+    and the LtiTool stores its issuer and client ID, the catalog is
+    invalidated when any of them is saved or deleted. The course changes
+    are detected by the catalog courses version.
+
+    Args:
+        sender: The model class being saved or deleted.
+        **kwargs: Arbitrary keyword arguments.
+
+    """
+    invalidate_catalog()
@@ -0,0 +1,53 @@
+"""Celery Tasks.
+
+Attributes:
+    MODULE_PATH (str): This module absolute path.
+
+"""
+from celery import shared_task
+
+from openedx_lti_tool_plugin.deep_linking.search import (
+    delete_orphan_search_entries,
+    get_stale_course_ids,
+    update_search_index,
+)
+
+MODULE_PATH = 'openedx_lti_tool_plugin.deep_linking.tasks'
+
+
+@shared_task(name=f'{MODULE_PATH}.update_course_search_index')
+def update_course_search_index(course_id: str) -> int:
+    """Update course search index task.
+
+    Task to update the deep linking search index of a course asynchronously.
+
+    Args:
+        course_id: Course ID string.
+
+    Returns:
+        Number of indexed entries.
+
+    """
+    return update_search_index(course_id)
+
+
+@shared_task(name=f'{MODULE_PATH}.update_stale_search_indexes')
+def update_stale_search_indexes() -> int:
+    """Update stale search indexes task.
+
+    Task to queue an update_course_search_index task for each course with
+    a stale deep linking search index, it should be run periodically
+    (e.g. with Celery beat) to index the courses published on the CMS.
+    The search entries of the deleted courses are removed first.
+
+    Returns:
+        Number of queued course search index updates.
+
+    """
+    delete_orphan_search_entries()
+    course_ids = get_stale_course_ids()
+
+    for course_id in course_ids:
+        update_course_search_index.delay(course_id)
+
+    return len(course_ids)
@@ -0,0 +1,168 @@
+"""Tests catalog module."""
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from openedx_lti_tool_plugin.deep_linking.catalog import (
+    CATALOG_VERSION_KEY,
+    get_catalog_key,
+    get_catalog_version,
+    get_courses_version,
+    invalidate_catalog,
+)
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests import AUD, ISS
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+
+MODULE_PATH = f'{MODULE_PATH}.catalog'
+SITE = 'example.com'
+
+
+class TestCatalogVersion(TestCase):
+    """Test get_catalog_version and invalidate_catalog functions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+
+    def test_get_catalog_version(self):
+        """Test get_catalog_version function."""
+        version = get_catalog_version()
+
+        self.assertEqual(get_catalog_version(), version)
+        self.assertEqual(cache.get(CATALOG_VERSION_KEY), version)
+
+    def test_invalidate_catalog(self):
+        """Test invalidate_catalog function."""
+        version = get_catalog_version()
+
+        invalidate_catalog()
+
+        self.assertNotEqual(get_catalog_version(), version)
+
+
+class TestGetCoursesVersion(TestCase):
+    """Test get_courses_version function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+        self.learning_context = LearningContextTest.objects.create(context_key='course-v1:org+course+run')
+        CourseContextTest.objects.create(learning_context=self.learning_context)
+
+    def get_version(self) -> str:
+        """Get the courses version without the cached version.
+
+        Returns:
+            Current courses version.
+
+        """
+        cache.clear()
+
+        return get_courses_version()
+
+    def test_get_courses_version(self):
+        """Test get_courses_version function (happy path)."""
+        version = get_courses_version()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_courses_version(), version)
+
+        self.assertEqual(self.get_version(), version)
+
+    def test_with_published_course(self):
+        """Test get_courses_version function with a published course."""
+        version = self.get_version()
+        self.learning_context.published_at += timedelta(minutes=1)
+        self.learning_context.save()
+
+        self.assertNotEqual(self.get_version(), version)
+
+    def test_with_created_and_deleted_course(self):
+        """Test get_courses_version function with a created and a deleted course."""
+        version = self.get_version()
+        learning_context = LearningContextTest.objects.create(
+            context_key='course-v1:org+other-course+run',
+            published_at=timezone.now() - timedelta(days=1),
+        )
+        CourseContextTest.objects.create(learning_context=learning_context)
+        created_version = self.get_version()
+
+        self.assertNotEqual(created_version, version)
+
+        CourseContextTest.objects.filter(learning_context=self.learning_context).delete()
+
+        self.assertNotEqual(self.get_version(), created_version)
+
+
+@patch(f'{MODULE_PATH}.get_courses_version', return_value='courses-version')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
+class TestGetCatalogKey(TestCase):
+    """Test get_catalog_key function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+
+    def test_get_catalog_key(
+        self,
+        get_settings_snapshot_mock: MagicMock,
+        get_courses_version_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_catalog_key function (happy path)."""
+        snapshot = get_settings_snapshot_mock.return_value
+        snapshot.site_orgs = ['org2', 'org1']
+        snapshot.course_access_configuration = False
+        key = get_catalog_key(ISS, AUD, SITE)
+
+        self.assertEqual(get_catalog_key(ISS, AUD, SITE), key)
+        self.assertNotEqual(get_catalog_key(ISS, AUD, 'other.example.com'), key)
+
+        snapshot.site_orgs = ['org1']
+
+        self.assertNotEqual(get_catalog_key(ISS, AUD, SITE), key)
+
+    def test_with_switch_change(
+        self,
+        get_settings_snapshot_mock: MagicMock,
+        get_courses_version_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_catalog_key function with COURSE_ACCESS_CONFIGURATION change."""
+        snapshot = get_settings_snapshot_mock.return_value
+        snapshot.site_orgs = []
+        snapshot.course_access_configuration = False
+        key = get_catalog_key(ISS, AUD, SITE)
+        snapshot.course_access_configuration = True
+
+        self.assertNotEqual(get_catalog_key(ISS, AUD, SITE), key)
+
+    def test_with_invalidation(
+        self,
+        get_settings_snapshot_mock: MagicMock,
+        get_courses_version_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_catalog_key function after invalidate_catalog."""
+        snapshot = get_settings_snapshot_mock.return_value
+        snapshot.site_orgs = []
+        snapshot.course_access_configuration = False
+        key = get_catalog_key(ISS, AUD, SITE)
+
+        invalidate_catalog()
+
+        self.assertNotEqual(get_catalog_key(ISS, AUD, SITE), key)
+
+    def test_with_courses_change(self, get_settings_snapshot_mock: MagicMock, get_courses_version_mock: MagicMock):
+        """Test get_catalog_key function with a courses version change."""
+        snapshot = get_settings_snapshot_mock.return_value
+        snapshot.site_orgs = []
+        snapshot.course_access_configuration = False
+        key = get_catalog_key(ISS, AUD, SITE)
+        get_courses_version_mock.return_value = 'other-courses-version'
+
+        self.assertNotEqual(get_catalog_key(ISS, AUD, SITE), key)
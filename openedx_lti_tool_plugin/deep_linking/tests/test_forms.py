@@ -5,6 +5,7 @@ from django.test import TestCase
 
 from openedx_lti_tool_plugin.deep_linking.forms import DeepLinkingForm
 from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.validators import JSONSchemaValidator
 
 MODULE_PATH = f'{MODULE_PATH}.forms'
 
@@ -48,6 +49,10 @@ class TestDeepLinkingForm(TestCase):
                 },
             },
         )
+        self.assertIn(
+            JSONSchemaValidator(self.form_class.CONTENT_ITEMS_SCHEMA, all_errors=True),
+            self.form_class.base_fields['content_items'].validators,
+        )
 
     @patch(f'{MODULE_PATH}.super')
     @patch(f'{MODULE_PATH}.DeepLinkResource')
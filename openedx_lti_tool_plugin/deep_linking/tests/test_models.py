@@ -0,0 +1,142 @@
+"""Tests models module."""
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry, ContentSearchTrigram
+from openedx_lti_tool_plugin.deep_linking.utils import get_trigrams
+from openedx_lti_tool_plugin.models import CourseContext
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+
+COURSE_ID = 'course-v1:org+course+run'
+OTHER_COURSE_ID = 'course-v1:org+other+run'
+UNIT_ID = 'block-v1:org+course+run+type@vertical+block@unit'
+PROBLEM_ID = 'block-v1:org+course+run+type@problem+block@problem'
+
+
+class TestContentSearchEntryManager(TestCase):
+    """Test ContentSearchEntryManager class."""
+
+    def test_index_course(self):
+        """Test index_course method (happy path)."""
+        ContentSearchEntry.objects.index_course(COURSE_ID, [('', 'course', 'Old title')])
+        ContentSearchEntry.objects.index_course(
+            COURSE_ID,
+            [('', 'course', 'Physics'), (UNIT_ID, 'vertical', 'Kinematics')],
+            'version',
+        )
+
+        entries = ContentSearchEntry.objects.filter(context_key=COURSE_ID).order_by('id')
+
+        self.assertEqual(
+            list(entries.values_list('usage_key', 'block_type', 'title', 'published_version')),
+            [('', 'course', 'Physics', 'version'), (UNIT_ID, 'vertical', 'Kinematics', 'version')],
+        )
+        self.assertEqual(
+            set(ContentSearchTrigram.objects.filter(entry=entries[0]).values_list('trigram', flat=True)),
+            get_trigrams('Physics'),
+        )
+        self.assertEqual(
+            ContentSearchTrigram.objects.count(),
+            len(get_trigrams('Physics')) + len(get_trigrams('Kinematics')),
+        )
+
+    def test_index_course_without_entries(self):
+        """Test index_course method without entries."""
+        ContentSearchEntry.objects.index_course(COURSE_ID, [('', 'course', 'Physics')])
+        ContentSearchEntry.objects.index_course(COURSE_ID, [])
+
+        self.assertFalse(ContentSearchEntry.objects.exists())
+        self.assertFalse(ContentSearchTrigram.objects.exists())
+
+
+class TestContentSearchEntryQuerySet(TestCase):
+    """Test ContentSearchEntryQuerySet class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        ContentSearchEntry.objects.index_course(
+            COURSE_ID,
+            [
+                ('', 'course', 'Introduction to Physics'),
+                (UNIT_ID, 'vertical', 'Physical units'),
+                (PROBLEM_ID, 'problem', 'Chemistry quiz'),
+            ],
+        )
+        ContentSearchEntry.objects.index_course(OTHER_COURSE_ID, [('', 'course', 'Advanced Physics')])
+
+    def test_search(self):
+        """Test search method (happy path)."""
+        results = ContentSearchEntry.objects.search('physics')
+
+        self.assertEqual(
+            [(entry.context_key, entry.title) for entry in results[:2]],
+            [(COURSE_ID, 'Introduction to Physics'), (OTHER_COURSE_ID, 'Advanced Physics')],
+        )
+        self.assertNotIn('Chemistry quiz', [entry.title for entry in results])
+
+    def test_search_with_typo(self):
+        """Test search method with a typo."""
+        self.assertEqual(
+            [entry.title for entry in ContentSearchEntry.objects.search('chemstry')],
+            ['Chemistry quiz'],
+        )
+
+    def test_search_with_courses(self):
+        """Test search method with a CourseContext QuerySet."""
+        for course_id in (COURSE_ID, OTHER_COURSE_ID):
+            CourseContextTest.objects.create(
+                learning_context=LearningContextTest.objects.create(context_key=course_id),
+            )
+
+        courses = CourseContext.objects.filter(learning_context__context_key=OTHER_COURSE_ID)
+
+        self.assertEqual(
+            [entry.title for entry in ContentSearchEntry.objects.search('physics', courses=courses)],
+            ['Advanced Physics'],
+        )
+        self.assertEqual(ContentSearchEntry.objects.search('physics', courses=CourseContext.objects.none()), [])
+
+    def test_search_with_limit(self):
+        """Test search method with limit."""
+        self.assertEqual(len(ContentSearchEntry.objects.search('physics', limit=1)), 1)
+
+    def test_search_without_trigrams(self):
+        """Test search method without query trigrams."""
+        self.assertEqual(ContentSearchEntry.objects.search('...'), [])
+
+    def test_search_without_results(self):
+        """Test search method without results."""
+        self.assertEqual(ContentSearchEntry.objects.search('biology'), [])
+
+    def test_matching_course_keys(self):
+        """Test matching_course_keys method (happy path)."""
+        self.assertEqual(
+            {item['entry__context_key'] for item in ContentSearchEntry.objects.matching_course_keys('physcs')},
+            {COURSE_ID, OTHER_COURSE_ID},
+        )
+        self.assertEqual(
+            list(ContentSearchEntry.objects.matching_course_keys('introduction')),
+            [{'entry__context_key': COURSE_ID}],
+        )
+
+    def test_matching_course_keys_without_course_entries(self):
+        """Test matching_course_keys method only matches course entries."""
+        self.assertFalse(ContentSearchEntry.objects.matching_course_keys('chemistry quiz').exists())
+
+    def test_matching_course_keys_without_trigrams(self):
+        """Test matching_course_keys method without query trigrams."""
+        self.assertFalse(ContentSearchEntry.objects.matching_course_keys('...').exists())
+
+
+class TestContentSearchEntry(TestCase):
+    """Test ContentSearchEntry class."""
+
+    def test_resource_id(self):
+        """Test resource_id property."""
+        self.assertEqual(ContentSearchEntry(context_key=COURSE_ID).resource_id, COURSE_ID)
+        self.assertEqual(ContentSearchEntry(context_key=COURSE_ID, usage_key=UNIT_ID).resource_id, UNIT_ID)
+
+    def test_str(self):
+        """Test __str__ method."""
+        self.assertEqual(str(ContentSearchEntry(id=1)), '<ContentSearchEntry, ID: 1>')
+        self.assertEqual(str(ContentSearchTrigram(id=1)), '<ContentSearchTrigram, ID: 1>')
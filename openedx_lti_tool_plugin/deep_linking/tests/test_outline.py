@@ -0,0 +1,156 @@
+"""Tests outline module."""
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_lti_tool_plugin.deep_linking.outline import (
+    PROBLEMS,
+    SECTIONS,
+    UNITS,
+    OutlineItem,
+    get_course_version,
+    get_outline_items,
+    is_gradable,
+    is_section,
+    is_unit,
+)
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.models import CourseContext
+
+MODULE_PATH = f'{MODULE_PATH}.outline'
+COURSE_KEY = CourseKey.from_string('course-v1:org+course+run')
+COURSE = COURSE_KEY.make_usage_key('course', 'course')
+SECTION = COURSE_KEY.make_usage_key('chapter', 'section')
+SUBSECTION = COURSE_KEY.make_usage_key('sequential', 'subsection')
+UNIT = COURSE_KEY.make_usage_key('vertical', 'unit')
+OTHER_UNIT = COURSE_KEY.make_usage_key('vertical', 'other-unit')
+PROBLEM = COURSE_KEY.make_usage_key('problem', 'problem')
+HTML = COURSE_KEY.make_usage_key('html', 'html')
+LTI = COURSE_KEY.make_usage_key('lti_consumer', 'lti')
+VERSION = 'random-version'
+
+
+class BlockStructureTest:
+    """BlockStructure test class."""
+
+    root_block_usage_key = COURSE
+    children = {
+        COURSE: [SECTION],
+        SECTION: [SUBSECTION],
+        SUBSECTION: [UNIT, OTHER_UNIT],
+        UNIT: [PROBLEM, HTML, LTI],
+        OTHER_UNIT: [],
+    }
+    fields = {
+        SECTION: {'display_name': 'Section'},
+        UNIT: {'display_name': 'Unit', 'graded': True},
+        OTHER_UNIT: {},
+        PROBLEM: {'display_name': 'Problem', 'has_score': True, 'graded': True},
+        LTI: {'display_name': 'LTI', 'has_score': True},
+    }
+
+    def __contains__(self, usage_key):
+        """Check if the block is in the structure."""
+        return usage_key in self.children or usage_key in self.fields
+
+    def get_children(self, usage_key):
+        """Get block children."""
+        return self.children.get(usage_key, [])
+
+    def get_xblock_field(self, usage_key, field_name, default=None):
+        """Get block field."""
+        return self.fields.get(usage_key, {}).get(field_name, default)
+
+
+class TestOutlineLevels(TestCase):
+    """Test outline level predicate functions."""
+
+    def test_is_section(self):
+        """Test is_section function."""
+        self.assertTrue(is_section(BlockStructureTest(), SECTION))
+        self.assertFalse(is_section(BlockStructureTest(), SUBSECTION))
+
+    def test_is_unit(self):
+        """Test is_unit function."""
+        self.assertTrue(is_unit(BlockStructureTest(), UNIT))
+        self.assertFalse(is_unit(BlockStructureTest(), PROBLEM))
+
+    def test_is_gradable(self):
+        """Test is_gradable function."""
+        self.assertTrue(is_gradable(BlockStructureTest(), PROBLEM))
+        self.assertTrue(is_gradable(BlockStructureTest(), LTI))
+        self.assertFalse(is_gradable(BlockStructureTest(), HTML))
+
+
+class TestGetCourseVersion(TestCase):
+    """Test get_course_version function."""
+
+    @patch.object(CourseContext.objects, 'filter')
+    def test_get_course_version(self, filter_mock: MagicMock):
+        """Test get_course_version function (happy path)."""
+        values_list_mock = filter_mock.return_value.values_list
+
+        self.assertEqual(get_course_version(str(COURSE_KEY)), values_list_mock.return_value.first.return_value)
+        filter_mock.assert_called_once_with(learning_context__context_key=str(COURSE_KEY))
+        values_list_mock.assert_called_once_with('learning_context__published_version', flat=True)
+        values_list_mock().first.assert_called_once_with()
+
+
+@patch(f'{MODULE_PATH}.get_course_in_cache', return_value=BlockStructureTest())
+class TestGetOutlineItems(TestCase):
+    """Test get_outline_items function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+
+    def test_sections(self, get_course_in_cache_mock: MagicMock):
+        """Test get_outline_items function with sections level."""
+        self.assertEqual(
+            get_outline_items(COURSE_KEY, None, SECTIONS, VERSION),
+            [OutlineItem(str(SECTION), 'chapter', 'Section', False)],
+        )
+        get_course_in_cache_mock.assert_called_once_with(COURSE_KEY)
+
+    def test_units(self, get_course_in_cache_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test get_outline_items function with units level."""
+        self.assertEqual(
+            get_outline_items(COURSE_KEY, SECTION, UNITS, VERSION),
+            [
+                OutlineItem(str(UNIT), 'vertical', 'Unit', True),
+                OutlineItem(str(OTHER_UNIT), 'vertical', 'vertical', False),
+            ],
+        )
+
+    def test_problems(self, get_course_in_cache_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test get_outline_items function with problems level."""
+        self.assertEqual(
+            get_outline_items(COURSE_KEY, UNIT, PROBLEMS, VERSION),
+            [
+                OutlineItem(str(PROBLEM), 'problem', 'Problem', True),
+                OutlineItem(str(LTI), 'lti_consumer', 'LTI', False),
+            ],
+        )
+
+    def test_with_cached_items(self, get_course_in_cache_mock: MagicMock):
+        """Test get_outline_items function with cached items."""
+        items = get_outline_items(COURSE_KEY, SECTION, UNITS, VERSION)
+
+        self.assertEqual(get_outline_items(COURSE_KEY, SECTION, UNITS, VERSION), items)
+        get_course_in_cache_mock.assert_called_once_with(COURSE_KEY)
+
+    def test_with_new_version(self, get_course_in_cache_mock: MagicMock):
+        """Test get_outline_items function with a new course version."""
+        get_outline_items(COURSE_KEY, SECTION, UNITS, VERSION)
+        get_outline_items(COURSE_KEY, SECTION, UNITS, 'new-version')
+
+        self.assertEqual(get_course_in_cache_mock.call_count, 2)
+
+    def test_without_parent_block(self, get_course_in_cache_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test get_outline_items function without parent block."""
+        self.assertIsNone(
+            get_outline_items(COURSE_KEY, COURSE_KEY.make_usage_key('chapter', 'unknown'), UNITS, VERSION),
+        )
@@ -0,0 +1,163 @@
+"""Tests search module."""
+from unittest.mock import MagicMock, call, patch
+
+from django.test import TestCase
+from opaque_keys.edx.keys import CourseKey
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.deep_linking.models import ContentSearchEntry, ContentSearchTrigram
+from openedx_lti_tool_plugin.deep_linking.search import (
+    delete_orphan_search_entries,
+    get_course_entries,
+    get_published_version,
+    get_stale_course_ids,
+    update_search_index,
+)
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+
+MODULE_PATH = f'{MODULE_PATH}.search'
+COURSE_ID = 'course-v1:org+course+run'
+OTHER_COURSE_ID = 'course-v1:org+other+run'
+
+
+@patch(f'{MODULE_PATH}.modulestore')
+class TestGetCourseEntries(TestCase):
+    """Test get_course_entries function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.course_key = CourseKey.from_string(COURSE_ID)
+        self.unit = MagicMock(location='unit-id', display_name_with_default='Unit')
+        self.problem = MagicMock(location='problem-id', display_name_with_default='Problem')
+
+    def test_get_course_entries(self, modulestore_mock: MagicMock):
+        """Test get_course_entries function (happy path)."""
+        modulestore_mock().get_course.return_value = MagicMock(display_name_with_default='Course')
+        modulestore_mock().get_items.side_effect = [[self.unit], [self.problem]]
+
+        self.assertEqual(
+            get_course_entries(self.course_key),
+            [
+                ('', 'course', 'Course'),
+                ('unit-id', 'vertical', 'Unit'),
+                ('problem-id', 'problem', 'Problem'),
+            ],
+        )
+        modulestore_mock().get_course.assert_called_once_with(self.course_key, depth=0)
+        modulestore_mock().get_items.assert_has_calls([
+            call(self.course_key, qualifiers={'category': 'vertical'}),
+            call(self.course_key, qualifiers={'category': 'problem'}),
+        ])
+
+    def test_without_course(self, modulestore_mock: MagicMock):
+        """Test get_course_entries function without course."""
+        modulestore_mock().get_course.return_value = None
+
+        self.assertEqual(get_course_entries(self.course_key), [])
+        modulestore_mock().get_items.assert_not_called()
+
+
+class TestGetPublishedVersion(TestCase):
+    """Test get_published_version function."""
+
+    def test_get_published_version(self):
+        """Test get_published_version function (happy path)."""
+        CourseContextTest.objects.create(
+            learning_context=LearningContextTest.objects.create(context_key=COURSE_ID, published_version='version'),
+        )
+
+        self.assertEqual(get_published_version(CourseKey.from_string(COURSE_ID)), 'version')
+
+    def test_without_course(self):
+        """Test get_published_version function without course."""
+        self.assertEqual(get_published_version(CourseKey.from_string(COURSE_ID)), '')
+
+
+class TestGetStaleCourseIds(TestCase):
+    """Test get_stale_course_ids function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+
+        for course_id in (COURSE_ID, OTHER_COURSE_ID):
+            CourseContextTest.objects.create(
+                learning_context=LearningContextTest.objects.create(context_key=course_id, published_version='new'),
+            )
+
+    def test_get_stale_course_ids(self):
+        """Test get_stale_course_ids function (happy path)."""
+        ContentSearchEntry.objects.index_course(COURSE_ID, [('', 'course', 'Course')], 'new')
+        ContentSearchEntry.objects.index_course(OTHER_COURSE_ID, [('', 'course', 'Course')], 'old')
+
+        self.assertEqual(get_stale_course_ids(), [OTHER_COURSE_ID])
+
+    def test_without_search_entries(self):
+        """Test get_stale_course_ids function without search entries."""
+        self.assertEqual(get_stale_course_ids(), [COURSE_ID, OTHER_COURSE_ID])
+
+    def test_without_stale_courses(self):
+        """Test get_stale_course_ids function without stale courses."""
+        for course_id in (COURSE_ID, OTHER_COURSE_ID):
+            ContentSearchEntry.objects.index_course(course_id, [('', 'course', 'Course')], 'new')
+
+        self.assertEqual(get_stale_course_ids(), [])
+
+
+class TestDeleteOrphanSearchEntries(TestCase):
+    """Test delete_orphan_search_entries function."""
+
+    @log_capture()
+    def test_delete_orphan_search_entries(self, log_mock: LogCaptureForDecorator):
+        """Test delete_orphan_search_entries function (happy path)."""
+        log_extra = {'entries': 2}
+        CourseContextTest.objects.create(learning_context=LearningContextTest.objects.create(context_key=COURSE_ID))
+        ContentSearchEntry.objects.index_course(COURSE_ID, [('', 'course', 'Course')])
+        ContentSearchEntry.objects.index_course(
+            OTHER_COURSE_ID,
+            [('', 'course', 'Deleted course'), ('unit', 'vertical', 'Unit')],
+        )
+
+        self.assertEqual(delete_orphan_search_entries(), 2)
+        self.assertEqual(
+            set(ContentSearchEntry.objects.values_list('context_key', flat=True)),
+            {COURSE_ID},
+        )
+        self.assertFalse(ContentSearchTrigram.objects.exclude(entry__context_key=COURSE_ID).exists())
+        log_mock.check((MODULE_PATH, 'INFO', f'Deep linking search orphan entries deleted: {log_extra}'))
+
+    def test_without_orphan_search_entries(self):
+        """Test delete_orphan_search_entries function without orphan search entries."""
+        self.assertEqual(delete_orphan_search_entries(), 0)
+
+
+class TestUpdateSearchIndex(TestCase):
+    """Test update_search_index function."""
+
+    @log_capture()
+    @patch(f'{MODULE_PATH}.ContentSearchEntry')
+    @patch(f'{MODULE_PATH}.get_course_entries')
+    @patch(f'{MODULE_PATH}.get_published_version', return_value='version')
+    def test_update_search_index(
+        self,
+        get_published_version_mock: MagicMock,
+        get_course_entries_mock: MagicMock,
+        content_search_entry_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+    ):
+        """Test update_search_index function (happy path)."""
+        get_course_entries_mock.return_value = [('', 'course', 'Course')]
+        log_extra = {'course_id': COURSE_ID, 'entries': 1, 'published_version': 'version'}
+
+        self.assertEqual(update_search_index(COURSE_ID), 1)
+        get_published_version_mock.assert_called_once_with(CourseKey.from_string(COURSE_ID))
+        get_course_entries_mock.assert_called_once_with(CourseKey.from_string(COURSE_ID))
+        content_search_entry_mock.objects.index_course.assert_called_once_with(
+            COURSE_ID,
+            get_course_entries_mock.return_value,
+            'version',
+        )
+        log_mock.check((MODULE_PATH, 'INFO', f'Deep linking search index updated: {log_extra}'))
@@ -0,0 +1,166 @@
+"""Tests session module."""
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.core import signing
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
+from openedx_lti_tool_plugin.deep_linking.session import (
+    DEEP_LINKING_SETTINGS_CLAIM,
+    DEPLOYMENT_ID_CLAIM,
+    SESSION_MAX_AGE,
+    SESSION_SALT,
+    DeepLinkingSession,
+    DeepLinkingSessionMixin,
+)
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests import AUD, ISS, SUB
+
+MODULE_PATH = f'{MODULE_PATH}.session'
+
+
+class TestDeepLinkingSession(TestCase):
+    """Test DeepLinkingSession class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.launch_id = str(uuid4())
+        self.deep_linking_settings = {'deep_link_return_url': 'https://example.com'}
+        self.launch_data = {
+            'iss': ISS,
+            'aud': AUD,
+            'sub': SUB,
+            'name': 'test-name',
+            DEPLOYMENT_ID_CLAIM: 'test-deployment-id',
+            DEEP_LINKING_SETTINGS_CLAIM: self.deep_linking_settings,
+        }
+        self.session = DeepLinkingSession(self.launch_id, self.launch_data)
+
+    def test_init(self):
+        """Test __init__ method keeps only the session claims."""
+        self.launch_data.pop('name')
+
+        self.assertEqual(self.session.launch_id, self.launch_id)
+        self.assertEqual(self.session.launch_data, self.launch_data)
+
+    def test_from_message(self):
+        """Test from_message method."""
+        message = MagicMock()
+        message.get_launch_data.return_value = self.launch_data
+
+        session = DeepLinkingSession.from_message(self.launch_id, message)
+
+        message.get_launch_data.assert_called_once_with()
+        self.assertEqual(session.launch_id, self.launch_id)
+        self.assertEqual(session.launch_data, self.session.launch_data)
+
+    def test_dumps_and_loads(self):
+        """Test dumps and loads methods (happy path)."""
+        session = DeepLinkingSession.loads(self.session.dumps(), self.launch_id)
+
+        self.assertEqual(session.launch_id, self.launch_id)
+        self.assertEqual(session.launch_data, self.session.launch_data)
+
+    def test_loads_with_invalid_signature(self):
+        """Test loads method with an invalid signature."""
+        with self.assertRaises(DeepLinkingException):
+            DeepLinkingSession.loads(f'{self.session.dumps()}x', self.launch_id)
+
+    @patch(f'{MODULE_PATH}.signing.loads')
+    def test_loads_with_expired_token(self, loads_mock: MagicMock):
+        """Test loads method with an expired token."""
+        loads_mock.side_effect = signing.SignatureExpired()
+
+        with self.assertRaises(DeepLinkingException):
+            DeepLinkingSession.loads('test-token', self.launch_id)
+
+        loads_mock.assert_called_once_with('test-token', salt=SESSION_SALT, max_age=SESSION_MAX_AGE)
+
+    def test_loads_with_another_launch_id(self):
+        """Test loads method with a token of another launch."""
+        with self.assertRaises(DeepLinkingException):
+            DeepLinkingSession.loads(self.session.dumps(), str(uuid4()))
+
+    @patch(f'{MODULE_PATH}.DeepLink')
+    def test_get_deep_link(self, deep_link_mock: MagicMock):
+        """Test get_deep_link method (happy path)."""
+        tool_config = MagicMock()
+
+        self.assertEqual(self.session.get_deep_link(tool_config), deep_link_mock.return_value)
+        tool_config.find_registration_by_params.assert_called_once_with(ISS, AUD)
+        deep_link_mock.assert_called_once_with(
+            tool_config.find_registration_by_params(),
+            'test-deployment-id',
+            self.deep_linking_settings,
+        )
+
+    @patch(f'{MODULE_PATH}.DeepLink')
+    def test_get_deep_link_without_settings(self, deep_link_mock: MagicMock):
+        """Test get_deep_link method without deep linking settings claim."""
+        tool_config = MagicMock()
+        self.session.launch_data.pop(DEEP_LINKING_SETTINGS_CLAIM)
+
+        with self.assertRaises(DeepLinkingException):
+            self.session.get_deep_link(tool_config)
+
+        tool_config.find_registration_by_params.assert_not_called()
+        deep_link_mock.assert_not_called()
+
+
+class TestDeepLinkingSessionMixin(TestCase):
+    """Test DeepLinkingSessionMixin class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.mixin_self = MagicMock()
+        self.request = MagicMock()
+        self.launch_id = uuid4()
+
+    @patch(f'{MODULE_PATH}.validate_deep_linking_message')
+    @patch.object(DeepLinkingSession, 'loads')
+    def test_with_token(
+        self,
+        loads_mock: MagicMock,
+        validate_deep_linking_message_mock: MagicMock,
+    ):
+        """Test get_deep_linking_session method with a session token."""
+        self.assertEqual(
+            DeepLinkingSessionMixin.get_deep_linking_session(
+                self.mixin_self,
+                self.request,
+                self.launch_id,
+                'test-token',
+            ),
+            loads_mock.return_value,
+        )
+        loads_mock.assert_called_once_with('test-token', self.launch_id)
+        self.mixin_self.get_message_from_cache.assert_not_called()
+        validate_deep_linking_message_mock.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.validate_deep_linking_message')
+    @patch.object(DeepLinkingSession, 'from_message')
+    def test_without_token(
+        self,
+        from_message_mock: MagicMock,
+        validate_deep_linking_message_mock: MagicMock,
+    ):
+        """Test get_deep_linking_session method without a session token."""
+        self.assertEqual(
+            DeepLinkingSessionMixin.get_deep_linking_session(
+                self.mixin_self,
+                self.request,
+                self.launch_id,
+            ),
+            from_message_mock.return_value,
+        )
+        self.mixin_self.get_message_from_cache.assert_called_once_with(self.request, self.launch_id)
+        validate_deep_linking_message_mock.assert_called_once_with(
+            self.mixin_self.get_message_from_cache(),
+        )
+        from_message_mock.assert_called_once_with(
+            self.launch_id,
+            self.mixin_self.get_message_from_cache(),
+        )
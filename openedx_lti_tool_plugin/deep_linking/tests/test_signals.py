@@ -0,0 +1,46 @@
+"""Test signals module."""
+from unittest.mock import MagicMock, patch
+
+import ddt
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal
+from django.test import TestCase
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool
+
+from openedx_lti_tool_plugin.deep_linking.signals import invalidate_content_item_catalog
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+from openedx_lti_tool_plugin.edxapp_wrapper.learning_sequences import course_context
+from openedx_lti_tool_plugin.models import LtiToolConfiguration
+
+MODULE_PATH = f'{MODULE_PATH}.signals'
+
+
+@ddt.ddt
+@patch(f'{MODULE_PATH}.invalidate_catalog')
+class TestInvalidateContentItemCatalog(TestCase):
+    """Test invalidate_content_item_catalog signal."""
+
+    def test_invalidate_content_item_catalog(self, invalidate_catalog_mock: MagicMock):
+        """Test signal (happy path)."""
+        invalidate_content_item_catalog(LtiToolConfiguration)
+
+        invalidate_catalog_mock.assert_called_once_with()
+
+    @ddt.data(
+        (post_save, LtiToolConfiguration),
+        (post_delete, LtiToolConfiguration),
+        (post_save, LtiTool),
+        (post_delete, LtiTool),
+    )
+    @ddt.unpack
+    def test_signal_receiver(self, signal: Signal, sender: type, invalidate_catalog_mock: MagicMock):
+        """Test signal is connected to the LtiToolConfiguration and LtiTool save and delete signals."""
+        signal.send(sender=sender, instance=MagicMock(), created=False)
+
+        invalidate_catalog_mock.assert_called_once_with()
+
+    def test_course_context_save(self, invalidate_catalog_mock: MagicMock):
+        """Test signal is not connected to the CMS written CourseContext save signal."""
+        post_save.send(sender=course_context(), instance=MagicMock(), created=False)
+
+        invalidate_catalog_mock.assert_not_called()
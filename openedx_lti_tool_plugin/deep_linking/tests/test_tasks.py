@@ -0,0 +1,40 @@
+"""Tests tasks module."""
+from unittest.mock import MagicMock, call, patch
+
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.deep_linking.tasks import update_course_search_index, update_stale_search_indexes
+from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.tasks'
+COURSE_ID = 'course-v1:org+course+run'
+OTHER_COURSE_ID = 'course-v1:org+other+run'
+
+
+class TestUpdateCourseSearchIndex(TestCase):
+    """Test update_course_search_index task."""
+
+    @patch(f'{MODULE_PATH}.update_search_index')
+    def test_update_course_search_index(self, update_search_index_mock: MagicMock):
+        """Test update_course_search_index task (happy path)."""
+        self.assertEqual(update_course_search_index(COURSE_ID), update_search_index_mock.return_value)
+        update_search_index_mock.assert_called_once_with(COURSE_ID)
+
+
+class TestUpdateStaleSearchIndexes(TestCase):
+    """Test update_stale_search_indexes task."""
+
+    @patch(f'{MODULE_PATH}.update_course_search_index')
+    @patch(f'{MODULE_PATH}.get_stale_course_ids', return_value=[COURSE_ID, OTHER_COURSE_ID])
+    @patch(f'{MODULE_PATH}.delete_orphan_search_entries')
+    def test_update_stale_search_indexes(
+        self,
+        delete_orphan_search_entries_mock: MagicMock,
+        get_stale_course_ids_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,
+    ):
+        """Test update_stale_search_indexes task (happy path)."""
+        self.assertEqual(update_stale_search_indexes(), 2)
+        delete_orphan_search_entries_mock.assert_called_once_with()
+        get_stale_course_ids_mock.assert_called_once_with()
+        update_course_search_index_mock.delay.assert_has_calls([call(COURSE_ID), call(OTHER_COURSE_ID)])
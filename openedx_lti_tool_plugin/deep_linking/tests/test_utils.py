@@ -5,7 +5,7 @@ from django.test import TestCase
 
 from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
 from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
-from openedx_lti_tool_plugin.deep_linking.utils import validate_deep_linking_message
+from openedx_lti_tool_plugin.deep_linking.utils import get_trigrams, validate_deep_linking_message
 
 MODULE_PATH = f'{MODULE_PATH}.utils'
 
@@ -40,3 +40,23 @@ class TestValidateDeepLinkingMessage(TestCase):
         self.message.is_deep_link_launch.assert_called_once_with()
         gettext_mock.assert_called_once_with('Message type is not LtiDeepLinkingRequest.')
         self.assertEqual(gettext_mock(), str(ctxm.exception))
+
+
+class TestGetTrigrams(TestCase):
+    """Test get_trigrams function."""
+
+    def test_get_trigrams(self):
+        """Test get_trigrams function (happy path)."""
+        self.assertEqual(get_trigrams('Cat'), {'  c', ' ca', 'cat', 'at '})
+
+    def test_with_accents_and_punctuation(self):
+        """Test with accents, punctuation and mixed case."""
+        self.assertEqual(get_trigrams('CÁT!'), get_trigrams('cat'))
+
+    def test_with_multiple_words(self):
+        """Test with multiple words."""
+        self.assertEqual(get_trigrams('a b'), {'  a', ' a ', '  b', ' b '})
+
+    def test_without_words(self):
+        """Test without words."""
+        self.assertEqual(get_trigrams(' - '), set())
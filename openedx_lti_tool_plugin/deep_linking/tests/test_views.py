@@ -1,7 +1,8 @@
 """Tests views module."""
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 from uuid import uuid4
 
+from ddt import data, ddt
 from django.conf import settings
 from django.http.response import Http404
 from django.test import RequestFactory, TestCase, override_settings
@@ -11,6 +12,7 @@ from pylti1p3.exception import LtiException
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
 from openedx_lti_tool_plugin.deep_linking.forms import DeepLinkingForm
+from openedx_lti_tool_plugin.deep_linking.session import SESSION_PARAM
 from openedx_lti_tool_plugin.deep_linking.tests import MODULE_PATH
 from openedx_lti_tool_plugin.deep_linking.views import DeepLinkingFormView, DeepLinkingView
 
@@ -19,6 +21,8 @@ MODULE_PATH = f'{MODULE_PATH}.views'
 
 @patch.object(DeepLinkingView, 'get_message')
 @patch(f'{MODULE_PATH}.validate_deep_linking_message')
+@patch(f'{MODULE_PATH}.DeepLinkingSession')
+@patch(f'{MODULE_PATH}.reverse')
 @patch(f'{MODULE_PATH}.redirect')
 class TestDeepLinkingViewPost(TestCase):
     """Test ResourceLinkLaunchView.post method."""
@@ -32,10 +36,17 @@ class TestDeepLinkingViewPost(TestCase):
     def test_with_deep_linking_request(
         self,
         redirect_mock: MagicMock,
+        reverse_mock: MagicMock,
+        deep_linking_session_mock: MagicMock,
         validate_deep_linking_message_mock: MagicMock,
         get_message_mock: MagicMock,
     ):
         """Test with deep linking request (happy path)."""
+        launch_id = uuid4()
+        get_message_mock.return_value.get_launch_id.return_value = f'lti1p3-launch-{launch_id}'
+        deep_linking_session_mock.from_message.return_value.dumps.return_value = 'test:token'
+        reverse_mock.return_value = '/test-form/'
+
         self.assertEqual(
             self.view_class.as_view()(self.request),
             redirect_mock.return_value,
@@ -43,17 +54,21 @@ class TestDeepLinkingViewPost(TestCase):
         get_message_mock.assert_called_once_with(self.request)
         validate_deep_linking_message_mock.assert_called_once_with(get_message_mock())
         get_message_mock().get_launch_id.assert_called_once_with()
-        get_message_mock().get_launch_id().replace.assert_called_once_with('lti1p3-launch-', '')
-        redirect_mock.assert_called_once_with(
+        deep_linking_session_mock.from_message.assert_called_once_with(str(launch_id), get_message_mock())
+        deep_linking_session_mock.from_message().dumps.assert_called_once_with()
+        reverse_mock.assert_called_once_with(
             f'{app_config.name}:1.3:deep-linking:form',
-            launch_id=get_message_mock().get_launch_id().replace(),
+            kwargs={'launch_id': str(launch_id)},
         )
+        redirect_mock.assert_called_once_with(f'/test-form/?{SESSION_PARAM}=test%3Atoken')
 
     @patch.object(DeepLinkingView, 'http_response_error')
     def test_with_lti_exception(
         self,
         http_response_error_mock: MagicMock,
         redirect_mock: MagicMock,
+        reverse_mock: MagicMock,
+        deep_linking_session_mock: MagicMock,
         validate_deep_linking_message_mock: MagicMock,
         get_message_mock: MagicMock,
     ):
@@ -67,6 +82,8 @@ class TestDeepLinkingViewPost(TestCase):
         )
         get_message_mock.assert_called_once_with(self.request)
         validate_deep_linking_message_mock.assert_not_called()
+        deep_linking_session_mock.from_message.assert_not_called()
+        reverse_mock.assert_not_called()
         redirect_mock.assert_not_called()
         http_response_error_mock.assert_called_once_with(exception)
 
@@ -75,6 +92,8 @@ class TestDeepLinkingViewPost(TestCase):
         self,
         http_response_error_mock: MagicMock,
         redirect_mock: MagicMock,
+        reverse_mock: MagicMock,
+        deep_linking_session_mock: MagicMock,
         validate_deep_linking_message_mock: MagicMock,
         get_message_mock: MagicMock,
     ):
@@ -88,6 +107,8 @@ class TestDeepLinkingViewPost(TestCase):
         )
         get_message_mock.assert_called_once_with(self.request)
         validate_deep_linking_message_mock.assert_called_once_with(get_message_mock())
+        deep_linking_session_mock.from_message.assert_not_called()
+        reverse_mock.assert_not_called()
         redirect_mock.assert_not_called()
         http_response_error_mock.assert_called_once_with(exception)
 
@@ -106,9 +127,9 @@ class TestDeepLinkingFormView(TestCase):
         self.assertEqual(DeepLinkingFormView.form_class, DeepLinkingForm)
 
 
-@patch.object(DeepLinkingFormView, 'get_message_from_cache')
-@patch(f'{MODULE_PATH}.validate_deep_linking_message')
-@patch(f'{MODULE_PATH}.configuration_helpers')
+@ddt
+@patch.object(DeepLinkingFormView, 'get_deep_linking_session')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 class TestDeepLinkingFormViewGet(TestCase):
     """Test DeepLinkingFormView.get method."""
 
@@ -117,77 +138,58 @@ class TestDeepLinkingFormViewGet(TestCase):
         super().setUp()
         self.view_class = DeepLinkingFormView
         self.launch_id = uuid4()
+        self.token = 'test-token'
         self.request = RequestFactory().get(
             reverse('1.3:deep-linking:form', args=[self.launch_id]),
+            {SESSION_PARAM: self.token},
         )
 
     @patch(f'{MODULE_PATH}.render')
     def test_with_deep_linking_request(
         self,
         render_mock: MagicMock,
-        configuration_helpers_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
+        get_deep_linking_session_mock: MagicMock,
     ):
         """Test with deep linking request (happy path)."""
         self.assertEqual(
             self.view_class.as_view()(self.request, self.launch_id),
             render_mock.return_value,
         )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_called_once_with(get_message_from_cache_mock())
-        configuration_helpers_mock().get_value.assert_called_once_with(
+        get_deep_linking_session_mock.assert_called_once_with(self.request, self.launch_id, self.token)
+        get_settings_snapshot_mock().get_value.assert_called_once_with(
             'OLTITP_DEEP_LINKING_FORM_TEMPLATE',
             settings.OLTITP_DEEP_LINKING_FORM_TEMPLATE,
         )
+        get_deep_linking_session_mock().dumps.assert_called_once_with()
         render_mock.assert_called_once_with(
             self.request,
-            configuration_helpers_mock().get_value(),
+            get_settings_snapshot_mock().get_value(),
             {
                 'launch_id': self.launch_id,
+                'session': get_deep_linking_session_mock().dumps(),
             },
         )
 
+    @data(LtiException, DeepLinkingException)
     @patch.object(DeepLinkingFormView, 'http_response_error')
-    def test_with_lti_exception(
+    def test_with_exception(
         self,
+        exception_class: Exception,
         http_response_error_mock: MagicMock,
-        configuration_helpers_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
+        get_deep_linking_session_mock: MagicMock,
     ):
-        """Test with LtiException."""
-        exception = LtiException('Error message')
-        get_message_from_cache_mock.side_effect = exception
+        """Test with LtiException or DeepLinkingException."""
+        exception = exception_class('Error message')
+        get_deep_linking_session_mock.side_effect = exception
 
         self.assertEqual(
             self.view_class.as_view()(self.request, self.launch_id),
             http_response_error_mock.return_value,
         )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_not_called()
-        configuration_helpers_mock().get_value.assert_not_called()
-        http_response_error_mock.assert_called_once_with(exception)
-
-    @patch.object(DeepLinkingFormView, 'http_response_error')
-    def test_with_deep_linking_exception(
-        self,
-        http_response_error_mock: MagicMock,
-        configuration_helpers_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
-    ):
-        """Test with DeepLinkingException."""
-        exception = DeepLinkingException('Error message')
-        validate_deep_linking_message_mock.side_effect = exception
-
-        self.assertEqual(
-            self.view_class.as_view()(self.request, self.launch_id),
-            http_response_error_mock.return_value,
-        )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_called_once_with(get_message_from_cache_mock())
-        configuration_helpers_mock().get_value.assert_not_called()
+        get_deep_linking_session_mock.assert_called_once_with(self.request, self.launch_id, self.token)
+        get_settings_snapshot_mock().get_value.assert_not_called()
         http_response_error_mock.assert_called_once_with(exception)
 
     @override_settings(OLTITP_ENABLE_LTI_TOOL=False)
@@ -197,8 +199,8 @@ class TestDeepLinkingFormViewGet(TestCase):
             self.view_class.as_view()(self.request)
 
 
-@patch.object(DeepLinkingFormView, 'get_message_from_cache')
-@patch(f'{MODULE_PATH}.validate_deep_linking_message')
+@ddt
+@patch.object(DeepLinkingFormView, 'get_deep_linking_session')
 @patch.object(DeepLinkingFormView, 'form_class')
 class TestDeepLinkingFormViewPost(TestCase):
     """Test DeepLinkingFormView.post method."""
@@ -208,8 +210,10 @@ class TestDeepLinkingFormViewPost(TestCase):
         super().setUp()
         self.view_class = DeepLinkingFormView
         self.launch_id = uuid4()
+        self.token = 'test-token'
         self.request = RequestFactory().post(
             reverse('1.3:deep-linking:form', args=[self.launch_id]),
+            {SESSION_PARAM: self.token},
         )
 
     @patch(f'{MODULE_PATH}.HttpResponse')
@@ -217,8 +221,7 @@ class TestDeepLinkingFormViewPost(TestCase):
         self,
         http_response_mock: MagicMock,
         form_class_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
+        get_deep_linking_session_mock: MagicMock,
     ):
         """Test with deep linking request (happy path)."""
         form_class_mock.return_value.cleaned_data = {
@@ -234,16 +237,15 @@ class TestDeepLinkingFormViewPost(TestCase):
             self.view_class.as_view()(self.request, self.launch_id),
             http_response_mock.return_value,
         )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_called_once_with(get_message_from_cache_mock())
+        get_deep_linking_session_mock.assert_called_once_with(self.request, self.launch_id, self.token)
         form_class_mock.assert_called_once_with(self.request.POST)
         form_class_mock().is_valid.assert_called_once_with()
-        get_message_from_cache_mock().get_deep_link.assert_called_once_with()
-        get_message_from_cache_mock().get_deep_link().output_response_form.assert_called_once_with(
+        get_deep_linking_session_mock().get_deep_link.assert_called_once_with(ANY)
+        get_deep_linking_session_mock().get_deep_link().output_response_form.assert_called_once_with(
             form_class_mock().cleaned_data['deep_link_resources'],
         )
         http_response_mock.assert_called_once_with(
-            get_message_from_cache_mock().get_deep_link().output_response_form(),
+            get_deep_linking_session_mock().get_deep_link().output_response_form(),
         )
 
     @patch.object(DeepLinkingFormView, 'http_response_error')
@@ -251,8 +253,7 @@ class TestDeepLinkingFormViewPost(TestCase):
         self,
         http_response_error_mock: MagicMock,
         form_class_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
+        get_deep_linking_session_mock: MagicMock,
     ):
         """Test with invalid form."""
         form_class_mock.return_value.is_valid.return_value = False
@@ -261,60 +262,31 @@ class TestDeepLinkingFormViewPost(TestCase):
             self.view_class.as_view()(self.request, self.launch_id),
             http_response_error_mock.return_value,
         )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_called_once_with(get_message_from_cache_mock())
+        get_deep_linking_session_mock.assert_called_once_with(self.request, self.launch_id, self.token)
         form_class_mock.assert_called_once_with(self.request.POST)
         form_class_mock().is_valid.assert_called_once_with()
-        get_message_from_cache_mock().get_deep_link.assert_not_called()
-        get_message_from_cache_mock().get_deep_link().output_response_form.assert_not_called()
+        get_deep_linking_session_mock().get_deep_link.assert_not_called()
         http_response_error_mock.assert_called_once()
 
+    @data(LtiException, DeepLinkingException)
     @patch.object(DeepLinkingFormView, 'http_response_error')
-    def test_with_lti_exception(
+    def test_with_exception(
         self,
+        exception_class: Exception,
         http_response_error_mock: MagicMock,
         form_class_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
+        get_deep_linking_session_mock: MagicMock,
     ):
-        """Test with LtiException."""
-        exception = LtiException('Error message')
-        get_message_from_cache_mock.side_effect = exception
-
-        self.assertEqual(
-            self.view_class.as_view()(self.request, self.launch_id),
-            http_response_error_mock.return_value,
-        )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_not_called()
-        form_class_mock.assert_not_called()
-        form_class_mock().is_valid.assert_not_called()
-        get_message_from_cache_mock.return_value.get_deep_link.assert_not_called()
-        get_message_from_cache_mock.return_value.get_deep_link().output_response_form.assert_not_called()
-        http_response_error_mock.assert_called_once_with(exception)
-
-    @patch.object(DeepLinkingFormView, 'http_response_error')
-    def test_with_deep_linking_exception(
-        self,
-        http_response_error_mock: MagicMock,
-        form_class_mock: MagicMock,
-        validate_deep_linking_message_mock: MagicMock,
-        get_message_from_cache_mock: MagicMock,
-    ):
-        """Test with DeepLinkingException."""
-        exception = DeepLinkingException('Error message')
-        validate_deep_linking_message_mock.side_effect = exception
+        """Test with LtiException or DeepLinkingException."""
+        exception = exception_class('Error message')
+        get_deep_linking_session_mock.side_effect = exception
 
         self.assertEqual(
             self.view_class.as_view()(self.request, self.launch_id),
             http_response_error_mock.return_value,
         )
-        get_message_from_cache_mock.assert_called_once_with(self.request, self.launch_id)
-        validate_deep_linking_message_mock.assert_called_once_with(get_message_from_cache_mock())
+        get_deep_linking_session_mock.assert_called_once_with(self.request, self.launch_id, self.token)
         form_class_mock.assert_not_called()
-        form_class_mock().is_valid.assert_not_called()
-        get_message_from_cache_mock().get_deep_link.assert_not_called()
-        get_message_from_cache_mock().get_deep_link().output_response_form.assert_not_called()
         http_response_error_mock.assert_called_once_with(exception)
 
     @override_settings(OLTITP_ENABLE_LTI_TOOL=False)
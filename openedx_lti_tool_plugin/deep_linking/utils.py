@@ -1,4 +1,8 @@
 """Utilities."""
+import re
+import unicodedata
+from typing import Set
+
 from django.utils.translation import gettext as _
 from pylti1p3.contrib.django import DjangoMessageLaunch
 
@@ -23,3 +27,29 @@ def validate_deep_linking_message(message: DjangoMessageLaunch):
         raise DeepLinkingException(
             _('Message type is not LtiDeepLinkingRequest.'),
         )
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """
+    Get the trigrams of a text.
+
+    The text is case folded, accents and punctuation are removed
+    and every word is padded with two leading spaces and one trailing
+    space, so short words and word prefixes also have trigrams.
+
+    Args:
+        text: Text string.
+
+    Returns:
+        Set of trigram strings.
+
+    """
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    trigrams = set()
+
+    for word in re.findall(r'\w+', text):
+        word = f'  {word} '
+        trigrams.update(word[index:index + 3] for index in range(len(word) - 2))
+
+    return trigrams
@@ -6,7 +6,9 @@ from django.conf import settings
 from django.http import HttpResponse
 from django.http.request import HttpRequest
 from django.shortcuts import redirect, render
+from django.urls import reverse
 from django.utils.decorators import method_decorator
+from django.utils.http import urlencode
 from django.utils.translation import gettext as _
 from django.views.decorators.clickjacking import xframe_options_exempt
 from django.views.decorators.csrf import csrf_exempt
@@ -15,9 +17,10 @@ from pylti1p3.exception import LtiException
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.deep_linking.exceptions import DeepLinkingException
 from openedx_lti_tool_plugin.deep_linking.forms import DeepLinkingForm
+from openedx_lti_tool_plugin.deep_linking.session import SESSION_PARAM, DeepLinkingSession, DeepLinkingSessionMixin
 from openedx_lti_tool_plugin.deep_linking.utils import validate_deep_linking_message
-from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
 from openedx_lti_tool_plugin.http import LoggedHttpResponseBadRequest
+from openedx_lti_tool_plugin.snapshot import get_settings_snapshot
 from openedx_lti_tool_plugin.views import LTIToolView
 
 
@@ -41,7 +44,8 @@ class DeepLinkingView(LTIToolView):
     ) -> Union[HttpResponse, LoggedHttpResponseBadRequest]:
         """HTTP POST request method.
 
-        Validate LtiDeepLinkingRequest message and redirect to DeepLinkingFormView.
+        Validate LtiDeepLinkingRequest message and redirect to DeepLinkingFormView
+        with a deep linking session token.
 
         Args:
             request: HttpRequest object.
@@ -55,11 +59,12 @@ class DeepLinkingView(LTIToolView):
             message = self.get_message(request)
             # Check launch message type.
             validate_deep_linking_message(message)
-            # Redirect to DeepLinkingForm view.
-            return redirect(
-                f'{app_config.name}:1.3:deep-linking:form',
-                launch_id=message.get_launch_id().replace('lti1p3-launch-', ''),
-            )
+            launch_id = message.get_launch_id().replace('lti1p3-launch-', '')
+            # Create deep linking session.
+            session = DeepLinkingSession.from_message(launch_id, message)
+            # Redirect to DeepLinkingForm view with the session token.
+            form_url = reverse(f'{app_config.name}:1.3:deep-linking:form', kwargs={'launch_id': launch_id})
+            return redirect(f'{form_url}?{urlencode({SESSION_PARAM: session.dumps()})}')
         except (LtiException, DeepLinkingException) as exc:
             return self.http_response_error(exc)
 
@@ -69,7 +74,7 @@ class DeepLinkingView(LTIToolView):
 # in an iframe within the platform. The view is protected by the LTI
 # authentication and authorization mechanisms.
 @method_decorator([csrf_exempt, xframe_options_exempt], name='dispatch')
-class DeepLinkingFormView(LTIToolView):
+class DeepLinkingFormView(DeepLinkingSessionMixin, LTIToolView):
     """Deep Linking Form View.
 
     This view renders an interface allowing the user to discover and select one
@@ -96,7 +101,10 @@ class DeepLinkingFormView(LTIToolView):
     ) -> Union[HttpResponse, LoggedHttpResponseBadRequest]:
         """HTTP GET request method.
 
-        Validate cached LtiDeepLinkingRequest message and render DeepLinkingForm.
+        Load the deep linking session and render DeepLinkingForm.
+
+        The session is loaded from the session token query param, without
+        a token the LtiDeepLinkingRequest message is restored from the cache.
 
         Args:
             request: HttpRequest object.
@@ -107,19 +115,18 @@ class DeepLinkingFormView(LTIToolView):
 
         """
         try:
-            # Get message from cache.
-            message = self.get_message_from_cache(request, launch_id)
-            # Validate message.
-            validate_deep_linking_message(message)
+            # Get deep linking session.
+            session = self.get_deep_linking_session(request, launch_id, request.GET.get(SESSION_PARAM))
             # Render form template.
             return render(
                 request,
-                configuration_helpers().get_value(
+                get_settings_snapshot().get_value(
                     'OLTITP_DEEP_LINKING_FORM_TEMPLATE',
                     settings.OLTITP_DEEP_LINKING_FORM_TEMPLATE,
                 ),
                 {
                     'launch_id': launch_id,
+                    'session': session.dumps(),
                 },
             )
         except (LtiException, DeepLinkingException) as exc:
@@ -132,7 +139,7 @@ class DeepLinkingFormView(LTIToolView):
     ) -> Union[HttpResponse, LoggedHttpResponseBadRequest]:
         """HTTP POST request method.
 
-        Validate cached LtiDeepLinkingRequest message, DeepLinkingForm
+        Load the deep linking session, validate DeepLinkingForm
         and render Deep Linking Response with selected form items.
 
         Args:
@@ -144,10 +151,8 @@ class DeepLinkingFormView(LTIToolView):
 
         """
         try:
-            # Get message from cache.
-            message = self.get_message_from_cache(request, launch_id)
-            # Validate message.
-            validate_deep_linking_message(message)
+            # Get deep linking session.
+            session = self.get_deep_linking_session(request, launch_id, request.POST.get(SESSION_PARAM))
             # Initialize form.
             form = self.form_class(request.POST)
             # Validate form.
@@ -155,7 +160,7 @@ class DeepLinkingFormView(LTIToolView):
                 raise DeepLinkingException(form.errors)
             # Render Deep Linking response.
             return HttpResponse(
-                message.get_deep_link().output_response_form(
+                session.get_deep_link(self.tool_config).output_response_form(
                     form.cleaned_data.get('deep_link_resources', []),
                 )
             )
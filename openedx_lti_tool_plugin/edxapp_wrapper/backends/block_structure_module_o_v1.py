@@ -0,0 +1,14 @@
+"""block_structure module backend (olive v1)."""
+from openedx.core.djangoapps.content.block_structure.api import (  # type: ignore  # pylint: disable=import-error
+    get_course_in_cache,
+)
+
+
+def get_course_in_cache_backend(*args: tuple, **kwargs: dict):
+    """Return the cached BlockStructure of a course.
+
+    Args:
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+    """
+    return get_course_in_cache(*args, **kwargs)
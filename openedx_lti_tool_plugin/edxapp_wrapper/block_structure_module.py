@@ -0,0 +1,12 @@
+"""edx-platform block_structure module wrapper."""
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
+
+
+def get_course_in_cache(*args: tuple, **kwargs: dict):
+    """Return the cached BlockStructure of a course.
+
+    Args:
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+    """
+    return get_backends().get_course_in_cache_backend(*args, **kwargs)
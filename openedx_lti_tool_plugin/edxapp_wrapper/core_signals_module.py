@@ -1,11 +1,7 @@
 """edx-platform core signals module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def course_grade_changed():
     """Return COURSE_GRADE_CHANGED class."""
-    return import_module(
-        settings.OLTITP_CORE_SIGNALS_BACKEND,
-    ).course_grade_changed_backend()
+    return get_backends().course_grade_changed_backend()
@@ -1,7 +1,5 @@
 """edx-platform grades module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def problem_weighted_score_changed():
@@ -11,9 +9,7 @@ def problem_weighted_score_changed():
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
-    return import_module(
-        settings.OLTITP_GRADES_BACKEND,
-    ).problem_weighted_score_changed_backend()
+    return get_backends().problem_weighted_score_changed_backend()
 
 
 def course_grade_factory(*args: tuple, **kwargs: dict):
@@ -23,6 +19,4 @@ def course_grade_factory(*args: tuple, **kwargs: dict):
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
-    return import_module(
-        settings.OLTITP_GRADES_BACKEND,
-    ).course_grade_factory_backend(*args, **kwargs)
+    return get_backends().course_grade_factory_backend(*args, **kwargs)
@@ -0,0 +1,169 @@
+"""edx-platform backend instrumentation.
+
+The backend functions of the BackendRegistry are wrapped with call timing,
+call counting and slow call logging when OLTITP_BACKEND_INSTRUMENTATION is
+enabled. The calls are reported as request custom attributes through the
+edx-django-utils monitoring API:
+
+- oltitp.backend.<name>.calls: Number of calls.
+- oltitp.backend.<name>.duration_ms: Total call duration in milliseconds.
+
+The objects returned by the BACKEND_PROXIES backend functions are wrapped
+with a BackendProxy, their method calls are reported with the method name
+appended to the backend function name (e.g. course_grade_factory_backend.read).
+The backends returning a model or exception class are not proxied, a proxy
+can't be used on isinstance checks or except clauses.
+
+Attributes:
+    METRIC_PREFIX (str): Custom attribute name prefix.
+    DEFAULT_SLOW_CALL_THRESHOLD (float): Default slow call threshold in seconds.
+    BACKEND_PROXIES (tuple): Backend functions returning an object
+        with the edx-platform methods called by the plugin, the
+        returned object must not be a class.
+
+"""
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from edx_django_utils.monitoring import accumulate
+
+log = logging.getLogger(__name__)
+METRIC_PREFIX = 'oltitp.backend'
+DEFAULT_SLOW_CALL_THRESHOLD = 0.5
+BACKEND_PROXIES = (
+    'configuration_helpers_backend',
+    'course_grade_factory_backend',
+    'modulestore_backend',
+)
+
+
+def timed(name: str, function: Callable, threshold: float, proxy: bool = False) -> Callable:
+    """Wrap a backend function with call timing.
+
+    Args:
+        name: Backend function name.
+        function: Backend function.
+        threshold: Slow call threshold in seconds.
+        proxy: Wrap the function result with a BackendProxy.
+
+    Returns:
+        Wrapped backend function.
+
+    """
+    @functools.wraps(function)
+    def wrapper(*args: tuple, **kwargs: dict) -> Any:
+        started = time.perf_counter()
+
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            record_call(name, time.perf_counter() - started, threshold)
+
+        return BackendProxy(name, result, threshold) if proxy else result
+
+    return wrapper
+
+
+def record_call(name: str, duration: float, threshold: float):
+    """Record a backend call.
+
+    Args:
+        name: Backend function name.
+        duration: Call duration in seconds.
+        threshold: Slow call threshold in seconds.
+
+    """
+    accumulate(f'{METRIC_PREFIX}.{name}.calls', 1)
+    accumulate(f'{METRIC_PREFIX}.{name}.duration_ms', round(duration * 1000, 3))
+
+    if duration >= threshold:
+        log_extra = {'backend': name, 'duration_ms': round(duration * 1000, 3)}
+        log.warning(f'Slow edx-platform backend call: {log_extra}')
+
+
+class BackendProxy:
+    """edx-platform Backend Proxy.
+
+    This class wraps an object returned by a backend function, the calls
+    of its methods and functions are timed, any other attribute (e.g. a
+    class or an exception type) is returned unwrapped. The result of calling
+    the object itself is proxied too (e.g. the store returned by the
+    modulestore function).
+
+    Attributes:
+        name (str): Backend function name.
+        target (Any): Proxied object.
+        threshold (float): Slow call threshold in seconds.
+
+    """
+
+    def __init__(self, name: str, target: Any, threshold: float):
+        """Initialize class instance.
+
+        Args:
+            name: Backend function name.
+            target: Proxied object.
+            threshold: Slow call threshold in seconds.
+
+        """
+        self.name = name
+        self.target = target
+        self.threshold = threshold
+
+    def __getattr__(self, attr: str) -> Any:
+        """Get a proxied object attribute.
+
+        Args:
+            attr: Attribute name.
+
+        Returns:
+            Timed method if the attribute is a method or a function,
+            the attribute otherwise.
+
+        """
+        value = getattr(self.target, attr)
+
+        if inspect.ismethod(value) or inspect.isfunction(value):
+            return timed(f'{self.name}.{attr}', value, self.threshold)
+
+        return value
+
+    def __call__(self, *args: tuple, **kwargs: dict) -> Any:
+        """Call the proxied object.
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            BackendProxy of the call result.
+
+        """
+        return BackendProxy(self.name, self.target(*args, **kwargs), self.threshold)
+
+    def __repr__(self) -> str:
+        """Get a string representation of this instance."""
+        return f'<BackendProxy, {self.name}: {self.target!r}>'
+
+
+def instrument(name: str, function: Callable) -> Callable:
+    """Instrument a backend function.
+
+    Args:
+        name: Backend function name.
+        function: Backend function.
+
+    Returns:
+        Timed backend function.
+
+    """
+    return timed(
+        name,
+        function,
+        getattr(settings, 'OLTITP_BACKEND_SLOW_CALL_THRESHOLD', DEFAULT_SLOW_CALL_THRESHOLD),
+        proxy=name in BACKEND_PROXIES,
+    )
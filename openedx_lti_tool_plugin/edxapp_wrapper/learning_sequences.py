@@ -1,11 +1,7 @@
 """edx-platform learning_sequences module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def course_context():
     """Return CourseContext class."""
-    return import_module(
-        settings.OLTITP_LEARNING_SEQUENCES_BACKEND,
-    ).course_context_backend()
+    return get_backends().course_context_backend()
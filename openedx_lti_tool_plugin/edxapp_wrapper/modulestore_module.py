@@ -1,11 +1,7 @@
 """edx-platform modulestore module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def modulestore():
     """Return modulestore function."""
-    return import_module(
-        settings.OLTITP_MODULESTORE_BACKEND,
-    ).modulestore()
+    return get_backends().modulestore_backend()()
@@ -0,0 +1,173 @@
+"""edx-platform backend registry.
+
+The backend modules configured on the OLTITP_*_BACKEND settings are imported
+once, when the app is ready, and their backend functions are stored on a
+frozen BackendRegistry. The edxapp_wrapper functions call the registry
+functions instead of importing the backend module on each call.
+
+The backend functions are instrumented when OLTITP_BACKEND_INSTRUMENTATION
+is enabled, see the instrumentation module.
+
+Attributes:
+    BACKEND_FUNCTIONS (dict): Backend functions required from each backend setting.
+    INSTRUMENTATION_SETTINGS (tuple): Backend instrumentation settings.
+
+"""
+import logging
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from openedx_lti_tool_plugin.edxapp_wrapper.instrumentation import instrument
+
+log = logging.getLogger(__name__)
+BACKEND_FUNCTIONS = {
+    'OLTITP_BLOCK_STRUCTURE_BACKEND': ('get_course_in_cache_backend',),
+    'OLTITP_CORE_SIGNALS_BACKEND': ('course_grade_changed_backend',),
+    'OLTITP_GRADES_BACKEND': ('problem_weighted_score_changed_backend', 'course_grade_factory_backend'),
+    'OLTITP_LEARNING_SEQUENCES_BACKEND': ('course_context_backend',),
+    'OLTITP_MODULESTORE_BACKEND': ('modulestore_backend',),
+    'OLTITP_SAFE_SESSIONS_BACKEND': ('mark_user_change_as_expected_backend',),
+    'OLTITP_SITE_CONFIGURATION_BACKEND': ('configuration_helpers_backend',),
+    'OLTITP_STUDENT_BACKEND': (
+        'user_profile_backend',
+        'course_enrollment_backend',
+        'course_enrollment_exception_backend',
+    ),
+    'OLTITP_USER_AUTHN_BACKEND': ('set_logged_in_cookies_backend',),
+}
+INSTRUMENTATION_SETTINGS = ('OLTITP_BACKEND_INSTRUMENTATION', 'OLTITP_BACKEND_SLOW_CALL_THRESHOLD')
+_registry: Optional['BackendRegistry'] = None
+
+
+class BackendRegistry:
+    """edx-platform Backend Registry.
+
+    A frozen registry with a backend function attribute for each
+    function name of BACKEND_FUNCTIONS.
+
+    Attributes:
+        get_course_in_cache_backend (Callable): block_structure get_course_in_cache backend.
+        course_grade_changed_backend (Callable): COURSE_GRADE_CHANGED backend.
+        problem_weighted_score_changed_backend (Callable): PROBLEM_WEIGHTED_SCORE_CHANGED backend.
+        course_grade_factory_backend (Callable): CourseGradeFactory backend.
+        course_context_backend (Callable): CourseContext backend.
+        modulestore_backend (Callable): modulestore backend.
+        mark_user_change_as_expected_backend (Callable): mark_user_change_as_expected backend.
+        configuration_helpers_backend (Callable): configuration_helpers backend.
+        user_profile_backend (Callable): UserProfile backend.
+        course_enrollment_backend (Callable): CourseEnrollment backend.
+        course_enrollment_exception_backend (Callable): CourseEnrollmentException backend.
+        set_logged_in_cookies_backend (Callable): set_logged_in_cookies backend.
+
+    """
+
+    get_course_in_cache_backend: Callable
+    course_grade_changed_backend: Callable
+    problem_weighted_score_changed_backend: Callable
+    course_grade_factory_backend: Callable
+    course_context_backend: Callable
+    modulestore_backend: Callable
+    mark_user_change_as_expected_backend: Callable
+    configuration_helpers_backend: Callable
+    user_profile_backend: Callable
+    course_enrollment_backend: Callable
+    course_enrollment_exception_backend: Callable
+    set_logged_in_cookies_backend: Callable
+
+    def __init__(self, backends: Dict[str, Callable]):
+        """Initialize class instance.
+
+        Args:
+            backends: Backend function by function name.
+
+        """
+        for name, function in backends.items():
+            object.__setattr__(self, name, function)
+
+    def __setattr__(self, name: str, value: Any):
+        """Prevent setting registry attributes.
+
+        Raises:
+            AttributeError: Always, the registry is frozen.
+
+        """
+        raise AttributeError(f'BackendRegistry is frozen, cannot set {name}.')
+
+    def __delattr__(self, name: str):
+        """Prevent deleting registry attributes.
+
+        Raises:
+            AttributeError: Always, the registry is frozen.
+
+        """
+        raise AttributeError(f'BackendRegistry is frozen, cannot delete {name}.')
+
+
+def load_backends() -> BackendRegistry:
+    """Import the configured backend modules and load the backend registry.
+
+    Returns:
+        BackendRegistry instance.
+
+    Raises:
+        ImproperlyConfigured: If a backend setting or function is missing.
+
+    """
+    global _registry  # pylint: disable=global-statement
+
+    backends = {}
+    missing = []
+
+    for setting_name, function_names in BACKEND_FUNCTIONS.items():
+        if not (module_path := getattr(settings, setting_name, None)):
+            raise ImproperlyConfigured(f'{setting_name} setting is missing.')
+
+        module = import_module(module_path)
+
+        for function_name in function_names:
+            if not callable(function := getattr(module, function_name, None)):
+                missing.append(f'{module_path}.{function_name}')
+                continue
+
+            backends[function_name] = function
+
+    if missing:
+        raise ImproperlyConfigured(f'Missing edx-platform backend functions: {", ".join(missing)}')
+
+    if getattr(settings, 'OLTITP_BACKEND_INSTRUMENTATION', False):
+        backends = {name: instrument(name, function) for name, function in backends.items()}
+
+    _registry = BackendRegistry(backends)
+    log.debug(f'edx-platform backends loaded: {sorted(backends)}')
+
+    return _registry
+
+
+def get_backends() -> BackendRegistry:
+    """Get the backend registry.
+
+    The registry is loaded on first use if the app is not ready yet.
+
+    Returns:
+        BackendRegistry instance.
+
+    """
+    return _registry or load_backends()
+
+
+@receiver(setting_changed)
+def reload_backends(setting: str, **kwargs: dict):
+    """Reload the backend registry when a backend setting changes.
+
+    Args:
+        setting: Changed setting name.
+        **kwargs: Arbitrary keyword arguments.
+
+    """
+    if setting in BACKEND_FUNCTIONS or setting in INSTRUMENTATION_SETTINGS:
+        load_backends()
@@ -1,7 +1,5 @@
 """edx-platform safe_sessions module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def mark_user_change_as_expected(*args: tuple, **kwargs: dict):
@@ -11,6 +9,4 @@ def mark_user_change_as_expected(*args: tuple, **kwargs: dict):
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
-    return import_module(
-        settings.OLTITP_SAFE_SESSIONS_BACKEND,
-    ).mark_user_change_as_expected_backend(*args, **kwargs)
+    return get_backends().mark_user_change_as_expected_backend(*args, **kwargs)
@@ -1,11 +1,7 @@
 """edx-platform site_configuration module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def configuration_helpers():
     """Return configuration_helpers function."""
-    return import_module(
-        settings.OLTITP_SITE_CONFIGURATION_BACKEND
-    ).configuration_helpers_backend()
+    return get_backends().configuration_helpers_backend()
@@ -0,0 +1,4 @@
+"""Test edxapp_wrapper module."""
+from openedx_lti_tool_plugin.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.edxapp_wrapper'
@@ -0,0 +1,220 @@
+"""Tests instrumentation module."""
+from unittest.mock import MagicMock, call, patch
+
+from django.test import TestCase, override_settings
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.edxapp_wrapper.instrumentation import (
+    METRIC_PREFIX,
+    BackendProxy,
+    instrument,
+    record_call,
+    timed,
+)
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
+from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
+from openedx_lti_tool_plugin.edxapp_wrapper.student_module import course_enrollment
+from openedx_lti_tool_plugin.edxapp_wrapper.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.instrumentation'
+NAME = 'test_backend'
+THRESHOLD = 0.5
+
+
+@patch(f'{MODULE_PATH}.record_call')
+@patch(f'{MODULE_PATH}.time.perf_counter', side_effect=[1.0, 1.25])
+class TestTimed(TestCase):
+    """Test timed function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.function = MagicMock()
+
+    def test_timed(self, perf_counter_mock: MagicMock, record_call_mock: MagicMock):
+        """Test timed function (happy path)."""
+        self.assertEqual(
+            timed(NAME, self.function, THRESHOLD)('arg', kwarg='kwarg'),
+            self.function.return_value,
+        )
+        self.function.assert_called_once_with('arg', kwarg='kwarg')
+        self.assertEqual(perf_counter_mock.call_count, 2)
+        record_call_mock.assert_called_once_with(NAME, 0.25, THRESHOLD)
+
+    def test_timed_with_proxy(self, perf_counter_mock: MagicMock, record_call_mock: MagicMock):
+        """Test timed function with proxy argument."""
+        result = timed(NAME, self.function, THRESHOLD, proxy=True)()
+
+        self.assertIsInstance(result, BackendProxy)
+        self.assertEqual(result.name, NAME)
+        self.assertEqual(result.target, self.function.return_value)
+        self.assertEqual(result.threshold, THRESHOLD)
+        self.assertEqual(perf_counter_mock.call_count, 2)
+        record_call_mock.assert_called_once_with(NAME, 0.25, THRESHOLD)
+
+    def test_timed_with_exception(self, perf_counter_mock: MagicMock, record_call_mock: MagicMock):
+        """Test timed function records a call that raises an exception."""
+        self.function.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            timed(NAME, self.function, THRESHOLD)()
+
+        self.assertEqual(perf_counter_mock.call_count, 2)
+        record_call_mock.assert_called_once_with(NAME, 0.25, THRESHOLD)
+
+
+class TestRecordCall(TestCase):
+    """Test record_call function."""
+
+    @log_capture()
+    @patch(f'{MODULE_PATH}.accumulate')
+    def test_record_call(self, accumulate_mock: MagicMock, log_mock: LogCaptureForDecorator):
+        """Test record_call function (happy path)."""
+        record_call(NAME, 0.25, THRESHOLD)
+
+        accumulate_mock.assert_has_calls([
+            call(f'{METRIC_PREFIX}.{NAME}.calls', 1),
+            call(f'{METRIC_PREFIX}.{NAME}.duration_ms', 250.0),
+        ])
+        log_mock.check()
+
+    @log_capture()
+    @patch(f'{MODULE_PATH}.accumulate')
+    def test_record_call_with_slow_call(self, accumulate_mock: MagicMock, log_mock: LogCaptureForDecorator):
+        """Test record_call function with slow call."""
+        record_call(NAME, 0.75, THRESHOLD)
+
+        accumulate_mock.assert_has_calls([
+            call(f'{METRIC_PREFIX}.{NAME}.calls', 1),
+            call(f'{METRIC_PREFIX}.{NAME}.duration_ms', 750.0),
+        ])
+        log_extra = {'backend': NAME, 'duration_ms': 750.0}
+        log_mock.check((MODULE_PATH, 'WARNING', f'Slow edx-platform backend call: {log_extra}'))
+
+
+class BackendTargetTest:
+    """BackendProxy target test class."""
+
+    class DoesNotExist(Exception):
+        """Test exception type."""
+
+    class Item:
+        """Test class."""
+
+    def read(self):
+        """Test method."""
+
+    @staticmethod
+    def get_value():
+        """Test function."""
+
+
+@patch(f'{MODULE_PATH}.timed')
+class TestBackendProxy(TestCase):
+    """Test BackendProxy class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.target = MagicMock(value='test-value')
+        self.proxy = BackendProxy(NAME, self.target, THRESHOLD)
+
+    def test_getattr_with_method(self, timed_mock: MagicMock):
+        """Test __getattr__ method with method attribute."""
+        target = BackendTargetTest()
+        proxy = BackendProxy(NAME, target, THRESHOLD)
+
+        self.assertEqual(proxy.read, timed_mock.return_value)
+        timed_mock.assert_called_once_with(f'{NAME}.read', target.read, THRESHOLD)
+
+    def test_getattr_with_function(self, timed_mock: MagicMock):
+        """Test __getattr__ method with function attribute."""
+        proxy = BackendProxy(NAME, BackendTargetTest, THRESHOLD)
+
+        self.assertEqual(proxy.get_value, timed_mock.return_value)
+        timed_mock.assert_called_once_with(f'{NAME}.get_value', BackendTargetTest.get_value, THRESHOLD)
+
+    def test_getattr_with_class(self, timed_mock: MagicMock):
+        """Test __getattr__ method with class and exception type attributes."""
+        proxy = BackendProxy(NAME, BackendTargetTest, THRESHOLD)
+
+        self.assertIs(proxy.DoesNotExist, BackendTargetTest.DoesNotExist)
+        self.assertIs(proxy.Item, BackendTargetTest.Item)
+        timed_mock.assert_not_called()
+
+    def test_getattr_with_callable_object(self, timed_mock: MagicMock):
+        """Test __getattr__ method with a callable object attribute."""
+        self.assertEqual(self.proxy.read, self.target.read)
+        timed_mock.assert_not_called()
+
+    def test_getattr_with_value(self, timed_mock: MagicMock):
+        """Test __getattr__ method with non callable attribute."""
+        self.assertEqual(self.proxy.value, 'test-value')
+        timed_mock.assert_not_called()
+
+    def test_call(self, timed_mock: MagicMock):
+        """Test __call__ method."""
+        result = self.proxy('arg')
+
+        self.assertIsInstance(result, BackendProxy)
+        self.assertEqual(result.target, self.target.return_value)
+        self.assertEqual(result.name, NAME)
+        self.target.assert_called_once_with('arg')
+        timed_mock.assert_not_called()
+
+
+@patch(f'{MODULE_PATH}.timed')
+class TestInstrument(TestCase):
+    """Test instrument function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.function = MagicMock()
+
+    def test_instrument(self, timed_mock: MagicMock):
+        """Test instrument function."""
+        self.assertEqual(instrument(NAME, self.function), timed_mock.return_value)
+        timed_mock.assert_called_once_with(NAME, self.function, THRESHOLD, proxy=False)
+
+    def test_instrument_with_proxy_backend(self, timed_mock: MagicMock):
+        """Test instrument function with BACKEND_PROXIES backend."""
+        self.assertEqual(
+            instrument('course_grade_factory_backend', self.function),
+            timed_mock.return_value,
+        )
+        timed_mock.assert_called_once_with(
+            'course_grade_factory_backend',
+            self.function,
+            THRESHOLD,
+            proxy=True,
+        )
+
+
+class TestBackendInstrumentation(TestCase):
+    """Test backend registry instrumentation."""
+
+    @patch(f'{MODULE_PATH}.accumulate')
+    def test_instrumented_registry(self, accumulate_mock: MagicMock):
+        """Test registry with OLTITP_BACKEND_INSTRUMENTATION enabled."""
+        with override_settings(OLTITP_BACKEND_INSTRUMENTATION=True):
+            helpers = configuration_helpers()
+            helpers.get_value('test-setting')
+
+        self.assertIsInstance(helpers, BackendProxy)
+        self.assertEqual(
+            [args[0] for args, _kwargs in accumulate_mock.call_args_list],
+            [
+                f'{METRIC_PREFIX}.configuration_helpers_backend.calls',
+                f'{METRIC_PREFIX}.configuration_helpers_backend.duration_ms',
+                f'{METRIC_PREFIX}.configuration_helpers_backend.get_value.calls',
+                f'{METRIC_PREFIX}.configuration_helpers_backend.get_value.duration_ms',
+            ],
+        )
+        self.assertNotIsInstance(get_backends().configuration_helpers_backend(), BackendProxy)
+
+    def test_instrumented_registry_with_class_backend(self):
+        """Test registry does not proxy a backend returning a model class."""
+        with override_settings(OLTITP_BACKEND_INSTRUMENTATION=True):
+            self.assertNotIsInstance(course_enrollment(), BackendProxy)
@@ -0,0 +1,114 @@
+"""Tests registry module."""
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+from openedx_lti_tool_plugin.edxapp_wrapper import registry
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import (
+    BACKEND_FUNCTIONS,
+    BackendRegistry,
+    get_backends,
+    load_backends,
+)
+from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
+from openedx_lti_tool_plugin.edxapp_wrapper.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests import backends_for_tests
+
+MODULE_PATH = f'{MODULE_PATH}.registry'
+
+
+class TestBackendRegistry(TestCase):
+    """Test BackendRegistry class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.function = MagicMock()
+        self.registry = BackendRegistry({'modulestore_backend': self.function})
+
+    def test_init(self):
+        """Test __init__ method."""
+        self.assertEqual(self.registry.modulestore_backend, self.function)
+
+    def test_setattr(self):
+        """Test __setattr__ method."""
+        with self.assertRaises(AttributeError):
+            self.registry.modulestore_backend = MagicMock()
+
+    def test_delattr(self):
+        """Test __delattr__ method."""
+        with self.assertRaises(AttributeError):
+            del self.registry.modulestore_backend
+
+
+class TestLoadBackends(TestCase):
+    """Test load_backends function."""
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        super().tearDown()
+        load_backends()
+
+    def test_load_backends(self):
+        """Test load_backends function (happy path)."""
+        backends = load_backends()
+
+        self.assertEqual(get_backends(), backends)
+
+        for function_names in BACKEND_FUNCTIONS.values():
+            for function_name in function_names:
+                self.assertEqual(
+                    getattr(backends, function_name),
+                    getattr(backends_for_tests, function_name),
+                )
+
+    @patch(f'{MODULE_PATH}.import_module')
+    def test_load_backends_imports_modules_once(self, import_module_mock: MagicMock):
+        """Test backend modules are imported by load_backends only."""
+        load_backends()
+        import_module_mock.reset_mock()
+
+        configuration_helpers()
+        configuration_helpers()
+
+        import_module_mock.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.import_module')
+    def test_load_backends_with_missing_function(self, import_module_mock: MagicMock):
+        """Test load_backends function with missing backend function."""
+        import_module_mock.return_value = ModuleType('test_backend')
+
+        with self.assertRaises(ImproperlyConfigured) as ctxm:
+            load_backends()
+
+        self.assertIn(
+            f'{settings.OLTITP_STUDENT_BACKEND}.user_profile_backend',
+            str(ctxm.exception),
+        )
+
+    def test_load_backends_with_missing_setting(self):
+        """Test load_backends function with missing backend setting."""
+        with patch.object(settings, 'OLTITP_STUDENT_BACKEND', ''):
+            with self.assertRaises(ImproperlyConfigured):
+                load_backends()
+
+
+class TestReloadBackends(TestCase):
+    """Test reload_backends function."""
+
+    def test_reload_on_backend_setting_change(self):
+        """Test the registry is reloaded when a backend setting changes."""
+        backends = get_backends()
+
+        with override_settings(OLTITP_STUDENT_BACKEND=settings.OLTITP_STUDENT_BACKEND):
+            self.assertIsNot(get_backends(), backends)
+
+    def test_no_reload_on_other_setting_change(self):
+        """Test the registry is not reloaded when another setting changes."""
+        backends = get_backends()
+
+        with override_settings(OLTITP_TEST_SETTING=True):
+            self.assertIs(registry._registry, backends)  # pylint: disable=protected-access
@@ -1,7 +1,5 @@
 """edx-platform user_authn module wrapper."""
-from importlib import import_module
-
-from django.conf import settings
+from openedx_lti_tool_plugin.edxapp_wrapper.registry import get_backends
 
 
 def set_logged_in_cookies(*args: tuple, **kwargs: dict):
@@ -11,6 +9,4 @@ def set_logged_in_cookies(*args: tuple, **kwargs: dict):
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
-    return import_module(
-        settings.OLTITP_USER_AUTHN_BACKEND,
-    ).set_logged_in_cookies_backend(*args, **kwargs)
+    return get_backends().set_logged_in_cookies_backend(*args, **kwargs)
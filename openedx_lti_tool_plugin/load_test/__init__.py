@@ -0,0 +1 @@
+"""LTI launch load test harness with a local LTI platform stand-in."""
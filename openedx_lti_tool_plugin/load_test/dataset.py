@@ -0,0 +1,393 @@
+"""Synthetic large-scale dataset generator.
+
+Attributes:
+    DEFAULT_LTI_TOOLS (int): Default number of LtiTool instances.
+    DEFAULT_ALLOWED_COURSE_IDS (int): Default number of allowed course IDs of each LtiToolConfiguration.
+    DEFAULT_COURSE_CONTEXTS (int): Default number of CourseContext instances.
+    DEFAULT_ORGS (int): Default number of course orgs.
+    DEFAULT_LTI_PROFILES (int): Default number of LtiProfile instances.
+    DEFAULT_GRADED_RESOURCES (int): Default number of LtiGradedResource instances.
+    DEFAULT_CHUNK_SIZE (int): Default number of instances per bulk_create batch.
+    SHORT_UUID_UNIT (int): UUID value of one unit of the LtiProfile short UUID.
+    GIVEN_NAMES (tuple): Synthetic PII given names.
+    FAMILY_NAMES (tuple): Synthetic PII family names.
+
+"""
+import json
+import logging
+import random
+import uuid
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import shortuuid
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool, LtiToolKey
+
+from openedx_lti_tool_plugin.edxapp_wrapper.learning_sequences import course_context
+from openedx_lti_tool_plugin.load_test.platform import generate_rsa_key_pair
+from openedx_lti_tool_plugin.models import LtiProfile, LtiToolConfiguration, User, UserProfile
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+
+log = logging.getLogger(__name__)
+DEFAULT_LTI_TOOLS = 5
+DEFAULT_ALLOWED_COURSE_IDS = 20
+DEFAULT_COURSE_CONTEXTS = 100
+DEFAULT_ORGS = 5
+DEFAULT_LTI_PROFILES = 1000
+DEFAULT_GRADED_RESOURCES = 2000
+DEFAULT_CHUNK_SIZE = 1000
+# The LtiProfile short UUID is the first 8 of the 22 shortuuid digits of the UUID.
+SHORT_UUID_UNIT = len(shortuuid.get_alphabet()) ** 14
+GIVEN_NAMES = ('Ada', 'Alan', 'Grace', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Ken', 'Frances', 'Edsger')
+FAMILY_NAMES = ('Lovelace', 'Turing', 'Hopper', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov', 'Thompson')
+
+
+def chunked(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """Split an iterable in lists of `chunk_size` items.
+
+    Args:
+        iterable: Iterable to split.
+        chunk_size: Number of items per list.
+
+    Yields:
+        List of at most `chunk_size` items.
+
+    """
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+class SyntheticDataset:
+    """Synthetic large-scale dataset generator.
+
+    The instances are created with `bulk_create` in chunks of `chunk_size`
+    instances, each chunk on its own transaction. The model save methods
+    and signals are skipped, the related instances they create are
+    created in bulk too:
+
+    - CourseContext and LearningContext instances spread across `orgs` orgs.
+    - LtiTool, LtiToolKey and LtiToolConfiguration instances, every
+      configuration has an allow-list of `allowed_course_ids` course IDs.
+    - LtiProfile, User and UserProfile instances spread across the LtiTools.
+    - LtiGradedResource instances spread across the LtiProfiles.
+
+    The primary keys of the created instances are queried by a unique
+    field, MySQL doesn't return them from `bulk_create`.
+
+    Every dataset has a random tag on its unique values, many
+    datasets can be generated on the same database.
+
+    Attributes:
+        lti_tools (int): Number of LtiTool instances.
+        allowed_course_ids (int): Number of allowed course IDs of each LtiToolConfiguration.
+        course_contexts (int): Number of CourseContext instances.
+        orgs (int): Number of course orgs.
+        lti_profiles (int): Number of LtiProfile instances.
+        graded_resources (int): Number of LtiGradedResource instances.
+        chunk_size (int): Number of instances per bulk_create batch.
+        tag (str): Dataset tag.
+        random (Random): Dataset random number generator.
+        short_uuid_offset (int): Short UUID value of the first LtiProfile.
+
+    """
+
+    def __init__(
+        self,
+        lti_tools: int = DEFAULT_LTI_TOOLS,
+        allowed_course_ids: int = DEFAULT_ALLOWED_COURSE_IDS,
+        course_contexts: int = DEFAULT_COURSE_CONTEXTS,
+        orgs: int = DEFAULT_ORGS,
+        lti_profiles: int = DEFAULT_LTI_PROFILES,
+        graded_resources: int = DEFAULT_GRADED_RESOURCES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: Optional[int] = None,
+    ):
+        """Initialize class instance.
+
+        Args:
+            lti_tools: Number of LtiTool instances.
+            allowed_course_ids: Number of allowed course IDs of each LtiToolConfiguration.
+            course_contexts: Number of CourseContext instances.
+            orgs: Number of course orgs.
+            lti_profiles: Number of LtiProfile instances.
+            graded_resources: Number of LtiGradedResource instances.
+            chunk_size: Number of instances per bulk_create batch.
+            seed: Random number generator seed.
+
+        """
+        self.lti_tools = lti_tools
+        self.allowed_course_ids = allowed_course_ids
+        self.course_contexts = course_contexts
+        self.orgs = max(orgs, 1)
+        self.lti_profiles = lti_profiles
+        self.graded_resources = graded_resources
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        self.tag = uuid.UUID(int=self.random.getrandbits(128)).hex[:8]
+        self.short_uuid_offset = self.random.randrange((1 << 128) // SHORT_UUID_UNIT - lti_profiles)
+
+    def generate(self) -> dict:
+        """Generate the dataset.
+
+        Returns:
+            Dictionary with the dataset tag and the number of created instances.
+
+        """
+        course_contexts = self.create_course_contexts()
+        lti_tools = self.create_lti_tools()
+        lti_profiles, graded_resources = self.create_lti_profiles(lti_tools)
+
+        return {
+            'tag': self.tag,
+            'course_contexts': course_contexts,
+            'lti_tools': len(lti_tools),
+            'lti_profiles': lti_profiles,
+            'graded_resources': graded_resources,
+        }
+
+    def get_course_id(self, number: int) -> str:
+        """Get a course ID of the dataset.
+
+        Args:
+            number: Course number.
+
+        Returns:
+            Course ID string.
+
+        """
+        return f'course-v1:Org{number % self.orgs}+{self.tag}-{number}+run'
+
+    def create_course_contexts(self) -> int:
+        """Create the CourseContext and LearningContext instances.
+
+        The LearningContext fields depend on the edx-platform
+        release, only the fields of the model are set.
+
+        Returns:
+            Number of created CourseContext instances.
+
+        """
+        course_context_model = course_context()
+        learning_context_model = course_context_model._meta.get_field('learning_context').related_model
+        field_names = {field.name for field in learning_context_model._meta.get_fields()}
+        created = 0
+
+        for numbers in chunked(range(self.course_contexts), self.chunk_size):
+            with transaction.atomic():
+                learning_contexts = learning_context_model.objects.bulk_create([
+                    learning_context_model(**{
+                        name: value
+                        for name, value in {
+                            'context_key': self.get_course_id(number),
+                            'title': f'Course {number}',
+                            'published_at': timezone.now(),
+                            'published_version': uuid.UUID(int=self.random.getrandbits(128)).hex[:24],
+                        }.items()
+                        if name in field_names
+                    })
+                    for number in numbers
+                ])
+                learning_context_ids = learning_context_model.objects.filter(
+                    context_key__in=[learning_context.context_key for learning_context in learning_contexts],
+                ).values_list('id', flat=True)
+                course_context_model.objects.bulk_create([
+                    course_context_model(learning_context_id=learning_context_id)
+                    for learning_context_id in learning_context_ids
+                ])
+
+            created += len(numbers)
+            log.info(f'Synthetic dataset CourseContext instances created: {created}/{self.course_contexts}')
+
+        return created
+
+    def create_lti_tools(self) -> List[Tuple[str, str]]:
+        """Create the LtiTool, LtiToolKey and LtiToolConfiguration instances.
+
+        Every LtiTool shares the same LtiToolKey.
+
+        Returns:
+            List of the LtiTool issuer and client ID.
+
+        """
+        private_key, public_key = generate_rsa_key_pair()
+        tool_key = LtiToolKey.objects.create(
+            name=f'synthetic-{self.tag}',
+            private_key=private_key,
+            public_key=public_key,
+        )
+        lti_tools = []
+
+        for numbers in chunked(range(self.lti_tools), self.chunk_size):
+            with transaction.atomic():
+                issuers = [f'https://platform-{number}.{self.tag}.example.com' for number in numbers]
+                LtiTool.objects.bulk_create([
+                    LtiTool(
+                        title=f'Synthetic {self.tag} {number}',
+                        issuer=issuer,
+                        client_id=f'client-{number}',
+                        auth_login_url=f'{issuer}/auth',
+                        auth_token_url=f'{issuer}/token',
+                        key_set_url=f'{issuer}/jwks',
+                        deployment_ids=json.dumps(['1']),
+                        tool_key=tool_key,
+                    )
+                    for number, issuer in zip(numbers, issuers)
+                ])
+                lti_tool_ids = LtiTool.objects.filter(issuer__in=issuers).values_list('id', 'issuer', 'client_id')
+                LtiToolConfiguration.objects.bulk_create([
+                    LtiToolConfiguration(lti_tool_id=lti_tool_id, allowed_course_ids=self.get_allowed_course_ids())
+                    for lti_tool_id, _issuer, _client_id in lti_tool_ids
+                ])
+
+            lti_tools.extend((issuer, client_id) for _lti_tool_id, issuer, client_id in lti_tool_ids)
+            log.info(f'Synthetic dataset LtiTool instances created: {len(lti_tools)}/{self.lti_tools}')
+
+        return lti_tools
+
+    def get_allowed_course_ids(self) -> str:
+        """Get the allowed course IDs of an LtiToolConfiguration.
+
+        The course IDs are picked from the CourseContext course IDs,
+        if the allow-list is larger the rest of the course IDs don't
+        have a CourseContext.
+
+        Returns:
+            JSON list of course IDs.
+
+        """
+        size = max(self.course_contexts, self.allowed_course_ids)
+
+        return json.dumps([
+            self.get_course_id(number)
+            for number in self.random.sample(range(size), self.allowed_course_ids)
+        ])
+
+    def create_lti_profiles(self, lti_tools: List[Tuple[str, str]]) -> Tuple[int, int]:
+        """Create the LtiProfile, User, UserProfile and LtiGradedResource instances.
+
+        The User email is autogenerated and the username is built from the
+        PII name, like the users created by a resource link launch.
+
+        Args:
+            lti_tools: List of the LtiTool issuer and client ID.
+
+        Returns:
+            Tuple with the number of created LtiProfile and LtiGradedResource instances.
+
+        """
+        if not lti_tools:
+            return 0, 0
+
+        created = 0
+        graded_resources = 0
+
+        for numbers in chunked(range(self.lti_profiles), self.chunk_size):
+            with transaction.atomic():
+                lti_profiles = [self.get_lti_profile(number, *lti_tools[number % len(lti_tools)]) for number in numbers]
+                User.objects.bulk_create([
+                    User(
+                        username=lti_profile.username,
+                        email=lti_profile.email,
+                        password=make_password(None),
+                    )
+                    for lti_profile in lti_profiles
+                ])
+                user_ids = dict(
+                    User.objects.filter(
+                        username__in=[lti_profile.username for lti_profile in lti_profiles],
+                    ).values_list('username', 'id'),
+                )
+                UserProfile.objects.bulk_create([
+                    UserProfile(user_id=user_ids[lti_profile.username], **lti_profile.user_profile_field_values)
+                    for lti_profile in lti_profiles
+                ])
+
+                for lti_profile in lti_profiles:
+                    lti_profile.user_id = user_ids[lti_profile.username]
+
+                LtiProfile.objects.bulk_create(lti_profiles)
+                graded_resources += self.create_graded_resources(numbers, lti_profiles)
+
+            created += len(numbers)
+            log.info(f'Synthetic dataset LtiProfile instances created: {created}/{self.lti_profiles}')
+
+        return created, graded_resources
+
+    def get_lti_profile(self, number: int, iss: str, aud: str) -> LtiProfile:
+        """Get an unsaved LtiProfile instance with a unique username.
+
+        The short UUID of the LtiProfile UUID is the LtiProfile number plus
+        the dataset offset, so the usernames are unique without keeping the
+        usernames of the created User instances.
+
+        Args:
+            number: LtiProfile number.
+            iss: LtiTool issuer.
+            aud: LtiTool client ID.
+
+        Returns:
+            LtiProfile instance.
+
+        """
+        lti_profile = LtiProfile(
+            uuid=uuid.UUID(
+                int=(self.short_uuid_offset + number) * SHORT_UUID_UNIT + self.random.randrange(SHORT_UUID_UNIT),
+            ),
+            platform_id=iss,
+            client_id=aud,
+            subject_id=f'{self.tag}-{number}',
+            pii={
+                'given_name': self.random.choice(GIVEN_NAMES),
+                'family_name': self.random.choice(FAMILY_NAMES),
+            },
+        )
+
+        return lti_profile
+
+    def create_graded_resources(self, numbers: range, lti_profiles: List[LtiProfile]) -> int:
+        """Create the LtiGradedResource instances of a chunk of LtiProfiles.
+
+        The LtiGradedResource instances are spread evenly across the LtiProfiles,
+        each instance is a problem of one of the CourseContext courses.
+
+        Args:
+            numbers: LtiProfile numbers of the chunk.
+            lti_profiles: LtiProfile instances of the chunk.
+
+        Returns:
+            Number of created LtiGradedResource instances.
+
+        """
+        lti_profile_ids = dict(
+            LtiProfile.objects.filter(
+                uuid__in=[lti_profile.uuid for lti_profile in lti_profiles],
+            ).values_list('uuid', 'id'),
+        )
+        graded_resources = []
+        courses = max(self.course_contexts, 1)
+
+        for number, lti_profile in zip(numbers, lti_profiles):
+            graded_resources.extend(
+                LtiGradedResource(
+                    lti_profile_id=lti_profile_ids[lti_profile.uuid],
+                    context_key=(
+                        f'block-v1:{self.get_course_id(resource_number % courses).split(":", 1)[1]}'
+                        f'+type@problem+block@{resource_number}'
+                    ),
+                    lineitem=f'{lti_profile.platform_id}/lineitems/{resource_number}',
+                )
+                for resource_number in range(
+                    number * self.graded_resources // self.lti_profiles,
+                    (number + 1) * self.graded_resources // self.lti_profiles,
+                )
+            )
+
+        for chunk in chunked(graded_resources, self.chunk_size):
+            LtiGradedResource.objects.bulk_create(chunk)
+
+        return len(graded_resources)
@@ -0,0 +1,6 @@
+"""Exceptions."""
+from openedx_lti_tool_plugin.exceptions import LtiToolException
+
+
+class LoadTestException(LtiToolException):
+    """An exception for load test errors."""
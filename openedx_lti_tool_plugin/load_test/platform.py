@@ -0,0 +1,376 @@
+"""Local LTI platform stand-in.
+
+Attributes:
+    CLIENT_ID (str): Default LtiTool client ID.
+    DEPLOYMENT_ID (str): Default LtiTool deployment ID.
+    MESSAGE_TYPE_CLAIM (str): LTI message type claim.
+    VERSION_CLAIM (str): LTI version claim.
+    ROLES_CLAIM (str): LTI roles claim.
+    TARGET_LINK_URI_CLAIM (str): LTI target link URI claim.
+    RESOURCE_LINK_CLAIM (str): LTI resource link claim.
+    ID_TOKEN_LIFETIME (int): id_token lifetime in seconds.
+
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.utils.translation import gettext as _
+from jwt.algorithms import RSAAlgorithm
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool, LtiToolKey
+
+from openedx_lti_tool_plugin.deep_linking.session import DEEP_LINKING_SETTINGS_CLAIM, DEPLOYMENT_ID_CLAIM
+from openedx_lti_tool_plugin.load_test.exceptions import LoadTestException
+
+CLIENT_ID = 'load-test-client'
+DEPLOYMENT_ID = '1'
+MESSAGE_TYPE_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/message_type'
+VERSION_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/version'
+ROLES_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/roles'
+TARGET_LINK_URI_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/target_link_uri'
+RESOURCE_LINK_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/resource_link'
+ID_TOKEN_LIFETIME = 60 * 5
+
+
+def generate_rsa_key_pair() -> Tuple[str, str]:
+    """Generate an RSA key pair.
+
+    Returns:
+        Tuple with the PEM private key and PEM public key.
+
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    return (
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode(),
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode(),
+    )
+
+
+class FakePlatformRequestHandler(BaseHTTPRequestHandler):
+    """FakePlatform HTTP request handler.
+
+    Endpoints:
+        GET /jwks: Platform public JWKS.
+        POST /token: OAuth 2.0 client credentials access token.
+        POST /lineitems/<name>/scores: AGS score publish.
+
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle HTTP GET request."""
+        if urlparse(self.path).path == '/jwks':
+            self.send_json('jwks', self.server.platform.get_jwks())
+            return
+
+        self.send_json('not_found', {}, status=404)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle HTTP POST request."""
+        path = urlparse(self.path).path
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if path == '/token':
+            self.send_json(
+                'token',
+                {'access_token': uuid4().hex, 'token_type': 'Bearer', 'expires_in': 3600},
+            )
+            return
+
+        if path.startswith('/lineitems/') and path.endswith('/scores'):
+            self.send_json('scores', {})
+            return
+
+        self.send_json('not_found', {}, status=404)
+
+    def send_json(self, endpoint: str, body: dict, status: int = 200):
+        """Send a JSON response and count the endpoint request.
+
+        Args:
+            endpoint: Endpoint name.
+            body: Response body.
+            status: Response HTTP status code.
+
+        """
+        self.server.platform.record_request(endpoint)
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: tuple):  # pylint: disable=redefined-builtin
+        """Disable the request log."""
+
+
+class FakePlatform:
+    """Local LTI platform stand-in.
+
+    An LTI 1.3 platform on a local HTTP server. The server serves the
+    platform JWKS, the OAuth 2.0 access token and the AGS score endpoints,
+    the platform authorizes the OIDC login requests of the tool with an
+    RS256 signed id_token.
+
+    Attributes:
+        client_id (str): LtiTool client ID.
+        deployment_id (str): LtiTool deployment ID.
+        kid (str): Platform key ID.
+        private_key (str): Platform PEM private key.
+        public_key (str): Platform PEM public key.
+        server (ThreadingHTTPServer): Platform HTTP server.
+        requests (Counter): Number of requests of each endpoint.
+
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        client_id: str = CLIENT_ID,
+        deployment_id: str = DEPLOYMENT_ID,
+    ):
+        """Initialize class instance.
+
+        Args:
+            host: HTTP server host.
+            port: HTTP server port, a free port is used if 0.
+            client_id: LtiTool client ID.
+            deployment_id: LtiTool deployment ID.
+
+        """
+        self.client_id = client_id
+        self.deployment_id = deployment_id
+        self.kid = uuid4().hex
+        self.private_key, self.public_key = generate_rsa_key_pair()
+        self.server = ThreadingHTTPServer((host, port), FakePlatformRequestHandler)
+        self.server.daemon_threads = True
+        self.server.platform = self
+        self.requests = Counter()
+        self._requests_lock = threading.Lock()
+        self._thread = None
+
+    def __enter__(self) -> FakePlatform:
+        """Start the platform HTTP server."""
+        self.start()
+
+        return self
+
+    def __exit__(self, *args: tuple):
+        """Stop the platform HTTP server."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """str: Platform base URL, also used as the issuer."""
+        host, port = self.server.server_address[:2]
+
+        return f'http://{host}:{port}'
+
+    @property
+    def auth_login_url(self) -> str:
+        """str: Platform OIDC authorization URL."""
+        return f'{self.url}/auth'
+
+    def start(self):
+        """Start the platform HTTP server on a thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the platform HTTP server."""
+        if self._thread:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self.server.server_close()
+
+    def record_request(self, endpoint: str):
+        """Count an endpoint request.
+
+        Args:
+            endpoint: Endpoint name.
+
+        """
+        with self._requests_lock:
+            self.requests[endpoint] += 1
+
+    def get_jwks(self) -> dict:
+        """Get the platform public JWKS.
+
+        Returns:
+            JWKS dictionary.
+
+        """
+        return {
+            'keys': [
+                {
+                    **json.loads(RSAAlgorithm.to_jwk(serialization.load_pem_public_key(self.public_key.encode()))),
+                    'kid': self.kid,
+                    'alg': 'RS256',
+                    'use': 'sig',
+                },
+            ],
+        }
+
+    def get_lineitem(self, name: str) -> str:
+        """Get an AGS line item URL.
+
+        Args:
+            name: Line item name.
+
+        Returns:
+            Line item URL.
+
+        """
+        return f'{self.url}/lineitems/{name}'
+
+    def create_lti_tool(self, title: str = 'load-test') -> LtiTool:
+        """Create the LtiTool of the platform.
+
+        The LtiToolConfiguration of the LtiTool is created by
+        the LtiTool post_save signal receiver.
+
+        Args:
+            title: LtiTool and LtiToolKey title.
+
+        Returns:
+            LtiTool instance.
+
+        """
+        private_key, public_key = generate_rsa_key_pair()
+
+        return LtiTool.objects.create(
+            title=title,
+            issuer=self.url,
+            client_id=self.client_id,
+            auth_login_url=self.auth_login_url,
+            auth_token_url=f'{self.url}/token',
+            key_set_url=f'{self.url}/jwks',
+            deployment_ids=json.dumps([self.deployment_id]),
+            tool_key=LtiToolKey.objects.create(
+                name=f'{title}-{uuid4().hex}',
+                private_key=private_key,
+                public_key=public_key,
+            ),
+        )
+
+    def get_id_token(self, sub: str, nonce: str, message_type: str, claims: Optional[dict] = None) -> str:
+        """Get a signed id_token.
+
+        Args:
+            sub: Subject claim.
+            nonce: OIDC login nonce.
+            message_type: LTI message type.
+            claims: Additional claims.
+
+        Returns:
+            RS256 signed id_token.
+
+        """
+        now = int(time.time())
+
+        return jwt.encode(
+            {
+                'iss': self.url,
+                'aud': self.client_id,
+                'sub': sub,
+                'iat': now,
+                'exp': now + ID_TOKEN_LIFETIME,
+                'nonce': nonce,
+                DEPLOYMENT_ID_CLAIM: self.deployment_id,
+                MESSAGE_TYPE_CLAIM: message_type,
+                VERSION_CLAIM: '1.3.0',
+                ROLES_CLAIM: ['http://purl.imsglobal.org/vocab/lis/v2/membership#Learner'],
+                **(claims or {}),
+            },
+            self.private_key,
+            algorithm='RS256',
+            headers={'kid': self.kid},
+        )
+
+    def authorize(self, location: str, sub: str, message_type: str, claims: Optional[dict] = None) -> dict:
+        """Authorize an OIDC login redirect of the tool.
+
+        Args:
+            location: Tool OIDC login redirect URL.
+            sub: Subject claim.
+            message_type: LTI message type.
+            claims: Additional claims.
+
+        Returns:
+            Dictionary with the launch URL and the launch form data.
+
+        Raises:
+            LoadTestException: If the redirect URL is not the platform OIDC authorization URL.
+
+        """
+        url = urlparse(location)
+
+        if f'{url.scheme}://{url.netloc}{url.path}' != self.auth_login_url:
+            raise LoadTestException(_(f'Invalid OIDC login redirect: {location}'))
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        claims = {TARGET_LINK_URI_CLAIM: params['redirect_uri'], **(claims or {})}
+
+        return {
+            'url': params['redirect_uri'],
+            'data': {
+                'id_token': self.get_id_token(sub, params['nonce'], message_type, claims),
+                'state': params['state'],
+            },
+        }
+
+    def get_resource_link_claims(self, resource_id: str, lineitem: str) -> dict:
+        """Get the LtiResourceLinkRequest claims.
+
+        Args:
+            resource_id: Resource ID custom parameter.
+            lineitem: AGS line item URL.
+
+        Returns:
+            Claims dictionary.
+
+        """
+        return {
+            RESOURCE_LINK_CLAIM: {'id': uuid4().hex},
+            'https://purl.imsglobal.org/spec/lti/claim/custom': {'resourceId': resource_id},
+            'https://purl.imsglobal.org/spec/lti-ags/claim/endpoint': {
+                'lineitem': lineitem,
+                'scope': ['https://purl.imsglobal.org/spec/lti-ags/scope/score'],
+            },
+        }
+
+    def get_deep_linking_claims(self) -> dict:
+        """Get the LtiDeepLinkingRequest claims.
+
+        Returns:
+            Claims dictionary.
+
+        """
+        return {
+            DEEP_LINKING_SETTINGS_CLAIM: {
+                'deep_link_return_url': f'{self.url}/deep_linking/return',
+                'accept_types': ['ltiResourceLink'],
+                'accept_presentation_document_targets': ['iframe', 'window'],
+                'accept_multiple': True,
+            },
+        }
@@ -0,0 +1,529 @@
+"""LTI launch load test runner.
+
+The load test drives the tool views with the Django test client against
+a FakePlatform, every virtual user goes through the OIDC login, id_token
+POST and redirect flow of the platform. The views, middlewares and
+database of the Django instance are used, no request is mocked.
+
+The plugin URLs are included with the plugin namespace, like the LMS does.
+
+Attributes:
+    urlpatterns (list): Plugin URL patterns included with the plugin namespace.
+    SCENARIOS (tuple): Load test scenario names, run in this order.
+    STAGES (dict): Stage names of each scenario.
+    PERCENTILES (tuple): Reported latency percentiles.
+    DEFAULT_USERS (int): Default number of virtual users.
+    DEFAULT_CONCURRENCY (int): Default number of concurrent virtual users.
+    DEFAULT_RESOURCE_ID (str): Default resource ID of the launches.
+    TOOL_URL (str): Django test client base URL.
+
+"""
+import json
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from platform import python_version
+from typing import Callable, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import django
+from django.db import close_old_connections, connection
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import include, re_path, resolve, reverse
+from django.utils.translation import gettext as _
+from pylti1p3.exception import LtiException
+from requests.exceptions import RequestException
+from waffle.testutils import override_switch
+
+from openedx_lti_tool_plugin import __version__
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.session import SESSION_PARAM
+from openedx_lti_tool_plugin.exceptions import LtiToolException
+from openedx_lti_tool_plugin.load_test.exceptions import LoadTestException
+from openedx_lti_tool_plugin.load_test.platform import FakePlatform
+from openedx_lti_tool_plugin.resource_link_launch.ags.client import clear_service_connectors
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import send_score_update
+from openedx_lti_tool_plugin.waffle import ALLOW_COMPLETE_COURSE_LAUNCH
+
+log = logging.getLogger(__name__)
+urlpatterns = [
+    re_path(
+        app_config.plugin_app['url_config']['lms.djangoapp']['regex'],
+        include(('openedx_lti_tool_plugin.urls', app_config.name), namespace=app_config.name),
+    ),
+]
+
+SCENARIOS = ('resource_link', 'deep_linking', 'score_publish')
+STAGES = {
+    'resource_link': ('resource_link_login', 'resource_link_launch'),
+    'deep_linking': (
+        'deep_linking_login',
+        'deep_linking_launch',
+        'deep_linking_form',
+        'deep_linking_content_items',
+        'deep_linking_response',
+    ),
+    'score_publish': ('score_publish',),
+}
+PERCENTILES = (50, 95, 99)
+DEFAULT_USERS = 100
+DEFAULT_CONCURRENCY = 10
+DEFAULT_RESOURCE_ID = 'course-v1:org+course+run'
+TOOL_URL = 'http://testserver'
+
+
+def get_percentile(values: List[float], percentile: float) -> float:
+    """Get the nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sorted values.
+        percentile: Percentile from 0 to 100.
+
+    Returns:
+        Percentile value or 0 if there are no values.
+
+    """
+    if not values:
+        return 0.0
+
+    return values[max(math.ceil(percentile / 100 * len(values)) - 1, 0)]
+
+
+class LoadTestStats:
+    """Load test stage statistics.
+
+    The duration and query count of every stage request, stored by the
+    virtual user threads.
+
+    Attributes:
+        samples (defaultdict): Duration and query count tuples of each stage.
+        errors (Counter): Number of failed requests of each stage.
+
+    """
+
+    def __init__(self):
+        """Initialize class instance."""
+        self.samples = defaultdict(list)
+        self.errors = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measure the duration and query count of a stage request.
+
+        The queries are captured on the database connection of the current thread.
+
+        Args:
+            stage: Stage name.
+
+        Yields:
+            None.
+
+        """
+        start = time.perf_counter()
+
+        try:
+            with CaptureQueriesContext(connection) as context:
+                yield
+        except Exception:
+            with self._lock:
+                self.errors[stage] += 1
+
+            raise
+
+        with self._lock:
+            self.samples[stage].append((time.perf_counter() - start, len(context)))
+
+    def get_stage_report(self, stage: str, duration: float) -> dict:
+        """Get the report of a stage.
+
+        Args:
+            stage: Stage name.
+            duration: Duration of the stage scenario in seconds.
+
+        Returns:
+            Dictionary with the request count, error count, throughput,
+            latency in milliseconds and query counts of the stage.
+
+        """
+        latencies = sorted(sample[0] * 1000 for sample in self.samples[stage])
+        queries = [sample[1] for sample in self.samples[stage]]
+
+        return {
+            'name': stage,
+            'count': len(latencies),
+            'errors': self.errors[stage],
+            'throughput': round(len(latencies) / duration, 3) if duration else 0.0,
+            'min_ms': round(latencies[0], 3) if latencies else 0.0,
+            'mean_ms': round(statistics.mean(latencies), 3) if latencies else 0.0,
+            **{
+                f'p{percentile}_ms': round(get_percentile(latencies, percentile), 3)
+                for percentile in PERCENTILES
+            },
+            'max_ms': round(latencies[-1], 3) if latencies else 0.0,
+            'queries': sum(queries),
+            'mean_queries': round(statistics.mean(queries), 3) if queries else 0.0,
+            'max_queries': max(queries, default=0),
+        }
+
+
+class LoadTest:
+    """LTI launch load test.
+
+    The scenarios run one after the other, each scenario runs its virtual
+    users on `concurrency` threads. Each virtual user has its own test
+    client and LtiProfile subject ID. A request that fails or responds
+    with an unexpected HTTP status code is counted as a stage error and
+    ends the flow of the virtual user.
+
+    - resource_link: OIDC login and LtiResourceLinkRequest launch with AGS claims.
+    - deep_linking: OIDC login, LtiDeepLinkingRequest launch, deep linking
+      form, content item list and deep linking response.
+    - score_publish: send_score_update task of every LtiGradedResource
+      created by the resource_link scenario, sent to the platform AGS endpoint.
+
+    Attributes:
+        platform (FakePlatform): LTI platform stand-in.
+        users (int): Number of virtual users.
+        concurrency (int): Number of concurrent virtual users.
+        scenarios (tuple): Scenario names.
+        resource_id (str): Resource ID of the launches.
+        stats (LoadTestStats): Stage statistics.
+        durations (dict): Duration of each scenario in seconds.
+        flows (dict): Number of completed virtual user flows of each scenario.
+
+    """
+
+    def __init__(
+        self,
+        platform: FakePlatform,
+        users: int = DEFAULT_USERS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        scenarios: Optional[Iterable[str]] = None,
+        resource_id: str = DEFAULT_RESOURCE_ID,
+    ):
+        """Initialize class instance.
+
+        Args:
+            platform: LTI platform stand-in, the platform server must be started.
+            users: Number of virtual users.
+            concurrency: Number of concurrent virtual users.
+            scenarios: Scenario names, all the scenarios are run if not set.
+            resource_id: Resource ID of the launches.
+
+        """
+        self.platform = platform
+        self.users = users
+        self.concurrency = concurrency
+        self.scenarios = tuple(scenario for scenario in SCENARIOS if scenario in (scenarios or SCENARIOS))
+        self.resource_id = resource_id
+        self.stats = LoadTestStats()
+        self.durations = {}
+        self.flows = Counter()
+        self._flows_lock = threading.Lock()
+
+    def run(self) -> dict:
+        """Run the load test.
+
+        The launches redirect to the complete course launch response, the
+        ALLOW_COMPLETE_COURSE_LAUNCH switch is enabled while the load test runs.
+
+        Returns:
+            Load test report dictionary.
+
+        """
+        clear_service_connectors()
+
+        with override_settings(ROOT_URLCONF=__name__), override_switch(ALLOW_COMPLETE_COURSE_LAUNCH.name, active=True):
+            self.platform.create_lti_tool()
+
+            for scenario in self.scenarios:
+                start = time.perf_counter()
+                self.run_scenario(getattr(self, f'run_{scenario}'), self.get_scenario_items(scenario), scenario)
+                self.durations[scenario] = time.perf_counter() - start
+
+        return self.get_report()
+
+    def get_scenario_items(self, scenario: str) -> list:
+        """Get the virtual user items of a scenario.
+
+        Args:
+            scenario: Scenario name.
+
+        Returns:
+            List of virtual user numbers or LtiGradedResource IDs.
+
+        """
+        if scenario == 'score_publish':
+            return list(
+                LtiGradedResource.objects.filter(
+                    lti_profile__platform_id=self.platform.url,
+                ).values_list('id', flat=True),
+            )
+
+        return list(range(self.users))
+
+    def run_scenario(self, function: Callable[[object], None], items: list, scenario: str):
+        """Run the virtual users of a scenario.
+
+        Args:
+            function: Virtual user function.
+            items: Virtual user items.
+            scenario: Scenario name.
+
+        """
+        def run_user(item: object):
+            try:
+                function(item)
+
+                with self._flows_lock:
+                    self.flows[scenario] += 1
+            except (LtiToolException, LtiException, RequestException) as exc:
+                log.error(f'Load test {scenario} virtual user failed: {exc}')
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(run_user, items))
+
+    @staticmethod
+    def check_response(response: HttpResponse, status_code: int) -> HttpResponse:
+        """Check the HTTP status code of a response.
+
+        Args:
+            response: HTTP response.
+            status_code: Expected HTTP status code.
+
+        Returns:
+            HTTP response.
+
+        Raises:
+            LoadTestException: If the response HTTP status code is not the expected one.
+
+        """
+        if response.status_code != status_code:
+            raise LoadTestException(
+                _(f'Unexpected HTTP status code: {response.status_code} (expected {status_code})'),
+            )
+
+        return response
+
+    def login(
+        self,
+        client: Client,
+        stage: str,
+        sub: str,
+        target_link_uri: str,
+        message_type: str,
+        claims: dict,
+    ) -> dict:
+        """Send an OIDC login request and authorize it on the platform.
+
+        Args:
+            client: Virtual user test client.
+            stage: Stage name.
+            sub: Subject claim.
+            target_link_uri: Launch URL.
+            message_type: LTI message type.
+            claims: Additional id_token claims.
+
+        Returns:
+            Dictionary with the launch URL and the launch form data.
+
+        """
+        with self.stats.measure(stage):
+            response = self.check_response(
+                client.post(
+                    reverse(f'{app_config.name}:1.3:login'),
+                    {
+                        'iss': self.platform.url,
+                        'client_id': self.platform.client_id,
+                        'login_hint': sub,
+                        'target_link_uri': target_link_uri,
+                        # Skip the cookie check page, the test client stores the cookies.
+                        'lti1p3_new_window': '1',
+                    },
+                ),
+                302,
+            )
+
+        return self.platform.authorize(response['Location'], sub, message_type, claims)
+
+    def run_resource_link(self, number: int):
+        """Run a resource_link virtual user.
+
+        Args:
+            number: Virtual user number.
+
+        """
+        client = Client(raise_request_exception=False)
+        sub = f'load-test-user-{number}'
+        launch = self.login(
+            client,
+            'resource_link_login',
+            sub,
+            f'{TOOL_URL}{reverse(f"{app_config.name}:1.3:resource-link:launch")}',
+            'LtiResourceLinkRequest',
+            self.platform.get_resource_link_claims(self.resource_id, self.platform.get_lineitem(sub)),
+        )
+
+        with self.stats.measure('resource_link_launch'):
+            self.check_response(client.post(launch['url'], launch['data']), 302)
+
+    def run_deep_linking(self, number: int):
+        """Run a deep_linking virtual user.
+
+        Args:
+            number: Virtual user number.
+
+        """
+        client = Client(raise_request_exception=False)
+        launch = self.login(
+            client,
+            'deep_linking_login',
+            f'load-test-user-{number}',
+            f'{TOOL_URL}{reverse(f"{app_config.name}:1.3:deep-linking:root")}',
+            'LtiDeepLinkingRequest',
+            self.platform.get_deep_linking_claims(),
+        )
+
+        with self.stats.measure('deep_linking_launch'):
+            response = self.check_response(client.post(launch['url'], launch['data']), 302)
+
+        form_url = urlparse(response['Location'])
+        launch_id = resolve(form_url.path).kwargs['launch_id']
+        session = parse_qs(form_url.query)[SESSION_PARAM][0]
+
+        with self.stats.measure('deep_linking_form'):
+            self.check_response(client.get(form_url.path, {SESSION_PARAM: session}), 200)
+
+        with self.stats.measure('deep_linking_content_items'):
+            self.check_response(
+                client.get(
+                    reverse(
+                        f'{app_config.name}:1.3:deep-linking:api:v1:course-content-item-list',
+                        args=[launch_id],
+                    ),
+                    {SESSION_PARAM: session},
+                ),
+                200,
+            )
+
+        with self.stats.measure('deep_linking_response'):
+            self.check_response(
+                client.post(
+                    form_url.path,
+                    {
+                        SESSION_PARAM: session,
+                        'content_items': json.dumps([
+                            {
+                                'type': 'ltiResourceLink',
+                                'url': f'{TOOL_URL}{reverse(f"{app_config.name}:1.3:resource-link:launch")}',
+                                'title': self.resource_id,
+                                'custom': {'resourceId': self.resource_id},
+                            },
+                        ]),
+                    },
+                ),
+                200,
+            )
+
+    def run_score_publish(self, graded_resource_id: int):
+        """Run a score_publish virtual user.
+
+        Args:
+            graded_resource_id: LtiGradedResource ID.
+
+        """
+        with self.stats.measure('score_publish'):
+            send_score_update(
+                graded_resource_id,
+                1,
+                1,
+                datetime.now(tz=timezone.utc).isoformat(),
+                f'load-test-{graded_resource_id}',
+            )
+
+    def get_report(self) -> dict:
+        """Get the load test report.
+
+        Returns:
+            Dictionary with the environment versions, the load test arguments,
+            the scenario throughput, the stage reports and the platform requests.
+
+        """
+        return {
+            'plugin_version': __version__,
+            'python_version': python_version(),
+            'django_version': django.get_version(),
+            'database': connection.vendor,
+            'users': self.users,
+            'concurrency': self.concurrency,
+            'duration': round(sum(self.durations.values()), 3),
+            'scenarios': [
+                {
+                    'name': scenario,
+                    'flows': self.flows[scenario],
+                    'duration': round(self.durations[scenario], 3),
+                    'throughput': round(self.flows[scenario] / self.durations[scenario], 3),
+                }
+                for scenario in self.scenarios
+            ],
+            'stages': [
+                self.stats.get_stage_report(stage, self.durations[scenario])
+                for scenario in self.scenarios
+                for stage in STAGES[scenario]
+            ],
+            'platform_requests': dict(self.platform.requests),
+        }
+
+
+def run_load_test(
+    users: int = DEFAULT_USERS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    scenarios: Optional[Iterable[str]] = None,
+    resource_id: str = DEFAULT_RESOURCE_ID,
+) -> dict:
+    """Run the load test on test databases.
+
+    The test databases are created before the load test and
+    destroyed after it, like the Django test runner does.
+
+    The SQLite in-memory test database locks a table on each write, the
+    concurrent writes of the virtual users fail. The concurrency results
+    need a MySQL or PostgreSQL test database.
+
+    Args:
+        users: Number of virtual users.
+        concurrency: Number of concurrent virtual users.
+        scenarios: Scenario names, all the scenarios are run if not set.
+        resource_id: Resource ID of the launches.
+
+    Returns:
+        Load test report dictionary.
+
+    """
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+
+    try:
+        with FakePlatform() as fake_platform:
+            return LoadTest(fake_platform, users, concurrency, scenarios, resource_id).run()
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
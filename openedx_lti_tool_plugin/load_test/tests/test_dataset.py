@@ -0,0 +1,133 @@
+"""Tests dataset module."""
+import json
+
+import ddt
+from django.test import TestCase
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool
+
+from openedx_lti_tool_plugin.load_test.dataset import SyntheticDataset, chunked
+from openedx_lti_tool_plugin.models import CourseContext, LtiProfile, LtiToolConfiguration, User, UserProfile
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.tests import AUD, ISS
+
+
+@ddt.ddt
+class TestChunked(TestCase):
+    """Test chunked function."""
+
+    @ddt.data(
+        (range(5), 2, [[0, 1], [2, 3], [4]]),
+        (range(4), 2, [[0, 1], [2, 3]]),
+        (range(0), 2, []),
+    )
+    @ddt.unpack
+    def test_chunked(self, iterable: range, chunk_size: int, expected: list):
+        """Test chunked function."""
+        self.assertEqual(list(chunked(iterable, chunk_size)), expected)
+
+
+class TestSyntheticDataset(TestCase):
+    """Test SyntheticDataset class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.dataset = SyntheticDataset(
+            lti_tools=3,
+            allowed_course_ids=8,
+            course_contexts=5,
+            orgs=2,
+            lti_profiles=7,
+            graded_resources=10,
+            chunk_size=2,
+            seed=1,
+        )
+
+    def test_generate(self):
+        """Test generate method (happy path)."""
+        self.assertEqual(
+            self.dataset.generate(),
+            {
+                'tag': self.dataset.tag,
+                'course_contexts': 5,
+                'lti_tools': 3,
+                'lti_profiles': 7,
+                'graded_resources': 10,
+            },
+        )
+        self.assertEqual(CourseContext.objects.count(), 5)
+        self.assertEqual(
+            {str(course_context.course_id.org) for course_context in CourseContext.objects.all()},
+            {'Org0', 'Org1'},
+        )
+        self.assertEqual(LtiTool.objects.count(), 3)
+        self.assertEqual(LtiToolConfiguration.objects.count(), 3)
+        self.assertEqual(User.objects.count(), 7)
+        self.assertEqual(UserProfile.objects.count(), 7)
+        self.assertEqual(LtiProfile.objects.count(), 7)
+        self.assertEqual(LtiGradedResource.objects.count(), 10)
+
+    def test_generate_relations(self):
+        """Test generated instances are related like the launch created instances."""
+        self.dataset.generate()
+
+        for lti_profile in LtiProfile.objects.select_related('user__profile'):
+            self.assertTrue(LtiTool.objects.filter(issuer=lti_profile.platform_id).exists())
+            self.assertEqual(lti_profile.user.email, lti_profile.email)
+            self.assertEqual(lti_profile.user.username, lti_profile.username)
+            self.assertEqual(lti_profile.user.profile.name, lti_profile.name)
+            self.assertFalse(lti_profile.user.has_usable_password())
+
+        course_ids = {str(course_context.course_id) for course_context in CourseContext.objects.all()}
+
+        for graded_resource in LtiGradedResource.objects.all():
+            self.assertIn(str(UsageKey.from_string(graded_resource.context_key).course_key), course_ids)
+
+    def test_allowed_course_ids(self):
+        """Test LtiToolConfiguration allow-lists."""
+        self.dataset.generate()
+
+        for lti_tool_configuration in LtiToolConfiguration.objects.all():
+            allowed_course_ids = json.loads(lti_tool_configuration.allowed_course_ids)
+            self.assertEqual(len(allowed_course_ids), 8)
+            self.assertEqual(len(set(allowed_course_ids)), 8)
+            lti_tool_configuration.clean()
+
+    def test_generate_twice(self):
+        """Test two datasets on the same database."""
+        self.dataset.generate()
+        SyntheticDataset(
+            lti_tools=1,
+            allowed_course_ids=1,
+            course_contexts=1,
+            orgs=1,
+            lti_profiles=1,
+            graded_resources=1,
+        ).generate()
+
+        self.assertEqual(LtiProfile.objects.count(), 8)
+
+    def test_generate_without_lti_tools(self):
+        """Test generate method without LtiTool instances."""
+        self.dataset.lti_tools = 0
+
+        counts = self.dataset.generate()
+
+        self.assertEqual((counts['lti_profiles'], counts['graded_resources']), (0, 0))
+        self.assertFalse(LtiProfile.objects.exists())
+
+    def test_get_lti_profile(self):
+        """Test get_lti_profile method usernames are unique and deterministic."""
+        usernames = [self.dataset.get_lti_profile(number, ISS, AUD).username for number in range(5000)]
+        dataset = SyntheticDataset(lti_profiles=7, seed=1)
+
+        self.assertEqual(len(set(usernames)), len(usernames))
+        self.assertEqual(dataset.get_lti_profile(0, ISS, AUD).username.split('.')[1], usernames[0].split('.')[1])
+
+    def test_get_course_id(self):
+        """Test get_course_id method."""
+        course_key = CourseKey.from_string(self.dataset.get_course_id(3))
+
+        self.assertEqual(course_key.org, 'Org1')
+        self.assertIn(self.dataset.tag, course_key.course)
@@ -0,0 +1,213 @@
+"""Tests runner module."""
+import logging
+from unittest.mock import MagicMock, patch
+
+import ddt
+from django.http import HttpResponse
+from django.test import TestCase, TransactionTestCase
+
+from openedx_lti_tool_plugin.load_test.exceptions import LoadTestException
+from openedx_lti_tool_plugin.load_test.platform import FakePlatform
+from openedx_lti_tool_plugin.load_test.runner import (
+    SCENARIOS,
+    STAGES,
+    LoadTest,
+    LoadTestStats,
+    get_percentile,
+    run_load_test,
+)
+from openedx_lti_tool_plugin.load_test.tests import MODULE_PATH
+from openedx_lti_tool_plugin.models import LtiProfile
+
+MODULE_PATH = f'{MODULE_PATH}.runner'
+
+
+@ddt.ddt
+class TestGetPercentile(TestCase):
+    """Test get_percentile function."""
+
+    @ddt.data(
+        ([], 50, 0.0),
+        ([1.0], 99, 1.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.0),
+        ([1.0, 2.0, 3.0, 4.0], 95, 4.0),
+        ([float(value) for value in range(1, 101)], 99, 99.0),
+        ([1.0, 2.0], 0, 1.0),
+    )
+    @ddt.unpack
+    def test_get_percentile(self, values: list, percentile: float, expected: float):
+        """Test get_percentile function."""
+        self.assertEqual(get_percentile(values, percentile), expected)
+
+
+class TestLoadTestStats(TestCase):
+    """Test LoadTestStats class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stats = LoadTestStats()
+
+    def test_measure(self):
+        """Test measure method records the stage duration and queries."""
+        with self.stats.measure('test'):
+            LtiProfile.objects.count()
+
+        duration, queries = self.stats.samples['test'][0]
+        self.assertGreater(duration, 0)
+        self.assertEqual(queries, 1)
+        self.assertEqual(self.stats.errors['test'], 0)
+
+    def test_measure_with_exception(self):
+        """Test measure method records a stage error."""
+        with self.assertRaises(LoadTestException):
+            with self.stats.measure('test'):
+                raise LoadTestException('test')
+
+        self.assertEqual(self.stats.samples['test'], [])
+        self.assertEqual(self.stats.errors['test'], 1)
+
+    def test_get_stage_report(self):
+        """Test get_stage_report method."""
+        self.stats.samples['test'] = [(0.002, 3), (0.001, 1)]
+        self.stats.errors['test'] = 1
+
+        self.assertEqual(
+            self.stats.get_stage_report('test', 2.0),
+            {
+                'name': 'test',
+                'count': 2,
+                'errors': 1,
+                'throughput': 1.0,
+                'min_ms': 1.0,
+                'mean_ms': 1.5,
+                'p50_ms': 1.0,
+                'p95_ms': 2.0,
+                'p99_ms': 2.0,
+                'max_ms': 2.0,
+                'queries': 4,
+                'mean_queries': 2,
+                'max_queries': 3,
+            },
+        )
+
+    def test_get_stage_report_without_samples(self):
+        """Test get_stage_report method without samples."""
+        report = self.stats.get_stage_report('test', 0)
+
+        self.assertEqual(report['count'], 0)
+        self.assertEqual(report['throughput'], 0.0)
+        self.assertEqual(report['p99_ms'], 0.0)
+        self.assertEqual(report['max_queries'], 0)
+
+
+class TestLoadTest(TransactionTestCase):
+    """Test LoadTest class.
+
+    The virtual users run on other threads with their own database
+    connection, the test data is committed.
+
+    """
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.platform = FakePlatform()
+        self.platform.start()
+        self.addCleanup(self.platform.stop)
+
+    def test_run(self):
+        """Test run method (happy path)."""
+        report = LoadTest(self.platform, users=2, concurrency=1).run()
+
+        self.assertEqual([scenario['name'] for scenario in report['scenarios']], list(SCENARIOS))
+        self.assertEqual([scenario['flows'] for scenario in report['scenarios']], [2, 2, 2])
+        self.assertEqual(
+            [stage['name'] for stage in report['stages']],
+            [stage for scenario in SCENARIOS for stage in STAGES[scenario]],
+        )
+        self.assertTrue(all(stage['count'] == 2 and not stage['errors'] for stage in report['stages']))
+        self.assertEqual(report['platform_requests']['scores'], 2)
+        self.assertEqual(LtiProfile.objects.filter(platform_id=self.platform.url).count(), 2)
+
+    def test_run_with_scenarios(self):
+        """Test run method with scenarios."""
+        report = LoadTest(self.platform, users=1, concurrency=1, scenarios=['score_publish', 'resource_link']).run()
+
+        self.assertEqual([scenario['name'] for scenario in report['scenarios']], ['resource_link', 'score_publish'])
+        self.assertEqual([stage['count'] for stage in report['stages']], [1, 1, 1])
+
+    def test_run_with_failed_launch(self):
+        """Test run method with a launch of an invalid resource ID."""
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        report = LoadTest(self.platform, users=2, concurrency=1, scenarios=['resource_link'], resource_id='x').run()
+
+        self.assertEqual(report['scenarios'][0]['flows'], 0)
+        self.assertEqual(report['stages'][0]['count'], 2)
+        self.assertEqual(report['stages'][1]['count'], 0)
+        self.assertEqual(report['stages'][1]['errors'], 2)
+
+    def test_check_response(self):
+        """Test check_response method."""
+        response = HttpResponse(status=302)
+
+        self.assertEqual(LoadTest.check_response(response, 302), response)
+
+        with self.assertRaises(LoadTestException):
+            LoadTest.check_response(response, 200)
+
+
+@patch(f'{MODULE_PATH}.teardown_test_environment')
+@patch(f'{MODULE_PATH}.teardown_databases')
+@patch(f'{MODULE_PATH}.setup_databases')
+@patch(f'{MODULE_PATH}.setup_test_environment')
+@patch(f'{MODULE_PATH}.LoadTest')
+@patch(f'{MODULE_PATH}.FakePlatform')
+class TestRunLoadTest(TestCase):
+    """Test run_load_test function."""
+
+    def test_run_load_test(
+        self,
+        fake_platform_mock: MagicMock,
+        load_test_mock: MagicMock,
+        setup_test_environment_mock: MagicMock,
+        setup_databases_mock: MagicMock,
+        teardown_databases_mock: MagicMock,
+        teardown_test_environment_mock: MagicMock,
+    ):
+        """Test run_load_test function (happy path)."""
+        self.assertEqual(
+            run_load_test(users=5, concurrency=2, scenarios=['resource_link'], resource_id='test'),
+            load_test_mock.return_value.run.return_value,
+        )
+        setup_test_environment_mock.assert_called_once_with()
+        setup_databases_mock.assert_called_once_with(verbosity=0, interactive=False)
+        load_test_mock.assert_called_once_with(
+            fake_platform_mock.return_value.__enter__.return_value,
+            5,
+            2,
+            ['resource_link'],
+            'test',
+        )
+        teardown_databases_mock.assert_called_once_with(setup_databases_mock.return_value, verbosity=0)
+        teardown_test_environment_mock.assert_called_once_with()
+
+    def test_run_load_test_with_exception(
+        self,
+        fake_platform_mock: MagicMock,  # pylint: disable=unused-argument
+        load_test_mock: MagicMock,
+        setup_test_environment_mock: MagicMock,  # pylint: disable=unused-argument
+        setup_databases_mock: MagicMock,  # pylint: disable=unused-argument
+        teardown_databases_mock: MagicMock,
+        teardown_test_environment_mock: MagicMock,
+    ):
+        """Test run_load_test function destroys the test databases on exception."""
+        load_test_mock.return_value.run.side_effect = LoadTestException
+
+        with self.assertRaises(LoadTestException):
+            run_load_test()
+
+        teardown_databases_mock.assert_called_once()
+        teardown_test_environment_mock.assert_called_once_with()
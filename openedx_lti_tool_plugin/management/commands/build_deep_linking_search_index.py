@@ -0,0 +1,97 @@
+"""Build deep linking search index management command."""
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_lti_tool_plugin.deep_linking.search import (
+    delete_orphan_search_entries,
+    get_stale_course_ids,
+    update_search_index,
+)
+from openedx_lti_tool_plugin.deep_linking.tasks import update_course_search_index
+from openedx_lti_tool_plugin.models import CourseContext
+
+
+class Command(BaseCommand):
+    """Build deep linking search index management command.
+
+    Index the title of a course, its units and its problems
+    for the deep linking search, the search index of every
+    course is built if no course ID is given.
+
+    The `--stale` option only builds the search index of the courses
+    published since they were indexed, the command can be run
+    periodically to index the courses published on the CMS.
+
+    The search entries of the deleted courses are removed if
+    no course ID is given.
+
+    Example:
+        ./manage.py lms build_deep_linking_search_index --course-id course-v1:org+course+run
+        ./manage.py lms build_deep_linking_search_index --stale --async
+
+    """
+
+    help = 'Build the deep linking search index of a course or all the courses.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: Command argument parser.
+
+        """
+        parser.add_argument('--course-id', action='append', default=[], help='Course ID.')
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Build the search index of each course with a Celery task.',
+        )
+        parser.add_argument(
+            '--stale',
+            action='store_true',
+            help='Build the search index of the courses published since they were indexed.',
+        )
+
+    def handle(self, *args: tuple, **options: dict):
+        """Handle command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Command options.
+
+        Raises:
+            CommandError: If a course ID is invalid.
+
+        """
+        if not options['course_id']:
+            deleted = delete_orphan_search_entries()
+            self.stdout.write(f'Deep linking search orphan entries deleted: {deleted}')
+
+        if options['course_id']:
+            course_ids = options['course_id']
+        elif options['stale']:
+            course_ids = get_stale_course_ids()
+        else:
+            course_ids = [
+                str(course_id)
+                for course_id in CourseContext.objects.values_list('learning_context__context_key', flat=True)
+            ]
+
+        for course_id in course_ids:
+            try:
+                CourseKey.from_string(course_id)
+            except InvalidKeyError as exc:
+                raise CommandError(f'Invalid course ID: {course_id}') from exc
+
+        for course_id in course_ids:
+            if options['run_async']:
+                result = update_course_search_index.delay(course_id)
+                self.stdout.write(f'Deep linking search index task queued: {course_id} {result.id}')
+                continue
+
+            entries = update_search_index(course_id)
+            self.stdout.write(f'Deep linking search index updated: {course_id} ({entries} entries)')
+
+        self.stdout.write(self.style.SUCCESS(f'Deep linking search index built: {len(course_ids)} courses'))
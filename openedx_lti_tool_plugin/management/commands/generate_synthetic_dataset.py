@@ -0,0 +1,116 @@
+"""Generate synthetic large-scale dataset management command."""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from openedx_lti_tool_plugin.load_test.dataset import (
+    DEFAULT_ALLOWED_COURSE_IDS,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_COURSE_CONTEXTS,
+    DEFAULT_GRADED_RESOURCES,
+    DEFAULT_LTI_PROFILES,
+    DEFAULT_LTI_TOOLS,
+    DEFAULT_ORGS,
+    SyntheticDataset,
+)
+
+
+class Command(BaseCommand):
+    """Generate synthetic large-scale dataset management command.
+
+    Bulk create LtiProfile, LtiTool, CourseContext and LtiGradedResource
+    instances on the database, to run scale benchmarks and query plan checks
+    locally. The default volumes are small, the production sized volumes
+    are set with the command options.
+
+    The command writes to the configured database, it's refused unless
+    DEBUG is enabled or the `--yes-this-is-not-production` option is given.
+    The instances are created with bulk_create, the post_save signals are
+    not sent, so the deep linking catalog and search index caches are stale.
+
+    Example:
+        ./manage.py generate_synthetic_dataset --lti-profiles 2000000 --seed 1 --yes-this-is-not-production
+
+    """
+
+    help = (
+        'Bulk create a synthetic large-scale dataset for scale testing. '
+        'Refused unless DEBUG is enabled or --yes-this-is-not-production is given. '
+        'The instances are bulk created without post_save signals, '
+        'the deep linking catalog and search index caches are left stale.'
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: Command argument parser.
+
+        """
+        parser.add_argument('--lti-tools', type=int, default=DEFAULT_LTI_TOOLS, help='Number of LtiTool instances.')
+        parser.add_argument(
+            '--allowed-course-ids',
+            type=int,
+            default=DEFAULT_ALLOWED_COURSE_IDS,
+            help='Number of allowed course IDs of each LtiToolConfiguration.',
+        )
+        parser.add_argument(
+            '--course-contexts',
+            type=int,
+            default=DEFAULT_COURSE_CONTEXTS,
+            help='Number of CourseContext instances.',
+        )
+        parser.add_argument('--orgs', type=int, default=DEFAULT_ORGS, help='Number of course orgs.')
+        parser.add_argument(
+            '--lti-profiles',
+            type=int,
+            default=DEFAULT_LTI_PROFILES,
+            help='Number of LtiProfile instances.',
+        )
+        parser.add_argument(
+            '--graded-resources',
+            type=int,
+            default=DEFAULT_GRADED_RESOURCES,
+            help='Number of LtiGradedResource instances.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of instances per bulk_create batch.',
+        )
+        parser.add_argument('--seed', type=int, default=None, help='Random number generator seed.')
+        parser.add_argument(
+            '--yes-this-is-not-production',
+            action='store_true',
+            help='Confirm the configured database is not a production database.',
+        )
+
+    def handle(self, *args: tuple, **options: dict):
+        """Handle command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Command options.
+
+        Raises:
+            CommandError: If DEBUG is disabled and the database is not confirmed as non-production.
+
+        """
+        if not settings.DEBUG and not options['yes_this_is_not_production']:
+            raise CommandError(
+                'Refusing to generate a synthetic dataset with DEBUG disabled, '
+                'use --yes-this-is-not-production if this is not a production database.',
+            )
+
+        counts = SyntheticDataset(
+            lti_tools=options['lti_tools'],
+            allowed_course_ids=options['allowed_course_ids'],
+            course_contexts=options['course_contexts'],
+            orgs=options['orgs'],
+            lti_profiles=options['lti_profiles'],
+            graded_resources=options['graded_resources'],
+            chunk_size=options['chunk_size'],
+            seed=options['seed'],
+        ).generate()
+
+        self.stdout.write(self.style.SUCCESS(f'Synthetic dataset generated: {counts}'))
@@ -0,0 +1,93 @@
+"""Resync LTI AGS scores management command."""
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from openedx_lti_tool_plugin.resource_link_launch.ags.resync import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS, ScoreResync
+from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import resync_scores
+
+
+class Command(BaseCommand):
+    """Resync LTI AGS scores management command.
+
+    Publish the current score of all the LtiGradedResource instances
+    of a course, an LTI platform or both.
+
+    Example:
+        ./manage.py lms resync_ags_scores --course-id course-v1:org+course+run
+
+    """
+
+    help = 'Publish the current score of all the LTI graded resources of a course or LTI platform.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: Command argument parser.
+
+        """
+        parser.add_argument('--course-id', default='', help='Course ID.')
+        parser.add_argument('--platform-id', default='', help='LTI platform ID (iss claim).')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of graded resources per batch.',
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help='Number of concurrent score publish requests.',
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Discard the checkpoint of a previous resync and start from the beginning.',
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Run the resync as a Celery task.',
+        )
+
+    def handle(self, *args: tuple, **options: dict):
+        """Handle command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Command options.
+
+        Raises:
+            CommandError: If no course ID or platform ID is given
+                or the course ID is invalid.
+
+        """
+        course_id = options['course_id']
+        platform_id = options['platform_id']
+        resync_kwargs = {
+            'chunk_size': options['chunk_size'],
+            'max_workers': options['max_workers'],
+        }
+
+        if not course_id and not platform_id:
+            raise CommandError('A course ID or platform ID is required.')
+
+        if course_id:
+            try:
+                CourseKey.from_string(course_id)
+            except InvalidKeyError as exc:
+                raise CommandError(f'Invalid course ID: {course_id}') from exc
+
+        if options['reset']:
+            ScoreResync(course_id, platform_id).reset_checkpoint()
+
+        if options['run_async']:
+            result = resync_scores.delay(course_id, platform_id, **resync_kwargs)
+            self.stdout.write(f'LTI AGS score resync task queued: {result.id}')
+            return
+
+        stats = ScoreResync(course_id, platform_id, **resync_kwargs).run()
+        self.stdout.write(self.style.SUCCESS(f'LTI AGS score resync finished: {stats}'))
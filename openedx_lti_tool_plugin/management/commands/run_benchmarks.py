@@ -0,0 +1,71 @@
+"""Run plugin microbenchmarks management command."""
+import json
+
+from django.core.management.base import BaseCommand
+
+from openedx_lti_tool_plugin.benchmarks import BENCHMARKS, DEFAULT_NUMBER, DEFAULT_REPEAT, DEFAULT_SIZE, run_benchmarks
+
+
+class Command(BaseCommand):
+    """Run plugin microbenchmarks management command.
+
+    Run the microbenchmarks of the plugin hot functions and write
+    the results as JSON, to compare the results of two releases.
+
+    Example:
+        ./manage.py run_benchmarks --size 1000 --output results.json
+
+    """
+
+    help = 'Run the plugin hot function microbenchmarks and write the JSON results.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: Command argument parser.
+
+        """
+        parser.add_argument(
+            '--benchmark',
+            action='append',
+            choices=BENCHMARKS,
+            dest='benchmarks',
+            help='Benchmark name, can be repeated. All the benchmarks are run by default.',
+        )
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=DEFAULT_SIZE,
+            help='Number of allowed course IDs, form content items and serialized items.',
+        )
+        parser.add_argument('--number', type=int, default=DEFAULT_NUMBER, help='Number of calls per repeat.')
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Number of repeats.')
+        parser.add_argument('--output', default='', help='Results file path, results are written to stdout by default.')
+
+    def handle(self, *args: tuple, **options: dict):
+        """Handle command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Command options.
+
+        """
+        results = json.dumps(
+            run_benchmarks(
+                options['benchmarks'],
+                size=options['size'],
+                number=options['number'],
+                repeat=options['repeat'],
+            ),
+            indent=2,
+        )
+
+        if not options['output']:
+            self.stdout.write(results)
+            return
+
+        with open(options['output'], 'w', encoding='utf-8') as output:
+            output.write(results)
+
+        self.stdout.write(self.style.SUCCESS(f'Benchmark results written to {options["output"]}'))
@@ -0,0 +1,83 @@
+"""Run LTI launch load test management command."""
+import json
+
+from django.core.management.base import BaseCommand
+
+from openedx_lti_tool_plugin.load_test.runner import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RESOURCE_ID,
+    DEFAULT_USERS,
+    SCENARIOS,
+    run_load_test,
+)
+
+
+class Command(BaseCommand):
+    """Run LTI launch load test management command.
+
+    Run the login, launch, deep linking and score publish flows of many
+    virtual users against a local LTI platform stand-in and test databases,
+    then write the throughput, latency percentiles and query counts of
+    each stage as JSON.
+
+    Example:
+        ./manage.py run_load_test --users 500 --concurrency 20 --output report.json
+
+    """
+
+    help = 'Run the LTI launch load test against a local LTI platform and write the JSON report.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: Command argument parser.
+
+        """
+        parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Number of virtual users.')
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help='Number of concurrent virtual users.',
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=SCENARIOS,
+            dest='scenarios',
+            help='Scenario name, can be repeated. All the scenarios are run by default.',
+        )
+        parser.add_argument('--resource-id', default=DEFAULT_RESOURCE_ID, help='Resource ID of the launches.')
+        parser.add_argument(
+            '--output',
+            default='',
+            help='Report file path, the report is written to stdout by default.',
+        )
+
+    def handle(self, *args: tuple, **options: dict):
+        """Handle command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Command options.
+
+        """
+        report = json.dumps(
+            run_load_test(
+                users=options['users'],
+                concurrency=options['concurrency'],
+                scenarios=options['scenarios'],
+                resource_id=options['resource_id'],
+            ),
+            indent=2,
+        )
+
+        if not options['output']:
+            self.stdout.write(report)
+            return
+
+        with open(options['output'], 'w', encoding='utf-8') as output:
+            output.write(report)
+
+        self.stdout.write(self.style.SUCCESS(f'Load test report written to {options["output"]}'))
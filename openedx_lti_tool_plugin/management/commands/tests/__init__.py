@@ -0,0 +1,3 @@
+"""Test management commands module."""
+
+MODULE_PATH = 'openedx_lti_tool_plugin.management.commands'
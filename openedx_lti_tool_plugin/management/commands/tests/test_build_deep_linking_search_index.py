@@ -0,0 +1,98 @@
+"""Tests build_deep_linking_search_index module."""
+from io import StringIO
+from unittest.mock import MagicMock, call, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.management.commands.tests import MODULE_PATH
+from openedx_lti_tool_plugin.models import CourseContext
+
+MODULE_PATH = f'{MODULE_PATH}.build_deep_linking_search_index'
+COURSE_ID = 'course-v1:org+course+run'
+OTHER_COURSE_ID = 'course-v1:org+other+run'
+
+
+@patch(f'{MODULE_PATH}.delete_orphan_search_entries', return_value=4)
+@patch(f'{MODULE_PATH}.update_course_search_index')
+@patch(f'{MODULE_PATH}.update_search_index', return_value=3)
+class TestBuildDeepLinkingSearchIndexCommand(TestCase):
+    """Test build_deep_linking_search_index command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stdout = StringIO()
+
+    def test_build(
+        self,
+        update_search_index_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,
+        delete_orphan_search_entries_mock: MagicMock,
+    ):
+        """Test command (happy path)."""
+        call_command('build_deep_linking_search_index', course_id=[COURSE_ID], stdout=self.stdout)
+
+        delete_orphan_search_entries_mock.assert_not_called()
+        update_search_index_mock.assert_called_once_with(COURSE_ID)
+        update_course_search_index_mock.delay.assert_not_called()
+        self.assertIn(f'{COURSE_ID} (3 entries)', self.stdout.getvalue())
+        self.assertIn('Deep linking search index built: 1 courses', self.stdout.getvalue())
+
+    @patch.object(CourseContext.objects, 'values_list', return_value=[COURSE_ID, OTHER_COURSE_ID])
+    def test_build_all_courses(
+        self,
+        values_list_mock: MagicMock,
+        update_search_index_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,  # pylint: disable=unused-argument
+        delete_orphan_search_entries_mock: MagicMock,
+    ):
+        """Test command without course ID."""
+        call_command('build_deep_linking_search_index', stdout=self.stdout)
+
+        delete_orphan_search_entries_mock.assert_called_once_with()
+        self.assertIn('Deep linking search orphan entries deleted: 4', self.stdout.getvalue())
+        values_list_mock.assert_called_once_with('learning_context__context_key', flat=True)
+        update_search_index_mock.assert_has_calls([call(COURSE_ID), call(OTHER_COURSE_ID)])
+
+    @patch(f'{MODULE_PATH}.get_stale_course_ids', return_value=[OTHER_COURSE_ID])
+    def test_build_stale_courses(
+        self,
+        get_stale_course_ids_mock: MagicMock,
+        update_search_index_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,  # pylint: disable=unused-argument
+        delete_orphan_search_entries_mock: MagicMock,
+    ):
+        """Test command with stale option."""
+        call_command('build_deep_linking_search_index', stale=True, stdout=self.stdout)
+
+        delete_orphan_search_entries_mock.assert_called_once_with()
+        get_stale_course_ids_mock.assert_called_once_with()
+        update_search_index_mock.assert_called_once_with(OTHER_COURSE_ID)
+
+    def test_build_with_async(
+        self,
+        update_search_index_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,
+        delete_orphan_search_entries_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test command with async option."""
+        call_command('build_deep_linking_search_index', course_id=[COURSE_ID], run_async=True, stdout=self.stdout)
+
+        update_search_index_mock.assert_not_called()
+        update_course_search_index_mock.delay.assert_called_once_with(COURSE_ID)
+        self.assertIn(str(update_course_search_index_mock.delay().id), self.stdout.getvalue())
+
+    def test_build_with_invalid_course_id(
+        self,
+        update_search_index_mock: MagicMock,
+        update_course_search_index_mock: MagicMock,
+        delete_orphan_search_entries_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test command with invalid course ID."""
+        with self.assertRaises(CommandError):
+            call_command('build_deep_linking_search_index', course_id=[COURSE_ID, 'invalid'], stdout=self.stdout)
+
+        update_search_index_mock.assert_not_called()
+        update_course_search_index_mock.delay.assert_not_called()
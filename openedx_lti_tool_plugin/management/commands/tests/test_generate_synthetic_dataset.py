@@ -0,0 +1,88 @@
+"""Tests generate_synthetic_dataset module."""
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from openedx_lti_tool_plugin.load_test.dataset import (
+    DEFAULT_ALLOWED_COURSE_IDS,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_COURSE_CONTEXTS,
+    DEFAULT_GRADED_RESOURCES,
+    DEFAULT_LTI_PROFILES,
+    DEFAULT_LTI_TOOLS,
+    DEFAULT_ORGS,
+)
+from openedx_lti_tool_plugin.management.commands.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.generate_synthetic_dataset'
+
+
+@patch(f'{MODULE_PATH}.SyntheticDataset')
+class TestGenerateSyntheticDatasetCommand(TestCase):
+    """Test generate_synthetic_dataset command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stdout = StringIO()
+
+    def test_generate(self, synthetic_dataset_mock: MagicMock):
+        """Test command (happy path)."""
+        call_command('generate_synthetic_dataset', yes_this_is_not_production=True, stdout=self.stdout)
+
+        synthetic_dataset_mock.assert_called_once_with(
+            lti_tools=DEFAULT_LTI_TOOLS,
+            allowed_course_ids=DEFAULT_ALLOWED_COURSE_IDS,
+            course_contexts=DEFAULT_COURSE_CONTEXTS,
+            orgs=DEFAULT_ORGS,
+            lti_profiles=DEFAULT_LTI_PROFILES,
+            graded_resources=DEFAULT_GRADED_RESOURCES,
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            seed=None,
+        )
+        synthetic_dataset_mock().generate.assert_called_once_with()
+        self.assertIn(str(synthetic_dataset_mock().generate.return_value), self.stdout.getvalue())
+
+    def test_generate_with_options(self, synthetic_dataset_mock: MagicMock):
+        """Test command with size options."""
+        call_command(
+            'generate_synthetic_dataset',
+            lti_tools=1,
+            allowed_course_ids=2,
+            course_contexts=3,
+            orgs=4,
+            lti_profiles=5,
+            graded_resources=6,
+            chunk_size=7,
+            seed=8,
+            yes_this_is_not_production=True,
+            stdout=self.stdout,
+        )
+
+        synthetic_dataset_mock.assert_called_once_with(
+            lti_tools=1,
+            allowed_course_ids=2,
+            course_contexts=3,
+            orgs=4,
+            lti_profiles=5,
+            graded_resources=6,
+            chunk_size=7,
+            seed=8,
+        )
+
+    @override_settings(DEBUG=True)
+    def test_generate_with_debug(self, synthetic_dataset_mock: MagicMock):
+        """Test command with DEBUG enabled."""
+        call_command('generate_synthetic_dataset', stdout=self.stdout)
+
+        synthetic_dataset_mock().generate.assert_called_once_with()
+
+    def test_generate_without_confirmation(self, synthetic_dataset_mock: MagicMock):
+        """Test command with DEBUG disabled and without confirmation option."""
+        with self.assertRaises(CommandError):
+            call_command('generate_synthetic_dataset', stdout=self.stdout)
+
+        synthetic_dataset_mock.assert_not_called()
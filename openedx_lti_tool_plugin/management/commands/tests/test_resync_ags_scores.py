@@ -0,0 +1,77 @@
+"""Tests resync_ags_scores module."""
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.management.commands.tests import MODULE_PATH
+from openedx_lti_tool_plugin.resource_link_launch.ags.resync import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS
+from openedx_lti_tool_plugin.tests import ISS
+
+MODULE_PATH = f'{MODULE_PATH}.resync_ags_scores'
+COURSE_ID = 'course-v1:org+course+run'
+
+
+@patch(f'{MODULE_PATH}.resync_scores')
+@patch(f'{MODULE_PATH}.ScoreResync')
+class TestResyncAgsScoresCommand(TestCase):
+    """Test resync_ags_scores command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stdout = StringIO()
+        self.resync_kwargs = {
+            'chunk_size': DEFAULT_CHUNK_SIZE,
+            'max_workers': DEFAULT_MAX_WORKERS,
+        }
+
+    def test_resync(self, score_resync_mock: MagicMock, resync_scores_mock: MagicMock):
+        """Test command (happy path)."""
+        call_command('resync_ags_scores', course_id=COURSE_ID, platform_id=ISS, stdout=self.stdout)
+
+        score_resync_mock.assert_called_once_with(COURSE_ID, ISS, **self.resync_kwargs)
+        score_resync_mock().run.assert_called_once_with()
+        score_resync_mock().reset_checkpoint.assert_not_called()
+        resync_scores_mock.delay.assert_not_called()
+        self.assertIn(str(score_resync_mock().run.return_value), self.stdout.getvalue())
+
+    def test_resync_with_reset(self, score_resync_mock: MagicMock, resync_scores_mock: MagicMock):
+        """Test command with reset option."""
+        call_command('resync_ags_scores', platform_id=ISS, reset=True, stdout=self.stdout)
+
+        score_resync_mock().reset_checkpoint.assert_called_once_with()
+        score_resync_mock().run.assert_called_once_with()
+        resync_scores_mock.delay.assert_not_called()
+
+    def test_resync_with_async(self, score_resync_mock: MagicMock, resync_scores_mock: MagicMock):
+        """Test command with async option."""
+        call_command(
+            'resync_ags_scores',
+            course_id=COURSE_ID,
+            max_workers=2,
+            run_async=True,
+            stdout=self.stdout,
+        )
+
+        resync_scores_mock.delay.assert_called_once_with(COURSE_ID, '', **{**self.resync_kwargs, 'max_workers': 2})
+        score_resync_mock().run.assert_not_called()
+        self.assertIn(str(resync_scores_mock.delay().id), self.stdout.getvalue())
+
+    def test_without_course_id_or_platform_id(self, score_resync_mock: MagicMock, resync_scores_mock: MagicMock):
+        """Test command without course ID or platform ID."""
+        with self.assertRaises(CommandError):
+            call_command('resync_ags_scores', stdout=self.stdout)
+
+        score_resync_mock.assert_not_called()
+        resync_scores_mock.delay.assert_not_called()
+
+    def test_with_invalid_course_id(self, score_resync_mock: MagicMock, resync_scores_mock: MagicMock):
+        """Test command with invalid course ID."""
+        with self.assertRaises(CommandError):
+            call_command('resync_ags_scores', course_id='invalid', stdout=self.stdout)
+
+        score_resync_mock.assert_not_called()
+        resync_scores_mock.delay.assert_not_called()
@@ -0,0 +1,68 @@
+"""Tests run_benchmarks module."""
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.benchmarks import DEFAULT_NUMBER, DEFAULT_REPEAT, DEFAULT_SIZE
+from openedx_lti_tool_plugin.management.commands.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.run_benchmarks'
+RESULTS = {'results': [{'name': 'get_identity_claims'}]}
+
+
+@patch(f'{MODULE_PATH}.run_benchmarks', return_value=RESULTS)
+class TestRunBenchmarksCommand(TestCase):
+    """Test run_benchmarks command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stdout = StringIO()
+
+    def test_run(self, run_benchmarks_mock: MagicMock):
+        """Test command (happy path)."""
+        call_command('run_benchmarks', stdout=self.stdout)
+
+        run_benchmarks_mock.assert_called_once_with(
+            None,
+            size=DEFAULT_SIZE,
+            number=DEFAULT_NUMBER,
+            repeat=DEFAULT_REPEAT,
+        )
+        self.assertEqual(json.loads(self.stdout.getvalue()), RESULTS)
+
+    def test_run_with_options(self, run_benchmarks_mock: MagicMock):
+        """Test command with benchmark, size, number and repeat options."""
+        call_command(
+            'run_benchmarks',
+            '--benchmark=get_identity_claims',
+            '--benchmark=is_course_id_allowed',
+            size=10,
+            number=20,
+            repeat=3,
+            stdout=self.stdout,
+        )
+
+        run_benchmarks_mock.assert_called_once_with(
+            ['get_identity_claims', 'is_course_id_allowed'],
+            size=10,
+            number=20,
+            repeat=3,
+        )
+
+    def test_run_with_output(self, run_benchmarks_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test command with output option."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+
+            call_command('run_benchmarks', output=output, stdout=self.stdout)
+
+            with open(output, encoding='utf-8') as results:
+                self.assertEqual(json.load(results), RESULTS)
+
+        self.assertIn(output, self.stdout.getvalue())
@@ -0,0 +1,68 @@
+"""Tests run_load_test module."""
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.load_test.runner import DEFAULT_CONCURRENCY, DEFAULT_RESOURCE_ID, DEFAULT_USERS
+from openedx_lti_tool_plugin.management.commands.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.run_load_test'
+REPORT = {'stages': [{'name': 'resource_link_login'}]}
+
+
+@patch(f'{MODULE_PATH}.run_load_test', return_value=REPORT)
+class TestRunLoadTestCommand(TestCase):
+    """Test run_load_test command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.stdout = StringIO()
+
+    def test_run(self, run_load_test_mock: MagicMock):
+        """Test command (happy path)."""
+        call_command('run_load_test', stdout=self.stdout)
+
+        run_load_test_mock.assert_called_once_with(
+            users=DEFAULT_USERS,
+            concurrency=DEFAULT_CONCURRENCY,
+            scenarios=None,
+            resource_id=DEFAULT_RESOURCE_ID,
+        )
+        self.assertEqual(json.loads(self.stdout.getvalue()), REPORT)
+
+    def test_run_with_options(self, run_load_test_mock: MagicMock):
+        """Test command with users, concurrency, scenario and resource ID options."""
+        call_command(
+            'run_load_test',
+            '--scenario=resource_link',
+            '--scenario=score_publish',
+            users=10,
+            concurrency=2,
+            resource_id='course-v1:org+other+run',
+            stdout=self.stdout,
+        )
+
+        run_load_test_mock.assert_called_once_with(
+            users=10,
+            concurrency=2,
+            scenarios=['resource_link', 'score_publish'],
+            resource_id='course-v1:org+other+run',
+        )
+
+    def test_run_with_output(self, run_load_test_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test command with output option."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'report.json')
+
+            call_command('run_load_test', output=output, stdout=self.stdout)
+
+            with open(output, encoding='utf-8') as report:
+                self.assertEqual(json.load(report), REPORT)
+
+        self.assertIn(output, self.stdout.getvalue())
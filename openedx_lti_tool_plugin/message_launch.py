@@ -0,0 +1,41 @@
+"""pylti1.3 message launch."""
+from django.utils.translation import gettext as _
+from pylti1p3.contrib.django import DjangoMessageLaunch
+from pylti1p3.exception import LtiException
+
+from openedx_lti_tool_plugin.circuit_breaker import JWKS, CircuitBreaker
+
+
+class LtiMessageLaunch(DjangoMessageLaunch):
+    """pylti1.3 DjangoMessageLaunch with an LTI platform circuit breaker."""
+
+    def fetch_public_key(self, key_set_url: str) -> dict:
+        """Fetch LTI platform public key set.
+
+        The public key set request fails fast while the JWKS
+        circuit breaker of the LTI platform is open.
+
+        Args:
+            key_set_url: LTI platform public key set URL.
+
+        Returns:
+            Public key set dictionary.
+
+        Raises:
+            LtiException: If the circuit breaker is open or the request failed.
+
+        """
+        circuit_breaker = CircuitBreaker(self._registration.get_issuer(), JWKS)
+
+        if circuit_breaker.acquire():
+            raise LtiException(_('LTI platform circuit breaker is open: %s') % key_set_url)
+
+        try:
+            public_key = super().fetch_public_key(key_set_url)
+        except LtiException:
+            circuit_breaker.record_failure()
+            raise
+
+        circuit_breaker.record_success()
+
+        return public_key
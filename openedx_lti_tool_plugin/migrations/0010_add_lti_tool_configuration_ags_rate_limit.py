@@ -0,0 +1,18 @@
+# Generated by Django 3.2.17 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_lti_tool_plugin', '0009_update_lti_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ltitoolconfiguration',
+            name='ags_rate_limit',
+            field=models.PositiveIntegerField(default=0, help_text='Maximum number of AGS score publish requests per minute sent to the LTI platform. 0 disables the rate limit.', verbose_name='AGS Rate Limit'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.17 on 2026-10-19 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_lti_tool_plugin', '0010_add_lti_tool_configuration_ags_rate_limit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentSearchEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('context_key', models.CharField(db_index=True, help_text='Course ID of the entry.', max_length=255, verbose_name='Context Key')),
+                ('usage_key', models.CharField(blank=True, help_text='Usage key of the block, empty for a course entry.', max_length=255, verbose_name='Usage Key')),
+                ('block_type', models.CharField(max_length=64, verbose_name='Block Type')),
+                ('title', models.CharField(blank=True, max_length=255, verbose_name='Title')),
+                ('published_version', models.CharField(blank=True, help_text='Course published version of the indexed entry.', max_length=255, verbose_name='Published Version')),
+            ],
+            options={
+                'verbose_name': 'content search entry',
+                'verbose_name_plural': 'content search entries',
+            },
+        ),
+        migrations.CreateModel(
+            name='ContentSearchTrigram',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trigrams', to='openedx_lti_tool_plugin.contentsearchentry')),
+            ],
+            options={
+                'verbose_name': 'content search trigram',
+                'verbose_name_plural': 'content search trigrams',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contentsearchtrigram',
+            index=models.Index(fields=['trigram', 'entry'], name='content_search_trigram'),
+        ),
+    ]
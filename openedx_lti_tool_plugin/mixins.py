@@ -3,9 +3,10 @@ from typing import Union
 
 from django.http.request import HttpRequest
 from django.utils.translation import gettext as _
-from pylti1p3.contrib.django import DjangoCacheDataStorage, DjangoDbToolConf, DjangoMessageLaunch
+from pylti1p3.contrib.django import DjangoCacheDataStorage, DjangoDbToolConf
 
 from openedx_lti_tool_plugin.http import LoggedHttpResponseBadRequest
+from openedx_lti_tool_plugin.message_launch import LtiMessageLaunch
 
 
 class LTIToolMixin:
@@ -42,17 +43,17 @@ class LTIToolMixin:
     def get_message(
         self,
         request: HttpRequest,
-    ) -> DjangoMessageLaunch:
-        """Get DjangoMessageLaunch.
+    ) -> LtiMessageLaunch:
+        """Get LtiMessageLaunch.
 
         Args:
             request: HTTP request object.
 
         Returns:
-            DjangoMessageLaunch object.
+            LtiMessageLaunch object.
 
         """
-        return DjangoMessageLaunch(
+        return LtiMessageLaunch(
             request,
             self.tool_config,
             launch_data_storage=self.tool_storage,
@@ -62,21 +63,21 @@ class LTIToolMixin:
         self,
         request: HttpRequest,
         launch_id: str,
-    ) -> DjangoMessageLaunch:
-        """Get DjangoMessageLaunch from cache.
+    ) -> LtiMessageLaunch:
+        """Get LtiMessageLaunch from cache.
 
         Args:
             request: HTTP request object.
             launch_id: Launch ID UUID4.
 
         Returns:
-            DjangoMessageLaunch object.
+            LtiMessageLaunch object.
 
         .. _LTI 1.3 Advantage Tool implementation in Python - Accessing Cached Launch Requests:
             https://github.com/dmitry-viskov/pylti1.3?tab=readme-ov-file#accessing-cached-launch-requests
 
         """
-        return DjangoMessageLaunch.from_cache(
+        return LtiMessageLaunch.from_cache(
             f'lti1p3-launch-{launch_id}',
             request,
             self.tool_config,
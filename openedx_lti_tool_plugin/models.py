@@ -2,7 +2,7 @@
 import json
 import re
 import uuid
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 import shortuuid
 from django.contrib.auth import get_user_model
@@ -20,9 +20,8 @@ from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.edxapp_wrapper.learning_sequences import course_context
-from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
 from openedx_lti_tool_plugin.edxapp_wrapper.student_module import user_profile
-from openedx_lti_tool_plugin.waffle import COURSE_ACCESS_CONFIGURATION
+from openedx_lti_tool_plugin.snapshot import get_settings_snapshot
 
 UserT = TypeVar('UserT', bound=AbstractBaseUser)
 User = get_user_model()
@@ -358,6 +357,14 @@ class LtiToolConfiguration(models.Model):
         </ul>
         """)),
     )
+    ags_rate_limit = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('AGS Rate Limit'),
+        help_text=_(
+            'Maximum number of AGS score publish requests per minute sent to the LTI platform. '
+            '0 disables the rate limit.'
+        ),
+    )
 
     class Meta:
         """Meta options."""
@@ -457,7 +464,7 @@ class CourseContextQuerySet(models.QuerySet):
             LtiTool.
 
         """
-        if not COURSE_ACCESS_CONFIGURATION.is_enabled():
+        if not get_settings_snapshot().course_access_configuration:
             return self.all()
 
         try:
@@ -473,6 +480,31 @@ class CourseContextQuerySet(models.QuerySet):
             ),
         )
 
+    def filter_by_orgs(self, orgs: Iterable[str], lookup: str = 'startswith') -> models.QuerySet:
+        """Filter QuerySet by orgs.
+
+        The org is matched with a prefix of the course key string
+        (`course-v1:{org}+`, `ccx-v1:{org}+` for CCX course keys or
+        `{org}/` for deprecated course keys), so the filter is done by
+        the database.
+
+        Args:
+            orgs: Org list.
+            lookup: Field lookup of the course key prefix match.
+
+        Returns:
+            QuerySet with CourseContext objects with an org matching
+            the org list.
+
+        """
+        org_filter = Q()
+
+        for org in orgs:
+            for prefix in (f'course-v1:{org}+', f'ccx-v1:{org}+', f'{org}/'):
+                org_filter |= Q(**{f'learning_context__context_key__{lookup}': prefix})
+
+        return self.filter(org_filter)
+
     def filter_by_site_orgs(self) -> models.QuerySet:
         """Filter QuerySet by site configuration orgs.
 
@@ -485,14 +517,8 @@ class CourseContextQuerySet(models.QuerySet):
             `course_org_filter` setting is not set
 
         """
-        if site_orgs := configuration_helpers().get_current_site_orgs():
-            return self.filter(
-                pk__in=[
-                    course_context.pk
-                    for course_context in self
-                    if course_context.org in site_orgs
-                ]
-            )
+        if site_orgs := get_settings_snapshot().site_orgs:
+            return self.filter_by_orgs(site_orgs)
 
         return self
 
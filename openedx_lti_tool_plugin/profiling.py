@@ -0,0 +1,285 @@
+"""Sampled request profiling of the plugin endpoints.
+
+The ProfilingMiddleware profiles the views of the plugin LTI 1.3 URL
+namespace with cProfile. A request is profiled if its LTI platform issuer
+is in OLTITP_PROFILING_ISSUERS or it's randomly sampled with the
+OLTITP_PROFILING_SAMPLE_RATE probability.
+
+The profiling overhead is bounded on each process: a single request is
+profiled at a time and at most OLTITP_PROFILING_MAX_PROFILES_PER_MINUTE
+requests are profiled per minute, the remaining requests are not profiled.
+
+Each profile is written to the OLTITP_PROFILING_DIRECTORY directory as a
+pstats file (<name>.prof) with a JSON request metadata file (<name>.json).
+
+Attributes:
+    PROFILED_NAMESPACE (str): Profiled URL namespace.
+    PROFILE_ATTR (str): Request attribute holding the RequestProfile.
+    DEFAULT_DIRECTORY (str): Default profiles directory.
+    DEFAULT_MAX_PROFILES_PER_MINUTE (int): Default number of profiles per minute.
+    BUDGET_WINDOW (int): Profiling budget window in seconds.
+
+"""
+import cProfile
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from typing import Callable, Optional, Tuple
+from uuid import uuid4
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+
+log = logging.getLogger(__name__)
+PROFILED_NAMESPACE = f'{app_config.name}:1.3'
+PROFILE_ATTR = '_oltitp_profile'
+DEFAULT_DIRECTORY = '/tmp/openedx_lti_tool_plugin/profiles'
+DEFAULT_MAX_PROFILES_PER_MINUTE = 6
+BUDGET_WINDOW = 60
+RequestProfile = namedtuple('RequestProfile', ['profiler', 'started', 'iss', 'client_id'])
+
+
+class ProfilingBudget:
+    """Profiling overhead budget.
+
+    A process-wide budget of profiled requests, it allows a single
+    profiled request at a time and `max_profiles` per minute.
+
+    Attributes:
+        max_profiles (int): Number of profiles per minute.
+
+    """
+
+    def __init__(self, max_profiles: int):
+        """Initialize class instance.
+
+        Args:
+            max_profiles: Number of profiles per minute.
+
+        """
+        self.max_profiles = max_profiles
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+        self._window_started = 0.0
+        self._profiles = 0
+
+    def acquire(self) -> bool:
+        """Acquire a profile of the budget.
+
+        Returns:
+            True if the request can be profiled, False otherwise.
+
+        """
+        if not self._active.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return False
+
+        with self._lock:
+            now = time.monotonic()
+
+            if now - self._window_started >= BUDGET_WINDOW:
+                self._window_started = now
+                self._profiles = 0
+
+            if self._profiles < self.max_profiles:
+                self._profiles += 1
+
+                return True
+
+        self._active.release()
+
+        return False
+
+    def release(self):
+        """Release the active profile."""
+        self._active.release()
+
+
+def get_lti_tool(request: HttpRequest) -> Tuple[str, str]:
+    """Get the LTI platform issuer and client ID of a request.
+
+    The issuer and client ID are obtained from the OIDC login parameters
+    or from the unverified claims of the launch id_token.
+
+    Args:
+        request: HTTP request object.
+
+    Returns:
+        Tuple with the issuer and client ID, an empty string if not found.
+
+    """
+    params = request.POST if request.method == 'POST' else request.GET
+
+    if id_token := params.get('id_token'):
+        try:
+            claims = jwt.decode(id_token, options={'verify_signature': False})
+        except jwt.InvalidTokenError:
+            return '', ''
+
+        aud = claims.get('aud', '')
+
+        return str(claims.get('iss', '')), str(aud[0] if isinstance(aud, list) and aud else aud)
+
+    return params.get('iss', ''), params.get('client_id', '')
+
+
+class ProfilingMiddleware:
+    """Sampled profiling middleware of the plugin endpoints.
+
+    The middleware is not used if OLTITP_PROFILING_ENABLED is disabled.
+
+    Attributes:
+        get_response (Callable): Next middleware or view.
+        sample_rate (float): Probability of profiling a request.
+        issuers (set): LTI platform issuers always profiled.
+        directory (str): Profiles directory.
+        budget (ProfilingBudget): Profiling overhead budget.
+
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        """Initialize class instance.
+
+        Args:
+            get_response: Next middleware or view.
+
+        Raises:
+            MiddlewareNotUsed: If OLTITP_PROFILING_ENABLED is disabled.
+
+        """
+        if not getattr(settings, 'OLTITP_PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'OLTITP_PROFILING_SAMPLE_RATE', 0.0)
+        self.issuers = set(getattr(settings, 'OLTITP_PROFILING_ISSUERS', []))
+        self.directory = getattr(settings, 'OLTITP_PROFILING_DIRECTORY', DEFAULT_DIRECTORY)
+        self.budget = ProfilingBudget(
+            getattr(settings, 'OLTITP_PROFILING_MAX_PROFILES_PER_MINUTE', DEFAULT_MAX_PROFILES_PER_MINUTE),
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process the request and save its profile.
+
+        Args:
+            request: HTTP request object.
+
+        Returns:
+            HTTP response object.
+
+        """
+        try:
+            response = self.get_response(request)
+        finally:
+            profile = getattr(request, PROFILE_ATTR, None)
+
+            if profile:
+                profile.profiler.disable()
+                self.budget.release()
+
+        if profile:
+            self.save_profile(request, response, profile)
+
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable,  # pylint: disable=unused-argument
+        view_args: tuple,  # pylint: disable=unused-argument
+        view_kwargs: dict,  # pylint: disable=unused-argument
+    ) -> None:
+        """Start the profiler of a sampled plugin request.
+
+        Args:
+            request: HTTP request object.
+            view_func: View function.
+            view_args: View positional arguments.
+            view_kwargs: View keyword arguments.
+
+        """
+        if not self.is_plugin_request(request):
+            return
+
+        iss, client_id = get_lti_tool(request)
+
+        if iss not in self.issuers and random.random() >= self.sample_rate:
+            return
+
+        if not self.budget.acquire():
+            return
+
+        profiler = cProfile.Profile()
+        setattr(request, PROFILE_ATTR, RequestProfile(profiler, time.perf_counter(), iss, client_id))
+        profiler.enable()
+
+    @staticmethod
+    def is_plugin_request(request: HttpRequest) -> bool:
+        """Check if a request is resolved to a plugin LTI 1.3 view.
+
+        Args:
+            request: HTTP request object.
+
+        Returns:
+            True if the view is on the plugin LTI 1.3 URL namespace.
+
+        """
+        namespace = getattr(request.resolver_match, 'namespace', '')
+
+        return namespace == PROFILED_NAMESPACE or namespace.startswith(f'{PROFILED_NAMESPACE}:')
+
+    def save_profile(self, request: HttpRequest, response: HttpResponse, profile: RequestProfile) -> Optional[str]:
+        """Write a request profile and its metadata.
+
+        Args:
+            request: HTTP request object.
+            response: HTTP response object.
+            profile: RequestProfile of the request.
+
+        Returns:
+            Profile file path without extension or None if it couldn't be written.
+
+        """
+        now = datetime.now(timezone.utc)
+        view_name = request.resolver_match.view_name
+        path = os.path.join(
+            self.directory,
+            f'{now:%Y%m%dT%H%M%S}-{view_name.replace(":", "-")}-{uuid4().hex[:8]}',
+        )
+        metadata = {
+            'timestamp': now.isoformat(),
+            'method': request.method,
+            'path': request.path,
+            'view_name': view_name,
+            'status_code': response.status_code,
+            'duration_ms': round((time.perf_counter() - profile.started) * 1000, 3),
+            'iss': profile.iss,
+            'client_id': profile.client_id,
+            'pid': os.getpid(),
+        }
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            profile.profiler.dump_stats(f'{path}.prof')
+
+            with open(f'{path}.json', 'w', encoding='utf-8') as metadata_file:
+                json.dump(metadata, metadata_file)
+        except OSError as exc:
+            log_extra = {'path': path, 'exception': str(exc)}
+            log.error(f'Unable to write request profile: {log_extra}')
+
+            return None
+
+        log_extra = {'path': path, **metadata}
+        log.info(f'Request profile written: {log_extra}')
+
+        return path
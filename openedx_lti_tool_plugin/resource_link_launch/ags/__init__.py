@@ -4,6 +4,12 @@ This module handles all the code related to LTI AGS (Assignment and Grade Servic
 
 Attributes:
     MODULE_PATH (str): This module absolute path.
+    MAX_SCORE (float): There is no constant defined for the max score sent from
+        edx-platform grades signals, we set this attribute based on a grade percent
+        that is between 0.0 and 1.0.
+
+        The method on that calculates the grades is in:
+        edx-platform/lms/djangoapps/grades/course_grade.py.
 
 .. _LTI Assignment and Grade Services Specification:
     https://www.imsglobal.org/spec/lti-ags/v2p0
@@ -11,3 +17,4 @@ Attributes:
 """
 
 MODULE_PATH = 'openedx_lti_tool_plugin.resource_link_launch.ags'
+MAX_SCORE = 1.0
@@ -0,0 +1,223 @@
+"""LTI AGS score client.
+
+Attributes:
+    SERVICE_CONNECTOR_TIMEOUT (int): Maximum ServiceConnector cache timeout in seconds.
+    ACCESS_TOKEN_EXPIRES_IN (int): Default access token lifetime in seconds.
+    ACCESS_TOKEN_EXPIRY_MARGIN (int): Seconds an access token is discarded before it expires.
+    SCORE_SCOPES (list): LTI AGS scopes of a score publish request.
+
+"""
+import threading
+import time
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from pylti1p3.assignments_grades import AssignmentsGradesService
+from pylti1p3.contrib.django import DjangoDbToolConf
+from pylti1p3.exception import LtiServiceException
+from pylti1p3.grade import Grade
+from pylti1p3.registration import Registration
+from pylti1p3.service_connector import ServiceConnector
+from requests import Response
+
+SERVICE_CONNECTOR_TIMEOUT = 300
+ACCESS_TOKEN_EXPIRES_IN = 3600
+ACCESS_TOKEN_EXPIRY_MARGIN = 30
+SCORE_SCOPES = [
+    'https://purl.imsglobal.org/spec/lti-ags/scope/lineitem',
+    'https://purl.imsglobal.org/spec/lti-ags/scope/score',
+]
+_service_connectors = threading.local()
+_service_connectors_version = 0
+_service_connectors_lock = threading.Lock()
+
+
+class AgsServiceConnector(ServiceConnector):
+    """pylti1.3 ServiceConnector with access token expiry.
+
+    The `expires_in` of each access token response is recorded
+    with a response hook of the ServiceConnector requests session.
+
+    Attributes:
+        access_token_expires (float, optional): Monotonic time the first
+            access token expires, None if no access token was fetched.
+
+    """
+
+    def __init__(self, registration: Registration):
+        """Initialize class instance.
+
+        Args:
+            registration: pylti1.3 Registration object.
+
+        """
+        super().__init__(registration)
+        self.access_token_expires: Optional[float] = None
+        self._requests_session.hooks['response'].append(self.record_access_token_expiry)
+
+    def record_access_token_expiry(self, response: Response, *args: tuple, **kwargs: dict):
+        """Record the expiry of an access token response.
+
+        Args:
+            response: HTTP response object.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        if not response.ok or 'grant_type=client_credentials' not in str(response.request.body or ''):
+            return
+
+        try:
+            expires_in = int(response.json().get('expires_in', ACCESS_TOKEN_EXPIRES_IN))
+        except (AttributeError, TypeError, ValueError):
+            expires_in = ACCESS_TOKEN_EXPIRES_IN
+
+        expires = time.monotonic() + expires_in - ACCESS_TOKEN_EXPIRY_MARGIN
+        self.access_token_expires = min(expires, self.access_token_expires or expires)
+
+    def is_expired(self, now: float) -> bool:
+        """Check if an access token of the ServiceConnector expired.
+
+        Args:
+            now: Monotonic time.
+
+        Returns:
+            True if an access token expired, False otherwise.
+
+        """
+        return self.access_token_expires is not None and self.access_token_expires <= now
+
+
+def get_thread_service_connectors() -> Dict[Tuple[str, str], Tuple[float, AgsServiceConnector]]:
+    """Get the ServiceConnector cache of the current thread.
+
+    Each thread has its own ServiceConnector objects, so the requests
+    sessions are not shared between the publisher worker threads.
+
+    Returns:
+        ServiceConnector cache dictionary.
+
+    """
+    if getattr(_service_connectors, 'version', None) != _service_connectors_version:
+        _service_connectors.version = _service_connectors_version
+        _service_connectors.cache = {}
+
+    return _service_connectors.cache
+
+
+def get_service_connector(iss: str, aud: str) -> AgsServiceConnector:
+    """Get the pylti1.3 ServiceConnector of an LtiTool.
+
+    The ServiceConnector is cached on the current thread until its access
+    token expires or for SERVICE_CONNECTOR_TIMEOUT seconds, this avoids the
+    LtiTool registration query and reuses the ServiceConnector access tokens
+    on each score publish request.
+
+    Args:
+        iss: Issuer claim.
+        aud: Audience claim.
+
+    Returns:
+        AgsServiceConnector object.
+
+    Raises:
+        LtiException: If the LtiTool is not found.
+
+    """
+    now = time.monotonic()
+    service_connectors = get_thread_service_connectors()
+    expires, service_connector = service_connectors.get((iss, aud), (0, None))
+
+    if expires > now and not service_connector.is_expired(now):
+        return service_connector
+
+    registration = DjangoDbToolConf().find_registration_by_params(iss, aud)
+    service_connector = AgsServiceConnector(registration)
+    service_connectors[iss, aud] = (now + SERVICE_CONNECTOR_TIMEOUT, service_connector)
+
+    return service_connector
+
+
+def evict_service_connector(iss: str, aud: str):
+    """Evict the ServiceConnector of an LtiTool from the current thread cache.
+
+    Args:
+        iss: Issuer claim.
+        aud: Audience claim.
+
+    """
+    get_thread_service_connectors().pop((iss, aud), None)
+
+
+def clear_service_connectors():
+    """Clear the ServiceConnector cache of every thread."""
+    global _service_connectors_version  # pylint: disable=global-statement
+
+    with _service_connectors_lock:
+        _service_connectors_version += 1
+
+
+class AgsScoreClient:
+    """LTI AGS score client.
+
+    A score publish client that only needs the LTI platform
+    registration, the line item URL and an access token.
+
+    """
+
+    def __init__(self, iss: str, aud: str, lineitem: str):
+        """Initialize class instance.
+
+        Args:
+            iss: Issuer claim.
+            aud: Audience claim.
+            lineitem: AGS lineitem URL.
+
+        """
+        self.iss = iss
+        self.aud = aud
+        self.lineitem = lineitem
+
+    def put_grade(self, grade: Grade) -> dict:
+        """Send a score publish request to the LTI platform.
+
+        The cached ServiceConnector is evicted if the LTI platform responds
+        with a 401 HTTP status code (e.g. a revoked access token), the
+        request is sent once more with a new ServiceConnector.
+
+        Args:
+            grade: pylti1.3 Grade object.
+
+        Returns:
+            Dictionary with the HTTP response body and headers.
+
+        Raises:
+            LtiException: If the LtiTool is not found or the LTI platform
+                responded with an error HTTP status code.
+            RequestException: Score publish request failure.
+
+        .. _LTI Assignment and Grade Services Specification - Score publish service:
+            https://www.imsglobal.org/spec/lti-ags/v2p0/#score-publish-service
+
+        """
+        try:
+            return self.get_service(get_service_connector(self.iss, self.aud)).put_grade(grade)
+        except LtiServiceException as exc:
+            if exc.response.status_code != HTTPStatus.UNAUTHORIZED:
+                raise
+
+            evict_service_connector(self.iss, self.aud)
+
+        return self.get_service(get_service_connector(self.iss, self.aud)).put_grade(grade)
+
+    def get_service(self, service_connector: ServiceConnector) -> AssignmentsGradesService:
+        """Get the pylti1.3 AssignmentsGradesService of the line item.
+
+        Args:
+            service_connector: pylti1.3 ServiceConnector object.
+
+        Returns:
+            pylti1.3 AssignmentsGradesService object.
+
+        """
+        return AssignmentsGradesService(service_connector, {'lineitem': self.lineitem, 'scope': SCORE_SCOPES})
@@ -0,0 +1,22 @@
+"""Exceptions."""
+from openedx_lti_tool_plugin.resource_link_launch.exceptions import ResourceLinkException
+
+
+class AgsThrottledException(ResourceLinkException):
+    """An exception for throttled LTI AGS requests.
+
+    Attributes:
+        retry_after (float): Seconds to wait before retrying the request.
+
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        """Initialize class instance.
+
+        Args:
+            message: Exception message.
+            retry_after: Seconds to wait before retrying the request.
+
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
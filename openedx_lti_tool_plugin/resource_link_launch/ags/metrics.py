@@ -0,0 +1,165 @@
+"""LTI AGS Celery task instrumentation.
+
+The AGS score update tasks are measured with a TaskMetrics instance, the
+metrics are reported as custom attributes of the task transaction through
+the edx-django-utils monitoring API:
+
+- oltitp.ags_task.name: Task name.
+- oltitp.ags_task.event_id: Score change event ID.
+- oltitp.ags_task.outcome: Task outcome (success or failure).
+- oltitp.ags_task.queue_lag_ms: Enqueue to start lag in milliseconds.
+- oltitp.ags_task.duration_ms: Task runtime in milliseconds.
+- oltitp.ags_task.<stage>_ms: Runtime of each stage (grade, modulestore, http) in milliseconds.
+- oltitp.ags_task.queries: Number of database queries.
+- oltitp.ags_task.published: Number of published scores.
+- oltitp.ags_task.rescheduled: Number of throttled and rescheduled scores.
+
+Attributes:
+    METRIC_PREFIX (str): Custom attribute name prefix.
+    STAGES (tuple): Task runtime stages.
+
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from django.db import connection
+from edx_django_utils.monitoring import set_custom_attribute
+
+log = logging.getLogger(__name__)
+METRIC_PREFIX = 'oltitp.ags_task'
+STAGES = ('grade', 'modulestore', 'http')
+
+
+class TaskMetrics:
+    """LTI AGS Celery task metrics.
+
+    A context manager measuring a task run, the metrics are reported
+    and logged when the context exits.
+
+    Attributes:
+        name (str): Task name.
+        event_id (str): Score change event ID.
+        enqueued_at (float, optional): Task enqueue UNIX timestamp.
+        stages (dict): Runtime of each stage in seconds.
+        published (int): Number of published scores.
+        rescheduled (int): Number of throttled and rescheduled scores.
+        queries (int): Number of database queries.
+
+    """
+
+    def __init__(self, name: str, event_id: str = '', enqueued_at: Optional[float] = None):
+        """Initialize class instance.
+
+        Args:
+            name: Task name.
+            event_id: Score change event ID.
+            enqueued_at: Task enqueue UNIX timestamp.
+
+        """
+        self.name = name
+        self.event_id = event_id
+        self.enqueued_at = enqueued_at
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        self.published = 0
+        self.rescheduled = 0
+        self.queries = 0
+        self._started_at = None
+        self._started = None
+        self._exit_stack = ExitStack()
+
+    def __enter__(self) -> TaskMetrics:
+        """Start the task measurement."""
+        self._started_at = time.time()
+        self._started = time.perf_counter()
+        self._exit_stack.enter_context(connection.execute_wrapper(self.count_query))
+
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *args: tuple):
+        """Stop the task measurement and report the metrics.
+
+        Args:
+            exc_type: Exception type if the task failed.
+            *args: Exception value and traceback.
+
+        """
+        self._exit_stack.close()
+        self.report(time.perf_counter() - self._started, 'failure' if exc_type else 'success')
+
+    def count_query(self, execute: Callable, *args: tuple) -> Any:
+        """Count a database query.
+
+        Args:
+            execute: Query execute function.
+            *args: Query SQL, parameters, many flag and context.
+
+        Returns:
+            Query execute result.
+
+        """
+        self.queries += 1
+
+        return execute(*args)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the runtime of a task stage.
+
+        Args:
+            name: Stage name.
+
+        Yields:
+            None.
+
+        """
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.stages[name] += time.perf_counter() - started
+
+    def record_publish(self, published: bool):
+        """Record a score publish.
+
+        Args:
+            published: True if the score was published, False if it was rescheduled.
+
+        """
+        if published:
+            self.published += 1
+        else:
+            self.rescheduled += 1
+
+    def report(self, duration: float, outcome: str):
+        """Report and log the task metrics.
+
+        Args:
+            duration: Task runtime in seconds.
+            outcome: Task outcome.
+
+        """
+        metrics = {
+            'name': self.name,
+            'event_id': self.event_id,
+            'outcome': outcome,
+            'queue_lag_ms': (
+                round(max(self._started_at - self.enqueued_at, 0) * 1000, 3)
+                if self.enqueued_at is not None else None
+            ),
+            'duration_ms': round(duration * 1000, 3),
+            **{f'{stage}_ms': round(value * 1000, 3) for stage, value in self.stages.items()},
+            'queries': self.queries,
+            'published': self.published,
+            'rescheduled': self.rescheduled,
+        }
+
+        for metric, value in metrics.items():
+            if value is not None:
+                set_custom_attribute(f'{METRIC_PREFIX}.{metric}', value)
+
+        log.info(f'LTI AGS task finished: {metrics}')
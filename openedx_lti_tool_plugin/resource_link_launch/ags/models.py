@@ -9,13 +9,21 @@ from django.db import models
 from django.db.models import QuerySet
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
-from pylti1p3.contrib.django import DjangoDbToolConf, DjangoMessageLaunch
 from pylti1p3.exception import LtiException
 from pylti1p3.grade import Grade
 from requests.exceptions import RequestException
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.circuit_breaker import AGS, CircuitBreaker
 from openedx_lti_tool_plugin.models import LtiProfile
+from openedx_lti_tool_plugin.resource_link_launch.ags.client import AgsScoreClient
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
+from openedx_lti_tool_plugin.resource_link_launch.ags.throttling import (
+    THROTTLED_STATUS_CODES,
+    TokenBucket,
+    get_rate_limit,
+    get_retry_after,
+)
 from openedx_lti_tool_plugin.resource_link_launch.ags.validators import validate_context_key
 
 log = logging.getLogger(__name__)
@@ -24,22 +32,25 @@ log = logging.getLogger(__name__)
 class LtiGradedResourceManager(models.Manager):
     """A manager for the LtiGradedResource model."""
 
-    def all_from_user_id(self, user_id: int, context_key: str) -> Optional[QuerySet]:
+    def all_from_user_id(self, user_id: int, context_key: str) -> QuerySet:
         """
         Retrieve all instances for a user ID and context key.
 
+        This query joins the LtiProfile table so all instances of every
+        LtiProfile related to the user are returned in a single query.
+
         Args:
             user_id: User ID.
             context_key: Graded resource opaque key string.
 
         Returns:
-            LtiGradedResourceManager query or None.
+            LtiGradedResource QuerySet.
 
         """
         return self.filter(
-            lti_profile=LtiProfile.objects.filter(user__id=user_id).first(),
+            lti_profile__user__id=user_id,
             context_key=context_key,
-        )
+        ).select_related('lti_profile')
 
 
 class LtiGradedResource(models.Model):
@@ -108,13 +119,64 @@ class LtiGradedResource(models.Model):
             },
         }
 
+    def check_rate_limit(self):
+        """Check the AGS rate limit of the LTI platform.
+
+        A token is consumed from the LtiTool token bucket, the bucket is
+        shared by all the LtiGradedResource instances of the LtiTool.
+
+        Raises:
+            AgsThrottledException: If the LtiToolConfiguration AGS rate limit is exceeded.
+
+        """
+        rate_limit = get_rate_limit(self.lti_profile.platform_id, self.lti_profile.client_id)
+
+        if not rate_limit:
+            return
+
+        rate = rate_limit / 60
+
+        bucket = TokenBucket((self.lti_profile.platform_id, self.lti_profile.client_id), rate, capacity=rate)
+
+        if retry_after := bucket.consume():
+            raise AgsThrottledException(_('LTI AGS rate limit exceeded.'), retry_after)
+
+    def get_grade(
+        self,
+        given_score: Union[int, float],
+        score_maximum: Union[int, float],
+        activity_progress: str,
+        grading_progress: str,
+        timestamp: datetime,
+    ) -> Grade:
+        """Get the pylti1.3 Grade of a score publish request.
+
+        Args:
+            given_score: Given score.
+            score_maximum: Score maximum.
+            activity_progress: Status of the activity's completion.
+            grading_progress: Status of the grading process.
+            timestamp: Score datetime.
+
+        Returns:
+            pylti1.3 Grade object.
+
+        """
+        return Grade()\
+            .set_score_given(given_score)\
+            .set_score_maximum(score_maximum)\
+            .set_timestamp(timestamp.isoformat())\
+            .set_activity_progress(activity_progress)\
+            .set_grading_progress(grading_progress)\
+            .set_user_id(self.lti_profile.subject_id)
+
     def publish_score(
         self,
         given_score: Union[int, float],
         score_maximum: Union[int, float],
         activity_progress: str = 'Submitted',
         grading_progress: str = 'FullyGraded',
-        timestamp: datetime = datetime.now(tz=timezone.utc),
+        timestamp: Optional[datetime] = None,
         event_id: str = '',
     ):
         """
@@ -125,10 +187,12 @@ class LtiGradedResource(models.Model):
             score_maximum: Score maximum.
             activity_progress: Status of the activity's completion.
             grading_progress: Status of the grading process.
-            timestamp: Score datetime.
+            timestamp: Score datetime, defaults to the current datetime.
             event_id: Optional ID for this event.
 
         Raises:
+            AgsThrottledException: LTI AGS rate limit exceeded, LTI platform circuit
+                breaker is open or LTI platform responded with a 429 or 503 HTTP status code.
             LtiException: Invalid score data.
             RequestException: LTI AGS score publish request failure.
 
@@ -136,6 +200,8 @@ class LtiGradedResource(models.Model):
             https://www.imsglobal.org/spec/lti-ags/v2p0/#score-publish-service
 
         """
+        timestamp = timestamp or datetime.now(tz=timezone.utc)
+        circuit_breaker = CircuitBreaker(self.lti_profile.platform_id, AGS)
         log_extra = {
             'event_id': event_id,
             'given_score': given_score,
@@ -149,28 +215,45 @@ class LtiGradedResource(models.Model):
 
         try:
             log.info(f'LTI AGS score publish request started: {log_extra}')
-            # Create pylti1.3 DjangoMessageLaunch object.
-            message = DjangoMessageLaunch(request=None, tool_config=DjangoDbToolConf())\
-                .set_auto_validation(enable=False)\
-                .set_jwt(self.publish_score_jwt)\
-                .set_restored()\
-                .validate_registration()
+            # Check LTI platform rate limit before the circuit breaker,
+            # a throttled request doesn't take the half-open probe.
+            self.check_rate_limit()
+            # Check LTI platform circuit breaker.
+            if retry_after := circuit_breaker.acquire():
+                raise AgsThrottledException(_('LTI platform circuit breaker is open.'), retry_after)
             # Create Grade object for pylti1.3 AssignmentsGradeService.
-            grade = Grade()\
-                .set_score_given(given_score)\
-                .set_score_maximum(score_maximum)\
-                .set_timestamp(timestamp.isoformat())\
-                .set_activity_progress(activity_progress)\
-                .set_grading_progress(grading_progress)\
-                .set_user_id(self.lti_profile.subject_id)
+            grade = self.get_grade(given_score, score_maximum, activity_progress, grading_progress, timestamp)
             # Send score publish request to LTI platform.
-            message.get_ags().put_grade(grade)
+            AgsScoreClient(
+                self.lti_profile.platform_id,
+                self.lti_profile.client_id,
+                self.lineitem,
+            ).put_grade(grade)
+            circuit_breaker.record_success()
             log.info(f'LTI AGS score publish request success: {log_extra}')
+        except AgsThrottledException as exc:
+            log_extra['retry_after'] = exc.retry_after
+            log.warning(f'LTI AGS score publish request throttled: {log_extra}')
+            raise
         except LtiException as exc:
             log_extra['exception'] = str(exc)
+            response = getattr(exc, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+
+            if status_code and status_code >= 500:
+                circuit_breaker.record_failure()
+            elif status_code:
+                circuit_breaker.record_success()
+
+            if status_code in THROTTLED_STATUS_CODES:
+                log_extra['retry_after'] = get_retry_after(response)
+                log.warning(f'LTI AGS score publish request throttled: {log_extra}')
+                raise AgsThrottledException(str(exc), log_extra['retry_after']) from exc
+
             log.error(f'LTI AGS score publish request failure: {log_extra}')
             raise
         except RequestException as exc:
+            circuit_breaker.record_failure()
             log_extra['exception'] = str(exc)
             log_extra['request'] = getattr(exc.request, '__dict__', {})
             log_extra['response'] = getattr(exc.response, '__dict__', {})
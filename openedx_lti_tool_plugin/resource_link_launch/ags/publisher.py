@@ -0,0 +1,219 @@
+"""LTI AGS asynchronous score publisher.
+
+Attributes:
+    DEFAULT_MAX_CONCURRENCY (int): Default number of concurrent score publish requests.
+    DEFAULT_MAX_HOST_CONCURRENCY (int): Default number of concurrent score publish requests per LTI platform host.
+    MAX_THROTTLED_RETRIES (int): Maximum retries of a throttled score publish request.
+
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from django.db import connection
+from pylti1p3.exception import LtiException
+from requests.exceptions import RequestException
+
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_MAX_HOST_CONCURRENCY = 16
+MAX_THROTTLED_RETRIES = 5
+
+
+class AsyncScorePublisher:
+    """LTI AGS asynchronous score publisher.
+
+    Publish many LtiGradedResource scores concurrently from a single process.
+
+    The score publish requests are scheduled on an asyncio event loop,
+    every LTI platform host has its own concurrency cap so a slow platform
+    can't use all the available concurrency. The blocking pylti1.3 HTTP
+    requests run on a thread pool while the event loop waits on them,
+    throttled requests wait on the event loop without using a thread.
+
+    The thread pool is reused by every publish call, the publisher
+    should be used as a context manager or closed after its use.
+
+    Attributes:
+        max_concurrency (int): Number of concurrent score publish requests.
+        max_host_concurrency (int): Number of concurrent score publish requests per LTI platform host.
+        event_id (str): Optional ID for the published scores.
+        executor (ThreadPoolExecutor): Score publish requests thread pool.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_host_concurrency: int = DEFAULT_MAX_HOST_CONCURRENCY,
+        event_id: str = '',
+    ):
+        """Initialize class instance.
+
+        Args:
+            max_concurrency: Number of concurrent score publish requests.
+            max_host_concurrency: Number of concurrent score publish requests per LTI platform host.
+            event_id: Optional ID for the published scores.
+
+        """
+        self.max_concurrency = max_concurrency
+        self.max_host_concurrency = min(max_host_concurrency, max_concurrency)
+        self.event_id = event_id
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def __enter__(self) -> AsyncScorePublisher:
+        """Enter the publisher context."""
+        return self
+
+    def __exit__(self, *args: tuple):
+        """Close the publisher."""
+        self.close()
+
+    def close(self):
+        """Shut down the thread pool."""
+        self.executor.shutdown()
+
+    def publish(
+        self,
+        scores: Iterable[Tuple[LtiGradedResource, Union[int, float], Union[int, float]]],
+    ) -> List[bool]:
+        """Publish scores.
+
+        Args:
+            scores: LtiGradedResource instance, given score and score maximum tuples.
+
+        Returns:
+            List with True for each published score or False for each failed score.
+
+        """
+        return asyncio.run(self.publish_all(scores))
+
+    async def publish_all(
+        self,
+        scores: Iterable[Tuple[LtiGradedResource, Union[int, float], Union[int, float]]],
+    ) -> List[bool]:
+        """Publish scores concurrently.
+
+        Args:
+            scores: LtiGradedResource instance, given score and score maximum tuples.
+
+        Returns:
+            List with True for each published score or False for each failed score.
+
+        """
+        semaphores = {}
+        timestamp = datetime.now(tz=timezone.utc)
+
+        return await asyncio.gather(*[
+            self.publish_score(
+                self.get_semaphore(semaphores, graded_resource.lineitem),
+                graded_resource,
+                given_score,
+                score_maximum,
+                timestamp,
+            )
+            for graded_resource, given_score, score_maximum in scores
+        ])
+
+    def get_semaphore(self, semaphores: Dict[str, asyncio.Semaphore], url: str) -> asyncio.Semaphore:
+        """Get the concurrency semaphore of an URL host.
+
+        Args:
+            semaphores: Dictionary of host semaphores.
+            url: LTI platform URL.
+
+        Returns:
+            Host semaphore.
+
+        """
+        host = urlparse(url).netloc
+
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.max_host_concurrency)
+
+        return semaphores[host]
+
+    async def publish_score(
+        self,
+        semaphore: asyncio.Semaphore,
+        graded_resource: LtiGradedResource,
+        given_score: Union[int, float],
+        score_maximum: Union[int, float],
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
+        """Publish LtiGradedResource score.
+
+        Throttled score publish requests are retried after the time requested
+        by the LTI platform, the host semaphore is released while waiting so
+        it can be used by the other requests to the host.
+
+        Args:
+            semaphore: LTI platform host semaphore.
+            graded_resource: LtiGradedResource instance.
+            given_score: Given score.
+            score_maximum: Score maximum.
+            timestamp: Score datetime.
+
+        Returns:
+            True if the score was published or False if it failed.
+
+        """
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(MAX_THROTTLED_RETRIES + 1):
+            async with semaphore:
+                try:
+                    await loop.run_in_executor(
+                        self.executor,
+                        self.publish_score_sync,
+                        graded_resource,
+                        given_score,
+                        score_maximum,
+                        timestamp,
+                    )
+
+                    return True
+                except AgsThrottledException as exc:
+                    retry_after = exc.retry_after
+                except (LtiException, RequestException):
+                    return False
+
+            if attempt < MAX_THROTTLED_RETRIES:
+                await asyncio.sleep(retry_after)
+
+        return False
+
+    def publish_score_sync(
+        self,
+        graded_resource: LtiGradedResource,
+        given_score: Union[int, float],
+        score_maximum: Union[int, float],
+        timestamp: Optional[datetime] = None,
+    ):
+        """Publish LtiGradedResource score from a thread pool thread.
+
+        The thread database connection is closed after each request,
+        close_old_connections keeps it open with CONN_MAX_AGE.
+
+        Args:
+            graded_resource: LtiGradedResource instance.
+            given_score: Given score.
+            score_maximum: Score maximum.
+            timestamp: Score datetime.
+
+        """
+        try:
+            graded_resource.publish_score(
+                given_score,
+                score_maximum,
+                timestamp=timestamp,
+                event_id=self.event_id,
+            )
+        finally:
+            connection.close()
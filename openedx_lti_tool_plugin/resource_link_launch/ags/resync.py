@@ -0,0 +1,257 @@
+"""LTI AGS score resync.
+
+Attributes:
+    CHECKPOINT_TIMEOUT (int): Resync checkpoint cache timeout in seconds.
+    DEFAULT_CHUNK_SIZE (int): Default number of LtiGradedResource instances per batch.
+    DEFAULT_MAX_WORKERS (int): Default number of concurrent score publish requests.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import uuid
+from itertools import groupby
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.edxapp_wrapper.grades_module import course_grade_factory
+from openedx_lti_tool_plugin.edxapp_wrapper.modulestore_module import modulestore
+from openedx_lti_tool_plugin.resource_link_launch.ags import MAX_SCORE
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.resource_link_launch.ags.publisher import DEFAULT_MAX_CONCURRENCY, AsyncScorePublisher
+
+log = logging.getLogger(__name__)
+CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_MAX_WORKERS = DEFAULT_MAX_CONCURRENCY
+
+
+class ScoreResync:
+    """LTI AGS score resync.
+
+    Publish the current score of every LtiGradedResource of a course,
+    an LTI platform or both.
+
+    The LtiGradedResource instances are streamed ordered by user and
+    processed in batches, the course grade of each user is read once
+    per course and the scores of a batch are published concurrently
+    with the AsyncScorePublisher.
+    After each batch the last processed user ID is saved as a checkpoint,
+    an interrupted resync will resume from this checkpoint.
+
+    """
+
+    def __init__(
+        self,
+        course_id: str = '',
+        platform_id: str = '',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Initialize class instance.
+
+        Args:
+            course_id: Course ID string.
+            platform_id: LTI platform ID.
+            chunk_size: Number of LtiGradedResource instances per batch.
+            max_workers: Number of concurrent score publish requests.
+
+        """
+        self.course_id = course_id
+        self.platform_id = platform_id
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.event_id = str(uuid.uuid4())
+        self.courses = {}
+
+    @property
+    def log_extra(self) -> dict:
+        """dict: Resync log extra data."""
+        return {
+            'event_id': self.event_id,
+            'course_id': self.course_id,
+            'platform_id': self.platform_id,
+        }
+
+    @property
+    def checkpoint_key(self) -> str:
+        """str: Resync checkpoint cache key."""
+        job_id = hashlib.md5(f'{self.course_id}|{self.platform_id}'.encode('utf-8')).hexdigest()
+
+        return f'{app_config.name}.ags.resync.{job_id}'
+
+    def get_checkpoint(self) -> int:
+        """Get last processed user ID.
+
+        Returns:
+            Last processed user ID or 0.
+
+        """
+        return cache.get(self.checkpoint_key, 0)
+
+    def set_checkpoint(self, user_id: int):
+        """Set last processed user ID.
+
+        Args:
+            user_id: User ID.
+
+        """
+        cache.set(self.checkpoint_key, user_id, CHECKPOINT_TIMEOUT)
+
+    def reset_checkpoint(self):
+        """Reset last processed user ID."""
+        cache.delete(self.checkpoint_key)
+
+    def get_queryset(self) -> QuerySet:
+        """Get LtiGradedResource QuerySet.
+
+        Returns:
+            LtiGradedResource QuerySet filtered by course ID and platform ID
+            and ordered by user ID, starting after the checkpoint user ID.
+
+        """
+        queryset = LtiGradedResource.objects.select_related('lti_profile__user').filter(
+            lti_profile__user__id__gt=self.get_checkpoint(),
+        )
+
+        if self.course_id:
+            course_key = CourseKey.from_string(self.course_id)
+            queryset = queryset.filter(
+                Q(context_key=str(course_key))
+                | Q(context_key__startswith=f'block-v1:{course_key.org}+{course_key.course}+{course_key.run}+'),
+            )
+
+        if self.platform_id:
+            queryset = queryset.filter(lti_profile__platform_id=self.platform_id)
+
+        return queryset.order_by('lti_profile__user__id', 'pk')
+
+    def iter_batches(self) -> Iterator[List[LtiGradedResource]]:
+        """Iterate LtiGradedResource batches.
+
+        The instances of a user are never split between batches.
+
+        Yields:
+            List of LtiGradedResource instances.
+
+        """
+        batch = []
+
+        for _user_id, graded_resources in groupby(
+            self.get_queryset().iterator(chunk_size=self.chunk_size),
+            key=lambda graded_resource: graded_resource.lti_profile.user_id,
+        ):
+            batch.extend(graded_resources)
+
+            if len(batch) >= self.chunk_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def get_course(self, course_key: CourseKey) -> Any:
+        """Get course from modulestore.
+
+        Args:
+            course_key: CourseKey object.
+
+        Returns:
+            Course descriptor.
+
+        """
+        if course_key not in self.courses:
+            self.courses[course_key] = modulestore().get_course(course_key)
+
+        return self.courses[course_key]
+
+    def get_scores(
+        self,
+        graded_resources: List[LtiGradedResource],
+    ) -> List[Tuple[LtiGradedResource, Union[int, float], Union[int, float]]]:
+        """Get scores of LtiGradedResource instances.
+
+        Args:
+            graded_resources: List of LtiGradedResource instances.
+
+        Returns:
+            List of LtiGradedResource instance, given score and score maximum tuples.
+
+        """
+        course_grades = {}
+        scores = []
+
+        for graded_resource in graded_resources:
+            user = graded_resource.lti_profile.user
+            usage_key = None
+
+            try:
+                course_key = CourseKey.from_string(graded_resource.context_key)
+            except InvalidKeyError:
+                usage_key = UsageKey.from_string(graded_resource.context_key)
+                course_key = usage_key.course_key
+
+            if (user.id, course_key) not in course_grades:
+                course_grades[user.id, course_key] = course_grade_factory().read(user, self.get_course(course_key))
+
+            course_grade = course_grades[user.id, course_key]
+
+            if usage_key:
+                scores.append((graded_resource, *course_grade.score_for_module(usage_key)))
+            else:
+                scores.append((graded_resource, course_grade.percent, MAX_SCORE))
+
+        return scores
+
+    def run(self) -> Dict[str, Union[int, float]]:
+        """Run score resync.
+
+        Returns:
+            Dictionary with resync statistics.
+
+        """
+        started = time.monotonic()
+        stats = {'processed': 0, 'published': 0, 'failed': 0}
+        log.info(f'LTI AGS score resync started: {self.log_extra}')
+
+        with AsyncScorePublisher(max_concurrency=self.max_workers, event_id=self.event_id) as publisher:
+            for batch in self.iter_batches():
+                results = publisher.publish(self.get_scores(batch))
+                stats['processed'] += len(results)
+                stats['published'] += results.count(True)
+                stats['failed'] += results.count(False)
+                self.set_checkpoint(batch[-1].lti_profile.user_id)
+                log.info(f'LTI AGS score resync progress: {self.get_progress(stats, started)}')
+
+        self.reset_checkpoint()
+        log.info(f'LTI AGS score resync finished: {self.get_progress(stats, started)}')
+
+        return stats
+
+    def get_progress(self, stats: dict, started: float) -> dict:
+        """Get resync progress.
+
+        Args:
+            stats: Dictionary with resync statistics.
+            started: Resync start monotonic time.
+
+        Returns:
+            Dictionary with resync log extra data, statistics,
+            elapsed seconds and throughput in scores per second.
+
+        """
+        elapsed = max(time.monotonic() - started, 0.001)
+
+        return {
+            **self.log_extra,
+            **stats,
+            'elapsed': round(elapsed, 2),
+            'throughput': round(stats['processed'] / elapsed, 2),
+        }
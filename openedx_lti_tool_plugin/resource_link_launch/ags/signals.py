@@ -1,15 +1,6 @@
-"""Django Signals.
-
-Attributes:
-    MAX_SCORE (float): There is no constant defined for the max score sent from
-        edx-platform grades signals, we set this attribute based on a grade percent
-        that is between 0.0 and 1.0.
-
-        The method on that calculates the grades is in:
-        edx-platform/lms/djangoapps/grades/course_grade.py.
-
-"""
+"""Django Signals."""
 import logging
+import time
 import uuid
 from typing import Any
 
@@ -19,12 +10,16 @@ from opaque_keys.edx.keys import CourseKey
 from openedx_lti_tool_plugin.edxapp_wrapper.core_signals_module import course_grade_changed
 from openedx_lti_tool_plugin.edxapp_wrapper.grades_module import problem_weighted_score_changed
 from openedx_lti_tool_plugin.models import LtiProfile, UserT
+from openedx_lti_tool_plugin.resource_link_launch.ags import MAX_SCORE
 from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
-from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import send_problem_score_update, send_vertical_score_update
+from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import (
+    publish_score,
+    send_problem_score_update,
+    send_vertical_score_update,
+)
 from openedx_lti_tool_plugin.utils import is_plugin_enabled
 
 log = logging.getLogger(__name__)
-MAX_SCORE = 1.0
 
 
 @receiver(course_grade_changed())
@@ -74,7 +69,8 @@ def publish_course_score(
     log.info(f'Sending course LTI AGS score publish request(s): {log_extra}')
 
     for lti_graded_resource in lti_graded_resources:
-        lti_graded_resource.publish_score(
+        publish_score(
+            lti_graded_resource,
             course_grade.percent,
             MAX_SCORE,
             event_id=log_extra.get('event_id'),
@@ -109,14 +105,22 @@ def update_unit_or_problem_score(
     ):
         return
 
+    event_id = str(uuid.uuid4())
+    enqueued_at = time.time()
+    log_extra = {'event_id': event_id, 'user_id': user_id, 'course_id': course_id, 'usage_id': usage_id}
+    log.info(f'Sending unit and problem LTI AGS score update task(s): {log_extra}')
     send_problem_score_update.delay(
         weighted_earned,
         weighted_possible,
         user_id,
         usage_id,
+        event_id=event_id,
+        enqueued_at=enqueued_at,
     )
     send_vertical_score_update.delay(
         user_id,
         course_id,
         usage_id,
+        event_id=event_id,
+        enqueued_at=enqueued_at,
     )
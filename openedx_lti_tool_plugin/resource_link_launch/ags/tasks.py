@@ -2,9 +2,12 @@
 
 Attributes:
     MODULE_PATH (str): This module absolute path.
+    MAX_THROTTLED_RETRIES (int): Maximum retries of a throttled score publish request.
 
 """
 import logging
+from datetime import datetime, timezone
+from typing import Optional, Union
 
 from celery import shared_task
 from django.contrib.auth import get_user_model
@@ -13,10 +16,94 @@ from opaque_keys.edx.keys import CourseKey, UsageKey
 from openedx_lti_tool_plugin.edxapp_wrapper.grades_module import course_grade_factory
 from openedx_lti_tool_plugin.edxapp_wrapper.modulestore_module import modulestore
 from openedx_lti_tool_plugin.resource_link_launch.ags import MODULE_PATH
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
+from openedx_lti_tool_plugin.resource_link_launch.ags.metrics import TaskMetrics
 from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.resource_link_launch.ags.resync import ScoreResync
 
 log = logging.getLogger(__name__)
 MODULE_PATH = f'{MODULE_PATH}.tasks'
+MAX_THROTTLED_RETRIES = 10
+
+
+@shared_task(
+    bind=True,
+    name=f'{MODULE_PATH}.send_score_update',
+    max_retries=MAX_THROTTLED_RETRIES,
+)
+def send_score_update(
+    self,
+    graded_resource_id: int,
+    given_score: Union[int, float],
+    score_maximum: Union[int, float],
+    timestamp: str,
+    event_id: str = '',
+):
+    """Send score update task.
+
+    Task to publish a throttled score publish request again,
+    the task is retried while the LTI platform keeps throttling it.
+
+    Args:
+        graded_resource_id: LtiGradedResource ID.
+        given_score: Given score.
+        score_maximum: Score maximum.
+        timestamp: Score ISO 8601 datetime string.
+        event_id: Optional ID for this event.
+
+    """
+    graded_resource = LtiGradedResource.objects.select_related('lti_profile').get(id=graded_resource_id)
+
+    try:
+        graded_resource.publish_score(
+            given_score,
+            score_maximum,
+            timestamp=datetime.fromisoformat(timestamp),
+            event_id=event_id,
+        )
+    except AgsThrottledException as exc:
+        raise self.retry(exc=exc, countdown=exc.retry_after)
+
+
+def publish_score(
+    graded_resource: LtiGradedResource,
+    given_score: Union[int, float],
+    score_maximum: Union[int, float],
+    event_id: str = '',
+) -> bool:
+    """Publish LtiGradedResource score.
+
+    The score publish request is rescheduled with the send_score_update
+    task if the LTI platform throttles it.
+
+    Args:
+        graded_resource: LtiGradedResource instance.
+        given_score: Given score.
+        score_maximum: Score maximum.
+        event_id: Optional ID for this event.
+
+    Returns:
+        True if the score was published, False if it was rescheduled.
+
+    """
+    timestamp = datetime.now(tz=timezone.utc)
+
+    try:
+        graded_resource.publish_score(
+            given_score,
+            score_maximum,
+            timestamp=timestamp,
+            event_id=event_id,
+        )
+    except AgsThrottledException as exc:
+        send_score_update.apply_async(
+            (graded_resource.id, given_score, score_maximum, timestamp.isoformat(), event_id),
+            countdown=exc.retry_after,
+        )
+
+        return False
+
+    return True
 
 
 @shared_task(name=f'{MODULE_PATH}.send_problem_score_update')
@@ -25,6 +112,8 @@ def send_problem_score_update(
     problem_weighted_possible: str,
     user_id: str,
     problem_id: str,
+    event_id: str = '',
+    enqueued_at: Optional[float] = None,
 ):
     """Send problem score update task.
 
@@ -35,21 +124,28 @@ def send_problem_score_update(
         problem_weighted_possible: Grade possible for the problem.
         user_id: Grading user ID.
         problem_id: Problem ID.
+        event_id: Score change event ID.
+        enqueued_at: Task enqueue UNIX timestamp.
 
     """
-    for graded_resource in LtiGradedResource.objects.all_from_user_id(
-        user_id=user_id,
-        context_key=problem_id,
-    ):
-        log.info(
-            'LTI AGS: Sending AGS update for problem %s with user %s',
-            problem_id,
-            user_id,
-        )
-        graded_resource.publish_score(
-            problem_weighted_earned,
-            problem_weighted_possible,
-        )
+    with TaskMetrics('send_problem_score_update', event_id, enqueued_at) as metrics:
+        log_extra = {'event_id': event_id, 'user_id': user_id, 'problem_id': problem_id}
+
+        for graded_resource in LtiGradedResource.objects.all_from_user_id(
+            user_id=user_id,
+            context_key=problem_id,
+        ):
+            log.info(f'Sending problem LTI AGS score publish request: {log_extra}')
+
+            with metrics.stage('http'):
+                metrics.record_publish(
+                    publish_score(
+                        graded_resource,
+                        problem_weighted_earned,
+                        problem_weighted_possible,
+                        event_id=event_id,
+                    ),
+                )
 
 
 @shared_task(name=f'{MODULE_PATH}.send_vertical_score_update')
@@ -57,6 +153,8 @@ def send_vertical_score_update(
     user_id: str,
     course_id: str,
     problem_id: str,
+    event_id: str = '',
+    enqueued_at: Optional[float] = None,
 ):
     """Send vertical score update task.
 
@@ -68,32 +166,65 @@ def send_vertical_score_update(
         user_id: Grading user ID.
         course_id: Context course id string.
         problem_id: Problem ID.
+        event_id: Score change event ID.
+        enqueued_at: Task enqueue UNIX timestamp.
 
     """
-    user = get_user_model().objects.get(id=user_id)
-    problem_descriptor = modulestore().get_item(UsageKey.from_string(problem_id))
-    vertical_key = problem_descriptor.parent
-    vertical_graded_resources = LtiGradedResource.objects.all_from_user_id(
-        user_id=user.id,
-        context_key=str(vertical_key),
-    )
-
-    if not vertical_graded_resources:
-        return
-
-    course_grade = course_grade_factory().read(
-        user,
-        modulestore().get_course(CourseKey.from_string(course_id)),
-    )
-    earned, possible = course_grade.score_for_module(vertical_key)
-
-    for graded_resource in vertical_graded_resources:
-        log.info(
-            'LTI AGS: Sending AGS update for unit %s with user %s',
-            str(vertical_key),
-            user_id,
-        )
-        graded_resource.publish_score(
-            earned,
-            possible,
+    with TaskMetrics('send_vertical_score_update', event_id, enqueued_at) as metrics:
+        user = get_user_model().objects.get(id=user_id)
+
+        with metrics.stage('modulestore'):
+            problem_descriptor = modulestore().get_item(UsageKey.from_string(problem_id))
+
+        vertical_key = problem_descriptor.parent
+        vertical_graded_resources = LtiGradedResource.objects.all_from_user_id(
+            user_id=user.id,
+            context_key=str(vertical_key),
         )
+
+        if not vertical_graded_resources:
+            return
+
+        with metrics.stage('modulestore'):
+            course = modulestore().get_course(CourseKey.from_string(course_id))
+
+        with metrics.stage('grade'):
+            earned, possible = course_grade_factory().read(user, course).score_for_module(vertical_key)
+
+        log_extra = {'event_id': event_id, 'user_id': user_id, 'unit_id': str(vertical_key)}
+
+        for graded_resource in vertical_graded_resources:
+            log.info(f'Sending unit LTI AGS score publish request: {log_extra}')
+
+            with metrics.stage('http'):
+                metrics.record_publish(
+                    publish_score(
+                        graded_resource,
+                        earned,
+                        possible,
+                        event_id=event_id,
+                    ),
+                )
+
+
+@shared_task(name=f'{MODULE_PATH}.resync_scores')
+def resync_scores(
+    course_id: str = '',
+    platform_id: str = '',
+    **kwargs: dict,
+) -> dict:
+    """Resync scores task.
+
+    Task to publish the current score of all the LtiGradedResource
+    instances of a course or LTI platform asynchronously.
+
+    Args:
+        course_id: Course ID string.
+        platform_id: LTI platform ID.
+        **kwargs: ScoreResync keyword arguments.
+
+    Returns:
+        Dictionary with resync statistics.
+
+    """
+    return ScoreResync(course_id, platform_id, **kwargs).run()
@@ -0,0 +1,242 @@
+"""Tests client module."""
+import threading
+from unittest.mock import MagicMock, patch
+
+import ddt
+from django.test import TestCase
+from pylti1p3.exception import LtiServiceException
+
+from openedx_lti_tool_plugin.resource_link_launch.ags.client import (
+    ACCESS_TOKEN_EXPIRES_IN,
+    ACCESS_TOKEN_EXPIRY_MARGIN,
+    SCORE_SCOPES,
+    SERVICE_CONNECTOR_TIMEOUT,
+    AgsScoreClient,
+    AgsServiceConnector,
+    clear_service_connectors,
+    evict_service_connector,
+    get_service_connector,
+)
+from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests import AUD, ISS
+
+MODULE_PATH = f'{MODULE_PATH}.client'
+LINEITEM = 'https://random-lineitem.test'
+TOKEN_REQUEST_BODY = 'grant_type=client_credentials&scope=score'
+DEFAULT_EXPIRES = 100.0 + ACCESS_TOKEN_EXPIRES_IN - ACCESS_TOKEN_EXPIRY_MARGIN
+
+
+@ddt.ddt
+@patch(f'{MODULE_PATH}.time.monotonic', return_value=100.0)
+class TestAgsServiceConnector(TestCase):
+    """Test AgsServiceConnector class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.service_connector = AgsServiceConnector(MagicMock())
+        self.response = MagicMock(ok=True, request=MagicMock(body=TOKEN_REQUEST_BODY))
+
+    def test_init(self, monotonic_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test __init__ method."""
+        self.assertIsNone(self.service_connector.access_token_expires)
+        self.assertIn(
+            self.service_connector.record_access_token_expiry,
+            self.service_connector._requests_session.hooks['response'],  # pylint: disable=protected-access
+        )
+
+    @ddt.data(
+        ({'access_token': 'token', 'expires_in': 600}, 100.0 + 600 - ACCESS_TOKEN_EXPIRY_MARGIN),
+        ({'access_token': 'token'}, DEFAULT_EXPIRES),
+        ({'access_token': 'token', 'expires_in': 'invalid'}, DEFAULT_EXPIRES),
+    )
+    @ddt.unpack
+    def test_record_access_token_expiry(
+        self,
+        body: dict,
+        expected: float,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test record_access_token_expiry method."""
+        self.response.json.return_value = body
+
+        self.service_connector.record_access_token_expiry(self.response)
+
+        self.assertEqual(self.service_connector.access_token_expires, expected)
+
+    def test_record_access_token_expiry_with_other_response(
+        self,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test record_access_token_expiry method with a non access token response."""
+        self.service_connector.record_access_token_expiry(MagicMock(ok=True, request=MagicMock(body='{}')))
+        self.service_connector.record_access_token_expiry(MagicMock(ok=False, request=self.response.request))
+
+        self.assertIsNone(self.service_connector.access_token_expires)
+
+    def test_is_expired(self, monotonic_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test is_expired method."""
+        self.assertFalse(self.service_connector.is_expired(100.0))
+
+        self.service_connector.access_token_expires = 200.0
+
+        self.assertFalse(self.service_connector.is_expired(199.0))
+        self.assertTrue(self.service_connector.is_expired(200.0))
+
+
+@patch(f'{MODULE_PATH}.time.monotonic', return_value=100.0)
+@patch(f'{MODULE_PATH}.AgsServiceConnector')
+@patch(f'{MODULE_PATH}.DjangoDbToolConf')
+class TestGetServiceConnector(TestCase):
+    """Test get_service_connector function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        clear_service_connectors()
+        self.addCleanup(clear_service_connectors)
+
+    def test_get_service_connector(
+        self,
+        tool_conf_mock: MagicMock,
+        service_connector_mock: MagicMock,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_service_connector function (happy path)."""
+        service_connector_mock.return_value.is_expired.return_value = False
+
+        self.assertEqual(get_service_connector(ISS, AUD), service_connector_mock.return_value)
+        self.assertEqual(get_service_connector(ISS, AUD), service_connector_mock.return_value)
+        tool_conf_mock().find_registration_by_params.assert_called_once_with(ISS, AUD)
+        service_connector_mock.assert_called_once_with(tool_conf_mock().find_registration_by_params())
+
+    def test_with_expired_service_connector(
+        self,
+        tool_conf_mock: MagicMock,
+        service_connector_mock: MagicMock,
+        monotonic_mock: MagicMock,
+    ):
+        """Test get_service_connector function with expired ServiceConnector."""
+        service_connector_mock.return_value.is_expired.return_value = False
+        get_service_connector(ISS, AUD)
+        monotonic_mock.return_value = 100.0 + SERVICE_CONNECTOR_TIMEOUT
+
+        get_service_connector(ISS, AUD)
+
+        self.assertEqual(tool_conf_mock().find_registration_by_params.call_count, 2)
+        self.assertEqual(service_connector_mock.call_count, 2)
+
+    def test_with_expired_access_token(
+        self,
+        tool_conf_mock: MagicMock,  # pylint: disable=unused-argument
+        service_connector_mock: MagicMock,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_service_connector function with an expired access token."""
+        service_connector_mock.return_value.is_expired.return_value = True
+
+        get_service_connector(ISS, AUD)
+        get_service_connector(ISS, AUD)
+
+        service_connector_mock.return_value.is_expired.assert_called_once_with(100.0)
+        self.assertEqual(service_connector_mock.call_count, 2)
+
+    def test_with_other_lti_tool(
+        self,
+        tool_conf_mock: MagicMock,
+        service_connector_mock: MagicMock,  # pylint: disable=unused-argument
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_service_connector function with other LtiTool."""
+        get_service_connector(ISS, AUD)
+        get_service_connector(ISS, 'other-aud')
+
+        self.assertEqual(tool_conf_mock().find_registration_by_params.call_count, 2)
+
+    def test_with_other_thread(
+        self,
+        tool_conf_mock: MagicMock,  # pylint: disable=unused-argument
+        service_connector_mock: MagicMock,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test get_service_connector function doesn't share a ServiceConnector between threads."""
+        service_connector_mock.side_effect = lambda registration: MagicMock(**{'is_expired.return_value': False})
+        service_connectors = []
+        thread = threading.Thread(target=lambda: service_connectors.append(get_service_connector(ISS, AUD)))
+        thread.start()
+        thread.join()
+
+        self.assertNotEqual(get_service_connector(ISS, AUD), service_connectors[0])
+
+    def test_evict_service_connector(
+        self,
+        tool_conf_mock: MagicMock,  # pylint: disable=unused-argument
+        service_connector_mock: MagicMock,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test evict_service_connector function."""
+        service_connector_mock.return_value.is_expired.return_value = False
+        get_service_connector(ISS, AUD)
+
+        evict_service_connector(ISS, AUD)
+        get_service_connector(ISS, AUD)
+
+        self.assertEqual(service_connector_mock.call_count, 2)
+
+
+@patch(f'{MODULE_PATH}.AssignmentsGradesService')
+@patch(f'{MODULE_PATH}.evict_service_connector')
+@patch(f'{MODULE_PATH}.get_service_connector')
+class TestAgsScoreClient(TestCase):
+    """Test AgsScoreClient class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.grade = MagicMock()
+        self.client = AgsScoreClient(ISS, AUD, LINEITEM)
+
+    def test_put_grade(
+        self,
+        get_service_connector_mock: MagicMock,
+        evict_service_connector_mock: MagicMock,
+        ags_mock: MagicMock,
+    ):
+        """Test put_grade method."""
+        self.assertEqual(self.client.put_grade(self.grade), ags_mock().put_grade.return_value)
+        get_service_connector_mock.assert_called_once_with(ISS, AUD)
+        ags_mock.assert_any_call(
+            get_service_connector_mock.return_value,
+            {'lineitem': LINEITEM, 'scope': SCORE_SCOPES},
+        )
+        ags_mock().put_grade.assert_called_once_with(self.grade)
+        evict_service_connector_mock.assert_not_called()
+
+    def test_put_grade_with_unauthorized_response(
+        self,
+        get_service_connector_mock: MagicMock,
+        evict_service_connector_mock: MagicMock,
+        ags_mock: MagicMock,
+    ):
+        """Test put_grade method evicts the ServiceConnector on a 401 response."""
+        ags_mock().put_grade.side_effect = [LtiServiceException(MagicMock(status_code=401)), {'body': {}}]
+
+        self.assertEqual(self.client.put_grade(self.grade), {'body': {}})
+        evict_service_connector_mock.assert_called_once_with(ISS, AUD)
+        self.assertEqual(get_service_connector_mock.call_count, 2)
+        self.assertEqual(ags_mock().put_grade.call_count, 2)
+
+    def test_put_grade_with_error_response(
+        self,
+        get_service_connector_mock: MagicMock,  # pylint: disable=unused-argument
+        evict_service_connector_mock: MagicMock,
+        ags_mock: MagicMock,
+    ):
+        """Test put_grade method with a non 401 error response."""
+        ags_mock().put_grade.side_effect = LtiServiceException(MagicMock(status_code=500))
+
+        with self.assertRaises(LtiServiceException):
+            self.client.put_grade(self.grade)
+
+        evict_service_connector_mock.assert_not_called()
+        ags_mock().put_grade.assert_called_once_with(self.grade)
@@ -0,0 +1,82 @@
+"""Tests metrics module."""
+from unittest.mock import MagicMock, call, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.resource_link_launch.ags.metrics import METRIC_PREFIX, STAGES, TaskMetrics
+from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.metrics'
+TASK_NAME = 'test-task'
+EVENT_ID = 'test-event-id'
+
+
+@patch(f'{MODULE_PATH}.set_custom_attribute')
+class TestTaskMetrics(TestCase):
+    """Test TaskMetrics class."""
+
+    def test_init(self, set_custom_attribute_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test __init__ method."""
+        metrics = TaskMetrics(TASK_NAME, EVENT_ID, 1000.0)
+
+        self.assertEqual(metrics.name, TASK_NAME)
+        self.assertEqual(metrics.event_id, EVENT_ID)
+        self.assertEqual(metrics.enqueued_at, 1000.0)
+        self.assertEqual(metrics.stages, dict.fromkeys(STAGES, 0.0))
+        self.assertEqual((metrics.published, metrics.rescheduled, metrics.queries), (0, 0, 0))
+
+    @log_capture()
+    @patch(f'{MODULE_PATH}.time.perf_counter', side_effect=[10.0, 10.5, 11.0, 12.0])
+    @patch(f'{MODULE_PATH}.time.time', return_value=1002.0)
+    def test_context(
+        self,
+        time_mock: MagicMock,  # pylint: disable=unused-argument
+        perf_counter_mock: MagicMock,  # pylint: disable=unused-argument
+        log_mock: LogCaptureForDecorator,
+        set_custom_attribute_mock: MagicMock,
+    ):
+        """Test the measured task metrics are reported and logged."""
+        with TaskMetrics(TASK_NAME, EVENT_ID, 1000.0) as metrics:
+            with metrics.stage('http'):
+                metrics.record_publish(True)
+
+            metrics.record_publish(False)
+            get_user_model().objects.count()
+
+        expected = {
+            'name': TASK_NAME,
+            'event_id': EVENT_ID,
+            'outcome': 'success',
+            'queue_lag_ms': 2000.0,
+            'duration_ms': 2000.0,
+            'grade_ms': 0.0,
+            'modulestore_ms': 0.0,
+            'http_ms': 500.0,
+            'queries': 1,
+            'published': 1,
+            'rescheduled': 1,
+        }
+        set_custom_attribute_mock.assert_has_calls(
+            [call(f'{METRIC_PREFIX}.{metric}', value) for metric, value in expected.items()],
+        )
+        log_mock.check((MODULE_PATH, 'INFO', f'LTI AGS task finished: {expected}'))
+
+    def test_context_with_exception(self, set_custom_attribute_mock: MagicMock):
+        """Test the task outcome with a task exception."""
+        with self.assertRaises(ValueError), TaskMetrics(TASK_NAME):
+            raise ValueError
+
+        set_custom_attribute_mock.assert_any_call(f'{METRIC_PREFIX}.outcome', 'failure')
+
+    def test_context_without_enqueued_at(self, set_custom_attribute_mock: MagicMock):
+        """Test the queue lag is not reported without enqueue timestamp."""
+        with TaskMetrics(TASK_NAME):
+            pass
+
+        self.assertNotIn(
+            f'{METRIC_PREFIX}.queue_lag_ms',
+            [args[0] for args, _ in set_custom_attribute_mock.call_args_list],
+        )
@@ -1,13 +1,15 @@
 """Tests models module."""
-from unittest.mock import MagicMock, PropertyMock, call, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from django.test import TestCase
-from pylti1p3.exception import LtiException
+from pylti1p3.exception import LtiException, LtiServiceException
 from requests.exceptions import RequestException
 from testfixtures import log_capture
 from testfixtures.logcapture import LogCaptureForDecorator
 
+from openedx_lti_tool_plugin.circuit_breaker import AGS
 from openedx_lti_tool_plugin.models import LtiProfile
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
 from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource, LtiGradedResourceManager
 from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
 from openedx_lti_tool_plugin.tests import AUD, ISS, SUB
@@ -19,22 +21,45 @@ class TestLtiGradedResourceManager(TestCase):
     """Test LtiGradedResourceManager class."""
 
     @patch.object(LtiGradedResourceManager, 'filter')
-    @patch.object(LtiProfile.objects, 'filter')
-    def test_all_from_user_id(
-        self,
-        lti_profile_filter_mock: MagicMock,
-        graded_resource_filter_mock: MagicMock,
-    ):
+    def test_all_from_user_id(self, graded_resource_filter_mock: MagicMock):
         """Test all_from_user_id method."""
         result = LtiGradedResource.objects.all_from_user_id(user_id='random-user-id', context_key='random-key')
 
-        lti_profile_filter_mock.assert_called_once_with(user__id='random-user-id')
-        lti_profile_filter_mock.return_value.first.assert_called_once_with()
         graded_resource_filter_mock.assert_called_once_with(
-            lti_profile=lti_profile_filter_mock().first(),
+            lti_profile__user__id='random-user-id',
             context_key='random-key',
         )
-        self.assertEqual(result, graded_resource_filter_mock())
+        graded_resource_filter_mock().select_related.assert_called_once_with('lti_profile')
+        self.assertEqual(result, graded_resource_filter_mock().select_related())
+
+    def test_all_from_user_id_with_multiple_lti_profiles(self):
+        """Test all_from_user_id method with multiple LtiProfile instances."""
+        context_key = 'course-v1:test+test+test'
+        lti_profile = LtiProfile.objects.create(platform_id=ISS, client_id=AUD, subject_id=SUB)
+        other_lti_profile = LtiProfile.objects.create(
+            user=lti_profile.user,
+            platform_id=ISS,
+            client_id=AUD,
+            subject_id=f'{SUB}-other',
+        )
+        graded_resources = [
+            LtiGradedResource.objects.create(
+                lti_profile=profile,
+                context_key=context_key,
+                lineitem='https://random-lineitem.test',
+            )
+            for profile in (lti_profile, other_lti_profile)
+        ]
+
+        with self.assertNumQueries(1):
+            result = list(
+                LtiGradedResource.objects.all_from_user_id(
+                    user_id=lti_profile.user.id,
+                    context_key=context_key,
+                ),
+            )
+
+        self.assertCountEqual(result, graded_resources)
 
 
 class TestLtiGradedResourceBaseTestCase(TestCase):
@@ -92,11 +117,42 @@ class TestLtiGradedResource(TestLtiGradedResourceBaseTestCase):
             },
         )
 
+    @patch(f'{MODULE_PATH}.TokenBucket')
+    @patch(f'{MODULE_PATH}.get_rate_limit', return_value=120)
+    def test_check_rate_limit(self, get_rate_limit_mock: MagicMock, token_bucket_mock: MagicMock):
+        """Test check_rate_limit method."""
+        token_bucket_mock.return_value.consume.return_value = 0
+
+        self.lti_graded_resource.check_rate_limit()
+
+        get_rate_limit_mock.assert_called_once_with(ISS, AUD)
+        token_bucket_mock.assert_called_once_with((ISS, AUD), 2, capacity=2)
+        token_bucket_mock().consume.assert_called_once_with()
+
+    @patch(f'{MODULE_PATH}.TokenBucket')
+    @patch(f'{MODULE_PATH}.get_rate_limit', return_value=120)
+    def test_check_rate_limit_exceeded(self, get_rate_limit_mock: MagicMock, token_bucket_mock: MagicMock):
+        """Test check_rate_limit method with rate limit exceeded."""
+        token_bucket_mock.return_value.consume.return_value = 0.5
+
+        with self.assertRaises(AgsThrottledException) as ctx:
+            self.lti_graded_resource.check_rate_limit()
+
+        self.assertEqual(ctx.exception.retry_after, 0.5)
+        get_rate_limit_mock.assert_called_once_with(ISS, AUD)
+
+    @patch(f'{MODULE_PATH}.TokenBucket')
+    @patch(f'{MODULE_PATH}.get_rate_limit', return_value=0)
+    def test_check_rate_limit_without_rate_limit(self, get_rate_limit_mock: MagicMock, token_bucket_mock: MagicMock):
+        """Test check_rate_limit method without rate limit."""
+        self.lti_graded_resource.check_rate_limit()
+
+        get_rate_limit_mock.assert_called_once_with(ISS, AUD)
+        token_bucket_mock.assert_not_called()
+
 
-@log_capture()
 @patch(f'{MODULE_PATH}.Grade')
-@patch(f'{MODULE_PATH}.DjangoMessageLaunch')
-@patch(f'{MODULE_PATH}.DjangoDbToolConf')
+@patch(f'{MODULE_PATH}.AgsScoreClient')
 class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
     """Test LtiGradedResource publish_score method."""
 
@@ -123,14 +179,23 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
     @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
     def test_publish_score(
         self,
-        log_mock: LogCaptureForDecorator,
         publish_score_jwt_mock: MagicMock,
-        tool_conf_mock: MagicMock,
-        message_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+        client_mock: MagicMock,
         grade_mock: MagicMock,
     ):
         """Test publish_score method (happy path)."""
         self.log_extra['jwt'] = publish_score_jwt_mock.return_value
+        # Make the chained Grade setter methods return the same mock instance.
+        for method in (
+            'set_score_given',
+            'set_score_maximum',
+            'set_timestamp',
+            'set_activity_progress',
+            'set_grading_progress',
+            'set_user_id',
+        ):
+            getattr(grade_mock.return_value, method).return_value = grade_mock.return_value
 
         self.lti_graded_resource.publish_score(
             self.given_score,
@@ -141,14 +206,7 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
             event_id=self.event_id,
         )
 
-        publish_score_jwt_mock.assert_has_calls([call(), call()])
-        tool_conf_mock.assert_called_once_with()
-        message_mock.assert_called_once_with(request=None, tool_config=tool_conf_mock())
-        message_mock().set_auto_validation.assert_called_once_with(enable=False)
-        message_mock().set_jwt.assert_called_once_with(publish_score_jwt_mock())
-        message_mock().set_restored.assert_called_once_with()
-        message_mock().validate_registration.assert_called_once_with()
-        message_mock().get_ags.assert_called_once_with()
+        publish_score_jwt_mock.assert_called_once_with()
         grade_mock.assert_called_once_with()
         grade_mock().set_score_given.assert_called_once_with(self.given_score)
         grade_mock().set_score_maximum.assert_called_once_with(self.score_maximum)
@@ -157,7 +215,8 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
         grade_mock().set_activity_progress.assert_called_once_with(self.activity_progress)
         grade_mock().set_grading_progress.assert_called_once_with(self.grading_progress)
         grade_mock().set_user_id.assert_called_once_with(self.lti_profile.subject_id)
-        message_mock().get_ags().put_grade.assert_called_once_with(grade_mock())
+        client_mock.assert_called_once_with(ISS, AUD, self.lti_graded_resource.lineitem)
+        client_mock().put_grade.assert_called_once_with(grade_mock())
         log_mock.check(
             (
                 MODULE_PATH,
@@ -175,16 +234,15 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
     @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
     def test_with_lti_exception(
         self,
-        log_mock: LogCaptureForDecorator,
         publish_score_jwt_mock: MagicMock,
-        tool_conf_mock: MagicMock,
-        message_mock: MagicMock,
-        grade_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
     ):
         """Test with LtiException."""
         exception_message = 'lti-exception-message'
         exception = LtiException(exception_message)
-        tool_conf_mock.side_effect = exception
+        client_mock.return_value.put_grade.side_effect = exception
         self.log_extra['jwt'] = publish_score_jwt_mock.return_value
         exception_log_extra = {**self.log_extra, 'exception': exception_message}
 
@@ -199,22 +257,8 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
             )
 
         publish_score_jwt_mock.assert_called_once_with()
-        tool_conf_mock.assert_called_once_with()
-        message_mock.assert_not_called()
-        message_mock().set_auto_validation.assert_not_called()
-        message_mock().set_jwt.assert_not_called()
-        message_mock().set_restored.assert_not_called()
-        message_mock().validate_registration.assert_not_called()
-        message_mock().get_ags.assert_not_called()
-        grade_mock.assert_not_called()
-        grade_mock().set_score_given.assert_not_called()
-        grade_mock().set_score_maximum.assert_not_called()
-        self.timestamp.isoformat.assert_not_called()
-        grade_mock().set_timestamp.assert_not_called()
-        grade_mock().set_activity_progress.assert_not_called()
-        grade_mock().set_grading_progress.assert_not_called()
-        grade_mock().set_user_id.assert_not_called()
-        message_mock().get_ags().put_grade.assert_not_called()
+        client_mock.assert_called_once_with(ISS, AUD, self.lti_graded_resource.lineitem)
+        client_mock().put_grade.assert_called_once()
         log_mock.check(
             (
                 MODULE_PATH,
@@ -232,11 +276,10 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
     @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
     def test_with_requests_exception(
         self,
-        log_mock: LogCaptureForDecorator,
         publish_score_jwt_mock: MagicMock,
-        tool_conf_mock: MagicMock,
-        message_mock: MagicMock,
-        grade_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
     ):
         """Test with RequestException."""
         exception_message = 'requests-exception-message'
@@ -247,7 +290,7 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
             request=request,
             response=response,
         )
-        tool_conf_mock.side_effect = exception
+        client_mock.return_value.put_grade.side_effect = exception
         self.log_extra['jwt'] = publish_score_jwt_mock.return_value
         exception_log_extra = {
             **self.log_extra,
@@ -267,22 +310,8 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
             )
 
         publish_score_jwt_mock.assert_called_once_with()
-        tool_conf_mock.assert_called_once_with()
-        message_mock.assert_not_called()
-        message_mock().set_auto_validation.assert_not_called()
-        message_mock().set_jwt.assert_not_called()
-        message_mock().set_restored.assert_not_called()
-        message_mock().validate_registration.assert_not_called()
-        message_mock().get_ags.assert_not_called()
-        grade_mock.assert_not_called()
-        grade_mock().set_score_given.assert_not_called()
-        grade_mock().set_score_maximum.assert_not_called()
-        self.timestamp.isoformat.assert_not_called()
-        grade_mock().set_timestamp.assert_not_called()
-        grade_mock().set_activity_progress.assert_not_called()
-        grade_mock().set_grading_progress.assert_not_called()
-        grade_mock().set_user_id.assert_not_called()
-        message_mock().get_ags().put_grade.assert_not_called()
+        client_mock.assert_called_once_with(ISS, AUD, self.lti_graded_resource.lineitem)
+        client_mock().put_grade.assert_called_once()
         log_mock.check(
             (
                 MODULE_PATH,
@@ -295,3 +324,182 @@ class TestLtiGradedResourcePublishScore(TestLtiGradedResourceBaseTestCase):
                 f'LTI AGS score publish request failure: {exception_log_extra}',
             ),
         )
+
+    @log_capture()
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_with_throttled_response(
+        self,
+        publish_score_jwt_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test with throttled LTI platform response."""
+        response = MagicMock(status_code=429, headers={'Retry-After': '15'})
+        client_mock.return_value.put_grade.side_effect = LtiServiceException(response)
+        self.log_extra['jwt'] = publish_score_jwt_mock.return_value
+        throttled_log_extra = {
+            **self.log_extra,
+            'exception': str(LtiServiceException(response)),
+            'retry_after': 15.0,
+        }
+
+        with self.assertRaises(AgsThrottledException) as ctx:
+            self.lti_graded_resource.publish_score(
+                self.given_score,
+                self.score_maximum,
+                self.activity_progress,
+                self.grading_progress,
+                self.timestamp,
+                event_id=self.event_id,
+            )
+
+        self.assertEqual(ctx.exception.retry_after, 15.0)
+        log_mock.check(
+            (
+                MODULE_PATH,
+                'INFO',
+                f'LTI AGS score publish request started: {self.log_extra}',
+            ),
+            (
+                MODULE_PATH,
+                'WARNING',
+                f'LTI AGS score publish request throttled: {throttled_log_extra}',
+            ),
+        )
+
+    @log_capture()
+    @patch.object(LtiGradedResource, 'check_rate_limit')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_with_rate_limit_exceeded(
+        self,
+        publish_score_jwt_mock: MagicMock,
+        check_rate_limit_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test with AGS rate limit exceeded."""
+        check_rate_limit_mock.side_effect = AgsThrottledException('throttled', 2)
+        self.log_extra['jwt'] = publish_score_jwt_mock.return_value
+        throttled_log_extra = {**self.log_extra, 'retry_after': 2}
+
+        with self.assertRaises(AgsThrottledException):
+            self.lti_graded_resource.publish_score(
+                self.given_score,
+                self.score_maximum,
+                self.activity_progress,
+                self.grading_progress,
+                self.timestamp,
+                event_id=self.event_id,
+            )
+
+        client_mock.assert_not_called()
+        log_mock.check(
+            (
+                MODULE_PATH,
+                'INFO',
+                f'LTI AGS score publish request started: {self.log_extra}',
+            ),
+            (
+                MODULE_PATH,
+                'WARNING',
+                f'LTI AGS score publish request throttled: {throttled_log_extra}',
+            ),
+        )
+
+    @patch(f'{MODULE_PATH}.CircuitBreaker')
+    @patch.object(LtiGradedResource, 'check_rate_limit')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_with_rate_limit_exceeded_and_circuit_breaker(
+        self,
+        publish_score_jwt_mock: MagicMock,  # pylint: disable=unused-argument
+        check_rate_limit_mock: MagicMock,
+        circuit_breaker_mock: MagicMock,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test a throttled request doesn't acquire the circuit breaker half-open probe."""
+        check_rate_limit_mock.side_effect = AgsThrottledException('throttled', 2)
+
+        with self.assertRaises(AgsThrottledException):
+            self.lti_graded_resource.publish_score(self.given_score, self.score_maximum)
+
+        circuit_breaker_mock().acquire.assert_not_called()
+        client_mock.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.CircuitBreaker')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_with_circuit_breaker_open(
+        self,
+        publish_score_jwt_mock: MagicMock,  # pylint: disable=unused-argument
+        circuit_breaker_mock: MagicMock,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test with LTI platform circuit breaker open."""
+        circuit_breaker_mock().acquire.return_value = 30
+
+        with self.assertRaises(AgsThrottledException) as ctx:
+            self.lti_graded_resource.publish_score(self.given_score, self.score_maximum)
+
+        self.assertEqual(ctx.exception.retry_after, 30)
+        circuit_breaker_mock.assert_called_with(ISS, AGS)
+        client_mock.assert_not_called()
+        circuit_breaker_mock().record_success.assert_not_called()
+        circuit_breaker_mock().record_failure.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.CircuitBreaker')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_circuit_breaker_with_server_error_response(
+        self,
+        publish_score_jwt_mock: MagicMock,  # pylint: disable=unused-argument
+        circuit_breaker_mock: MagicMock,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test circuit breaker with LTI platform server error response."""
+        circuit_breaker_mock().acquire.return_value = 0
+        client_mock.return_value.put_grade.side_effect = LtiServiceException(MagicMock(status_code=500))
+
+        with self.assertRaises(LtiServiceException):
+            self.lti_graded_resource.publish_score(self.given_score, self.score_maximum)
+
+        circuit_breaker_mock().record_failure.assert_called_once_with()
+        circuit_breaker_mock().record_success.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.CircuitBreaker')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_circuit_breaker_with_requests_exception(
+        self,
+        publish_score_jwt_mock: MagicMock,  # pylint: disable=unused-argument
+        circuit_breaker_mock: MagicMock,
+        client_mock: MagicMock,
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test circuit breaker with RequestException."""
+        circuit_breaker_mock().acquire.return_value = 0
+        client_mock.return_value.put_grade.side_effect = RequestException()
+
+        with self.assertRaises(RequestException):
+            self.lti_graded_resource.publish_score(self.given_score, self.score_maximum)
+
+        circuit_breaker_mock().record_failure.assert_called_once_with()
+        circuit_breaker_mock().record_success.assert_not_called()
+
+    @patch(f'{MODULE_PATH}.CircuitBreaker')
+    @patch.object(LtiGradedResource, 'publish_score_jwt', new_callable=PropertyMock)
+    def test_circuit_breaker_with_success(
+        self,
+        publish_score_jwt_mock: MagicMock,  # pylint: disable=unused-argument
+        circuit_breaker_mock: MagicMock,
+        client_mock: MagicMock,  # pylint: disable=unused-argument
+        grade_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test circuit breaker with successful score publish request."""
+        circuit_breaker_mock().acquire.return_value = 0
+
+        self.lti_graded_resource.publish_score(self.given_score, self.score_maximum)
+
+        circuit_breaker_mock().record_success.assert_called_once_with()
+        circuit_breaker_mock().record_failure.assert_not_called()
@@ -0,0 +1,178 @@
+"""Tests publisher module."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import TestCase
+from pylti1p3.exception import LtiException
+
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
+from openedx_lti_tool_plugin.resource_link_launch.ags.publisher import MAX_THROTTLED_RETRIES, AsyncScorePublisher
+from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.publisher'
+LINEITEM = 'https://random-platform.test/lineitem/1'
+OTHER_LINEITEM = 'https://other-platform.test/lineitem/1'
+
+
+class TestAsyncScorePublisher(TestCase):
+    """Test AsyncScorePublisher class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.publisher = AsyncScorePublisher(max_concurrency=4, max_host_concurrency=2, event_id='test-event-id')
+        self.addCleanup(self.publisher.close)
+        self.graded_resource = MagicMock(lineitem=LINEITEM)
+
+    def publish_score(self, graded_resource: MagicMock, semaphore: Optional[asyncio.Semaphore] = None) -> bool:
+        """Run publish_score method on an event loop.
+
+        Args:
+            graded_resource: LtiGradedResource mock.
+            semaphore: LTI platform host semaphore.
+
+        Returns:
+            publish_score method result.
+
+        """
+        async def publish_score():
+            return await self.publisher.publish_score(
+                semaphore or asyncio.Semaphore(1),
+                graded_resource,
+                1,
+                2,
+            )
+
+        return asyncio.run(publish_score())
+
+    def test_init(self):
+        """Test __init__ method."""
+        self.assertEqual(self.publisher.max_concurrency, 4)
+        self.assertEqual(self.publisher.max_host_concurrency, 2)
+        self.assertEqual(self.publisher.executor._max_workers, 4)  # pylint: disable=protected-access
+
+        with AsyncScorePublisher(max_concurrency=1, max_host_concurrency=2) as publisher:
+            self.assertEqual(publisher.max_host_concurrency, 1)
+
+    @patch.object(ThreadPoolExecutor, 'shutdown')
+    def test_context_manager(self, shutdown_mock: MagicMock):
+        """Test the thread pool is shut down on context exit."""
+        with AsyncScorePublisher() as publisher:
+            shutdown_mock.assert_not_called()
+
+        self.assertIsInstance(publisher, AsyncScorePublisher)
+        shutdown_mock.assert_called_once_with()
+
+    @patch(f'{MODULE_PATH}.connection')
+    def test_publish(self, connection_mock: MagicMock):
+        """Test publish method (happy path)."""
+        other_graded_resource = MagicMock(lineitem=OTHER_LINEITEM)
+        other_graded_resource.publish_score.side_effect = LtiException
+
+        self.assertEqual(
+            self.publisher.publish([(self.graded_resource, 1, 2), (other_graded_resource, 3, 4)]),
+            [True, False],
+        )
+        self.graded_resource.publish_score.assert_called_once()
+        self.assertEqual(self.graded_resource.publish_score.call_args.args, (1, 2))
+        self.assertEqual(self.graded_resource.publish_score.call_args.kwargs['event_id'], 'test-event-id')
+        self.assertEqual(
+            self.graded_resource.publish_score.call_args.kwargs['timestamp'],
+            other_graded_resource.publish_score.call_args.kwargs['timestamp'],
+        )
+        self.assertEqual(connection_mock.close.call_count, 2)
+
+    def test_publish_reuses_executor(self):
+        """Test publish method reuses the thread pool between calls."""
+        executor = self.publisher.executor
+
+        self.assertEqual(self.publisher.publish([(self.graded_resource, 1, 2)]), [True])
+        self.assertEqual(self.publisher.publish([(self.graded_resource, 1, 2)]), [True])
+        self.assertIs(self.publisher.executor, executor)
+
+    def test_publish_with_host_concurrency(self):
+        """Test publish method with the host concurrency cap."""
+        publisher = AsyncScorePublisher(max_concurrency=8, max_host_concurrency=2)
+        active = {'current': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def publish_score(*args: tuple, **kwargs: dict):
+            with lock:
+                active['current'] += 1
+                active['max'] = max(active['max'], active['current'])
+
+            time.sleep(0.01)
+
+            with lock:
+                active['current'] -= 1
+
+        graded_resources = [MagicMock(lineitem=LINEITEM) for _ in range(6)]
+
+        for graded_resource in graded_resources:
+            graded_resource.publish_score.side_effect = publish_score
+
+        self.assertEqual(publisher.publish([(item, 1, 1) for item in graded_resources]), [True] * 6)
+        self.assertEqual(active['max'], 2)
+
+    def test_get_semaphore(self):
+        """Test get_semaphore method."""
+        semaphores = {}
+
+        async def get_semaphores():
+            return (
+                self.publisher.get_semaphore(semaphores, LINEITEM),
+                self.publisher.get_semaphore(semaphores, f'{LINEITEM}/scores'),
+                self.publisher.get_semaphore(semaphores, OTHER_LINEITEM),
+            )
+
+        semaphore, same_host_semaphore, other_host_semaphore = asyncio.run(get_semaphores())
+
+        self.assertIs(semaphore, same_host_semaphore)
+        self.assertIsNot(semaphore, other_host_semaphore)
+        self.assertEqual(list(semaphores), ['random-platform.test', 'other-platform.test'])
+
+    @patch(f'{MODULE_PATH}.asyncio.sleep')
+    def test_publish_score_with_throttled_request(self, sleep_mock: AsyncMock):
+        """Test publish_score method with throttled request."""
+        self.graded_resource.publish_score.side_effect = [AgsThrottledException('throttled', 3), None]
+
+        self.assertTrue(self.publish_score(self.graded_resource))
+        self.assertEqual(self.graded_resource.publish_score.call_count, 2)
+        sleep_mock.assert_awaited_once_with(3)
+
+    def test_publish_score_releases_semaphore_while_throttled(self):
+        """Test publish_score method releases the host semaphore while it waits."""
+        self.graded_resource.publish_score.side_effect = [AgsThrottledException('throttled', 3), None]
+        semaphore_states = []
+
+        async def publish_score():
+            semaphore = asyncio.Semaphore(1)
+
+            async def sleep(delay: float):  # pylint: disable=unused-argument
+                semaphore_states.append(semaphore.locked())
+
+            with patch(f'{MODULE_PATH}.asyncio.sleep', side_effect=sleep):
+                return await self.publisher.publish_score(semaphore, self.graded_resource, 1, 2)
+
+        self.assertTrue(asyncio.run(publish_score()))
+        self.assertEqual(semaphore_states, [False])
+
+    @patch(f'{MODULE_PATH}.asyncio.sleep')
+    def test_publish_score_with_max_throttled_retries(self, sleep_mock: AsyncMock):
+        """Test publish_score method with maximum throttled retries."""
+        self.graded_resource.publish_score.side_effect = AgsThrottledException('throttled', 3)
+
+        self.assertFalse(self.publish_score(self.graded_resource))
+        self.assertEqual(self.graded_resource.publish_score.call_count, MAX_THROTTLED_RETRIES + 1)
+        self.assertEqual(sleep_mock.await_count, MAX_THROTTLED_RETRIES)
+
+    def test_publish_score_with_exception(self):
+        """Test publish_score method with exception."""
+        self.graded_resource.publish_score.side_effect = LtiException
+
+        self.assertFalse(self.publish_score(self.graded_resource))
+        self.graded_resource.publish_score.assert_called_once()
@@ -0,0 +1,164 @@
+"""Tests resync module."""
+from unittest.mock import MagicMock, call, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.models import LtiProfile
+from openedx_lti_tool_plugin.resource_link_launch.ags import MAX_SCORE
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.resource_link_launch.ags.resync import ScoreResync
+from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
+from openedx_lti_tool_plugin.tests import AUD, ISS, SUB
+
+MODULE_PATH = f'{MODULE_PATH}.resync'
+COURSE_ID = 'course-v1:org+course+run'
+PROBLEM_ID = 'block-v1:org+course+run+type@problem+block@test'
+OTHER_COURSE_ID = 'course-v1:org+other+run'
+LINEITEM = 'https://random-lineitem.test'
+
+
+class TestScoreResync(TestCase):
+    """Test ScoreResync class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+        self.lti_profile = LtiProfile.objects.create(platform_id=ISS, client_id=AUD, subject_id=SUB)
+        self.other_lti_profile = LtiProfile.objects.create(
+            platform_id='https://other-platform.test',
+            client_id=AUD,
+            subject_id=SUB,
+        )
+        self.course_resource = LtiGradedResource.objects.create(
+            lti_profile=self.lti_profile,
+            context_key=COURSE_ID,
+            lineitem=LINEITEM,
+        )
+        self.problem_resource = LtiGradedResource.objects.create(
+            lti_profile=self.lti_profile,
+            context_key=PROBLEM_ID,
+            lineitem=LINEITEM,
+        )
+        self.other_course_resource = LtiGradedResource.objects.create(
+            lti_profile=self.lti_profile,
+            context_key=OTHER_COURSE_ID,
+            lineitem=LINEITEM,
+        )
+        self.other_platform_resource = LtiGradedResource.objects.create(
+            lti_profile=self.other_lti_profile,
+            context_key=COURSE_ID,
+            lineitem=LINEITEM,
+        )
+
+    def test_checkpoint(self):
+        """Test get_checkpoint, set_checkpoint and reset_checkpoint methods."""
+        resync = ScoreResync(COURSE_ID)
+
+        self.assertEqual(resync.get_checkpoint(), 0)
+
+        resync.set_checkpoint(self.lti_profile.user_id)
+
+        self.assertEqual(ScoreResync(COURSE_ID).get_checkpoint(), self.lti_profile.user_id)
+        self.assertEqual(ScoreResync(COURSE_ID, ISS).get_checkpoint(), 0)
+
+        resync.reset_checkpoint()
+
+        self.assertEqual(resync.get_checkpoint(), 0)
+
+    def test_get_queryset_with_course_id(self):
+        """Test get_queryset method with course ID."""
+        self.assertEqual(
+            list(ScoreResync(COURSE_ID).get_queryset()),
+            [self.course_resource, self.problem_resource, self.other_platform_resource],
+        )
+
+    def test_get_queryset_with_platform_id(self):
+        """Test get_queryset method with platform ID."""
+        self.assertEqual(
+            list(ScoreResync(platform_id=ISS).get_queryset()),
+            [self.course_resource, self.problem_resource, self.other_course_resource],
+        )
+
+    def test_get_queryset_with_checkpoint(self):
+        """Test get_queryset method with checkpoint."""
+        resync = ScoreResync(COURSE_ID)
+        resync.set_checkpoint(self.lti_profile.user_id)
+
+        self.assertEqual(list(resync.get_queryset()), [self.other_platform_resource])
+
+    def test_iter_batches(self):
+        """Test iter_batches method."""
+        batches = list(ScoreResync(COURSE_ID, chunk_size=1).iter_batches())
+
+        self.assertEqual(
+            batches,
+            [[self.course_resource, self.problem_resource], [self.other_platform_resource]],
+        )
+
+    @patch(f'{MODULE_PATH}.modulestore')
+    def test_get_course(self, modulestore_mock: MagicMock):
+        """Test get_course method."""
+        resync = ScoreResync(COURSE_ID)
+        course_key = CourseKey.from_string(COURSE_ID)
+
+        self.assertEqual(resync.get_course(course_key), modulestore_mock().get_course.return_value)
+        self.assertEqual(resync.get_course(course_key), modulestore_mock().get_course.return_value)
+        modulestore_mock().get_course.assert_called_once_with(course_key)
+
+    @patch.object(ScoreResync, 'get_course')
+    @patch(f'{MODULE_PATH}.course_grade_factory')
+    def test_get_scores(self, course_grade_factory_mock: MagicMock, get_course_mock: MagicMock):
+        """Test get_scores method."""
+        course_grade = course_grade_factory_mock().read.return_value
+        course_grade.score_for_module.return_value = (1, 2)
+
+        self.assertEqual(
+            ScoreResync(COURSE_ID).get_scores([self.course_resource, self.problem_resource]),
+            [
+                (self.course_resource, course_grade.percent, MAX_SCORE),
+                (self.problem_resource, 1, 2),
+            ],
+        )
+        get_course_mock.assert_called_once_with(CourseKey.from_string(COURSE_ID))
+        course_grade_factory_mock().read.assert_called_once_with(
+            self.lti_profile.user,
+            get_course_mock.return_value,
+        )
+        course_grade.score_for_module.assert_called_once_with(UsageKey.from_string(PROBLEM_ID))
+
+    @log_capture(attributes=('levelname',))
+    @patch(f'{MODULE_PATH}.AsyncScorePublisher')
+    @patch.object(ScoreResync, 'get_scores', side_effect=lambda batch: [(item, 1, 1) for item in batch])
+    def test_run(
+        self,
+        get_scores_mock: MagicMock,
+        publisher_mock: MagicMock,
+        log_mock: LogCaptureForDecorator,
+    ):
+        """Test run method."""
+        publisher_mock().__enter__.return_value = publisher_mock()
+        publisher_mock().publish.side_effect = [[True, False], [True]]
+        resync = ScoreResync(COURSE_ID, chunk_size=1, max_workers=4)
+
+        with patch.object(ScoreResync, 'set_checkpoint') as set_checkpoint_mock:
+            stats = resync.run()
+
+        self.assertEqual(stats, {'processed': 3, 'published': 2, 'failed': 1})
+        self.assertEqual(get_scores_mock.call_count, 2)
+        publisher_mock.assert_called_with(max_concurrency=4, event_id=resync.event_id)
+        publisher_mock().publish.assert_has_calls([
+            call(get_scores_mock.side_effect([self.course_resource, self.problem_resource])),
+            call(get_scores_mock.side_effect([self.other_platform_resource])),
+        ])
+        publisher_mock().__exit__.assert_called_once()
+        set_checkpoint_mock.assert_has_calls([
+            call(self.lti_profile.user_id),
+            call(self.other_lti_profile.user_id),
+        ])
+        self.assertEqual(resync.get_checkpoint(), 0)
+        log_mock.check('INFO', 'INFO', 'INFO', 'INFO')
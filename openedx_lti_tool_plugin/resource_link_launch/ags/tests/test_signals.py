@@ -44,8 +44,10 @@ class TestPublishCourseScore(TestCase):
         }
 
     @log_capture()
+    @patch(f'{MODULE_PATH}.publish_score')
     def test_publish_course_score(
         self,
+        publish_score_mock: MagicMock,
         log_mock: LogCaptureForDecorator,
         uuid4_mock: MagicMock,
         is_plugin_enabled_mock: MagicMock,
@@ -72,7 +74,8 @@ class TestPublishCourseScore(TestCase):
             user_id=self.user.id,
             context_key=self.course_key,
         )
-        self.lti_graded_resource.publish_score.assert_called_once_with(
+        publish_score_mock.assert_called_once_with(
+            self.lti_graded_resource,
             self.course_grade.percent,
             MAX_SCORE,
             event_id=str(uuid4_mock()),
@@ -158,12 +161,16 @@ class TestUpdateUnitOrProblem(TestCase):
         self.course_id = COURSE_ID
         self.usage_id = USAGE_KEY
 
+    @patch(f'{MODULE_PATH}.time.time', return_value=1000.0)
+    @patch(f'{MODULE_PATH}.uuid.uuid4', return_value=EVENT_ID)
     @patch(f'{MODULE_PATH}.LtiProfile')
     @patch(f'{MODULE_PATH}.is_plugin_enabled')
     def test_with_unit_or_problem_score_update(
         self,
         is_plugin_enabled: MagicMock,
         lti_profile_mock: MagicMock,
+        uuid4_mock: MagicMock,  # pylint: disable=unused-argument
+        time_mock: MagicMock,  # pylint: disable=unused-argument
         send_problem_score_update_mock: MagicMock,
         send_vertical_score_update_mock: MagicMock,
     ):
@@ -186,8 +193,16 @@ class TestUpdateUnitOrProblem(TestCase):
             self.weighted_possible,
             self.user_id,
             self.usage_id,
+            event_id=str(EVENT_ID),
+            enqueued_at=1000.0,
+        )
+        send_vertical_score_update_mock.delay.assert_called_once_with(
+            self.user_id,
+            self.course_id,
+            self.usage_id,
+            event_id=str(EVENT_ID),
+            enqueued_at=1000.0,
         )
-        send_vertical_score_update_mock.delay.assert_called_once_with(self.user_id, self.course_id, self.usage_id)
 
     @override_settings(OLTITP_ENABLE_LTI_TOOL=False)
     def test_with_plugin_disabled(
@@ -1,11 +1,20 @@
 """Tests tasks module."""
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+from celery.exceptions import Retry
 from django.test import TestCase
 from testfixtures import log_capture
 from testfixtures.logcapture import LogCaptureForDecorator
 
-from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import send_problem_score_update, send_vertical_score_update
+from openedx_lti_tool_plugin.resource_link_launch.ags.exceptions import AgsThrottledException
+from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import (
+    publish_score,
+    resync_scores,
+    send_problem_score_update,
+    send_score_update,
+    send_vertical_score_update,
+)
 from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
 from openedx_lti_tool_plugin.tests import COURSE_ID, USAGE_KEY
 
@@ -26,8 +35,12 @@ class TestSendVerticalScoreUpdate(TestCase):
         self.problem_id = USAGE_KEY
         self.problem_descriptor = MagicMock()
         self.vertical_graded_resource = MagicMock()
+        self.event_id = 'test-event-id'
+        self.enqueued_at = 1000.0
 
     @log_capture()
+    @patch(f'{MODULE_PATH}.TaskMetrics')
+    @patch(f'{MODULE_PATH}.publish_score')
     @patch(f'{MODULE_PATH}.get_user_model')
     @patch(f'{MODULE_PATH}.UsageKey')
     @patch(f'{MODULE_PATH}.modulestore')
@@ -42,9 +55,12 @@ class TestSendVerticalScoreUpdate(TestCase):
         modulestore_mock: MagicMock,
         usage_key_mock: MagicMock,
         get_user_model_mock: MagicMock,
+        publish_score_mock: MagicMock,
+        task_metrics_mock: MagicMock,
         log: LogCaptureForDecorator,
     ):
         """Test with vertical score update."""
+        metrics = task_metrics_mock.return_value.__enter__.return_value
         get_user_model_mock.return_value.objects.get.return_value = self.user
         vertical_key = MagicMock()
         self.problem_descriptor.parent = vertical_key
@@ -60,9 +76,13 @@ class TestSendVerticalScoreUpdate(TestCase):
                 self.user_id,
                 self.course_id,
                 self.problem_id,
+                self.event_id,
+                self.enqueued_at,
             ),
             None,
         )
+        task_metrics_mock.assert_called_once_with('send_vertical_score_update', self.event_id, self.enqueued_at)
+        log_extra = {'event_id': self.event_id, 'user_id': self.user_id, 'unit_id': str(vertical_key)}
         get_user_model_mock.assert_called_once_with()
         get_user_model_mock.return_value.objects.get.assert_called_once_with(id=self.user_id)
         usage_key_mock.from_string.assert_called_once_with(self.problem_id)
@@ -77,7 +97,7 @@ class TestSendVerticalScoreUpdate(TestCase):
             (
                 MODULE_PATH,
                 'INFO',
-                f'LTI AGS: Sending AGS update for unit {vertical_key} with user {self.user_id}',
+                f'Sending unit LTI AGS score publish request: {log_extra}',
             ),
         )
         course_key_mock.from_string.assert_called_once_with(self.course_id)
@@ -88,10 +108,13 @@ class TestSendVerticalScoreUpdate(TestCase):
             self.course_descriptor,
         )
         self.course_grade.score_for_module.assert_called_once_with(self.problem_descriptor.parent)
-        self.vertical_graded_resource.publish_score.assert_called_once_with(
+        publish_score_mock.assert_called_once_with(
+            self.vertical_graded_resource,
             1,
             1,
+            event_id=self.event_id,
         )
+        metrics.record_publish.assert_called_once_with(publish_score_mock.return_value)
 
     @patch(f'{MODULE_PATH}.log')
     @patch(f'{MODULE_PATH}.get_user_model')
@@ -145,14 +168,21 @@ class TestSendProblemScoreUpdate(TestCase):
         self.problem_weighted_earned = 1
         self.problem_weighted_possible = 1
         self.graded_resource = MagicMock()
+        self.event_id = 'test-event-id'
+        self.enqueued_at = 1000.0
 
     @log_capture()
+    @patch(f'{MODULE_PATH}.TaskMetrics')
+    @patch(f'{MODULE_PATH}.publish_score')
     def test_with_problem_score_update(
         self,
+        publish_score_mock: MagicMock,
+        task_metrics_mock: MagicMock,
         log: LogCaptureForDecorator,
         lti_graded_resource_mock: MagicMock,
     ):
         """Test with problem score update."""
+        metrics = task_metrics_mock.return_value.__enter__.return_value
         lti_graded_resource_mock.objects.all_from_user_id.return_value = [
             self.graded_resource,
         ]
@@ -163,9 +193,13 @@ class TestSendProblemScoreUpdate(TestCase):
                 self.problem_weighted_possible,
                 self.user_id,
                 self.problem_id,
+                self.event_id,
+                self.enqueued_at,
             ),
             None,
         )
+        task_metrics_mock.assert_called_once_with('send_problem_score_update', self.event_id, self.enqueued_at)
+        log_extra = {'event_id': self.event_id, 'user_id': self.user_id, 'problem_id': self.problem_id}
         lti_graded_resource_mock.objects.all_from_user_id.assert_called_once_with(
             user_id=self.user_id,
             context_key=self.problem_id,
@@ -174,13 +208,16 @@ class TestSendProblemScoreUpdate(TestCase):
             (
                 MODULE_PATH,
                 'INFO',
-                f'LTI AGS: Sending AGS update for problem {self.problem_id} with user {self.user_id}',
+                f'Sending problem LTI AGS score publish request: {log_extra}',
             ),
         )
-        self.graded_resource.publish_score.assert_called_once_with(
+        publish_score_mock.assert_called_once_with(
+            self.graded_resource,
             self.problem_weighted_earned,
             self.problem_weighted_possible,
+            event_id=self.event_id,
         )
+        metrics.record_publish.assert_called_once_with(publish_score_mock.return_value)
 
     @patch(f'{MODULE_PATH}.log')
     def test_without_graded_resource(
@@ -202,3 +239,93 @@ class TestSendProblemScoreUpdate(TestCase):
         )
         self.graded_resource.publish_score.assert_not_called()
         log_mock.assert_not_called()
+
+
+class TestResyncScores(TestCase):
+    """Test resync_scores function."""
+
+    @patch(f'{MODULE_PATH}.ScoreResync')
+    def test_resync_scores(self, score_resync_mock: MagicMock):
+        """Test resync_scores function."""
+        self.assertEqual(
+            resync_scores(COURSE_ID, chunk_size=10),
+            score_resync_mock.return_value.run.return_value,
+        )
+        score_resync_mock.assert_called_once_with(COURSE_ID, '', chunk_size=10)
+        score_resync_mock().run.assert_called_once_with()
+
+
+class TestSendScoreUpdate(TestCase):
+    """Test send_score_update function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graded_resource_id = 1
+        self.timestamp = '2020-01-01T00:00:00+00:00'
+        self.event_id = 'test-event-id'
+
+    @patch(f'{MODULE_PATH}.LtiGradedResource')
+    def test_send_score_update(self, lti_graded_resource_mock: MagicMock):
+        """Test send_score_update function (happy path)."""
+        graded_resource = lti_graded_resource_mock.objects.select_related().get()
+
+        send_score_update(self.graded_resource_id, 1, 2, self.timestamp, self.event_id)
+
+        lti_graded_resource_mock.objects.select_related.assert_called_with('lti_profile')
+        lti_graded_resource_mock.objects.select_related().get.assert_called_with(id=self.graded_resource_id)
+        graded_resource.publish_score.assert_called_once_with(
+            1,
+            2,
+            timestamp=datetime.fromisoformat(self.timestamp),
+            event_id=self.event_id,
+        )
+
+    @patch.object(send_score_update, 'retry', return_value=Retry())
+    @patch(f'{MODULE_PATH}.LtiGradedResource')
+    def test_with_throttled_request(self, lti_graded_resource_mock: MagicMock, retry_mock: MagicMock):
+        """Test with throttled request."""
+        exception = AgsThrottledException('throttled', 10)
+        lti_graded_resource_mock.objects.select_related().get().publish_score.side_effect = exception
+
+        with self.assertRaises(Retry):
+            send_score_update(self.graded_resource_id, 1, 2, self.timestamp, self.event_id)
+
+        retry_mock.assert_called_once_with(exc=exception, countdown=10)
+
+
+@patch(f'{MODULE_PATH}.datetime')
+@patch.object(send_score_update, 'apply_async')
+class TestPublishScore(TestCase):
+    """Test publish_score function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graded_resource = MagicMock()
+        self.event_id = 'test-event-id'
+
+    def test_publish_score(self, apply_async_mock: MagicMock, datetime_mock: MagicMock):
+        """Test publish_score function (happy path)."""
+        self.assertTrue(publish_score(self.graded_resource, 1, 2, event_id=self.event_id))
+        self.graded_resource.publish_score.assert_called_once_with(
+            1,
+            2,
+            timestamp=datetime_mock.now.return_value,
+            event_id=self.event_id,
+        )
+        apply_async_mock.assert_not_called()
+
+    def test_with_throttled_request(self, apply_async_mock: MagicMock, datetime_mock: MagicMock):
+        """Test with throttled request."""
+        self.graded_resource.publish_score.side_effect = AgsThrottledException('throttled', 10)
+
+        self.assertFalse(publish_score(self.graded_resource, 1, 2, event_id=self.event_id))
+        apply_async_mock.assert_called_once_with(
+            (
+                self.graded_resource.id,
+                1,
+                2,
+                datetime_mock.now.return_value.isoformat.return_value,
+                self.event_id,
+            ),
+            countdown=10,
+        )
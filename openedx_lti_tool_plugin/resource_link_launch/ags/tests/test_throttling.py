@@ -0,0 +1,139 @@
+"""Tests throttling module."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from openedx_lti_tool_plugin.models import LtiToolConfiguration
+from openedx_lti_tool_plugin.resource_link_launch.ags.tests import MODULE_PATH
+from openedx_lti_tool_plugin.resource_link_launch.ags.throttling import (
+    DEFAULT_RETRY_AFTER,
+    LOCK_RETRY_DELAY,
+    LOCK_WAIT,
+    TokenBucket,
+    get_rate_limit,
+    get_retry_after,
+)
+from openedx_lti_tool_plugin.tests import AUD, ISS
+
+MODULE_PATH = f'{MODULE_PATH}.throttling'
+
+
+class TestGetRateLimit(TestCase):
+    """Test get_rate_limit function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+
+    @patch.object(LtiToolConfiguration.objects, 'filter')
+    def test_get_rate_limit(self, filter_mock: MagicMock):
+        """Test get_rate_limit function (happy path)."""
+        filter_mock().values_list().first.return_value = 60
+
+        self.assertEqual(get_rate_limit(ISS, AUD), 60)
+        self.assertEqual(get_rate_limit(ISS, AUD), 60)
+        filter_mock.assert_called_with(lti_tool__issuer=ISS, lti_tool__client_id=AUD)
+        filter_mock().values_list.assert_called_with('ags_rate_limit', flat=True)
+        filter_mock().values_list().first.assert_called_once_with()
+
+    def test_without_configuration(self):
+        """Test get_rate_limit function without LtiToolConfiguration."""
+        self.assertEqual(get_rate_limit(ISS, AUD), 0)
+
+
+class TestGetRetryAfter(TestCase):
+    """Test get_retry_after function."""
+
+    def test_with_seconds(self):
+        """Test with Retry-After header in seconds."""
+        self.assertEqual(get_retry_after(MagicMock(headers={'Retry-After': '120'})), 120)
+
+    def test_with_http_date(self):
+        """Test with Retry-After header HTTP-date."""
+        retry_date = datetime.now(tz=timezone.utc) + timedelta(seconds=60)
+        response = MagicMock(headers={'Retry-After': format_datetime(retry_date, usegmt=True)})
+
+        self.assertAlmostEqual(get_retry_after(response), 60, delta=2)
+
+    def test_with_past_http_date(self):
+        """Test with Retry-After header HTTP-date in the past."""
+        retry_date = datetime.now(tz=timezone.utc) - timedelta(seconds=60)
+        response = MagicMock(headers={'Retry-After': format_datetime(retry_date, usegmt=True)})
+
+        self.assertEqual(get_retry_after(response), 0)
+
+    def test_without_header(self):
+        """Test without Retry-After header."""
+        self.assertEqual(get_retry_after(MagicMock(headers={})), DEFAULT_RETRY_AFTER)
+
+    def test_with_invalid_header(self):
+        """Test with invalid Retry-After header."""
+        self.assertEqual(get_retry_after(MagicMock(headers={'Retry-After': 'invalid'})), DEFAULT_RETRY_AFTER)
+
+
+@patch(f'{MODULE_PATH}.time.time', return_value=1000.0)
+class TestTokenBucket(TestCase):
+    """Test TokenBucket class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+
+    def test_consume(self, time_mock: MagicMock):
+        """Test consume method (happy path)."""
+        bucket = TokenBucket((ISS, AUD), rate=1, capacity=2)
+
+        self.assertEqual(bucket.consume(), 0)
+        self.assertEqual(bucket.consume(), 0)
+        self.assertEqual(bucket.consume(), 1)
+
+        time_mock.return_value = 1001.0
+
+        self.assertEqual(bucket.consume(), 0)
+
+    def test_key(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test each LtiTool of an issuer has its own bucket."""
+        bucket = TokenBucket((ISS, AUD), rate=1)
+
+        self.assertEqual(bucket.consume(), 0)
+        self.assertEqual(bucket.consume(), 1)
+        self.assertEqual(TokenBucket((ISS, 'other-aud'), rate=1).consume(), 0)
+
+    @patch(f'{MODULE_PATH}.time.sleep')
+    def test_consume_with_lock_contention(
+        self,
+        sleep_mock: MagicMock,
+        time_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test consume method waits for a bucket lock released by another process."""
+        bucket = TokenBucket((ISS, AUD), rate=2)
+        lock_key = f'{bucket.cache_key}.lock'
+        cache.add(lock_key, True)
+        sleep_mock.side_effect = lambda delay: cache.delete(lock_key)
+
+        self.assertEqual(bucket.consume(), 0)
+        sleep_mock.assert_called_once_with(LOCK_RETRY_DELAY)
+
+    @patch(f'{MODULE_PATH}.time.sleep')
+    @patch(f'{MODULE_PATH}.time.monotonic', side_effect=[0.0, 0.1, LOCK_WAIT])
+    def test_consume_with_lock(
+        self,
+        monotonic_mock: MagicMock,  # pylint: disable=unused-argument
+        sleep_mock: MagicMock,
+        time_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test consume method with bucket locked by another process for LOCK_WAIT seconds."""
+        bucket = TokenBucket((ISS, AUD), rate=2)
+        cache.add(f'{bucket.cache_key}.lock', True)
+
+        self.assertEqual(bucket.consume(), 0.5)
+        sleep_mock.assert_called_once_with(LOCK_RETRY_DELAY)
+
+    def test_timeout(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test timeout property."""
+        self.assertEqual(TokenBucket((ISS, AUD), rate=0.5, capacity=2).timeout, 5)
@@ -0,0 +1,169 @@
+"""LTI AGS request throttling.
+
+Attributes:
+    DEFAULT_RETRY_AFTER (int): Seconds to wait when a throttled response has no Retry-After header.
+    LOCK_TIMEOUT (int): Token bucket lock cache timeout in seconds.
+    LOCK_WAIT (float): Seconds to wait for a token bucket lock held by another process.
+    LOCK_RETRY_DELAY (float): Seconds between token bucket lock attempts.
+    RATE_LIMIT_CACHE_TIMEOUT (int): LtiToolConfiguration rate limit cache timeout in seconds.
+    THROTTLED_STATUS_CODES (tuple): HTTP status codes of throttled responses.
+
+"""
+import hashlib
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Tuple
+
+from django.core.cache import cache
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.models import LtiToolConfiguration
+
+DEFAULT_RETRY_AFTER = 30
+LOCK_TIMEOUT = 1
+LOCK_WAIT = 0.5
+LOCK_RETRY_DELAY = 0.005
+RATE_LIMIT_CACHE_TIMEOUT = 60
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+def get_cache_key(name: str, *values: str) -> str:
+    """Get a cache key for this module.
+
+    Args:
+        name: Cache key name.
+        *values: Values that identify the cache key.
+
+    Returns:
+        Cache key string.
+
+    """
+    return f'{app_config.name}.ags.{name}.{hashlib.md5("|".join(values).encode("utf-8")).hexdigest()}'
+
+
+def get_rate_limit(iss: str, aud: str) -> int:
+    """Get the AGS rate limit of an LtiTool.
+
+    Args:
+        iss: Issuer claim.
+        aud: Audience claim.
+
+    Returns:
+        LtiToolConfiguration `ags_rate_limit` field value or 0.
+
+    """
+    return cache.get_or_set(
+        get_cache_key('rate_limit', iss, aud),
+        lambda: LtiToolConfiguration.objects.filter(
+            lti_tool__issuer=iss,
+            lti_tool__client_id=aud,
+        ).values_list('ags_rate_limit', flat=True).first() or 0,
+        RATE_LIMIT_CACHE_TIMEOUT,
+    )
+
+
+def get_retry_after(response: Any) -> float:
+    """Get the seconds to wait before retrying a throttled request.
+
+    Args:
+        response: HTTP response object.
+
+    Returns:
+        Retry-After header value in seconds or DEFAULT_RETRY_AFTER.
+
+    .. _RFC 9110 - Retry-After:
+        https://www.rfc-editor.org/rfc/rfc9110#field.retry-after
+
+    """
+    retry_after = response.headers.get('Retry-After', '')
+
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+
+    try:
+        return max((parsedate_to_datetime(retry_after) - datetime.now(tz=timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class TokenBucket:
+    """Distributed token bucket.
+
+    A token bucket rate limiter shared between processes,
+    the bucket state is stored on the Django cache.
+
+    """
+
+    def __init__(self, key: Tuple[str, ...], rate: float, capacity: float = 1.0):
+        """Initialize class instance.
+
+        Args:
+            key: Values that identify the bucket.
+            rate: Tokens added to the bucket per second.
+            capacity: Maximum number of tokens in the bucket.
+
+        """
+        self.cache_key = get_cache_key('token_bucket', *key)
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+
+    def consume(self) -> float:
+        """Consume a token from the bucket.
+
+        The bucket lock is retried for LOCK_WAIT seconds while
+        another process holds it, lock contention is not throttling.
+
+        Returns:
+            0 if a token was consumed or the seconds to wait
+            until a token is available.
+
+        """
+        lock_key = f'{self.cache_key}.lock'
+
+        if not self.acquire_lock(lock_key):
+            return 1 / self.rate
+
+        try:
+            now = time.time()
+            tokens, updated = cache.get(self.cache_key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+
+            if tokens < 1:
+                cache.set(self.cache_key, (tokens, now), self.timeout)
+
+                return (1 - tokens) / self.rate
+
+            cache.set(self.cache_key, (tokens - 1, now), self.timeout)
+
+            return 0
+        finally:
+            cache.delete(lock_key)
+
+    @staticmethod
+    def acquire_lock(lock_key: str) -> bool:
+        """Acquire the bucket lock.
+
+        Args:
+            lock_key: Bucket lock cache key.
+
+        Returns:
+            True if the lock was acquired before LOCK_WAIT seconds, False otherwise.
+
+        """
+        deadline = time.monotonic() + LOCK_WAIT
+
+        while not cache.add(lock_key, True, LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                return False
+
+            time.sleep(LOCK_RETRY_DELAY)
+
+        return True
+
+    @property
+    def timeout(self) -> int:
+        """int: Bucket state cache timeout, the time it takes to refill the bucket."""
+        return int(self.capacity / self.rate) + 1
@@ -517,7 +517,7 @@ class TestResourceLinkLaunchViewGetLtiToolConfiguration(ResourceLinkLaunchViewBa
         self.assertEqual(gettext_mock(), str(ctxm.exception))
 
 
-@patch(f'{MODULE_PATH}.COURSE_ACCESS_CONFIGURATION')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 class TestResourceLinkLaunchViewCheckCourseAccessPermission(ResourceLinkLaunchViewBaseTestCase):
     """Test ResourceLinkLaunchView.check_course_access_permission method."""
 
@@ -528,34 +528,34 @@ class TestResourceLinkLaunchViewCheckCourseAccessPermission(ResourceLinkLaunchVi
 
     def test_with_allowed_course_id(
         self,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with allowed Course ID."""
         self.view_class.check_course_access_permission(COURSE_ID, self.lti_tool_configuration)
 
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         self.lti_tool_configuration.is_course_id_allowed.assert_called_once_with(COURSE_ID)
 
     def test_with_disabled_course_access_configuration_switch(
         self,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with disabled `COURSE_ACCESS_CONFIGURATION` switch."""
-        course_access_configuration_switch_mock.is_enabled.return_value = False
+        get_settings_snapshot_mock.return_value.course_access_configuration = False
 
         self.view_class.check_course_access_permission(
             COURSE_ID,
             self.lti_tool_configuration,
         )
 
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         self.lti_tool_configuration.is_course_id_allowed.assert_not_called()
 
     @patch(f'{MODULE_PATH}._')
     def test_with_disallowed_course_id(
         self,
         gettext_mock: MagicMock,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with disallowed Course ID."""
         self.lti_tool_configuration.is_course_id_allowed.return_value = False
@@ -566,7 +566,7 @@ class TestResourceLinkLaunchViewCheckCourseAccessPermission(ResourceLinkLaunchVi
                 self.lti_tool_configuration,
             )
 
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         self.lti_tool_configuration.is_course_id_allowed.assert_called_once_with(COURSE_ID)
         gettext_mock.assert_called_once_with(f'Course ID {COURSE_ID} is not allowed.')
 
@@ -772,13 +772,13 @@ class TestResourceLinkLaunchViewGetOrCreateLtiProfile(ResourceLinkLaunchViewBase
 
 
 @patch(f'{MODULE_PATH}.render')
-@patch(f'{MODULE_PATH}.configuration_helpers')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 class TestResourceLinkLaunchViewRenderLoginPrompt(ResourceLinkLaunchViewBaseTestCase):
     """Test ResourceLinkLaunchView.render_login_prompt method."""
 
     def test_render_template(
         self,
-        configuration_helpers_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
         render_mock: MagicMock,
     ):
         """Test render template."""
@@ -791,7 +791,7 @@ class TestResourceLinkLaunchViewRenderLoginPrompt(ResourceLinkLaunchViewBaseTest
             ),
             render_mock.return_value,
         )
-        configuration_helpers_mock().get_value.assert_called_once_with(
+        get_settings_snapshot_mock().get_value.assert_called_once_with(
             'OLTITP_LOGIN_PROMPT_TEMPLATE',
             settings.OLTITP_LOGIN_PROMPT_TEMPLATE,
         )
@@ -799,7 +799,7 @@ class TestResourceLinkLaunchViewRenderLoginPrompt(ResourceLinkLaunchViewBaseTest
         self.message.get_launch_id().replace.assert_called_once_with('lti1p3-launch-', '')
         render_mock.assert_called_once_with(
             None,
-            configuration_helpers_mock().get_value(),
+            get_settings_snapshot_mock().get_value(),
             {
                 'launch_id': self.message.get_launch_id().replace(),
                 'lti_tool_configuration': self.lti_tool_configuration,
@@ -934,29 +934,26 @@ class TestResourceLinkLaunchViewGetLaunchResponse(ResourceLinkLaunchViewBaseTest
         )
 
 
-@patch(f'{MODULE_PATH}.ALLOW_COMPLETE_COURSE_LAUNCH')
 @patch(f'{MODULE_PATH}.redirect')
-@patch(f'{MODULE_PATH}.configuration_helpers')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 class TestResourceLinkLaunchViewGetCourseLaunchResponse(ResourceLinkLaunchViewBaseTestCase):
     """Test ResourceLinkLaunchView get_course_launch_response method."""
 
     def test_with_enabled_allow_complete_course_launch_switch(
         self,
-        configuration_helpers: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
         redirect_mock: MagicMock,
-        allow_complete_course_launch_mock: MagicMock,
     ):
         """Test with enabled `ALLOW_COMPLETE_COURSE_LAUNCH` switch."""
-        allow_complete_course_launch_mock.is_enabled.return_value = True
+        get_settings_snapshot_mock.return_value.allow_complete_course_launch = True
 
         self.assertEqual(self.view_class.get_course_launch_response(COURSE_ID), redirect_mock.return_value)
-        allow_complete_course_launch_mock.is_enabled.assert_called_once_with()
-        configuration_helpers().get_value.assert_called_once_with(
+        get_settings_snapshot_mock().get_value.assert_called_once_with(
             "LEARNING_MICROFRONTEND_URL",
             settings.LEARNING_MICROFRONTEND_URL,
         )
         redirect_mock.assert_called_once_with(
-            f'{configuration_helpers().get_value()}'
+            f'{get_settings_snapshot_mock().get_value()}'
             f'/course/{COURSE_ID}'
         )
 
@@ -964,19 +961,17 @@ class TestResourceLinkLaunchViewGetCourseLaunchResponse(ResourceLinkLaunchViewBa
     def test_with_disabled_allow_complete_course_launch_switch(
         self,
         gettext_mock: MagicMock,
-        configuration_helpers: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
         redirect_mock: MagicMock,
-        allow_complete_course_launch_mock: MagicMock,
     ):
         """Test with disabled `ALLOW_COMPLETE_COURSE_LAUNCH` switch."""
-        allow_complete_course_launch_mock.is_enabled.return_value = False
+        get_settings_snapshot_mock.return_value.allow_complete_course_launch = False
 
         with self.assertRaises(ResourceLinkException):
             self.view_class.get_course_launch_response(COURSE_ID)
 
-        allow_complete_course_launch_mock.is_enabled.assert_called_once_with()
         gettext_mock.assert_called_once_with('Complete course launches are not enabled.')
-        configuration_helpers().get_value.assert_not_called()
+        get_settings_snapshot_mock().get_value.assert_not_called()
         redirect_mock.assert_not_called()
 
 
@@ -25,7 +25,6 @@ from pylti1p3.contrib.django import DjangoMessageLaunch
 from pylti1p3.exception import LtiException
 
 from openedx_lti_tool_plugin.edxapp_wrapper.safe_sessions_module import mark_user_change_as_expected
-from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
 from openedx_lti_tool_plugin.edxapp_wrapper.student_module import course_enrollment, course_enrollment_exception
 from openedx_lti_tool_plugin.edxapp_wrapper.user_authn_module import set_logged_in_cookies
 from openedx_lti_tool_plugin.http import LoggedHttpResponseBadRequest
@@ -33,9 +32,9 @@ from openedx_lti_tool_plugin.models import LtiProfile, LtiToolConfiguration, Use
 from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
 from openedx_lti_tool_plugin.resource_link_launch.exceptions import ResourceLinkException
 from openedx_lti_tool_plugin.resource_link_launch.utils import validate_resource_link_message
+from openedx_lti_tool_plugin.snapshot import get_settings_snapshot
 from openedx_lti_tool_plugin.utils import get_identity_claims
 from openedx_lti_tool_plugin.views import LTIToolView
-from openedx_lti_tool_plugin.waffle import ALLOW_COMPLETE_COURSE_LAUNCH, COURSE_ACCESS_CONFIGURATION
 
 log = logging.getLogger(__name__)
 AGS_CLAIM_ENDPOINT = 'https://purl.imsglobal.org/spec/lti-ags/claim/endpoint'
@@ -313,7 +312,7 @@ class ResourceLinkLaunchView(LTIToolView):
             https://openid.net/specs/openid-connect-core-1_0.html#IDToken
 
         """
-        if not COURSE_ACCESS_CONFIGURATION.is_enabled():
+        if not get_settings_snapshot().course_access_configuration:
             return
 
         if not lti_tool_configuration.is_course_id_allowed(course_id):
@@ -440,7 +439,7 @@ class ResourceLinkLaunchView(LTIToolView):
         """
         return render(
             request,
-            configuration_helpers().get_value(
+            get_settings_snapshot().get_value(
                 'OLTITP_LOGIN_PROMPT_TEMPLATE',
                 settings.OLTITP_LOGIN_PROMPT_TEMPLATE,
             ),
@@ -560,11 +559,11 @@ class ResourceLinkLaunchView(LTIToolView):
             ResourceLinkException: If ALLOW_COMPLETE_COURSE_LAUNCH is disabled.
 
         """
-        if not ALLOW_COMPLETE_COURSE_LAUNCH.is_enabled():
+        if not get_settings_snapshot().allow_complete_course_launch:
             raise ResourceLinkException(_('Complete course launches are not enabled.'))
 
         return redirect(
-            f'{configuration_helpers().get_value("LEARNING_MICROFRONTEND_URL", settings.LEARNING_MICROFRONTEND_URL)}'
+            f'{get_settings_snapshot().get_value("LEARNING_MICROFRONTEND_URL", settings.LEARNING_MICROFRONTEND_URL)}'
             f'/course/{course_id}'
         )
 
@@ -43,6 +43,10 @@ def plugin_settings(settings: LazySettings):
     # General settings
     settings.OLTITP_ENABLE_LTI_TOOL = False
 
+    # LTI platform circuit breaker settings
+    settings.OLTITP_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    settings.OLTITP_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+
     # Resource link launch settings
     settings.OLTITP_LOGIN_PROMPT_TEMPLATE = 'openedx_lti_tool_plugin/resource_link/login_prompt.html'
 
@@ -50,6 +54,7 @@ def plugin_settings(settings: LazySettings):
     settings.OLTITP_DEEP_LINKING_FORM_TEMPLATE = 'openedx_lti_tool_plugin/deep_linking/form.html'
 
     # Backends settings
+    settings.OLTITP_BLOCK_STRUCTURE_BACKEND = f'{BACKENDS_MODULE_PATH}.block_structure_module_o_v1'
     settings.OLTITP_CORE_SIGNALS_BACKEND = f'{BACKENDS_MODULE_PATH}.core_signals_module_o_v1'
     settings.OLTITP_MODULESTORE_BACKEND = f'{BACKENDS_MODULE_PATH}.modulestore_module_o_v1'
     settings.OLTITP_SAFE_SESSIONS_BACKEND = f'{BACKENDS_MODULE_PATH}.safe_sessions_module_o_v1'
@@ -58,3 +63,12 @@ def plugin_settings(settings: LazySettings):
     settings.OLTITP_GRADES_BACKEND = f'{BACKENDS_MODULE_PATH}.grades_module_o_v1'
     settings.OLTITP_USER_AUTHN_BACKEND = f'{BACKENDS_MODULE_PATH}.user_authn_module_o_v1'
     settings.OLTITP_LEARNING_SEQUENCES_BACKEND = f'{BACKENDS_MODULE_PATH}.learning_sequences_o_v1'
+    settings.OLTITP_BACKEND_INSTRUMENTATION = False
+    settings.OLTITP_BACKEND_SLOW_CALL_THRESHOLD = 0.5
+
+    # Profiling settings
+    settings.OLTITP_PROFILING_ENABLED = False
+    settings.OLTITP_PROFILING_SAMPLE_RATE = 0.0
+    settings.OLTITP_PROFILING_ISSUERS = []
+    settings.OLTITP_PROFILING_DIRECTORY = '/tmp/openedx_lti_tool_plugin/profiles'
+    settings.OLTITP_PROFILING_MAX_PROFILES_PER_MINUTE = 6
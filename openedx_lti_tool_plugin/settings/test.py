@@ -69,6 +69,10 @@ LEARNING_MICROFRONTEND_URL = 'example.com'
 # General settings
 OLTITP_ENABLE_LTI_TOOL = True
 
+# LTI platform circuit breaker settings
+OLTITP_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+OLTITP_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+
 # Resource link launch settings
 OLTITP_LOGIN_PROMPT_TEMPLATE = 'openedx_lti_tool_plugin/resource_link/login_prompt.html'
 
@@ -77,6 +81,7 @@ OLTITP_DEEP_LINKING_FORM_TEMPLATE = 'openedx_lti_tool_plugin/deep_linking/form.h
 
 # Backend settings
 OLTITP_TEST_BACKEND_MODULE_PATH = 'openedx_lti_tool_plugin.tests.backends_for_tests'
+OLTITP_BLOCK_STRUCTURE_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_CORE_SIGNALS_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_MODULESTORE_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_SAFE_SESSIONS_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
@@ -85,3 +90,12 @@ OLTITP_STUDENT_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_GRADES_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_USER_AUTHN_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
 OLTITP_LEARNING_SEQUENCES_BACKEND = OLTITP_TEST_BACKEND_MODULE_PATH
+OLTITP_BACKEND_INSTRUMENTATION = False
+OLTITP_BACKEND_SLOW_CALL_THRESHOLD = 0.5
+
+# Profiling settings
+OLTITP_PROFILING_ENABLED = False
+OLTITP_PROFILING_SAMPLE_RATE = 0.0
+OLTITP_PROFILING_ISSUERS = []
+OLTITP_PROFILING_DIRECTORY = '/tmp/openedx_lti_tool_plugin/profiles'
+OLTITP_PROFILING_MAX_PROFILES_PER_MINUTE = 6
@@ -1,12 +1,46 @@
 """Django Signals."""
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_init, post_save, pre_save
 from django.dispatch import receiver
 from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.models import LtiProfile, LtiToolConfiguration, UserT
 
+ORIGINAL_EMAIL_ATTR = '_oltitp_original_email'
+
+
+@receiver(
+    post_init,
+    sender=get_user_model(),
+    dispatch_uid=f'{app_config.name}.track_user_original_email_on_init',
+)
+@receiver(
+    post_save,
+    sender=get_user_model(),
+    dispatch_uid=f'{app_config.name}.track_user_original_email_on_save',
+)
+def track_user_original_email(
+    sender: UserT,  # pylint: disable=unused-argument
+    instance: UserT,
+    **kwargs: dict,
+):
+    """Track User original email.
+
+    This signal stores the loaded or saved User email on the instance,
+    restrict_lti_profile_user uses it to ignore Users without an
+    autogenerated email without querying the database.
+
+    A deferred email field is not loaded, the original email is None.
+
+    Args:
+        sender: User model.
+        instance: User model instance.
+        **kwargs: Arbitrary keyword arguments.
+
+    """
+    setattr(instance, ORIGINAL_EMAIL_ATTR, instance.__dict__.get('email'))
+
 
 @receiver(
     pre_save,
@@ -27,6 +61,9 @@ def restrict_lti_profile_user(
     this is done to prevent an User with an autogenerated email to
     gain access to the Open edX platform outside an LTI 1.3 launch.
 
+    This signal runs on every User save, the LtiProfile is only queried
+    if the email is saved and the original or new email is autogenerated.
+
     Args:
         sender: User model.
         instance: User model instance.
@@ -37,6 +74,18 @@ def restrict_lti_profile_user(
     if not instance.pk:
         return
 
+    # Ignore if User email is not being saved.
+    if (update_fields := kwargs.get('update_fields')) is not None and 'email' not in update_fields:
+        return
+
+    # Ignore if User original and new emails are non-autogenerated.
+    # The LtiProfile is queried if the original email is unknown.
+    domain = f'@{app_config.domain_name}'
+    original_email = getattr(instance, ORIGINAL_EMAIL_ATTR, None)
+
+    if original_email is not None and domain not in original_email and domain not in (instance.email or ''):
+        return
+
     # Ignore if User has no LtiProfile instance or User is
     # non-autogenerated and has multiple LtiProfile instances.
     # There could be an edge case in which an autogenerated User
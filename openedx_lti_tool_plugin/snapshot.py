@@ -0,0 +1,86 @@
+"""Per-request plugin settings snapshot.
+
+The waffle switches and site configuration values used by the plugin are
+read lazily, at most once per request, from a SettingsSnapshot stored on
+the current request. Outside a request (e.g. Celery tasks or management
+commands) a new snapshot is returned on each call.
+
+Attributes:
+    SNAPSHOT_ATTR (str): Request attribute holding the SettingsSnapshot.
+
+"""
+from functools import cached_property
+from typing import Any, List
+
+from crum import get_current_request
+
+from openedx_lti_tool_plugin.edxapp_wrapper.site_configuration_module import configuration_helpers
+from openedx_lti_tool_plugin.waffle import ALLOW_COMPLETE_COURSE_LAUNCH, COURSE_ACCESS_CONFIGURATION, SAVE_PII_DATA
+
+SNAPSHOT_ATTR = '_oltitp_settings_snapshot'
+
+
+class SettingsSnapshot:
+    """Plugin Settings Snapshot.
+
+    Each value is read on first access and reused afterwards.
+
+    """
+
+    def __init__(self):
+        """Initialize class instance."""
+        self._values = {}
+
+    @cached_property
+    def allow_complete_course_launch(self) -> bool:
+        """bool: ALLOW_COMPLETE_COURSE_LAUNCH switch state."""
+        return ALLOW_COMPLETE_COURSE_LAUNCH.is_enabled()
+
+    @cached_property
+    def course_access_configuration(self) -> bool:
+        """bool: COURSE_ACCESS_CONFIGURATION switch state."""
+        return COURSE_ACCESS_CONFIGURATION.is_enabled()
+
+    @cached_property
+    def save_pii_data(self) -> bool:
+        """bool: SAVE_PII_DATA switch state."""
+        return SAVE_PII_DATA.is_enabled()
+
+    @cached_property
+    def site_orgs(self) -> List[str]:
+        """list: Current site configuration `course_org_filter` orgs."""
+        return list(configuration_helpers().get_current_site_orgs() or [])
+
+    def get_value(self, name: str, default: Any = None) -> Any:
+        """Get a site configuration value.
+
+        Args:
+            name: Site configuration value name.
+            default: Default value, the first default of a name is used.
+
+        Returns:
+            Site configuration value or the default value.
+
+        """
+        if name not in self._values:
+            self._values[name] = configuration_helpers().get_value(name, default)
+
+        return self._values[name]
+
+
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Get the settings snapshot of the current request.
+
+    Returns:
+        SettingsSnapshot of the current request, a new
+        SettingsSnapshot if there is no current request.
+
+    """
+    if (request := get_current_request()) is None:
+        return SettingsSnapshot()
+
+    if (snapshot := getattr(request, SNAPSHOT_ATTR, None)) is None:
+        snapshot = SettingsSnapshot()
+        setattr(request, SNAPSHOT_ATTR, snapshot)
+
+    return snapshot
@@ -1,7 +1,64 @@
-"""Test backends for the openedx_lti_tool_plugin module."""
+"""Test backends for the openedx_lti_tool_plugin module.
+
+The backends return stubs of the edx-platform objects used by the plugin,
+the launch, deep linking and AGS paths can run locally with these stubs.
+"""
+from types import SimpleNamespace
 from unittest.mock import Mock
 
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
+from opaque_keys.edx.django.models import LearningContextKeyField
+
+
+class ConfigurationHelpersTest:
+    """configuration_helpers Test Class.
+
+    The site configuration is empty, the default values are returned.
+
+    """
+
+    @staticmethod
+    def get_value(name: str, default: object = None) -> object:  # pylint: disable=unused-argument
+        """Return site configuration default value."""
+        return default
+
+    @staticmethod
+    def get_current_site_orgs() -> list:
+        """Return site configuration orgs."""
+        return []
+
+
+def configuration_helpers_backend():
+    """Return configuration_helpers test class."""
+    return ConfigurationHelpersTest
+
+
+class ModuleStoreTest:
+    """ModuleStore Test Class.
+
+    Every item is the child of a `vertical` block with the same block ID.
+
+    """
+
+    @staticmethod
+    def get_item(usage_key, *args: tuple, **kwargs: dict):
+        """Return item stub."""
+        return SimpleNamespace(
+            location=usage_key,
+            parent=usage_key.course_key.make_usage_key('vertical', usage_key.block_id),
+        )
+
+    @staticmethod
+    def get_course(course_key, *args: tuple, **kwargs: dict):
+        """Return course stub."""
+        return SimpleNamespace(id=course_key)
+
+
+def modulestore_backend():
+    """Return modulestore test function."""
+    return ModuleStoreTest
 
 
 def course_grade_changed_backend():
@@ -9,6 +66,16 @@ def course_grade_changed_backend():
     return Mock()
 
 
+def get_course_in_cache_backend(*args: tuple, **kwargs: dict):
+    """Return get_course_in_cache mock function.
+
+    Args:
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+    """
+    return Mock()
+
+
 def mark_user_change_as_expected_backend(*args: tuple, **kwargs: dict):
     """Return mark_user_change_as_expected mock function.
 
@@ -19,9 +86,16 @@ def mark_user_change_as_expected_backend(*args: tuple, **kwargs: dict):
     return Mock()
 
 
+class UserProfileTest(models.Model):
+    """UserProfile Test Model."""
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
+    name = models.CharField(max_length=255, blank=True)
+
+
 def user_profile_backend():
-    """Return UserProfile mock function."""
-    return Mock()
+    """Return UserProfile Test Model."""
+    return UserProfileTest
 
 
 def course_enrollment_backend():
@@ -39,24 +113,73 @@ def problem_weighted_score_changed_backend():
     return Mock()
 
 
-def course_grade_factory_backend():
-    """Return CourseGradeFactory mock function."""
-    return Mock()
+class CourseGradeTest:
+    """CourseGrade Test Class.
+
+    Every course and module is fully graded.
+
+    Attributes:
+        percent (float): Course grade percent.
+
+    """
+
+    percent = 1.0
+
+    @staticmethod
+    def score_for_module(usage_key) -> tuple:  # pylint: disable=unused-argument
+        """Return module earned and possible score."""
+        return 1.0, 1.0
+
 
+class CourseGradeFactoryTest:
+    """CourseGradeFactory Test Class."""
 
-def set_logged_in_cookies_backend(*args: tuple, **kwargs: dict):
-    """Return set_logged_in_cookies mock function.
+    @staticmethod
+    def read(*args: tuple, **kwargs: dict) -> CourseGradeTest:
+        """Return CourseGrade test instance."""
+        return CourseGradeTest()
+
+
+def course_grade_factory_backend(*args: tuple, **kwargs: dict):
+    """Return CourseGradeFactory test instance.
 
     Args:
         *args: Variable length argument list.
         **kwargs: Arbitrary keyword arguments.
     """
-    return Mock()
+    return CourseGradeFactoryTest(*args, **kwargs)
+
+
+def set_logged_in_cookies_backend(request, response, user):  # pylint: disable=unused-argument
+    """Return set_logged_in_cookies test function response.
+
+    Args:
+        request: HTTP request object.
+        response: HTTP response object.
+        user: User instance.
+    """
+    return response
+
+
+class LearningContextTest(models.Model):
+    """LearningContext Test Model."""
+
+    context_key = LearningContextKeyField(max_length=255, unique=True)
+    title = models.CharField(max_length=255, blank=True)
+    published_at = models.DateTimeField(default=timezone.now)
+    published_version = models.CharField(max_length=24, blank=True)
 
 
 class CourseContextTest(models.Model):
     """CourseContext Test Model."""
 
+    learning_context = models.OneToOneField(
+        LearningContextTest,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='course_context',
+    )
+
 
 def course_context_backend():
     """Return CourseContext Test Model."""
@@ -0,0 +1,121 @@
+"""Tests benchmarks module."""
+from unittest.mock import MagicMock, patch
+
+from crum import get_current_request
+from django.test import TestCase, override_settings
+from django.urls import get_urlconf
+
+from openedx_lti_tool_plugin.benchmarks import (
+    BENCHMARKS,
+    BenchmarkResult,
+    get_benchmarks,
+    get_course_ids,
+    get_request_host,
+    run_benchmark,
+    run_benchmarks,
+)
+from openedx_lti_tool_plugin.snapshot import SNAPSHOT_ATTR
+from openedx_lti_tool_plugin.tests import MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.benchmarks'
+
+
+class TestGetCourseIds(TestCase):
+    """Test get_course_ids function."""
+
+    def test_get_course_ids(self):
+        """Test get_course_ids function (happy path)."""
+        course_ids = get_course_ids(20)
+
+        self.assertEqual(len(course_ids), 20)
+        self.assertEqual(len(set(course_ids)), 20)
+
+
+class TestGetRequestHost(TestCase):
+    """Test get_request_host function."""
+
+    @override_settings(ALLOWED_HOSTS=['.example.com', 'localhost'])
+    def test_with_allowed_hosts(self):
+        """Test function with ALLOWED_HOSTS setting."""
+        self.assertEqual(get_request_host(), 'example.com')
+
+    @override_settings(ALLOWED_HOSTS=['*'])
+    def test_with_wildcard_allowed_host(self):
+        """Test function with wildcard ALLOWED_HOSTS setting."""
+        self.assertEqual(get_request_host(), 'localhost')
+
+    @override_settings(ALLOWED_HOSTS=[])
+    def test_without_allowed_hosts(self):
+        """Test function without ALLOWED_HOSTS setting."""
+        self.assertEqual(get_request_host(), 'localhost')
+
+
+class TestGetBenchmarks(TestCase):
+    """Test get_benchmarks function."""
+
+    def test_get_benchmarks(self):
+        """Test every benchmark function runs without queries."""
+        benchmarks = get_benchmarks(size=5)
+
+        self.assertEqual(tuple(benchmarks), BENCHMARKS)
+
+        with self.assertNumQueries(0):
+            run_benchmarks(size=5, number=1, repeat=1)
+
+
+class TestRunBenchmark(TestCase):
+    """Test run_benchmark function."""
+
+    def test_run_benchmark(self):
+        """Test run_benchmark function (happy path)."""
+        function = MagicMock()
+
+        result = run_benchmark('test', function, number=3, repeat=2)
+
+        self.assertEqual(function.call_count, 6)
+        self.assertIsInstance(result, BenchmarkResult)
+        self.assertEqual(result[:3], ('test', 3, 2))
+        self.assertLessEqual(result.min_us, result.median_us)
+        self.assertLessEqual(result.median_us, result.max_us)
+
+
+@patch(f'{MODULE_PATH}.run_benchmark')
+class TestRunBenchmarks(TestCase):
+    """Test run_benchmarks function."""
+
+    def test_run_benchmarks(self, run_benchmark_mock: MagicMock):
+        """Test run_benchmarks function (happy path)."""
+        run_benchmark_mock.side_effect = lambda name, *args: BenchmarkResult(name, 1, 1, 1.0, 1.0, 1.0, 1.0)
+
+        report = run_benchmarks(size=5, number=1, repeat=1)
+
+        self.assertEqual([result['name'] for result in report['results']], list(BENCHMARKS))
+        self.assertEqual((report['size'], report['number'], report['repeat']), (5, 1, 1))
+        self.assertIn('plugin_version', report)
+        self.assertIsNone(get_current_request())
+        self.assertIsNone(get_urlconf())
+
+    def test_run_benchmarks_with_names(self, run_benchmark_mock: MagicMock):
+        """Test run_benchmarks function with benchmark names."""
+        def run_benchmark_side_effect(name, *args):
+            request = get_current_request()
+            self.assertTrue(getattr(request, SNAPSHOT_ATTR).save_pii_data)
+            self.assertEqual(get_urlconf(), MODULE_PATH)
+
+            return BenchmarkResult(name, 1, 1, 1.0, 1.0, 1.0, 1.0)
+
+        run_benchmark_mock.side_effect = run_benchmark_side_effect
+
+        report = run_benchmarks(['get_identity_claims'], size=5, number=1, repeat=1)
+
+        self.assertEqual([result['name'] for result in report['results']], ['get_identity_claims'])
+
+    def test_run_benchmarks_with_exception(self, run_benchmark_mock: MagicMock):
+        """Test run_benchmarks function resets the current request and URLconf on exception."""
+        run_benchmark_mock.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            run_benchmarks(size=5, number=1, repeat=1)
+
+        self.assertIsNone(get_current_request())
+        self.assertIsNone(get_urlconf())
@@ -0,0 +1,120 @@
+"""Tests circuit_breaker module."""
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.circuit_breaker import AGS, CLOSED, HALF_OPEN, JWKS, OPEN, CircuitBreaker
+from openedx_lti_tool_plugin.tests import ISS, MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.circuit_breaker'
+
+
+@patch(f'{MODULE_PATH}.time.time', return_value=1000.0)
+class TestCircuitBreaker(TestCase):
+    """Test CircuitBreaker class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+        self.circuit_breaker = CircuitBreaker(ISS, AGS, failure_threshold=2, recovery_timeout=10)
+
+    @override_settings(
+        OLTITP_CIRCUIT_BREAKER_FAILURE_THRESHOLD=3,
+        OLTITP_CIRCUIT_BREAKER_RECOVERY_TIMEOUT=30,
+    )
+    def test_init(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test __init__ method."""
+        circuit_breaker = CircuitBreaker(ISS, AGS)
+
+        self.assertEqual(circuit_breaker.platform_id, ISS)
+        self.assertEqual(circuit_breaker.endpoint, AGS)
+        self.assertEqual(circuit_breaker.failure_threshold, 3)
+        self.assertEqual(circuit_breaker.recovery_timeout, 30)
+        self.assertNotEqual(circuit_breaker.cache_key, CircuitBreaker('other-platform', AGS).cache_key)
+        self.assertNotEqual(circuit_breaker.cache_key, CircuitBreaker(ISS, JWKS).cache_key)
+
+    def test_acquire_with_closed_state(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test acquire method with closed state."""
+        self.assertEqual(self.circuit_breaker.state, CLOSED)
+        self.assertEqual(self.circuit_breaker.acquire(), 0)
+
+    @log_capture()
+    def test_record_failure(self, log_mock: LogCaptureForDecorator, time_mock: MagicMock):
+        """Test record_failure method opens the circuit on the failure threshold."""
+        opened_log_extra = {**self.circuit_breaker.log_extra, 'failures': 2}
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, CLOSED)
+
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, OPEN)
+        self.assertEqual(CircuitBreaker(ISS, AGS, recovery_timeout=10).state, OPEN)
+        self.assertEqual(self.circuit_breaker.acquire(), 10)
+
+        time_mock.return_value = 1004.0
+
+        self.assertEqual(self.circuit_breaker.acquire(), 6)
+        log_mock.check(
+            (MODULE_PATH, 'WARNING', f'LTI platform circuit breaker opened: {opened_log_extra}'),
+        )
+
+    def test_acquire_with_half_open_state(self, time_mock: MagicMock):
+        """Test acquire method with half-open state allows a single probe request."""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        time_mock.return_value = 1010.0
+
+        self.assertEqual(self.circuit_breaker.state, HALF_OPEN)
+        self.assertEqual(self.circuit_breaker.acquire(), 0)
+        self.assertEqual(self.circuit_breaker.acquire(), 10)
+
+    def test_record_failure_with_half_open_state(self, time_mock: MagicMock):
+        """Test record_failure method with half-open state opens the circuit again."""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        time_mock.return_value = 1010.0
+        self.circuit_breaker.acquire()
+
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, OPEN)
+        self.assertEqual(self.circuit_breaker.acquire(), 10)
+
+    @log_capture()
+    def test_record_success(self, log_mock: LogCaptureForDecorator, time_mock: MagicMock):
+        """Test record_success method closes the circuit."""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        time_mock.return_value = 1010.0
+        self.circuit_breaker.acquire()
+        log_mock.clear()
+
+        self.circuit_breaker.record_success()
+
+        self.assertEqual(self.circuit_breaker.state, CLOSED)
+        self.assertEqual(self.circuit_breaker.acquire(), 0)
+        log_mock.check(
+            (MODULE_PATH, 'INFO', f'LTI platform circuit breaker closed: {self.circuit_breaker.log_extra}'),
+        )
+
+    def test_record_success_resets_failures(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test record_success method resets consecutive failures."""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, CLOSED)
+
+    def test_record_success_with_other_endpoint(self, time_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test record_success method doesn't close the circuit of another endpoint."""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+
+        CircuitBreaker(ISS, JWKS).record_success()
+
+        self.assertEqual(self.circuit_breaker.state, OPEN)
@@ -0,0 +1,76 @@
+"""Tests message_launch module."""
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from pylti1p3.contrib.django import DjangoMessageLaunch
+from pylti1p3.exception import LtiException
+
+from openedx_lti_tool_plugin.circuit_breaker import AGS, JWKS, OPEN, CircuitBreaker
+from openedx_lti_tool_plugin.message_launch import LtiMessageLaunch
+from openedx_lti_tool_plugin.tests import ISS, MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.message_launch'
+KEY_SET_URL = 'https://random-key-set-url.test'
+
+
+@patch.object(DjangoMessageLaunch, 'fetch_public_key')
+@patch(f'{MODULE_PATH}.CircuitBreaker')
+class TestLtiMessageLaunch(TestCase):
+    """Test LtiMessageLaunch class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.message = LtiMessageLaunch(MagicMock(), MagicMock())
+        self.message._registration = MagicMock()  # pylint: disable=protected-access
+        self.message._registration.get_issuer.return_value = ISS  # pylint: disable=protected-access
+
+    def test_fetch_public_key(self, circuit_breaker_mock: MagicMock, fetch_public_key_mock: MagicMock):
+        """Test fetch_public_key method (happy path)."""
+        circuit_breaker_mock().acquire.return_value = 0
+
+        self.assertEqual(self.message.fetch_public_key(KEY_SET_URL), fetch_public_key_mock.return_value)
+        circuit_breaker_mock.assert_called_with(ISS, JWKS)
+        fetch_public_key_mock.assert_called_once_with(KEY_SET_URL)
+        circuit_breaker_mock().record_success.assert_called_once_with()
+        circuit_breaker_mock().record_failure.assert_not_called()
+
+    def test_with_circuit_breaker_open(self, circuit_breaker_mock: MagicMock, fetch_public_key_mock: MagicMock):
+        """Test fetch_public_key method with circuit breaker open."""
+        circuit_breaker_mock().acquire.return_value = 10
+
+        with self.assertRaises(LtiException):
+            self.message.fetch_public_key(KEY_SET_URL)
+
+        fetch_public_key_mock.assert_not_called()
+        circuit_breaker_mock().record_success.assert_not_called()
+        circuit_breaker_mock().record_failure.assert_not_called()
+
+    def test_with_lti_exception(self, circuit_breaker_mock: MagicMock, fetch_public_key_mock: MagicMock):
+        """Test fetch_public_key method with LtiException."""
+        circuit_breaker_mock().acquire.return_value = 0
+        fetch_public_key_mock.side_effect = LtiException
+
+        with self.assertRaises(LtiException):
+            self.message.fetch_public_key(KEY_SET_URL)
+
+        circuit_breaker_mock().record_failure.assert_called_once_with()
+        circuit_breaker_mock().record_success.assert_not_called()
+
+
+class TestLtiMessageLaunchCircuitBreaker(TestCase):
+    """Test LtiMessageLaunch class circuit breaker."""
+
+    @patch.object(DjangoMessageLaunch, 'fetch_public_key')
+    def test_fetch_public_key_with_ags_circuit_breaker_open(self, fetch_public_key_mock: MagicMock):
+        """Test a JWKS success doesn't close an open AGS circuit breaker."""
+        cache.clear()
+        message = LtiMessageLaunch(MagicMock(), MagicMock())
+        message._registration = MagicMock()  # pylint: disable=protected-access
+        message._registration.get_issuer.return_value = ISS  # pylint: disable=protected-access
+        ags_circuit_breaker = CircuitBreaker(ISS, AGS, failure_threshold=1)
+        ags_circuit_breaker.record_failure()
+
+        self.assertEqual(message.fetch_public_key(KEY_SET_URL), fetch_public_key_mock.return_value)
+        self.assertEqual(ags_circuit_breaker.state, OPEN)
@@ -38,7 +38,7 @@ class TestLTIToolMixin(TestCase):
 
     @patch.object(LTIToolMixin, 'tool_config', new_callable=PropertyMock)
     @patch.object(LTIToolMixin, 'tool_storage', new_callable=PropertyMock)
-    @patch(f'{MODULE_PATH}.DjangoMessageLaunch')
+    @patch(f'{MODULE_PATH}.LtiMessageLaunch')
     def test_get_message(
         self,
         message_launch_mock: MagicMock,
@@ -58,7 +58,7 @@ class TestLTIToolMixin(TestCase):
 
     @patch.object(LTIToolMixin, 'tool_config', new_callable=PropertyMock)
     @patch.object(LTIToolMixin, 'tool_storage', new_callable=PropertyMock)
-    @patch(f'{MODULE_PATH}.DjangoMessageLaunch')
+    @patch(f'{MODULE_PATH}.LtiMessageLaunch')
     def test_get_message_from_cache(
         self,
         message_launch_mock: MagicMock,
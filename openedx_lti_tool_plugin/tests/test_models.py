@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, PropertyMock, call, patch
 import ddt
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db.models import signals
+from django.db.models import Q, signals
 from django.test import TestCase
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
@@ -17,6 +17,7 @@ from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool, LtiToolKe
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.models import CourseContext, CourseContextQuerySet, LtiProfile, LtiToolConfiguration
 from openedx_lti_tool_plugin.tests import AUD, ISS, ORG, SUB
+from openedx_lti_tool_plugin.tests.backends_for_tests import LearningContextTest
 
 MODULE_PATH = 'openedx_lti_tool_plugin.models'
 NAME = 'random-name'
@@ -624,7 +625,7 @@ class TestLtiToolConfiguration(TestCase):
         self.assertIn(LtiToolConfiguration.UserProvisioningMode.EXISTING_ONLY.value, choices)
 
 
-@patch(f'{MODULE_PATH}.COURSE_ACCESS_CONFIGURATION')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 @patch.object(CourseContextQuerySet, 'all')
 @patch(f'{MODULE_PATH}.DjangoDbToolConf')
 @patch.object(LtiToolConfiguration.objects, 'get')
@@ -642,14 +643,14 @@ class TestCourseContextQuerySetAllForLtiTool(TestCase):
         lti_tool_configuration_get_mock: MagicMock,
         django_db_tool_conf_mock: MagicMock,
         course_context_manager_all_mock: MagicMock,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with LtiToolConfiguration (happy path)."""
         self.assertEqual(
             CourseContext.objects.all_for_lti_tool(ISS, AUD),
             course_context_manager_filter_mock.return_value,
         )
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         course_context_manager_all_mock.assert_not_called()
         django_db_tool_conf_mock.assert_called_once_with()
         django_db_tool_conf_mock().get_lti_tool.assert_called_once_with(ISS, AUD)
@@ -672,7 +673,7 @@ class TestCourseContextQuerySetAllForLtiTool(TestCase):
         lti_tool_configuration_get_mock: MagicMock,
         django_db_tool_conf_mock: MagicMock,
         course_context_manager_all_mock: MagicMock,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test without LtiToolConfiguration."""
         lti_tool_configuration_get_mock.side_effect = LtiToolConfiguration.DoesNotExist
@@ -681,7 +682,7 @@ class TestCourseContextQuerySetAllForLtiTool(TestCase):
             CourseContext.objects.all_for_lti_tool(ISS, AUD),
             course_context_manager_none_mock.return_value,
         )
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         course_context_manager_all_mock.assert_not_called()
         django_db_tool_conf_mock.assert_called_once_with()
         django_db_tool_conf_mock().get_lti_tool.assert_called_once_with(ISS, AUD)
@@ -700,16 +701,16 @@ class TestCourseContextQuerySetAllForLtiTool(TestCase):
         lti_tool_configuration_get_mock: MagicMock,
         django_db_tool_conf_mock: MagicMock,
         course_context_manager_all_mock: MagicMock,
-        course_access_configuration_switch_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with disabled COURSE_ACCESS_CONFIGURATION switch."""
-        course_access_configuration_switch_mock.is_enabled.return_value = None
+        get_settings_snapshot_mock.return_value.course_access_configuration = False
 
         self.assertEqual(
             CourseContext.objects.all_for_lti_tool(ISS, AUD),
             course_context_manager_all_mock.return_value,
         )
-        course_access_configuration_switch_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         course_context_manager_all_mock.assert_called_once_with()
         django_db_tool_conf_mock.assert_not_called()
         django_db_tool_conf_mock().get_lti_tool.assert_not_called()
@@ -719,6 +720,42 @@ class TestCourseContextQuerySetAllForLtiTool(TestCase):
         course_context_manager_filter_mock.assert_not_called()
 
 
+class TestCourseContextQuerySetFilterByOrgs(TestCase):
+    """Test CourseContextQuerySet.filter_by_orgs method."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.queryset_class = CourseContextQuerySet
+        self.queryset_self = MagicMock()
+
+    def test_filter_by_orgs(self):
+        """Test filter_by_orgs method (happy path)."""
+        self.assertEqual(
+            self.queryset_class.filter_by_orgs(self.queryset_self, [ORG, 'other-org']),
+            self.queryset_self.filter.return_value,
+        )
+        self.queryset_self.filter.assert_called_once_with(
+            Q(learning_context__context_key__startswith=f'course-v1:{ORG}+')
+            | Q(learning_context__context_key__startswith=f'ccx-v1:{ORG}+')
+            | Q(learning_context__context_key__startswith=f'{ORG}/')
+            | Q(learning_context__context_key__startswith='course-v1:other-org+')
+            | Q(learning_context__context_key__startswith='ccx-v1:other-org+')
+            | Q(learning_context__context_key__startswith='other-org/'),
+        )
+        self.queryset_self.__iter__.assert_not_called()
+
+    def test_with_lookup(self):
+        """Test filter_by_orgs method with lookup argument."""
+        self.queryset_class.filter_by_orgs(self.queryset_self, [ORG], lookup='istartswith')
+
+        self.queryset_self.filter.assert_called_once_with(
+            Q(learning_context__context_key__istartswith=f'course-v1:{ORG}+')
+            | Q(learning_context__context_key__istartswith=f'ccx-v1:{ORG}+')
+            | Q(learning_context__context_key__istartswith=f'{ORG}/'),
+        )
+
+
 class TestCourseContextQuerySetFilterBySiteOrgs(TestCase):
     """Test CourseContextQuerySet.filter_by_site_orgs method."""
 
@@ -727,39 +764,36 @@ class TestCourseContextQuerySetFilterBySiteOrgs(TestCase):
         super().setUp()
         self.queryset_class = CourseContextQuerySet
         self.queryset_self = MagicMock()
-        self.course_context = MagicMock(pk='test-pk', org=ORG)
-        self.course_contexts = [self.course_context]
 
-    @patch(f'{MODULE_PATH}.configuration_helpers')
+    @patch(f'{MODULE_PATH}.get_settings_snapshot')
     def test_with_site_configuration_setting(
         self,
-        configuration_helpers_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test with with site configuration `course_org_filter` setting (happy path)."""
-        self.queryset_self.__iter__.return_value = self.course_contexts
-        configuration_helpers_mock().get_current_site_orgs.return_value = [ORG]
+        get_settings_snapshot_mock.return_value.site_orgs = [ORG, 'other-org']
 
         self.assertEqual(
             self.queryset_class.filter_by_site_orgs(self.queryset_self),
-            self.queryset_self.filter.return_value,
+            self.queryset_self.filter_by_orgs.return_value,
         )
-        configuration_helpers_mock().get_current_site_orgs.assert_called_once_with()
-        self.queryset_self.filter.assert_called_once_with(pk__in=[self.course_context.pk])
+        get_settings_snapshot_mock.assert_called_once_with()
+        self.queryset_self.filter_by_orgs.assert_called_once_with([ORG, 'other-org'])
 
-    @patch(f'{MODULE_PATH}.configuration_helpers')
+    @patch(f'{MODULE_PATH}.get_settings_snapshot')
     def test_without_site_configuration_setting(
         self,
-        configuration_helpers_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
     ):
         """Test without site configuration `course_org_filter` setting."""
-        configuration_helpers_mock().get_current_site_orgs.return_value = None
+        get_settings_snapshot_mock.return_value.site_orgs = []
 
         self.assertEqual(
             self.queryset_class.filter_by_site_orgs(self.queryset_self),
             self.queryset_self,
         )
-        configuration_helpers_mock().get_current_site_orgs.assert_called_once_with()
-        self.queryset_self.filter.assert_not_called()
+        get_settings_snapshot_mock.assert_called_once_with()
+        self.queryset_self.filter_by_orgs.assert_not_called()
 
 
 class TestCourseContext(TestCase):
@@ -768,8 +802,8 @@ class TestCourseContext(TestCase):
     def setUp(self):
         """Set up test fixtures."""
         super().setUp()
-        self.learning_context = MagicMock(
-            context_key=MagicMock(org=ORG),
+        self.learning_context = LearningContextTest(
+            context_key=CourseKey.from_string(f'course-v1:{ORG}+course+run'),
             title='test-title',
         )
         self.course_context = CourseContext()
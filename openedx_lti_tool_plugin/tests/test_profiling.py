@@ -0,0 +1,266 @@
+"""Tests profiling module."""
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import ddt
+import jwt
+from django.core.exceptions import MiddlewareNotUsed
+from django.http.response import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import include, re_path
+from testfixtures import log_capture
+from testfixtures.logcapture import LogCaptureForDecorator
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.profiling import (
+    BUDGET_WINDOW,
+    PROFILE_ATTR,
+    PROFILED_NAMESPACE,
+    ProfilingBudget,
+    ProfilingMiddleware,
+    RequestProfile,
+    get_lti_tool,
+)
+from openedx_lti_tool_plugin.tests import AUD, ISS, MODULE_PATH
+
+MODULE_PATH = f'{MODULE_PATH}.profiling'
+VIEW_NAME = f'{PROFILED_NAMESPACE}:login'
+urlpatterns = [
+    re_path(
+        app_config.plugin_app['url_config']['lms.djangoapp']['regex'],
+        include(('openedx_lti_tool_plugin.urls', app_config.name), namespace=app_config.name),
+    ),
+]
+
+
+@patch(f'{MODULE_PATH}.time.monotonic', return_value=1000.0)
+class TestProfilingBudget(TestCase):
+    """Test ProfilingBudget class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.budget = ProfilingBudget(2)
+
+    def test_acquire(self, monotonic_mock: MagicMock):  # pylint: disable=unused-argument
+        """Test acquire method allows a single active profile."""
+        self.assertTrue(self.budget.acquire())
+        self.assertFalse(self.budget.acquire())
+
+        self.budget.release()
+
+        self.assertTrue(self.budget.acquire())
+
+    def test_acquire_with_exhausted_budget(self, monotonic_mock: MagicMock):
+        """Test acquire method with the budget window exhausted."""
+        for _ in range(2):
+            self.assertTrue(self.budget.acquire())
+            self.budget.release()
+
+        self.assertFalse(self.budget.acquire())
+
+        monotonic_mock.return_value += BUDGET_WINDOW
+
+        self.assertTrue(self.budget.acquire())
+
+
+@ddt.ddt
+class TestGetLtiTool(TestCase):
+    """Test get_lti_tool function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def test_with_login_parameters(self):
+        """Test with OIDC login GET parameters."""
+        request = self.factory.get('/', {'iss': ISS, 'client_id': AUD})
+
+        self.assertEqual(get_lti_tool(request), (ISS, AUD))
+
+    @ddt.data(AUD, [AUD, 'other-aud'])
+    def test_with_id_token(self, aud: str):
+        """Test with the launch id_token unverified claims."""
+        request = self.factory.post('/', {'id_token': jwt.encode({'iss': ISS, 'aud': aud}, 'secret')})
+
+        self.assertEqual(get_lti_tool(request), (ISS, AUD))
+
+    def test_with_invalid_id_token(self):
+        """Test with an invalid id_token."""
+        request = self.factory.post('/', {'id_token': 'invalid'})
+
+        self.assertEqual(get_lti_tool(request), ('', ''))
+
+    def test_without_lti_tool(self):
+        """Test without LTI platform parameters."""
+        self.assertEqual(get_lti_tool(self.factory.get('/')), ('', ''))
+
+
+@override_settings(OLTITP_PROFILING_ENABLED=True)
+@ddt.ddt
+class TestProfilingMiddleware(TestCase):
+    """Test ProfilingMiddleware class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+        self.response = HttpResponse()
+        self.get_response = MagicMock(return_value=self.response)
+        self.request = RequestFactory().get('/', {'iss': ISS, 'client_id': AUD})
+        self.request.resolver_match = MagicMock(namespace=PROFILED_NAMESPACE, view_name=VIEW_NAME)
+
+    def get_middleware(self, **kwargs: dict) -> ProfilingMiddleware:
+        """Get a ProfilingMiddleware with profiling settings.
+
+        Args:
+            **kwargs: Profiling settings.
+
+        Returns:
+            ProfilingMiddleware instance.
+
+        """
+        with override_settings(OLTITP_PROFILING_DIRECTORY=self.directory.name, **kwargs):
+            return ProfilingMiddleware(self.get_response)
+
+    @override_settings(OLTITP_PROFILING_ENABLED=False)
+    def test_init_disabled(self):
+        """Test __init__ method with OLTITP_PROFILING_ENABLED disabled."""
+        with self.assertRaises(MiddlewareNotUsed):
+            ProfilingMiddleware(self.get_response)
+
+    @ddt.data(
+        (PROFILED_NAMESPACE, True),
+        (f'{PROFILED_NAMESPACE}:resource-link', True),
+        (app_config.name, False),
+        (f'{PROFILED_NAMESPACE}0', False),
+        ('admin', False),
+    )
+    @ddt.unpack
+    def test_is_plugin_request(self, namespace: str, expected: bool):
+        """Test is_plugin_request method."""
+        self.request.resolver_match.namespace = namespace
+
+        self.assertEqual(ProfilingMiddleware.is_plugin_request(self.request), expected)
+
+    def test_process_view_with_issuer(self):
+        """Test process_view method profiles the OLTITP_PROFILING_ISSUERS requests."""
+        middleware = self.get_middleware(OLTITP_PROFILING_ISSUERS=[ISS])
+
+        middleware.process_view(self.request, MagicMock(), (), {})
+
+        profile = getattr(self.request, PROFILE_ATTR)
+        profile.profiler.disable()
+        self.assertEqual((profile.iss, profile.client_id), (ISS, AUD))
+
+    @ddt.data((0.5, True), (0.1, False))
+    @ddt.unpack
+    @patch(f'{MODULE_PATH}.random.random', return_value=0.2)
+    def test_process_view_with_sample_rate(
+        self,
+        sample_rate: float,
+        profiled: bool,
+        random_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test process_view method samples requests with OLTITP_PROFILING_SAMPLE_RATE."""
+        middleware = self.get_middleware(OLTITP_PROFILING_SAMPLE_RATE=sample_rate)
+
+        middleware.process_view(self.request, MagicMock(), (), {})
+
+        self.assertEqual(hasattr(self.request, PROFILE_ATTR), profiled)
+
+        if profiled:
+            getattr(self.request, PROFILE_ATTR).profiler.disable()
+
+    def test_process_view_without_plugin_request(self):
+        """Test process_view method skips requests outside the plugin namespace."""
+        self.request.resolver_match.namespace = 'admin'
+        middleware = self.get_middleware(OLTITP_PROFILING_SAMPLE_RATE=1.0)
+
+        middleware.process_view(self.request, MagicMock(), (), {})
+
+        self.assertFalse(hasattr(self.request, PROFILE_ATTR))
+
+    def test_process_view_without_budget(self):
+        """Test process_view method skips requests without profiling budget."""
+        middleware = self.get_middleware(OLTITP_PROFILING_SAMPLE_RATE=1.0, OLTITP_PROFILING_MAX_PROFILES_PER_MINUTE=0)
+
+        middleware.process_view(self.request, MagicMock(), (), {})
+
+        self.assertFalse(hasattr(self.request, PROFILE_ATTR))
+
+    @patch.object(ProfilingMiddleware, 'save_profile')
+    def test_call(self, save_profile_mock: MagicMock):
+        """Test __call__ method stops the profiler and saves the profile."""
+        middleware = self.get_middleware()
+        profile = RequestProfile(MagicMock(), 0.0, ISS, AUD)
+        setattr(self.request, PROFILE_ATTR, profile)
+        middleware.budget = MagicMock()
+
+        self.assertEqual(middleware(self.request), self.response)
+        self.get_response.assert_called_once_with(self.request)
+        profile.profiler.disable.assert_called_once_with()
+        middleware.budget.release.assert_called_once_with()
+        save_profile_mock.assert_called_once_with(self.request, self.response, profile)
+
+    @patch.object(ProfilingMiddleware, 'save_profile')
+    def test_call_without_profile(self, save_profile_mock: MagicMock):
+        """Test __call__ method without a request profile."""
+        self.assertEqual(self.get_middleware()(self.request), self.response)
+        save_profile_mock.assert_not_called()
+
+    @log_capture()
+    def test_save_profile(self, log_mock: LogCaptureForDecorator):
+        """Test save_profile method writes the profile and its metadata."""
+        middleware = self.get_middleware()
+        profile = RequestProfile(MagicMock(), 0.0, ISS, AUD)
+
+        path = middleware.save_profile(self.request, self.response, profile)
+
+        self.assertEqual(os.path.dirname(path), self.directory.name)
+        self.assertIn('openedx_lti_tool_plugin-1.3-login', path)
+        profile.profiler.dump_stats.assert_called_once_with(f'{path}.prof')
+
+        with open(f'{path}.json', encoding='utf-8') as metadata_file:
+            metadata = json.load(metadata_file)
+
+        self.assertEqual(metadata['view_name'], VIEW_NAME)
+        self.assertEqual(metadata['status_code'], 200)
+        self.assertEqual((metadata['iss'], metadata['client_id']), (ISS, AUD))
+        self.assertEqual(log_mock.actual()[0][1], 'INFO')
+
+    @log_capture()
+    def test_save_profile_with_os_error(self, log_mock: LogCaptureForDecorator):
+        """Test save_profile method with an unwritable directory."""
+        middleware = self.get_middleware()
+        profile = RequestProfile(MagicMock(), 0.0, ISS, AUD)
+        profile.profiler.dump_stats.side_effect = OSError('error')
+
+        self.assertIsNone(middleware.save_profile(self.request, self.response, profile))
+        self.assertEqual(log_mock.actual()[0][1], 'ERROR')
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestProfilingMiddlewareRequest(TestCase):
+    """Test ProfilingMiddleware on plugin requests."""
+
+    def test_request(self):
+        """Test a sampled plugin request profile is written."""
+        with tempfile.TemporaryDirectory() as directory, self.modify_settings(
+            MIDDLEWARE={'append': f'{MODULE_PATH}.ProfilingMiddleware'},
+        ), self.settings(
+            OLTITP_PROFILING_ENABLED=True,
+            OLTITP_PROFILING_SAMPLE_RATE=1.0,
+            OLTITP_PROFILING_DIRECTORY=directory,
+        ):
+            response = self.client.get(f'/{app_config.name}/1.3/pub/jwks')
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                sorted(os.path.splitext(name)[1] for name in os.listdir(directory)),
+                ['.json', '.prof'],
+            )
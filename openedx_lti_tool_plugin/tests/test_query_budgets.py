@@ -0,0 +1,326 @@
+"""Tests query budgets of the launch, deep linking and AGS paths.
+
+Each test runs a request or task path with the test backends and fails if
+the path makes more database queries than its budget, the failure message
+lists the captured queries.
+
+The plugin URLs are included with the plugin namespace, like the LMS does.
+
+Attributes:
+    urlpatterns (list): URL patterns list.
+    QUERY_BUDGETS (dict): Maximum number of queries of each path.
+    CONTENT_ITEM_PAGE_SIZES (tuple): Number of courses of the content item page tests.
+
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import ddt
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, re_path, reverse
+from opaque_keys.edx.keys import CourseKey
+from pylti1p3.contrib.django import DjangoCacheDataStorage
+from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool, LtiToolKey
+from waffle.testutils import override_switch
+
+from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
+from openedx_lti_tool_plugin.deep_linking.session import DEPLOYMENT_ID_CLAIM, DeepLinkingSession
+from openedx_lti_tool_plugin.models import LtiProfile, LtiToolConfiguration
+from openedx_lti_tool_plugin.resource_link_launch.ags.models import LtiGradedResource
+from openedx_lti_tool_plugin.resource_link_launch.ags.tasks import (
+    resync_scores,
+    send_problem_score_update,
+    send_score_update,
+    send_vertical_score_update,
+)
+from openedx_lti_tool_plugin.resource_link_launch.views import AGS_CLAIM_ENDPOINT, AGS_SCORE_SCOPE
+from openedx_lti_tool_plugin.tests import AUD, ISS, MODULE_PATH, SUB
+from openedx_lti_tool_plugin.tests.backends_for_tests import CourseContextTest, LearningContextTest
+from openedx_lti_tool_plugin.waffle import ALLOW_COMPLETE_COURSE_LAUNCH
+
+urlpatterns = [
+    re_path(
+        app_config.plugin_app['url_config']['lms.djangoapp']['regex'],
+        include(('openedx_lti_tool_plugin.urls', app_config.name), namespace=app_config.name),
+    ),
+]
+
+COURSE_ID = 'course-v1:org+course+run'
+PROBLEM_ID = 'block-v1:org+course+run+type@problem+block@test'
+VERTICAL_ID = 'block-v1:org+course+run+type@vertical+block@test'
+LINEITEM = 'https://foo.example.com/lineitem'
+MESSAGE_TYPE_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/message_type'
+VERSION_CLAIM = 'https://purl.imsglobal.org/spec/lti/claim/version'
+RESOURCE_LINK_LAUNCH_DATA = {
+    'iss': ISS,
+    'aud': AUD,
+    'sub': SUB,
+    MESSAGE_TYPE_CLAIM: 'LtiResourceLinkRequest',
+    VERSION_CLAIM: '1.3.0',
+    DEPLOYMENT_ID_CLAIM: '1',
+    AGS_CLAIM_ENDPOINT: {'lineitem': LINEITEM, 'scope': [AGS_SCORE_SCOPE]},
+}
+QUERY_BUDGETS = {
+    'first_launch': 30,
+    'returning_launch': 21,
+    'login_prompt_launch': 4,
+    'content_items': 3,
+    'content_items_not_modified': 0,
+    'content_items_cursor': 2,
+    'send_score_update': 2,
+    'send_problem_score_update': 2,
+    'send_vertical_score_update': 3,
+    'resync_scores': 1,
+}
+CONTENT_ITEM_PAGE_SIZES = (1, 10, 50)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class QueryBudgetTestCase(TestCase):
+    """Query Budget TestCase."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        cache.clear()
+        self.lti_tool = LtiTool.objects.create(
+            title='test-lti-tool',
+            issuer=ISS,
+            client_id=AUD,
+            auth_login_url='https://foo.example.com/login',
+            auth_token_url='https://foo.example.com/token',
+            key_set_url='https://foo.example.com/jwks',
+            deployment_ids='["1"]',
+            tool_key=LtiToolKey.objects.create(name='test-lti-tool-key'),
+        )
+        self.lti_tool_configuration = LtiToolConfiguration.objects.get(lti_tool=self.lti_tool)
+
+    @contextmanager
+    def assertQueryBudget(self, path: str) -> Iterator[CaptureQueriesContext]:  # pylint: disable=invalid-name
+        """Assert a path makes at most its budget of queries.
+
+        Args:
+            path: QUERY_BUDGETS path name.
+
+        Yields:
+            CaptureQueriesContext of the path.
+
+        """
+        budget = QUERY_BUDGETS[path]
+
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        queries = '\n'.join(
+            f'{number}. {query["sql"]}'
+            for number, query in enumerate(context.captured_queries, start=1)
+        )
+        self.assertLessEqual(
+            len(context),
+            budget,
+            f'{path} made {len(context)} queries, the budget is {budget}:\n{queries}',
+        )
+
+
+@override_switch(ALLOW_COMPLETE_COURSE_LAUNCH.name, active=True)
+class TestResourceLinkLaunchQueryBudget(QueryBudgetTestCase):
+    """Test ResourceLinkLaunchView query budgets."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.url = reverse(f'{app_config.name}:1.3:resource-link:launch-resource-id', args=[COURSE_ID])
+
+    def launch(self) -> HttpResponse:
+        """Send a resource link launch request with cached launch data.
+
+        Returns:
+            HTTP response.
+
+        """
+        launch_id = str(uuid4())
+        storage = DjangoCacheDataStorage(cache_name='default')
+        storage.set_request(MagicMock(is_secure=MagicMock(return_value=False)))
+        storage.set_value(f'lti1p3-launch-{launch_id}', RESOURCE_LINK_LAUNCH_DATA)
+
+        return self.client.post(f'{self.url}?launch_id={launch_id}')
+
+    def test_first_launch(self):
+        """Test first launch creates the User and LtiProfile."""
+        with self.assertQueryBudget('first_launch'):
+            response = self.launch()
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(LtiProfile.objects.filter(subject_id=SUB).exists())
+
+    def test_returning_launch(self):
+        """Test launch of an existing LtiProfile."""
+        self.launch()
+        self.client.logout()
+
+        with self.assertQueryBudget('returning_launch'):
+            response = self.launch()
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_login_prompt_launch(self):
+        """Test launch rendering the login prompt."""
+        self.lti_tool_configuration.user_provisioning_mode = (
+            LtiToolConfiguration.UserProvisioningMode.EXISTING_AND_NEW
+        )
+        self.lti_tool_configuration.save()
+
+        with self.assertQueryBudget('login_prompt_launch'):
+            response = self.launch()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(LtiProfile.objects.filter(subject_id=SUB).exists())
+
+
+@ddt.ddt
+class TestCourseContentItemQueryBudget(QueryBudgetTestCase):
+    """Test CourseContentItemViewSet query budgets."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.launch_id = str(uuid4())
+        self.url = reverse(
+            f'{app_config.name}:1.3:deep-linking:api:v1:course-content-item-list',
+            args=[self.launch_id],
+        )
+        self.session = DeepLinkingSession(self.launch_id, {'iss': ISS, 'aud': AUD, 'sub': SUB}).dumps()
+
+    def create_courses(self, size: int):
+        """Create CourseContext instances.
+
+        Args:
+            size: Number of courses.
+
+        """
+        for number in range(size):
+            CourseContextTest.objects.create(
+                learning_context=LearningContextTest.objects.create(
+                    context_key=CourseKey.from_string(f'course-v1:org+course-{number}+run'),
+                    title=f'Course {number}',
+                ),
+            )
+
+    @ddt.data(*CONTENT_ITEM_PAGE_SIZES)
+    def test_content_items(self, size: int):
+        """Test content item list and its revalidation with the ETag."""
+        self.create_courses(size)
+
+        with self.assertQueryBudget('content_items'):
+            response = self.client.get(self.url, {'session': self.session, 'page_size': size})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], size)
+
+        with self.assertQueryBudget('content_items_not_modified'):
+            response = self.client.get(
+                self.url,
+                {'session': self.session, 'page_size': size},
+                HTTP_IF_NONE_MATCH=response['ETag'],
+            )
+
+        self.assertEqual(response.status_code, 304)
+
+    @ddt.data(*CONTENT_ITEM_PAGE_SIZES)
+    def test_content_items_cursor(self, size: int):
+        """Test content item list pages of the cursor pagination mode."""
+        self.create_courses(size * 2)
+        query = {'session': self.session, 'page_size': size, 'pagination': 'cursor', 'ordering': 'title'}
+
+        with self.assertQueryBudget('content_items_cursor'):
+            response = self.client.get(self.url, query)
+
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget('content_items_cursor'):
+            response = self.client.get(response.json()['next'])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), size)
+
+
+@ddt.ddt
+@patch(f'{MODULE_PATH}.resource_link_launch.ags.models.AgsScoreClient')
+class TestAgsTaskQueryBudget(QueryBudgetTestCase):
+    """Test AGS task query budgets."""
+
+    def create_graded_resources(self, size: int, context_key: str) -> list:
+        """Create LtiGradedResource instances of a User.
+
+        Args:
+            size: Number of LtiGradedResource instances.
+            context_key: LtiGradedResource context key.
+
+        Returns:
+            List of LtiGradedResource instances.
+
+        """
+        lti_profile = LtiProfile.objects.create(platform_id=ISS, client_id=AUD, subject_id=SUB)
+
+        return [
+            LtiGradedResource.objects.create(
+                lti_profile=lti_profile,
+                context_key=context_key,
+                lineitem=f'{LINEITEM}/{number}',
+            )
+            for number in range(size)
+        ]
+
+    def test_send_score_update(self, ags_score_client_mock: MagicMock):
+        """Test send_score_update task."""
+        graded_resource, = self.create_graded_resources(1, PROBLEM_ID)
+
+        with self.assertQueryBudget('send_score_update'):
+            send_score_update(graded_resource.id, 1, 1, datetime.now(tz=timezone.utc).isoformat(), '')
+
+        ags_score_client_mock().put_grade.assert_called_once()
+
+    @ddt.data(1, 10)
+    def test_send_problem_score_update(self, size: int, ags_score_client_mock: MagicMock):
+        """Test send_problem_score_update task."""
+        graded_resources = self.create_graded_resources(size, PROBLEM_ID)
+
+        with self.assertQueryBudget('send_problem_score_update'):
+            send_problem_score_update(1, 1, graded_resources[0].lti_profile.user_id, PROBLEM_ID)
+
+        self.assertEqual(ags_score_client_mock().put_grade.call_count, size)
+
+    @ddt.data(1, 10)
+    def test_send_vertical_score_update(self, size: int, ags_score_client_mock: MagicMock):
+        """Test send_vertical_score_update task."""
+        graded_resources = self.create_graded_resources(size, VERTICAL_ID)
+
+        with self.assertQueryBudget('send_vertical_score_update'):
+            send_vertical_score_update(graded_resources[0].lti_profile.user_id, COURSE_ID, PROBLEM_ID)
+
+        self.assertEqual(ags_score_client_mock().put_grade.call_count, size)
+
+    @patch(f'{MODULE_PATH}.resource_link_launch.ags.resync.AsyncScorePublisher')
+    @ddt.data(1, 10)
+    def test_resync_scores(
+        self,
+        size: int,
+        async_score_publisher_mock: MagicMock,
+        ags_score_client_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test resync_scores task."""
+        self.create_graded_resources(size, PROBLEM_ID)
+        async_score_publisher_mock().__enter__.return_value = async_score_publisher_mock()
+        async_score_publisher_mock().publish.side_effect = lambda scores: [True] * len(scores)
+
+        with self.assertQueryBudget('resync_scores'):
+            stats = resync_scores(COURSE_ID)
+
+        self.assertEqual(stats['processed'], size)
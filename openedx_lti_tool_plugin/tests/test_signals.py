@@ -8,7 +8,12 @@ from pylti1p3.contrib.django.lti1p3_tool_config.models import LtiTool, LtiToolKe
 
 from openedx_lti_tool_plugin.apps import OpenEdxLtiToolPluginConfig as app_config
 from openedx_lti_tool_plugin.models import LtiProfile, LtiToolConfiguration
-from openedx_lti_tool_plugin.signals import create_lti_tool_configuration, restrict_lti_profile_user
+from openedx_lti_tool_plugin.signals import (
+    ORIGINAL_EMAIL_ATTR,
+    create_lti_tool_configuration,
+    restrict_lti_profile_user,
+    track_user_original_email,
+)
 from openedx_lti_tool_plugin.tests import AUD, ISS, SUB
 
 EMAIL = 'test@example.com'
@@ -17,6 +22,47 @@ APP_EMAIL = f'test@{app_config.domain_name}'
 USERNAME = 'test-username'
 
 
+class TestTrackUserOriginalEmail(TestCase):
+    """Test track_user_original_email signal."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user_model = get_user_model()
+        self.user = self.user_model.objects.create(
+            email=EMAIL,
+            username=USERNAME,
+        )
+
+    def test_user_loaded(self):
+        """Test original email is tracked when User is loaded."""
+        user = self.user_model.objects.get(pk=self.user.pk)
+        user.email = NEW_EMAIL
+
+        self.assertEqual(getattr(user, ORIGINAL_EMAIL_ATTR), EMAIL)
+
+    def test_user_saved(self):
+        """Test original email is tracked when User is saved."""
+        self.user.email = NEW_EMAIL
+        self.user.save()
+
+        self.assertEqual(getattr(self.user, ORIGINAL_EMAIL_ATTR), NEW_EMAIL)
+
+    def test_user_with_deferred_email(self):
+        """Test original email is not loaded when email is deferred."""
+        with self.assertNumQueries(1):
+            user = self.user_model.objects.only('pk').get(pk=self.user.pk)
+
+        self.assertIsNone(getattr(user, ORIGINAL_EMAIL_ATTR))
+
+    def test_track_user_original_email(self):
+        """Test track_user_original_email function."""
+        self.user.email = NEW_EMAIL
+
+        track_user_original_email(self.user_model, self.user)
+
+        self.assertEqual(getattr(self.user, ORIGINAL_EMAIL_ATTR), NEW_EMAIL)
+
+
 class TestRestrictLtiProfileUser(TestCase):
     """Test restrict_lti_profile_user signal."""
 
@@ -51,29 +97,52 @@ class TestRestrictLtiProfileUser(TestCase):
     def test_user_without_lti_profile(self, get_mock: MagicMock):
         """Test when User has no LtiProfile instance."""
         get_mock.side_effect = LtiProfile.DoesNotExist
-        self.user.email = NEW_EMAIL
+        self.user.email = APP_EMAIL
 
         restrict_lti_profile_user(self.user_model, self.user)
 
         get_mock.assert_called_once_with(user=self.user)
-        self.assertEqual(self.user.email, NEW_EMAIL)
+        self.assertEqual(self.user.email, APP_EMAIL)
 
     @patch.object(LtiProfile.objects, 'get')
     def test_user_with_multiple_lti_profiles(self, get_mock: MagicMock):
         """Test when User has multiple LtiProfile instances."""
         get_mock.side_effect = LtiProfile.MultipleObjectsReturned
-        self.user.email = NEW_EMAIL
+        self.user.email = APP_EMAIL
 
         restrict_lti_profile_user(self.user_model, self.user)
 
         get_mock.assert_called_once_with(user=self.user)
-        self.assertEqual(self.user.email, NEW_EMAIL)
+        self.assertEqual(self.user.email, APP_EMAIL)
+
+    @patch.object(LtiProfile.objects, 'get')
+    def test_email_not_updated(self, get_mock: MagicMock):
+        """Test when User email is not in the saved fields."""
+        user = self.user_model.objects.get(pk=self.lti_profile.user.pk)
+        user.email = NEW_EMAIL
+
+        restrict_lti_profile_user(self.user_model, user, update_fields=frozenset({'last_login'}))
+
+        get_mock.assert_not_called()
+        self.assertEqual(user.email, NEW_EMAIL)
 
     @patch.object(LtiProfile.objects, 'get')
     def test_non_autogenerated_user_email(self, get_mock: MagicMock):
-        """Test when User email is non-autogenerated."""
+        """Test when User original and new emails are non-autogenerated."""
+        self.user.email = NEW_EMAIL
+
+        with self.assertNumQueries(0):
+            restrict_lti_profile_user(self.user_model, self.user)
+
+        get_mock.assert_not_called()
+        self.assertEqual(self.user.email, NEW_EMAIL)
+
+    @patch.object(LtiProfile.objects, 'get')
+    def test_non_autogenerated_user_email_without_original_email(self, get_mock: MagicMock):
+        """Test when User email is non-autogenerated and original email is unknown."""
         self.lti_profile.user = self.user
         get_mock.return_value = self.lti_profile
+        setattr(self.user, ORIGINAL_EMAIL_ATTR, None)
         self.user.email = NEW_EMAIL
 
         restrict_lti_profile_user(self.user_model, self.user)
@@ -85,10 +154,10 @@ class TestRestrictLtiProfileUser(TestCase):
     def test_autogenerated_user_email(self, get_mock: MagicMock):
         """Test when User email is autogenerated."""
         get_mock.return_value = self.lti_profile
-        user = self.user_model.objects.get(pk=self.lti_profile .user.pk)
+        user = self.user_model.objects.get(pk=self.lti_profile.user.pk)
         user.email = NEW_EMAIL
 
-        restrict_lti_profile_user(self.user_model, user)
+        restrict_lti_profile_user(self.user_model, user, update_fields=frozenset({'email'}))
 
         get_mock.assert_called_once_with(user=user)
         self.assertEqual(user.email, self.lti_profile.user.email)
@@ -0,0 +1,99 @@
+"""Tests snapshot module."""
+from unittest.mock import MagicMock, patch
+
+from django.test import RequestFactory, TestCase
+
+from openedx_lti_tool_plugin.snapshot import SNAPSHOT_ATTR, SettingsSnapshot, get_settings_snapshot
+from openedx_lti_tool_plugin.tests import MODULE_PATH, ORG
+
+MODULE_PATH = f'{MODULE_PATH}.snapshot'
+
+
+@patch(f'{MODULE_PATH}.configuration_helpers')
+class TestSettingsSnapshot(TestCase):
+    """Test SettingsSnapshot class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.snapshot = SettingsSnapshot()
+
+    @patch(f'{MODULE_PATH}.SAVE_PII_DATA')
+    @patch(f'{MODULE_PATH}.COURSE_ACCESS_CONFIGURATION')
+    @patch(f'{MODULE_PATH}.ALLOW_COMPLETE_COURSE_LAUNCH')
+    def test_switches(
+        self,
+        allow_complete_course_launch_mock: MagicMock,
+        course_access_configuration_mock: MagicMock,
+        save_pii_data_mock: MagicMock,
+        configuration_helpers_mock: MagicMock,  # pylint: disable=unused-argument
+    ):
+        """Test switch properties are read once."""
+        for _ in range(2):
+            self.assertEqual(
+                self.snapshot.allow_complete_course_launch,
+                allow_complete_course_launch_mock.is_enabled.return_value,
+            )
+            self.assertEqual(
+                self.snapshot.course_access_configuration,
+                course_access_configuration_mock.is_enabled.return_value,
+            )
+            self.assertEqual(
+                self.snapshot.save_pii_data,
+                save_pii_data_mock.is_enabled.return_value,
+            )
+
+        allow_complete_course_launch_mock.is_enabled.assert_called_once_with()
+        course_access_configuration_mock.is_enabled.assert_called_once_with()
+        save_pii_data_mock.is_enabled.assert_called_once_with()
+
+    def test_site_orgs(self, configuration_helpers_mock: MagicMock):
+        """Test site_orgs property is read once."""
+        configuration_helpers_mock().get_current_site_orgs.return_value = [ORG]
+
+        self.assertEqual(self.snapshot.site_orgs, [ORG])
+        self.assertEqual(self.snapshot.site_orgs, [ORG])
+        configuration_helpers_mock().get_current_site_orgs.assert_called_once_with()
+
+    def test_site_orgs_without_orgs(self, configuration_helpers_mock: MagicMock):
+        """Test site_orgs property without site configuration orgs."""
+        configuration_helpers_mock().get_current_site_orgs.return_value = None
+
+        self.assertEqual(self.snapshot.site_orgs, [])
+
+    def test_get_value(self, configuration_helpers_mock: MagicMock):
+        """Test get_value method reads each value once."""
+        self.assertEqual(
+            self.snapshot.get_value('test-name', 'test-default'),
+            configuration_helpers_mock().get_value.return_value,
+        )
+        self.assertEqual(
+            self.snapshot.get_value('test-name', 'test-default'),
+            configuration_helpers_mock().get_value.return_value,
+        )
+        self.snapshot.get_value('other-name')
+
+        self.assertEqual(configuration_helpers_mock().get_value.call_count, 2)
+        configuration_helpers_mock().get_value.assert_any_call('test-name', 'test-default')
+        configuration_helpers_mock().get_value.assert_any_call('other-name', None)
+
+
+@patch(f'{MODULE_PATH}.get_current_request')
+class TestGetSettingsSnapshot(TestCase):
+    """Test get_settings_snapshot function."""
+
+    def test_with_request(self, get_current_request_mock: MagicMock):
+        """Test with current request (happy path)."""
+        request = RequestFactory().get('/')
+        get_current_request_mock.return_value = request
+        snapshot = get_settings_snapshot()
+
+        self.assertIsInstance(snapshot, SettingsSnapshot)
+        self.assertIs(getattr(request, SNAPSHOT_ATTR), snapshot)
+        self.assertIs(get_settings_snapshot(), snapshot)
+
+    def test_without_request(self, get_current_request_mock: MagicMock):
+        """Test without current request."""
+        get_current_request_mock.return_value = None
+
+        self.assertIsNot(get_settings_snapshot(), get_settings_snapshot())
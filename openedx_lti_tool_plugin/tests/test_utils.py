@@ -52,7 +52,7 @@ class TestGetPiiFromClaims(TestCase):
 
 @patch(f'{MODULE_PATH}.get_client_id')
 @patch(f'{MODULE_PATH}.get_pii_from_claims')
-@patch(f'{MODULE_PATH}.SAVE_PII_DATA')
+@patch(f'{MODULE_PATH}.get_settings_snapshot')
 class TestGetIdentityClaims(TestCase):
     """Test `get_identity_claims` function."""
 
@@ -68,12 +68,12 @@ class TestGetIdentityClaims(TestCase):
 
     def test_with_enabled_save_pii_data_switch(
         self,
-        save_pii_data_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
         get_pii_from_claims_mock: MagicMock,
         get_client_id_mock: MagicMock,
     ):
         """Test with enabled `SAVE_PII_DATA` switch."""
-        save_pii_data_mock.is_enabled.return_value = True
+        get_settings_snapshot_mock.return_value.save_pii_data = True
 
         self.assertEqual(
             get_identity_claims(self.launch_data),
@@ -85,17 +85,17 @@ class TestGetIdentityClaims(TestCase):
             )
         )
         get_client_id_mock.assert_called_once_with(self.launch_data['aud'], self.launch_data['azp'])
-        save_pii_data_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         get_pii_from_claims_mock.assert_called_once_with(self.launch_data)
 
     def test_with_disabled_save_pii_data_switch(
         self,
-        save_pii_data_mock: MagicMock,
+        get_settings_snapshot_mock: MagicMock,
         get_pii_from_claims_mock: MagicMock,
         get_client_id_mock: MagicMock,
     ):
         """Test with disabled `SAVE_PII_DATA` switch."""
-        save_pii_data_mock.is_enabled.return_value = False
+        get_settings_snapshot_mock.return_value.save_pii_data = False
 
         self.assertEqual(
             get_identity_claims(self.launch_data),
@@ -107,5 +107,5 @@ class TestGetIdentityClaims(TestCase):
             )
         )
         get_client_id_mock.assert_called_once_with(self.launch_data['aud'], self.launch_data['azp'])
-        save_pii_data_mock.is_enabled.assert_called_once_with()
+        get_settings_snapshot_mock.assert_called_once_with()
         get_pii_from_claims_mock.assert_not_called()
@@ -18,43 +18,93 @@ class TestJSONSchemaValidator(TestCase):
         """Set up test fixtures."""
         super().setUp()
         self.validator_class = JSONSchemaValidator
-        self.schema = {}
-        self.value = {}
+        self.schema = {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {'title': {'type': 'string'}},
+            },
+        }
+        self.value = [{'title': 'test-title'}]
+        self.invalid_value = [{'title': 1}, {'title': 'test-title'}, {'title': 2}]
         self.message = 'test-message'
 
     def test_init(self):
         """Test __init__ method."""
-        instance = self.validator_class(self.schema)
+        instance = self.validator_class(self.schema, all_errors=True)
 
         self.assertEqual(instance.schema, self.schema)
+        self.assertTrue(instance.all_errors)
+        self.assertIsNone(instance._validator)  # pylint: disable=protected-access
 
-    @patch(f'{MODULE_PATH}.jsonschema.validate')
-    def test_call_with_valid_json(self, validate_mock: MagicMock):
-        """Test __call__ method with valid JSON value."""
+    def test_deconstruct(self):
+        """Test deconstruct method."""
         self.assertEqual(
-            self.validator_class(self.schema)(self.value),
-            self.value,
+            self.validator_class(self.schema, all_errors=True).deconstruct(),  # pylint: disable=no-member
+            (
+                f'{MODULE_PATH}.JSONSchemaValidator',
+                (self.schema,),
+                {'all_errors': True},
+            ),
+        )
+
+    def test_eq(self):
+        """Test __eq__ method."""
+        self.assertEqual(self.validator_class(self.schema), self.validator_class(self.schema))
+        self.assertNotEqual(
+            self.validator_class(self.schema),
+            self.validator_class(self.schema, all_errors=True),
         )
-        validate_mock.assert_called_once_with(self.value, self.schema)
+        self.assertNotEqual(self.validator_class(self.schema), self.validator_class({}))
 
-    @patch(f'{MODULE_PATH}.jsonschema.validate')
-    def test_call_with_validation_error(self, validate_mock: MagicMock):
-        """Test __call__ method with jsonschema.ValidationError."""
-        validate_mock.side_effect = jsonschema.ValidationError(self.message)
+    @patch(f'{MODULE_PATH}.jsonschema.validators.validator_for')
+    def test_get_validator(self, validator_for_mock: MagicMock):
+        """Test get_validator method compiles the schema once."""
+        instance = self.validator_class(self.schema)
+
+        self.assertEqual(instance.get_validator(), validator_for_mock.return_value.return_value)
+        self.assertEqual(instance.get_validator(), validator_for_mock.return_value.return_value)
+        validator_for_mock.assert_called_once_with(self.schema)
+        validator_for_mock().check_schema.assert_called_once_with(self.schema)
+        validator_for_mock().assert_called_once_with(self.schema)
+
+    def test_call_with_valid_json(self):
+        """Test __call__ method with valid JSON value."""
+        for all_errors in (False, True):
+            with self.subTest(all_errors=all_errors):
+                self.assertEqual(
+                    self.validator_class(self.schema, all_errors=all_errors)(self.value),
+                    self.value,
+                )
 
+    def test_call_with_validation_error(self):
+        """Test __call__ method with invalid JSON value."""
         with self.assertRaises(ValidationError) as ctxm:
-            self.validator_class(self.schema)(self.value)
+            self.validator_class(self.schema)(self.invalid_value)
 
-        self.assertEqual(str([self.message]), str(ctxm.exception))
-        validate_mock.assert_called_once_with(self.value, self.schema)
+        self.assertEqual(len(ctxm.exception.messages), 1)
+        self.assertIn("1 is not of type 'string'", ctxm.exception.messages[0])
+
+    def test_call_with_validation_error_and_all_errors(self):
+        """Test __call__ method with invalid JSON value and all_errors."""
+        with self.assertRaises(ValidationError) as ctxm:
+            self.validator_class(self.schema, all_errors=True)(self.invalid_value)
+
+        self.assertEqual(
+            ctxm.exception.messages,
+            [
+                "$[0].title: 1 is not of type 'string'",
+                "$[2].title: 2 is not of type 'string'",
+            ],
+        )
 
-    @patch(f'{MODULE_PATH}.jsonschema.validate')
-    def test_call_with_schema_error(self, validate_mock: MagicMock):
+    @patch.object(JSONSchemaValidator, 'get_validator')
+    def test_call_with_schema_error(self, get_validator_mock: MagicMock):
         """Test __call__ method with jsonschema.SchemaError."""
-        validate_mock.side_effect = jsonschema.SchemaError(self.message)
+        get_validator_mock.side_effect = jsonschema.SchemaError(self.message)
 
         with self.assertRaises(ValidationError) as ctxm:
             self.validator_class(self.schema)(self.value)
 
         self.assertEqual(str([self.message]), str(ctxm.exception))
-        validate_mock.assert_called_once_with(self.value, self.schema)
+        get_validator_mock.assert_called_once_with()
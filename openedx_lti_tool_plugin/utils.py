@@ -9,7 +9,7 @@ from typing import Optional, Tuple
 
 from django.conf import settings
 
-from openedx_lti_tool_plugin.waffle import SAVE_PII_DATA
+from openedx_lti_tool_plugin.snapshot import get_settings_snapshot
 
 PII_CLAIM_NAMES = [
     'name',
@@ -115,5 +115,5 @@ def get_identity_claims(launch_data: dict) -> Tuple[str, str, str, dict]:
         launch_data.get('iss'),
         get_client_id(launch_data.get('aud'), launch_data.get('azp')),
         launch_data.get('sub'),
-        get_pii_from_claims(launch_data) if SAVE_PII_DATA.is_enabled() else {},
+        get_pii_from_claims(launch_data) if get_settings_snapshot().save_pii_data else {},
     )
@@ -10,6 +10,13 @@ from django.utils.deconstruct import deconstructible
 class JSONSchemaValidator:
     """JSON Schema Validator.
 
+    The schema is checked and compiled into a validator instance on first
+    use, the compiled validator is reused by every call of this instance.
+
+    Attributes:
+        schema (dict): JSON Schema dictionary.
+        all_errors (bool): Report all the value errors instead of the best match.
+
     .. _JSON Schema Documentation:
         https://json-schema.org/docs
 
@@ -18,14 +25,17 @@ class JSONSchemaValidator:
 
     """
 
-    def __init__(self, schema: dict):
+    def __init__(self, schema: dict, all_errors: bool = False):
         """Initialize class instance.
 
         Args:
             schema: JSON Schema dictionary.
+            all_errors: Report all the value errors instead of the best match.
 
         """
         self.schema = schema
+        self.all_errors = all_errors
+        self._validator = None
 
     def __call__(self, value: Any) -> Any:
         """Validate value JSON Schema.
@@ -33,10 +43,58 @@ class JSONSchemaValidator:
         Args:
             value: JSON value.
 
+        Returns:
+            Validated JSON value.
+
+        Raises:
+            ValidationError: If the schema or the value is invalid.
+
         """
         try:
-            jsonschema.validate(value, self.schema)
-        except (jsonschema.ValidationError, jsonschema.SchemaError) as exc:
+            validator = self.get_validator()
+        except jsonschema.SchemaError as exc:
             raise ValidationError(str(exc)) from exc
 
+        if self.all_errors:
+            if errors := sorted(validator.iter_errors(value), key=lambda error: list(error.path)):
+                raise ValidationError([f'{error.json_path}: {error.message}' for error in errors])
+
+            return value
+
+        if error := jsonschema.exceptions.best_match(validator.iter_errors(value)):
+            raise ValidationError(str(error))
+
         return value
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare validator instances.
+
+        Args:
+            other: Object to compare.
+
+        Returns:
+            True if the other object is a JSONSchemaValidator with the same arguments.
+
+        """
+        return (
+            isinstance(other, self.__class__)
+            and self.schema == other.schema
+            and self.all_errors == other.all_errors
+        )
+
+    def get_validator(self) -> jsonschema.protocols.Validator:
+        """Get the compiled schema validator.
+
+        Returns:
+            jsonschema Validator instance of the schema dialect.
+
+        Raises:
+            jsonschema.SchemaError: If the schema is invalid.
+
+        """
+        if self._validator is None:
+            validator_class = jsonschema.validators.validator_for(self.schema)
+            validator_class.check_schema(self.schema)
+            self._validator = validator_class(self.schema)
+
+        return self._validator